@@ -0,0 +1,15 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: __init__.py — benchmarks/__init__.py
+
+"""Offline regression benchmarks for the oops hot paths.
+
+- :mod:`benchmarks.generator` writes a deterministic fake Odoo project.
+- :mod:`benchmarks.scenarios` times the scanner, XML scanner, KB store,
+  refactor analysis, addon discovery and ``depends show`` on that tree.
+- :mod:`benchmarks.runner` records results and compares them with
+  ``benchmarks/baseline.json``.
+
+Run ``python -m benchmarks`` or ``pytest -m bench``.
+"""
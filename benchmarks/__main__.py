@@ -0,0 +1,146 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: __main__.py — benchmarks/__main__.py
+
+"""Command line entry point: ``python -m benchmarks``.
+
+Exits 1 when a scenario regresses beyond its tolerance against the baseline.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+
+import click
+from benchmarks.generator import TreeSpec
+from benchmarks.memory import measure_memory
+from benchmarks.runner import (
+    BASELINE_PATH,
+    DEFAULT_TOLERANCE,
+    compare,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.startup import measure_startup
+
+
+@click.command(help=__doc__)
+@click.option(
+    "--scenario",
+    "-s",
+    "names",
+    multiple=True,
+    type=click.Choice(sorted(SCENARIOS)),
+    help="Scenario to run (repeatable). Defaults to all.",
+)
+@click.option("--repeat", "-r", default=5, show_default=True, help="Timed samples per scenario.")
+@click.option("--scale", default=1, show_default=True, help="Multiply module counts of the default tree.")
+@click.option(
+    "--output",
+    "-o",
+    "output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the results JSON to this path.",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=BASELINE_PATH,
+    show_default=True,
+    help="Baseline to compare against.",
+)
+@click.option(
+    "--tolerance",
+    default=DEFAULT_TOLERANCE,
+    show_default=True,
+    help="Allowed slowdown before failing (1.0 = twice as slow).",
+)
+@click.option("--update-baseline", is_flag=True, help="Store these results as the new baseline.")
+@click.option(
+    "--memory",
+    is_flag=True,
+    help="Only measure the peak RSS of a full global KB build of the tree (Unix only).",
+)
+@click.option(
+    "--startup",
+    is_flag=True,
+    help="Only measure the cold-start latency of the pre-commit hook entry points.",
+)
+def main(
+    names,
+    repeat: int,
+    scale: int,
+    output,
+    baseline: Path,
+    tolerance: float,
+    update_baseline: bool,
+    memory: bool,
+    startup: bool,
+) -> None:
+    if startup:
+        timings = measure_startup(repeat=repeat)
+        for hook, entry in timings["hooks"].items():
+            click.echo(
+                f"{hook:<24} {entry['wall_ms']:>8.1f} ms  (import {entry['import_ms']:.1f} ms, "
+                f"repository {entry['repo_ms']:.2f} ms{', GitPython' if entry['gitpython'] else ''})"
+            )
+        if output is not None:
+            save_results(timings, output)
+            click.echo(f"Results written to {output}", err=True)
+        return
+
+    base = TreeSpec()
+    spec = dataclasses.replace(
+        base,
+        core_modules=base.core_modules * scale,
+        local_modules=base.local_modules * scale,
+        modules_per_submodule=base.modules_per_submodule * scale,
+    )
+    if memory:
+        usage = measure_memory(spec)
+        click.echo(
+            f"global KB build: {usage['modules']} modules, {usage['symbols']} symbols in {usage['seconds']:.1f} s, "
+            f"peak RSS {usage['peak_rss_mb']:.1f} MB ({usage['build_rss_mb']:+.1f} MB over imports)"
+        )
+        if output is not None:
+            save_results(usage, output)
+            click.echo(f"Results written to {output}", err=True)
+        return
+
+    results = run_benchmarks(list(names) or None, spec=spec, repeat=repeat)
+
+    for name, entry in results["scenarios"].items():
+        click.echo(f"{name:<18} {entry['median_s'] * 1000:>10.1f} ms  (x{entry['normalized']:.2f} calib)")
+
+    if output is not None:
+        save_results(results, output)
+        click.echo(f"Results written to {output}", err=True)
+
+    if update_baseline:
+        save_results(results, baseline)
+        click.echo(f"Baseline updated: {baseline}", err=True)
+        return
+
+    if not baseline.exists():
+        click.echo(f"No baseline at {baseline}; skipping comparison.", err=True)
+        return
+
+    reference = load_results(baseline)
+    if reference.get("spec") != results["spec"]:
+        click.echo("Baseline was recorded with a different tree spec; skipping comparison.", err=True)
+        return
+
+    regressions = compare(results, reference, tolerance)
+    for regression in regressions:
+        click.echo(f"REGRESSION {regression}", err=True)
+    if regressions:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: generator.py — benchmarks/generator.py
+
+"""Deterministic generator of fake Odoo project trees.
+
+The tree mimics a real project layout closely enough to exercise the hot
+paths end to end::
+
+    <root>/
+        .oops.yaml                       minimal config (manifest lookups need one)
+        .gitmodules                      one entry per submodule
+        odoo/addons/<core modules>       stand-in for the Odoo sources (origin "odoo")
+        .third-party/<sub>/<module>/     submodule checkouts
+        <module> -> .third-party/...     root symlinks to a share of submodule addons
+        <local modules>/                 project-owned addons at the root
+
+Each module carries a manifest, Python models (new models and ``_inherit``
+extensions chained up to ``inherit_depth`` modules deep), computed fields,
+onchanges, overrides calling ``super()``, and XML views, actions and menus.
+Identical :class:`TreeSpec` values always produce byte-identical trees.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from oops.core.compat import Dict, List, Optional
+
+CONFIG = (
+    "version: 1\n"
+    "images:\n"
+    "  source:\n    repository: bench/repo\n    file: tags.json\n"
+    "  collections:\n    - production\n"
+    "  registries:\n"
+    "    deprecated:\n      - loginline\n"
+    "    warn:\n      - odoo\n"
+    "manifest:\n  author: Bench\n"
+    "stats:\n  enabled: false\n"
+)
+
+_FIELD_TYPES = ("Char", "Integer", "Float", "Boolean", "Date", "Text", "Many2one", "Selection")
+
+
+@dataclass(frozen=True)
+class TreeSpec:
+    """Shape of a generated tree.
+
+    Attributes:
+        core_modules: modules under ``odoo/addons`` (origin ``odoo``).
+        local_modules: project-owned modules at the repository root.
+        submodules: number of ``.third-party/<sub>`` checkouts.
+        modules_per_submodule: addons inside each submodule.
+        symlink_ratio: share of submodule addons linked at the root (0..1).
+        models_per_module: model classes per module.
+        fields_per_model: fields declared on each model class.
+        methods_per_model: extra methods per model class (computes not included).
+        views_per_model: form/list views generated per model.
+        inherit_depth: how many modules an ``_inherit`` chain may span.
+        seed: seed of the pseudo-random choices (field types, dependencies).
+    """
+
+    core_modules: int = 10
+    local_modules: int = 10
+    submodules: int = 3
+    modules_per_submodule: int = 10
+    symlink_ratio: float = 0.5
+    models_per_module: int = 3
+    fields_per_model: int = 8
+    methods_per_model: int = 4
+    views_per_model: int = 2
+    inherit_depth: int = 3
+    seed: int = 1234
+
+
+@dataclass
+class GeneratedTree:
+    """Paths and module names of a generated tree."""
+
+    root: Path
+    spec: TreeSpec
+    core: List[Path] = field(default_factory=list)
+    local: List[Path] = field(default_factory=list)
+    submodules: Dict[str, List[Path]] = field(default_factory=dict)
+    symlinks: List[Path] = field(default_factory=list)
+
+    @property
+    def core_root(self) -> Path:
+        """Directory holding the stand-in Odoo core addons."""
+        return self.root / "odoo" / "addons"
+
+    @property
+    def modules(self) -> List[Path]:
+        """Every generated module directory (core, submodules, local)."""
+        return [*self.core, *(m for mods in self.submodules.values() for m in mods), *self.local]
+
+    @property
+    def installed(self) -> List[str]:
+        """Module names visible at the repository root (local + symlinked)."""
+        return sorted([p.name for p in self.local] + [p.name for p in self.symlinks])
+
+
+def _model_name(module: str, index: int) -> str:
+    return f"{module.replace('_', '.')}.m{index}"
+
+
+def _class_name(module: str, index: int) -> str:
+    return "".join(part.title() for part in module.split("_")) + f"M{index}"
+
+
+def _render_model(
+    rng: random.Random,
+    module: str,
+    index: int,
+    spec: TreeSpec,
+    inherit: "str | None",
+    comodels: List[str],
+) -> str:
+    model = _model_name(module, index)
+    lines = [
+        "from odoo import api, fields, models",
+        "",
+        "",
+        f"class {_class_name(module, index)}(models.Model):",
+        f'    """Synthetic model {index} of {module}."""',
+        "",
+    ]
+    if inherit:
+        lines.append(f'    _inherit = "{inherit}"')
+    else:
+        lines += [f'    _name = "{model}"', f'    _description = "{module} model {index}"']
+    lines.append("")
+
+    for f in range(spec.fields_per_model):
+        kind = rng.choice(_FIELD_TYPES)
+        name = f"x_{module}_f{index}_{f}"
+        if kind == "Many2one":
+            target = rng.choice(comodels) if comodels else model
+            lines.append(f'    {name} = fields.Many2one("{target}", string="Field {f}", help="Link {f}.")')
+        elif kind == "Selection":
+            lines.append(f'    {name} = fields.Selection([("a", "A"), ("b", "B")], string="Field {f}", default="a")')
+        else:
+            lines.append(f'    {name} = fields.{kind}(string="Field {f}", help="Synthetic field {f}.")')
+    total = f"x_{module}_total{index}"
+    lines += [
+        f'    {total} = fields.Float(compute="_compute_{total}", store=True)',
+        "",
+        f'    @api.depends("x_{module}_f{index}_0")',
+        f"    def _compute_{total}(self):",
+        '        """Sum the synthetic amounts."""',
+        "        for record in self:",
+        f"            record.{total} = len(record.ids)",
+        "",
+    ]
+    for m in range(spec.methods_per_model):
+        if m == 0:
+            lines += [
+                f'    @api.onchange("x_{module}_f{index}_0")',
+                f"    def _onchange_{module}_{index}(self):",
+                "        self.ensure_one()",
+                "",
+            ]
+        elif m == 1 and inherit:
+            lines += [
+                "    def write(self, vals):",
+                '        """Override write to flag synthetic changes."""',
+                "        return super().write(vals)",
+                "",
+            ]
+        else:
+            lines += [
+                f"    def action_{module}_{index}_{m}(self):",
+                f'        """Synthetic action {m}."""',
+                "        for record in self:",
+                f"            record.message_post(body='{m}')",
+                "        return True",
+                "",
+            ]
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def _render_views(module: str, models: List[str], spec: TreeSpec, owners: Dict[str, str]) -> str:
+    body: List[str] = []
+    for i, model in enumerate(models):
+        for v in range(spec.views_per_model):
+            view_type = "form" if v % 2 == 0 else "list"
+            xml_id = f"view_{module}_m{i}_{view_type}_{v}"
+            owner = owners.get(model)
+            if owner:
+                body.append(
+                    f'    <record id="{xml_id}" model="ir.ui.view">\n'
+                    f'        <field name="name">{model}.{view_type}.{v}</field>\n'
+                    f'        <field name="model">{model}</field>\n'
+                    f'        <field name="inherit_id" ref="{owner}.view_{owner}_m0_form_0"/>\n'
+                    f'        <field name="arch" type="xml">\n'
+                    f'            <xpath expr="//field[1]" position="after">\n'
+                    f'                <field name="x_{module}_f{i}_0"/>\n'
+                    f"            </xpath>\n"
+                    f"        </field>\n"
+                    f"    </record>"
+                )
+                continue
+            inner = "".join(f'<field name="x_{module}_f{i}_{f}"/>' for f in range(spec.fields_per_model))
+            button = f'<button name="action_{module}_{i}_2" type="object" string="Run"/>' if view_type == "form" else ""
+            body.append(
+                f'    <record id="{xml_id}" model="ir.ui.view">\n'
+                f'        <field name="name">{model}.{view_type}.{v}</field>\n'
+                f'        <field name="model">{model}</field>\n'
+                f'        <field name="arch" type="xml">\n'
+                f"            <{view_type}>{button}{inner}</{view_type}>\n"
+                f"        </field>\n"
+                f"    </record>"
+            )
+        body.append(
+            f'    <record id="action_{module}_m{i}" model="ir.actions.act_window">\n'
+            f'        <field name="name">{module} {i}</field>\n'
+            f'        <field name="res_model">{model}</field>\n'
+            f"    </record>\n"
+            f'    <menuitem id="menu_{module}_m{i}" name="{module} {i}" action="action_{module}_m{i}"/>'
+        )
+    return '<?xml version="1.0" encoding="utf-8"?>\n<odoo>\n' + "\n".join(body) + "\n</odoo>\n"
+
+
+def _write_module(
+    rng: random.Random,
+    dest: Path,
+    spec: TreeSpec,
+    depends: List[str],
+    parents: List[str],
+    owners: Dict[str, str],
+) -> None:
+    """Write one module; ``parents`` are models it extends, ``owners`` maps them to their module."""
+    module = dest.name
+    (dest / "models").mkdir(parents=True)
+    (dest / "views").mkdir()
+
+    models: List[str] = []
+    files: List[str] = []
+    for i in range(spec.models_per_module):
+        inherit = parents[i] if i < len(parents) else None
+        model = inherit or _model_name(module, i)
+        models.append(model)
+        filename = f"model_{i}"
+        files.append(filename)
+        (dest / "models" / f"{filename}.py").write_text(
+            _render_model(rng, module, i, spec, inherit, parents), encoding="utf-8"
+        )
+
+    (dest / "models" / "__init__.py").write_text("".join(f"from . import {f}\n" for f in files), encoding="utf-8")
+    (dest / "__init__.py").write_text("from . import models\n", encoding="utf-8")
+    (dest / "views" / f"{module}_views.xml").write_text(_render_views(module, models, spec, owners), encoding="utf-8")
+    manifest = {
+        "name": module.replace("_", " ").title(),
+        "version": "17.0.1.0.0",
+        "author": "Bench",
+        "license": "AGPL-3",
+        "depends": depends,
+        "data": [f"views/{module}_views.xml"],
+        "installable": True,
+    }
+    (dest / "__manifest__.py").write_text(repr(manifest) + "\n", encoding="utf-8")
+
+
+def generate_tree(root: Path, spec: Optional[TreeSpec] = None) -> GeneratedTree:
+    """Generate a fake Odoo project under ``root`` (created if missing).
+
+    Modules are written in a fixed order: core, then each submodule, then
+    local addons. Every module depends on a few earlier ones and extends
+    models of its direct dependency chain, bounded by ``spec.inherit_depth``.
+
+    Args:
+        root: directory receiving the tree.
+        spec: shape of the tree; the default :class:`TreeSpec` when None.
+
+    Returns:
+        A :class:`GeneratedTree` describing what was written.
+    """
+    spec = spec or TreeSpec()
+    rng = random.Random(spec.seed)
+    root.mkdir(parents=True, exist_ok=True)
+    (root / ".oops.yaml").write_text(CONFIG, encoding="utf-8")
+    tree = GeneratedTree(root=root, spec=spec)
+
+    written: List[str] = []
+    models_of: Dict[str, List[str]] = {}
+    owner_of: Dict[str, str] = {}
+    own_of: Dict[str, List[str]] = {}
+    chain_depth: Dict[str, int] = {}
+
+    def _add(dest: Path) -> None:
+        module = dest.name
+        depends = sorted(set(rng.sample(written, min(2, len(written))))) if written else []
+        parents: List[str] = []
+        depth = 0
+        for dep in depends:
+            if chain_depth[dep] < spec.inherit_depth:
+                # Extend the dependency's head model, lengthening its chain...
+                parents.extend(models_of[dep][:1])
+                depth = max(depth, chain_depth[dep] + 1)
+            elif own_of[dep]:
+                # ...or, once the chain is deep enough, start a new one.
+                parents.append(own_of[dep][0])
+                depth = max(depth, 1)
+        _write_module(rng, dest, spec, depends, parents, {p: owner_of[p] for p in parents})
+        own = [_model_name(module, i) for i in range(len(parents), spec.models_per_module)]
+        for model in own:
+            owner_of[model] = module
+        own_of[module] = own
+        models_of[module] = parents + own
+        chain_depth[module] = depth
+        written.append(module)
+
+    for i in range(spec.core_modules):
+        dest = tree.core_root / f"core_{i}"
+        _add(dest)
+        tree.core.append(dest)
+
+    gitmodules: List[str] = []
+    for s in range(spec.submodules):
+        sub = f"sub_{s}"
+        sub_root = root / ".third-party" / sub
+        gitmodules.append(
+            f'[submodule "{sub}"]\n\tpath = .third-party/{sub}\n\turl = https://example.invalid/{sub}.git\n'
+        )
+        tree.submodules[sub] = []
+        for m in range(spec.modules_per_submodule):
+            dest = sub_root / f"{sub}_mod_{m}"
+            _add(dest)
+            tree.submodules[sub].append(dest)
+            if m < round(spec.modules_per_submodule * spec.symlink_ratio):
+                link = root / dest.name
+                os.symlink(os.path.relpath(dest, root), link, target_is_directory=True)
+                tree.symlinks.append(link)
+    (root / ".gitmodules").write_text("".join(gitmodules), encoding="utf-8")
+
+    for i in range(spec.local_modules):
+        dest = root / f"local_{i}"
+        _add(dest)
+        tree.local.append(dest)
+
+    return tree
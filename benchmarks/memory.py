@@ -0,0 +1,97 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: memory.py — benchmarks/memory.py
+
+"""Peak memory of a full global KB build.
+
+The build runs in a fresh interpreter (``python -m benchmarks.memory <odoo>
+<db>``) so its peak RSS is not polluted by the tree generator or by earlier
+scenarios; the child reports its RSS right after imports and at exit, and
+the difference is what the build itself cost. Unix only (``resource``).
+
+Results are plain JSON::
+
+    {"modules": 600, "symbols": 78000, "import_rss_mb": 41.2,
+     "peak_rss_mb": 73.4, "build_rss_mb": 32.2, "seconds": 5.1}
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.generator import TreeSpec, generate_tree
+from oops.core.compat import Any, Dict, Optional
+
+
+def _max_rss_mb() -> float:
+    import resource
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024  # bytes on macOS, KiB elsewhere
+
+
+def _child_env() -> Dict[str, str]:
+    # The child runs from the generated tree: keep this checkout importable.
+    root = str(Path(__file__).resolve().parent.parent)
+    paths = [root, *(os.path.abspath(p) for p in os.environ.get("PYTHONPATH", "").split(os.pathsep) if p)]
+    return {**os.environ, "PYTHONPATH": os.pathsep.join(paths)}
+
+
+def measure_memory(spec: Optional[TreeSpec] = None, workdir: Optional[Path] = None) -> Dict[str, Any]:
+    """Generate a tree and measure the peak RSS of building its global KB.
+
+    Args:
+        spec: shape of the generated tree (default :class:`TreeSpec`); only its
+            core modules are scanned.
+        workdir: where to generate the tree; a temporary directory otherwise.
+
+    Returns:
+        The measurement dict (see the module docstring).
+
+    Raises:
+        subprocess.CalledProcessError: if the build fails.
+    """
+    with contextlib.ExitStack() as stack:
+        base = workdir or Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="oops-bench-")))
+        tree = generate_tree(base / "tree", spec)
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.memory", str(tree.root / "odoo"), str(base / "bench_memory.db")],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=str(tree.root),  # manifest lookups read the generated .oops.yaml
+            env=_child_env(),
+        ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def _child(odoo_path: Path, db_path: Path) -> Dict[str, Any]:
+    from oops.kb.build import build_global_kb
+
+    import_rss = _max_rss_mb()
+    start = time.perf_counter()
+    result = build_global_kb(db_path, "17.0", [("odoo", odoo_path)])
+    elapsed = time.perf_counter() - start
+    if result.errors:
+        raise SystemExit("\n".join(result.errors))
+    peak_rss = _max_rss_mb()
+    return {
+        "modules": result.data["kb"]["modules"],
+        "symbols": result.data["kb"]["symbols"],
+        "import_rss_mb": round(import_rss, 1),
+        "peak_rss_mb": round(peak_rss, 1),
+        "build_rss_mb": round(peak_rss - import_rss, 1),
+        "seconds": round(elapsed, 2),
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(_child(Path(sys.argv[1]), Path(sys.argv[2]))))
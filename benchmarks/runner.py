@@ -0,0 +1,189 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: runner.py — benchmarks/runner.py
+
+"""Run scenarios, persist results and compare them against a baseline.
+
+Raw wall times depend on the machine, so a fixed pure-Python calibration
+loop is timed right before each scenario (CPU frequency scaling makes a
+single up-front calibration unreliable). Scenario medians are stored both in
+seconds and *normalised* (divided by that calibration time); baselines
+compare the normalised values, which keeps a baseline recorded on a laptop
+usable on a CI runner.
+
+Results are plain JSON::
+
+    {
+      "schema": 1,
+      "python": "3.11.7", "platform": "Linux-...",
+      "spec": {...TreeSpec...},
+      "calibration_s": 0.012,
+      "scenarios": {
+        "kb.scanner": {"median_s": 0.41, "min_s": 0.40, "runs": 5,
+                       "calibration_s": 0.012, "normalized": 34.1},
+        ...
+      }
+    }
+
+A baseline file has the same shape plus an optional per-scenario
+``"tolerance"`` overriding the global one.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator
+
+from benchmarks.generator import TreeSpec, generate_tree
+from benchmarks.scenarios import SCENARIOS
+from oops.core.compat import Any, Dict, List, Optional
+
+RESULTS_SCHEMA = 1
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+DEFAULT_TOLERANCE = 1.0  # fail when more than twice as slow as the baseline (shared CI runners are noisy)
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A scenario whose normalised median exceeds its baseline allowance."""
+
+    name: str
+    baseline: float
+    current: float
+    tolerance: float
+
+    @property
+    def ratio(self) -> float:
+        """Current / baseline normalised median."""
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.ratio:.2f}x baseline (allowed {1 + self.tolerance:.2f}x)"
+
+
+@contextlib.contextmanager
+def _chdir(path: Path) -> Iterator[None]:
+    # Manifest lookups read .oops.yaml from the working directory.
+    previous = Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def _calibrate(loops: int = 200_000, rounds: int = 3) -> float:
+    """Best-of-``rounds`` time of a fixed pure-Python workload (dict/str churn)."""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        acc: Dict[str, int] = {}
+        for i in range(loops):
+            key = f"k{i % 1024}"
+            acc[key] = acc.get(key, 0) + len(key)
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def time_call(fn: Any, state: Any, repeat: int, warmup: int = 1) -> List[float]:
+    """Return ``repeat`` wall-clock samples of ``fn(state)`` after ``warmup`` calls."""
+    for _ in range(warmup):
+        fn(state)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(state)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def run_benchmarks(
+    names: Optional[List[str]] = None,
+    spec: Optional[TreeSpec] = None,
+    repeat: int = 5,
+    workdir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Generate a tree, time the selected scenarios and return the results dict.
+
+    Args:
+        names: scenario names (all of :data:`SCENARIOS` when None).
+        spec: shape of the generated tree; the default :class:`TreeSpec` when None.
+        repeat: timed samples per scenario (after one warm-up call).
+        workdir: where to generate the tree; a temporary directory otherwise.
+
+    Raises:
+        KeyError: if a requested scenario does not exist.
+    """
+    spec = spec or TreeSpec()
+    selected = [SCENARIOS[n] for n in (names or list(SCENARIOS))]
+    results: Dict[str, Any] = {
+        "schema": RESULTS_SCHEMA,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "spec": asdict(spec),
+        "calibration_s": None,
+        "scenarios": {},
+    }
+    calibrations = []
+
+    with contextlib.ExitStack() as stack:
+        base = workdir or Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="oops-bench-")))
+        tree = generate_tree(base / "tree", spec)
+        stack.enter_context(_chdir(tree.root))
+        for scenario in selected:
+            state = scenario.setup(tree, base)
+            scenario.run(state)  # warm-up
+            calibration = _calibrate()
+            samples = time_call(scenario.run, state, repeat, warmup=0)
+            median = statistics.median(samples)
+            calibrations.append(calibration)
+            results["scenarios"][scenario.name] = {
+                "median_s": round(median, 6),
+                "min_s": round(min(samples), 6),
+                "runs": len(samples),
+                "calibration_s": round(calibration, 6),
+                "normalized": round(median / calibration, 3),
+            }
+    results["calibration_s"] = round(statistics.median(calibrations), 6) if calibrations else None
+    return results
+
+
+def compare(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[Regression]:
+    """Return the scenarios slower than ``baseline`` by more than their tolerance.
+
+    Scenarios missing from either side are ignored, so adding a scenario does
+    not break older baselines.
+    """
+    regressions = []
+    for name, current in results.get("scenarios", {}).items():
+        ref = baseline.get("scenarios", {}).get(name)
+        if not ref:
+            continue
+        allowed = ref.get("tolerance", tolerance)
+        if current["normalized"] > ref["normalized"] * (1 + allowed):
+            regressions.append(Regression(name, ref["normalized"], current["normalized"], allowed))
+    return regressions
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    """Read a results or baseline JSON file."""
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_results(results: Dict[str, Any], path: Path) -> Path:
+    """Write ``results`` as indented, key-sorted JSON (stable diffs for baselines)."""
+    path.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return path
@@ -0,0 +1,191 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: scenarios.py — benchmarks/scenarios.py
+
+"""Timed scenarios, one per hot path.
+
+A scenario is a ``setup(tree, workdir)`` returning the state its ``run``
+callable needs; only ``run`` is timed. Setups reuse the production code
+(scan, KB write) so every scenario measures the real implementation on the
+generated tree rather than a mock.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from benchmarks.generator import GeneratedTree
+from oops.core.compat import Any, Dict, List
+
+Setup = Callable[[GeneratedTree, Path], Any]
+Run = Callable[[Any], Any]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A named, timed operation on a generated tree."""
+
+    name: str
+    description: str
+    setup: Setup
+    run: Run
+
+
+def _scan_all(tree: GeneratedTree) -> List[Dict[str, Any]]:
+    from oops.kb.scanner import scan_module
+    from oops.kb.xml_scanner import scan_module_xml
+
+    results = []
+    for module in tree.modules:
+        scan = scan_module(module, "odoo", module.parent)
+        scan.update(scan_module_xml(module, "odoo", module.parent))
+        results.append(scan)
+    return results
+
+
+def _write_kb(tree: GeneratedTree, db_path: Path) -> Path:
+    from oops.kb.store import write_global_kb
+
+    if db_path.exists():
+        db_path.unlink()
+    write_global_kb(db_path, "17.0", {"odoo": str(tree.core_root)}, _scan_all(tree))
+    return db_path
+
+
+# --- kb/scanner -----------------------------------------------------------
+
+
+def _run_scanner(tree: GeneratedTree) -> int:
+    from oops.kb.scanner import scan_module
+
+    return sum(len(scan_module(m, "odoo", m.parent)["symbols"]) for m in tree.modules)
+
+
+# --- kb/xml_scanner -------------------------------------------------------
+
+
+def _run_xml_scanner(tree: GeneratedTree) -> int:
+    from oops.kb.xml_scanner import scan_module_xml
+
+    return sum(len(scan_module_xml(m, "odoo", m.parent)["views"]) for m in tree.modules)
+
+
+# --- kb/store -------------------------------------------------------------
+
+
+def _setup_store_write(tree: GeneratedTree, workdir: Path) -> tuple:
+    return tree, workdir / "bench_write.db", _scan_all(tree)
+
+
+def _run_store_write(state: tuple) -> None:
+    from oops.kb.store import write_global_kb
+
+    tree, db_path, scans = state
+    if db_path.exists():
+        db_path.unlink()
+    write_global_kb(db_path, "17.0", {"odoo": str(tree.core_root)}, scans)
+
+
+def _setup_store_read(tree: GeneratedTree, workdir: Path) -> tuple:
+    db_path = _write_kb(tree, workdir / "bench_read.db")
+    models = []
+    for module in tree.modules:
+        for i in range(tree.spec.models_per_module):
+            models.append(f"{module.name.replace('_', '.')}.m{i}")
+    return db_path, models
+
+
+def _run_store_read(state: tuple) -> int:
+    from oops.kb.store import KBReader
+
+    db_path, models = state
+    hits = 0
+    with KBReader(db_path) as kb:
+        kb.get_modules()
+        for model in models:
+            hits += len(kb.get_model_symbols(model))
+            hits += len(kb.get_model_creators(model))
+            kb.get_model_inherits(model)
+    return hits
+
+
+# --- io/refactor ----------------------------------------------------------
+
+
+def _setup_refactor(tree: GeneratedTree, workdir: Path) -> tuple:
+    from oops.kb.store import KBReader
+
+    db_path = _write_kb(tree, workdir / "bench_refactor.db")
+    with KBReader(db_path) as kb:
+        modules_index = kb.get_modules()
+    files = [(m.name, f) for m in tree.local for f in sorted((m / "models").glob("model_*.py"))]
+    return db_path, modules_index, files
+
+
+def _run_refactor(state: tuple) -> int:
+    from oops.io.refactor import analyse_file
+    from oops.kb.store import KBReader
+
+    db_path, modules_index, files = state
+    classes = 0
+    with KBReader(db_path) as kb:
+        for module, py_file in files:
+            classes += len(analyse_file(py_file, kb, modules_index, module))
+    return classes
+
+
+# --- io/file.find_addons --------------------------------------------------
+
+
+def _run_find_addons(tree: GeneratedTree) -> int:
+    from oops.io.file import find_addons
+
+    return sum(1 for _ in find_addons(tree.root))
+
+
+# --- depends show ---------------------------------------------------------
+
+
+def _setup_depends(tree: GeneratedTree, workdir: Path) -> tuple:
+    from oops.io.manifest import load_manifest
+
+    odoo_kb = {
+        m.name: {"depends": load_manifest(m).get("depends", []), "origin": "odoo"}
+        for m in tree.modules
+        if m not in tree.local
+    }
+    return tree, odoo_kb
+
+
+def _run_depends(state: tuple) -> dict:
+    from oops.commands.depends.show import compute_dependency_metrics, expand_to_transitive_closure
+    from oops.io.file import find_addons
+
+    tree, odoo_kb = state
+    addons = [
+        {"name": a.technical_name, "depends": a.depends, "origin": "local", "location": None}
+        for a in find_addons(tree.root, shallow=True)
+    ]
+    expand_to_transitive_closure(addons, odoo_kb)
+    return compute_dependency_metrics(addons)
+
+
+def _tree_only(tree: GeneratedTree, workdir: Path) -> GeneratedTree:
+    return tree
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    s.name: s
+    for s in (
+        Scenario("kb.scanner", "Python AST scan of every module", _tree_only, _run_scanner),
+        Scenario("kb.xml_scanner", "XML scan of every module", _tree_only, _run_xml_scanner),
+        Scenario("kb.store.write", "Write a KB from precomputed scans", _setup_store_write, _run_store_write),
+        Scenario("kb.store.read", "KBReader lookups for every model", _setup_store_read, _run_store_read),
+        Scenario("io.refactor", "analyse_file on every local model file", _setup_refactor, _run_refactor),
+        Scenario("io.find_addons", "Recursive addon discovery from the root", _tree_only, _run_find_addons),
+        Scenario("depends.show", "Closure + metrics of `oops depends show`", _setup_depends, _run_depends),
+    )
+}
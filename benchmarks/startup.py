@@ -0,0 +1,125 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: startup.py — benchmarks/startup.py
+
+"""Startup latency of the pre-commit hook entry points.
+
+Hooks run once per commit in a fresh interpreter, so what matters is the
+cost of importing the entry point and locating the repository, not the
+steady-state speed measured by the scenarios. Each sample runs ``python -m
+benchmarks.startup <module> <repo|context>`` in a throwaway git repository;
+the child times its own import and repository lookup and reports whether
+GitPython got imported, the parent times the whole process.
+
+Results are plain JSON::
+
+    {"repeat": 5, "hooks": {"oops-check-manifest": {"wall_ms": 410.2,
+     "import_ms": 352.8, "repo_ms": 0.3, "gitpython": false}, ...}}
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.memory import _child_env
+from oops.core.compat import Any, Dict, List, Optional
+
+# Entry points of .pre-commit-hooks.yaml → (module, how it locates the repository).
+HOOKS: Dict[str, tuple] = {
+    "oops-update-readme": ("oops.commands.readme.update", "context"),
+    "oops-exclude-addons": ("oops.commands.project.exclude", "context"),
+    "oops-check-project": ("oops.commands.project.check", "context"),
+    "oops-check-manifest": ("oops.commands.manifest.check", "context"),
+    "oops-check-requirements": ("oops.commands.requirements.check", "context"),
+    "oops-check-submodules": ("oops.commands.submodules.check", "repo"),
+}
+
+
+def _init_repo(path: Path) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+    git = ["git", "-c", "user.name=bench", "-c", "user.email=bench@example.invalid"]
+    subprocess.run([*git, "init", "-q"], cwd=path, check=True)
+    (path / "README.md").write_text("bench\n", encoding="utf-8")
+    subprocess.run([*git, "add", "."], cwd=path, check=True)
+    subprocess.run([*git, "commit", "-qm", "init"], cwd=path, check=True)
+
+
+def measure_startup(
+    names: Optional[List[str]] = None,
+    repeat: int = 5,
+    workdir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Time the hook entry points from a cold interpreter.
+
+    Args:
+        names: hooks to measure (keys of :data:`HOOKS`); all by default.
+        repeat: processes started per hook; medians are reported.
+        workdir: where to create the git repository; a temporary directory otherwise.
+
+    Returns:
+        The measurement dict (see the module docstring).
+
+    Raises:
+        subprocess.CalledProcessError: if an entry point fails to import.
+    """
+    hooks: Dict[str, Any] = {}
+    with contextlib.ExitStack() as stack:
+        base = workdir or Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="oops-bench-")))
+        repo = base / "repo"
+        _init_repo(repo)
+        for name in names or list(HOOKS):
+            module, lookup = HOOKS[name]
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                output = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.startup", module, lookup],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                    cwd=str(repo),
+                    env=_child_env(),
+                ).stdout
+                sample = json.loads(output.splitlines()[-1])
+                sample["wall_ms"] = (time.perf_counter() - start) * 1000
+                samples.append(sample)
+            hooks[name] = {
+                "wall_ms": round(statistics.median(s["wall_ms"] for s in samples), 1),
+                "import_ms": round(statistics.median(s["import_ms"] for s in samples), 1),
+                "repo_ms": round(statistics.median(s["repo_ms"] for s in samples), 2),
+                "gitpython": any(s["gitpython"] for s in samples),
+            }
+    return {"repeat": repeat, "hooks": hooks}
+
+
+def _child(module: str, lookup: str) -> Dict[str, Any]:
+    start = time.perf_counter()
+    importlib.import_module(module)
+    imported = time.perf_counter()
+    if lookup == "repo":
+        from oops.services.git import require_repository
+
+        require_repository()
+    else:
+        from oops.services.repository import require_repo_context
+
+        require_repo_context()
+    done = time.perf_counter()
+    return {
+        "import_ms": (imported - start) * 1000,
+        "repo_ms": (done - imported) * 1000,
+        "gitpython": "git" in sys.modules,
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(_child(sys.argv[1], sys.argv[2])))
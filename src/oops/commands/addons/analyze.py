@@ -68,54 +68,101 @@ JSON output — IR v2 (--format json)::
       ]
     }
 
+JSON Lines output — IR v2 stream (--format jsonl)::
+
+    The same IR, streamed as one compact, self-describing record per line
+    while modules are analysed (bounded memory, immediate first byte).
+    Every record carries a "record" discriminator ("type" is already a field
+    attribute); node records also carry their "module":
+
+    {"record": "metadata", "schema_version": 2, "...": "..."}
+    {"record": "module", "module": "project_management", "manifest": {...}, "metrics": {...}, "...": "..."}
+    {"record": "model", "module": "project_management", "id": "project_management:project.project", "...": "..."}
+    {"record": "field", "module": "project_management", "id": "...#field:dev_hours", "...": "..."}
+    {"record": "method", "module": "project_management", "id": "...#method:_compute_dev_hours", "...": "..."}
+    {"record": "view", "module": "project_management", "id": "project_management.portal_tasks_list", "...": "..."}
+    {"record": "summary", "modules": 1, "warnings": ["..."]}
+
 Origins use one enum everywhere: {core, enterprise, oca, third_party, custom}
 (oca is currently folded into third_party — see metadata.limitations).
 
 --format html is temporarily unavailable while the HTML report is migrated to
 this IR; use --format json or --format text.
+
+Single-module fast path: ``oops addons analyze <module>`` skips the
+project-wide checks (root drift) and, when the project KB is otherwise
+fresh, re-scans only the module and its in-project dependencies whose files
+changed since the KB was written. Its LOC share is computed against the
+cached per-addon totals of the last full count (``.oops-cache/loc.json``);
+``--project-loc`` recounts every root addon and refreshes that cache. Without
+a cached count the share is left out.
+
+Parallel analysis (--jobs N): modules are sharded across N worker
+processes, each with its own read-only connection to the project KB. Results
+are merged back in argument order, so the report is identical to a serial run.
+
+Watch mode (--watch): after the first report, the analysed addons are watched
+for changes. Each save re-scans only the touched addons into the project KB,
+re-analyses them and renders the report again (json: rewrites --output-path).
 """
 
 from __future__ import annotations
 
 import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Iterator
 
 import click
 from oops.commands.base import command
+from oops.core.cache import record_access
+from oops.core.compat import Any, Dict, List, Optional
 from oops.core.config import AnalyzeConfig, config
 from oops.core.exceptions import OopsError
 from oops.core.logger import live_progress, log
 from oops.core.metadata import get_metadata, update_metadata
 from oops.core.models import ClassSummary, ModuleSummary, Result, ResultCollection, StructureSummary, ViewsSummary
 from oops.core.paths import global_kb_path, project_kb_path
-from oops.io.file import detect_readme, find_addons
+from oops.core.profiling import span
+from oops.io.file import detect_readme
 from oops.io.installed_modules import read_installed_modules
 from oops.io.manifest import load_manifest
 from oops.io.python_imports import discover_imported_files
 from oops.io.refactor import ClassInfo, SymbolInfo, analyse_file
-from oops.kb.build import build_project_kb, compute_root_drift, is_project_kb_stale
+from oops.kb.build import (
+    build_project_kb,
+    changed_project_modules,
+    compute_root_drift,
+    is_project_kb_stale,
+    refresh_project_kb,
+)
 from oops.kb.scanner import build_module_field_refs
 from oops.kb.store import KBReader
 from oops.output.formatters import (
     FormatterRegistry,
     JsonFormatter,
+    JsonLinesFormatter,
     OutputFormatter,
     SpaReportFormatter,
     SummaryConsoleFormatter,
 )
-from oops.output.sinks import deliver
+from oops.output.sinks import JsonLinesSink, deliver
 from oops.services.git import require_repository
 from oops.services.kb import set_kb_metadata
-from oops.services.loc import get_addon_loc
+from oops.services.loc import count_project_loc, get_addon_loc, load_project_loc
 from oops.services.project import require_project
+from oops.services.watch import refresh_modules, report_cycle, watch_modules
 from oops.utils.helpers import deep_visit
 
 from .domain_profile import compute_domain_profile
-from .presenters.analyze import AnalyzePresenter
+from .presenters.analyze import AnalyzePresenter, iter_module_records
 
 FORMATTERS: FormatterRegistry = {
     "text": SummaryConsoleFormatter,
     "json": JsonFormatter,
+    "jsonl": JsonLinesFormatter,
     "html": SpaReportFormatter,
 }
 
@@ -141,10 +188,13 @@ FORMATTERS: FormatterRegistry = {
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["text", "json", "html"]),
+    type=click.Choice(["text", "json", "jsonl", "html"]),
     default="text",
     show_default=True,
-    help="Output format. 'json' is suited for downstream LLM agent consumption.",
+    help=(
+        "Output format. 'json' is suited for downstream LLM agent consumption; "
+        "'jsonl' streams one compact record per module/model/field/method/view."
+    ),
 )
 @click.option(
     "--output-path",
@@ -153,6 +203,26 @@ FORMATTERS: FormatterRegistry = {
     default=None,
     help="Write the output to this path instead of stdout (json) or a temp file (html).",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of worker processes analysing modules in parallel.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    default=False,
+    help="Keep running: re-analyse addons as their files change.",
+)
+@click.option(
+    "--project-loc",
+    is_flag=True,
+    default=False,
+    help="Single module: recount the LOC of every root addon for its project share (refreshes the cached count).",
+)
 @click.pass_context
 def main(  # noqa: C901, PLR0912, PLR0915
     ctx,
@@ -160,13 +230,22 @@ def main(  # noqa: C901, PLR0912, PLR0915
     refresh: bool,
     output_format: str,
     output_path: Path,
+    jobs: int,
+    watch: bool,
+    project_loc: bool,
 ) -> None:
 
+    if watch and output_format == "jsonl":
+        raise click.UsageError("--watch cannot be combined with --format jsonl.")
+    if watch and output_format == "html" and output_path is None:
+        raise click.UsageError("--watch with --format html needs --output-path (the report is rewritten in place).")
+
     metadata = get_metadata()
 
     formatter: OutputFormatter = FORMATTERS[output_format]()
 
-    json_mode = output_format == "json"
+    json_mode = output_format in ("json", "jsonl")
+    stream_mode = output_format == "jsonl"
     results: ResultCollection[ModuleSummary] = ResultCollection(title="Addons analyze")
     if not json_mode:
         results.add_warning("This command is experimental and may change without notice between releases.")
@@ -174,6 +253,8 @@ def main(  # noqa: C901, PLR0912, PLR0915
     resolved_paths = [mp.resolve() for mp in module_paths]
     _, repo_path = require_repository()
     odoo_image = require_project(repo_path)
+    # One module, no forced rebuild: keep the work proportional to that module.
+    fast = len(resolved_paths) == 1 and not refresh
 
     # 1. Long-running processing — produces a typed Result of domain dataclasses.
 
@@ -181,7 +262,7 @@ def main(  # noqa: C901, PLR0912, PLR0915
         version = str(odoo_image.major_version)
         info = read_installed_modules(repo_path)
 
-        if info is not None:
+        if info is not None and not fast:
             _gkb = global_kb_path(version)
             _odoo_mods: set[str] = set()
             if _gkb.exists():
@@ -202,7 +283,8 @@ def main(  # noqa: C901, PLR0912, PLR0915
                     f"(will not be scanned by the project KB): {extra}"
                 )
 
-        stale, reason = is_project_kb_stale(repo_path, version)
+        with span("kb.stale"):
+            stale, reason = is_project_kb_stale(repo_path, version)
         needs_build = refresh or stale
 
         kb_path: Path | None = None
@@ -217,7 +299,8 @@ def main(  # noqa: C901, PLR0912, PLR0915
             why = "forced via --refresh" if refresh else f"stale: {reason}"
             results.add_warning(f"Rebuilding project KB: {why}")
             try:
-                kb_result = build_project_kb(repo_path, version, info.modules)
+                with span("kb.build", modules=len(info.modules)):
+                    kb_result = build_project_kb(repo_path, version, info.modules)
             except FileNotFoundError as exc:
                 raise OopsError(str(exc)) from None
             results.merge(kb_result)
@@ -228,108 +311,81 @@ def main(  # noqa: C901, PLR0912, PLR0915
                 raise OopsError(f"Project KB not found: {kb_path}")
 
         assert kb_path is not None
+        record_access(kb_path, "kb-project", hit=not needs_build)
+
+        if fast and not needs_build:
+            with span("kb.refresh"):
+                results.merge(_refresh_changed(repo_path, kb_path, resolved_paths[0].name))
+
+        with span("loc"):
+            total_loc = _total_loc(repo_path, resolved_paths, recount=project_loc)
+        if total_loc is None and not json_mode:
+            results.add_warning("LOC share left out: no cached project count yet (run once with --project-loc).")
+
+        # JSON Lines streams each module's records as soon as it is analysed
+        # instead of accumulating the whole IR; metadata is stamped up front
+        # so the leading record already describes the stream.
+        set_kb_metadata(repo_path, version)
+        _stamp_ir_metadata()
+        sink = JsonLinesSink(output_path) if stream_mode else nullcontext()
+
+        with sink, KBReader(kb_path) as kb:
+            # The fast path only needs the module's dependency closure to resolve symbols.
+            modules_index = kb.get_modules_closure([resolved_paths[0].name]) if fast else kb.get_modules()
+            weights = {**AnalyzeConfig().domain_weights, **config.analyze.domain_weights}
+
+            if stream_mode:
+                sink.write({"record": "metadata", **(metadata.to_dict() if metadata else {})})
+
+            analysed = _analyse_modules(resolved_paths, kb_path, kb, modules_index, total_loc, weights, jobs)
+            for module_result in analysed:
+                if stream_mode:
+                    for record in iter_module_records(module_result):
+                        sink.write(record)
+                else:
+                    results.add(module_result)
+
+            if stream_mode:
+                sink.write({"record": "summary", "modules": len(resolved_paths), "warnings": results.warnings})
+
+    if stream_mode:
+        return
 
-        if len(resolved_paths) == 1:
-            try:
-                _, _root = require_repository()
-                total_loc = sum(get_addon_loc(a.path).total for a in find_addons(_root, shallow=True))
-            except Exception:
-                total_loc = get_addon_loc(str(resolved_paths[0])).total
-        else:
-            total_loc = sum(get_addon_loc(str(mp)).total for mp in resolved_paths)
-
-        with KBReader(kb_path) as kb:
-            modules_index = kb.get_modules()
-
-            for i, module_path in enumerate(resolved_paths, start=1):
-                log.info(f"Analysing {module_path.name} ({i}/{len(resolved_paths)})...")
-                module_name = module_path.name
-                module_result: Result[ModuleSummary] = Result()
-
-                manifest = load_manifest(module_path)
-                if not manifest:
-                    module_result.add_warning(f"{module_name}: no manifest found — header will show <unknown>")
-
-                models_dir = module_path / "models"
-                model_py_files = discover_imported_files(models_dir)
-
-                if not model_py_files:
-                    if models_dir.is_dir():
-                        module_result.add_warning(f"{module_name}: models/ has no imported .py files")
-                    else:
-                        module_result.add_warning(f"{module_name}: no models/ directory")
-
-                module_local_refs = build_module_field_refs(model_py_files)
-
-                all_classes: list[ClassSummary] = []
-                all_class_infos: list[ClassInfo] = []
-                method_symbols: list[dict] = []
-                for py_file in model_py_files:
-                    rel_file = f"{module_name}/{py_file.relative_to(module_path).as_posix()}"
-                    class_infos = analyse_file(py_file, kb, modules_index, module_name, module_local_refs)
-                    for ci in class_infos:
-                        ci.source_file = rel_file  # IR v2: own-module source path
-                        all_class_infos.append(ci)
-                        cs = _summarize_class(ci)
-                        cs.missing_description = cs.is_new_model and not ci.description
-                        cs.resolved_description = ci.description
-                        if not cs.is_new_model and cs.inherit:
-                            creators = kb.get_model_creators(cs.inherit[0])
-                            if creators:
-                                best = creators[0]
-                                cs.ancestor_model = cs.inherit[0]
-                                cs.ancestor_module = best["module"]
-                                cs.ancestor_origin = best["origin"]
-                                if not cs.resolved_description and best.get("description"):
-                                    cs.resolved_description = best["description"]
-                                    cs.description_inherited_from = best["module"]
-                        all_classes.append(cs)
-                        model_label = ci.model_name or (ci.inherit[0] if ci.inherit else "")
-                        method_symbols.extend(
-                            {
-                                "model": model_label,
-                                "kind": "method",
-                                "name": s.name,
-                                "section": s.section,
-                                "line_start": s.lineno,
-                                "line_end": s.end_lineno,
-                                "source_file": rel_file,
-                                "is_override": s.is_override,
-                                "has_docstring": s.has_docstring,
-                            }
-                            for s in ci.symbols
-                            if s.kind == "method"
-                        )
-
-                views_summary, xml_analysed = _build_views_summary(module_name, manifest, kb)
-                structure = _build_structure(module_path, manifest, xml_analysed)
-                loc = get_addon_loc(str(module_path))
-                loc_pct = round(100.0 * loc.total / total_loc, 1) if total_loc else 0.0
-
-                module_result.data = ModuleSummary(
-                    module_name=module_name,
-                    module_path=module_path,
-                    manifest=manifest,
-                    classes=all_classes,
-                    structure=structure,
-                    loc=loc,
-                    loc_pct=loc_pct,
-                    views_summary=views_summary,
-                    method_symbols=method_symbols,
-                    class_infos=all_class_infos,
-                    readme=detect_readme(module_path),
-                )
+    # 2. Presenter prepares neutral dicts according to the formatter's audience.
+    output = AnalyzePresenter().prepare(results, target=formatter.target, metadata=metadata)
+    deliver(formatter, output, output_format, output_path)
 
-                weights = {**AnalyzeConfig().domain_weights, **config.analyze.domain_weights}
-                module_result.data.domain_profile = compute_domain_profile(
-                    module_result.data, kb, weights
-                )
+    if not watch:
+        return
+
+    # 3. Watch: re-scan and re-analyse only the touched addons, then re-render.
+    by_path = dict(zip(resolved_paths, results.items))
+    try:
+        for touched in watch_modules(resolved_paths):
+            t0 = time.perf_counter()
+            refreshed = refresh_modules(repo_path, touched)
+            for warning in refreshed.warnings + refreshed.errors:
+                log.warning(warning)
+            with KBReader(kb_path) as kb:
+                modules_index = kb.get_modules()
+                for module_path in touched:
+                    with span("analyze.module", module=module_path.name):
+                        by_path[module_path] = _analyse_module(module_path, kb, modules_index, total_loc, weights)
+            results.items = [by_path[p] for p in resolved_paths]
+            output = AnalyzePresenter().prepare(results, target=formatter.target, metadata=metadata)
+            deliver(formatter, output, output_format, output_path)
+            report_cycle(touched, t0)
+    except KeyboardInterrupt:
+        pass
 
-                results.add(module_result)
 
-    set_kb_metadata(repo_path, version)
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
 
-    # IR v2 contract: stamp the schema version and the recorded limitations.
+def _stamp_ir_metadata() -> None:
+    """IR v2 contract: stamp the schema version and the recorded limitations."""
     update_metadata(
         schema_version=2,
         limitations=[
@@ -338,14 +394,173 @@ def main(  # noqa: C901, PLR0912, PLR0915
         ],
     )
 
-    # 2. Presenter prepares neutral dicts according to the formatter's audience.
-    output = AnalyzePresenter().prepare(results, target=formatter.target, metadata=metadata)
-    deliver(formatter, output, output_format, output_path)
 
+def _refresh_changed(repo_path: Path, kb_path: Path, module_name: str) -> "Result[list[str]]":
+    """Re-scan the module and its in-project dependencies edited since the KB was written."""
+    with KBReader(kb_path) as kb:
+        closure = [module_name, *kb.get_depends_chain(module_name)]
+    changed = changed_project_modules(repo_path, closure, kb_path)
+    if not changed:
+        return Result(data=[])
+    log.info(f"Refreshing {', '.join(changed)} in the project KB...")
+    return refresh_project_kb(repo_path, changed)
+
+
+def _total_loc(repo_path: Path, module_paths: List[Path], recount: bool = False) -> Optional[int]:
+    """Return the LOC denominator of the modules' share, None when unknown.
+
+    Several modules share their own total. A single module is measured
+    against the project's root addons: the cached count (with the module's
+    own count swapped in), or a fresh count of every addon with ``recount``.
+    """
+    if len(module_paths) > 1:
+        return sum(get_addon_loc(str(mp)).total for mp in module_paths)
+    totals = count_project_loc(repo_path) if recount else load_project_loc(repo_path)
+    if totals is None:
+        return None
+    module_path = module_paths[0]
+    totals[module_path.name] = get_addon_loc(str(module_path)).total
+    return sum(totals.values())
+
+
+# Per-process state of the --jobs workers, set once by _init_worker.
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(kb_path: Path, modules_index: dict, total_loc: Optional[int], weights: "dict[str, float]") -> None:
+    """Keep what every task of this worker shares: the KB path and the module index."""
+    _WORKER.update(kb_path=kb_path, modules_index=modules_index, total_loc=total_loc, weights=weights)
+
+
+def _analyse_in_worker(module_path: Path) -> Result[ModuleSummary]:
+    state = _WORKER
+    # One read-only connection per task: workers end without running any
+    # cleanup, so a connection held for the worker's lifetime is never closed.
+    with KBReader(state["kb_path"], read_only=True) as kb:
+        return _analyse_module(module_path, kb, state["modules_index"], state["total_loc"], state["weights"])
+
+
+def _analyse_modules(
+    module_paths: List[Path],
+    kb_path: Path,
+    kb: KBReader,
+    modules_index: dict,
+    total_loc: Optional[int],
+    weights: "dict[str, float]",
+    jobs: int = 1,
+) -> Iterator[Result[ModuleSummary]]:
+    """Yield the analysis of every module, in ``module_paths`` order.
+
+    With ``jobs > 1`` modules are sharded across worker processes (each task
+    opening ``kb_path`` read-only); results still come out in order, as
+    soon as the leading ones are ready.
+    """
+    if jobs <= 1 or len(module_paths) <= 1:
+        for i, module_path in enumerate(module_paths, start=1):
+            log.info(f"Analysing {module_path.name} ({i}/{len(module_paths)})...")
+            with span("analyze.module", module=module_path.name):
+                yield _analyse_module(module_path, kb, modules_index, total_loc, weights)
+        return
+
+    workers = min(jobs, len(module_paths))
+    log.info(f"Analysing {len(module_paths)} modules with {workers} workers...")
+    pool = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(kb_path, modules_index, total_loc, weights)
+    )
+    with span("analyze.pool", modules=len(module_paths), jobs=workers), pool:
+        yield from pool.map(_analyse_in_worker, module_paths)
+
+
+def _analyse_module(  # noqa: C901
+    module_path: Path,
+    kb: KBReader,
+    modules_index: dict,
+    total_loc: Optional[int],
+    weights: "dict[str, float]",
+) -> Result[ModuleSummary]:
+    """Analyse one module against the project KB and return its typed summary."""
+    module_name = module_path.name
+    module_result: Result[ModuleSummary] = Result()
+
+    manifest = load_manifest(module_path)
+    if not manifest:
+        module_result.add_warning(f"{module_name}: no manifest found — header will show <unknown>")
+
+    models_dir = module_path / "models"
+    model_py_files = discover_imported_files(models_dir)
+
+    if not model_py_files:
+        if models_dir.is_dir():
+            module_result.add_warning(f"{module_name}: models/ has no imported .py files")
+        else:
+            module_result.add_warning(f"{module_name}: no models/ directory")
+
+    module_local_refs = build_module_field_refs(model_py_files)
+
+    all_classes: list[ClassSummary] = []
+    all_class_infos: list[ClassInfo] = []
+    method_symbols: list[dict] = []
+    for py_file in model_py_files:
+        rel_file = f"{module_name}/{py_file.relative_to(module_path).as_posix()}"
+        class_infos = analyse_file(py_file, kb, modules_index, module_name, module_local_refs)
+        for ci in class_infos:
+            ci.source_file = rel_file  # IR v2: own-module source path
+            all_class_infos.append(ci)
+            cs = _summarize_class(ci)
+            cs.missing_description = cs.is_new_model and not ci.description
+            cs.resolved_description = ci.description
+            if not cs.is_new_model and cs.inherit:
+                creators = kb.get_model_creators(cs.inherit[0])
+                if creators:
+                    best = creators[0]
+                    cs.ancestor_model = cs.inherit[0]
+                    cs.ancestor_module = best["module"]
+                    cs.ancestor_origin = best["origin"]
+                    if not cs.resolved_description and best.get("description"):
+                        cs.resolved_description = best["description"]
+                        cs.description_inherited_from = best["module"]
+            all_classes.append(cs)
+            model_label = ci.model_name or (ci.inherit[0] if ci.inherit else "")
+            method_symbols.extend(
+                {
+                    "model": model_label,
+                    "kind": "method",
+                    "name": s.name,
+                    "section": s.section,
+                    "line_start": s.lineno,
+                    "line_end": s.end_lineno,
+                    "source_file": rel_file,
+                    "is_override": s.is_override,
+                    "has_docstring": s.has_docstring,
+                }
+                for s in ci.symbols
+                if s.kind == "method"
+            )
+
+    views_summary, xml_analysed = _build_views_summary(module_name, manifest, kb)
+    structure = _build_structure(module_path, manifest, xml_analysed)
+    loc = get_addon_loc(str(module_path))
+    if total_loc is None:
+        loc_pct = None
+    else:
+        loc_pct = round(100.0 * loc.total / total_loc, 1) if total_loc else 0.0
+
+    module_result.data = ModuleSummary(
+        module_name=module_name,
+        module_path=module_path,
+        manifest=manifest,
+        classes=all_classes,
+        structure=structure,
+        loc=loc,
+        loc_pct=loc_pct,
+        views_summary=views_summary,
+        method_symbols=method_symbols,
+        class_infos=all_class_infos,
+        readme=detect_readme(module_path),
+    )
+    module_result.data.domain_profile = compute_domain_profile(module_result.data, kb, weights)
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
+    return module_result
 
 
 def _summarize_class(ci: ClassInfo) -> ClassSummary:
@@ -9,15 +9,19 @@ Produces a deterministic ``domain_profile`` dict from a ``ModuleSummary`` + KB,
 quantifying how much a module touches each Odoo functional domain (Sales,
 Accounting, …) and which transversal pillars it touches.
 
+Models are classified by the KB's precomputed ``model_domains`` table: every
+model the module touches is looked up in a single query.
+
 Public entry point:
     compute_domain_profile(summary, kb, weights) -> dict
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING
 
-from oops.kb.domains import EXCLUDED_TECHNICAL_MODULES, PILLAR_MODULES, domain_label
+from oops.core.compat import Any, Dict, List, Optional, Set, Tuple
+from oops.kb.domains import domain_label
 
 if TYPE_CHECKING:
     from oops.core.models import ModuleSummary
@@ -48,40 +52,20 @@ def _empty_indicators() -> Dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
-def _classify_model(model: str, kb: "KBReader") -> Tuple[str, Optional[str]]:
+def _classify_model(model: str, domains: Dict[str, Dict[str, Any]]) -> Tuple[str, Optional[str]]:
     """Return (kind, anchor) for a model based on its creator's owning app.
 
     kind:   'noise'  — technical; skip.
             'pillar' — transversal pillar module.
             'domain' — functional Odoo application.
     anchor: app or pillar technical name (None for noise).
-    """
-    creators = kb.get_model_creators(model)
-    if not creators:
-        return ("noise", None)
-
-    creator_module = creators[0]["module"]
-
-    if creator_module in EXCLUDED_TECHNICAL_MODULES:
-        return ("noise", None)
-
-    if creator_module in PILLAR_MODULES:
-        return ("pillar", creator_module)
 
-    app = kb.get_module_app(creator_module)
-
-    if app is None:
+    ``domains`` is the result of :meth:`KBReader.get_model_domains`.
+    """
+    entry = domains.get(model)
+    if entry is None:
         return ("noise", None)
-
-    if app in EXCLUDED_TECHNICAL_MODULES:
-        # Owning app is a technical module (e.g. mail=application in Odoo 18).
-        # The creator module itself is not technical — use it as the domain anchor.
-        return ("domain", creator_module)
-
-    if app in PILLAR_MODULES:
-        return ("pillar", app)
-
-    return ("domain", app)
+    return (entry["kind"], entry["anchor"])
 
 
 # ---------------------------------------------------------------------------
@@ -89,25 +73,8 @@ def _classify_model(model: str, kb: "KBReader") -> Tuple[str, Optional[str]]:
 # ---------------------------------------------------------------------------
 
 
-def _resolve_new_model_domain(ci: Any, kb: "KBReader") -> Tuple[str, Optional[str]]:
-    """Attribute a brand-new custom model to a domain/pillar via structural links.
-
-    Priority:
-      1. _inherits parents (via KB model_origins).
-      2. First required Many2one comodel (source-line order).
-      3. First Many2one comodel (source-line order).
-
-    Returns ('noise', None) when no link can be classified.
-    """
-    model_name = ci.model_name or ""
-
-    # 1. _inherits parents
-    for parent in kb.get_model_inherits(model_name):
-        kind, anchor = _classify_model(parent, kb)
-        if kind in ("domain", "pillar"):
-            return (kind, anchor)
-
-    # 2 & 3. Many2one fields, sorted by source line
+def _m2o_candidates(ci: Any) -> List[str]:
+    """Many2one comodels of a class: required first, then any (source-line order, deduplicated)."""
     m2o_fields = sorted(
         (
             s
@@ -119,24 +86,58 @@ def _resolve_new_model_domain(ci: Any, kb: "KBReader") -> Tuple[str, Optional[st
         ),
         key=lambda s: s.lineno,
     )
-
-    # Required first, then any
     required_m2o = [s for s in m2o_fields if s.field_details.get("required")]
-    candidates = required_m2o + m2o_fields  # required first, rest after
 
-    seen_comodels: set = set()
-    for sym in candidates:
+    comodels: List[str] = []
+    for sym in required_m2o + m2o_fields:
         comodel = sym.field_details.get("comodel")
-        if not comodel or comodel in seen_comodels:
-            continue
-        seen_comodels.add(comodel)
-        kind, anchor = _classify_model(comodel, kb)
+        if comodel not in comodels:
+            comodels.append(comodel)
+    return comodels
+
+
+def _resolve_new_model_domain(
+    ci: Any, parents: List[str], domains: Dict[str, Dict[str, Any]]
+) -> Tuple[str, Optional[str]]:
+    """Attribute a brand-new custom model to a domain/pillar via structural links.
+
+    Priority:
+      1. _inherits parents (via KB model_origins).
+      2. First required Many2one comodel (source-line order).
+      3. First Many2one comodel (source-line order).
+
+    Args:
+        ci:      ClassInfo of the new model.
+        parents: Its _inherits parents (:meth:`KBReader.get_model_inherits`).
+        domains: Classification of the candidate models.
+
+    Returns ('noise', None) when no link can be classified.
+    """
+    # 1. _inherits parents
+    for parent in parents:
+        kind, anchor = _classify_model(parent, domains)
+        if kind in ("domain", "pillar"):
+            return (kind, anchor)
+
+    # 2 & 3. Many2one comodels, required first
+    for comodel in _m2o_candidates(ci):
+        kind, anchor = _classify_model(comodel, domains)
         if kind in ("domain", "pillar"):
             return (kind, anchor)
 
     return ("noise", None)
 
 
+def _touched_models(pairs: List[Tuple[Any, Any]], parents: Dict[str, List[str]], vs: Any) -> Set[str]:
+    """Models to classify: extended models, new models' _inherits parents and Many2one comodels, view models."""
+    touched = {ci.inherit[0] for _, ci in pairs if not ci.is_new_model and ci.inherit}
+    touched.update(model for models in parents.values() for model in models)
+    touched.update(comodel for _, ci in pairs if ci.is_new_model for comodel in _m2o_candidates(ci))
+    if vs is not None:
+        touched.update(view["model"] for view in vs.view_list if view.get("model"))
+    return touched
+
+
 # ---------------------------------------------------------------------------
 # Main computation
 # ---------------------------------------------------------------------------
@@ -172,16 +173,21 @@ def compute_domain_profile(
     custom_models = 0
 
     pairs = list(zip(summary.classes, summary.class_infos))
+    vs = summary.views_summary
+
+    # Classify every model the module touches with a single KB query.
+    parents = {ci.model_name: kb.get_model_inherits(ci.model_name or "") for _, ci in pairs if ci.is_new_model}
+    model_domains = kb.get_model_domains(_touched_models(pairs, parents, vs))
 
     for cs, ci in pairs:
         is_new = ci.is_new_model
 
         # Determine anchor via model classification.
         if is_new:
-            kind, anchor = _resolve_new_model_domain(ci, kb)
+            kind, anchor = _resolve_new_model_domain(ci, parents[ci.model_name], model_domains)
         else:
             target_model = ci.inherit[0] if ci.inherit else ""
-            kind, anchor = _classify_model(target_model, kb)
+            kind, anchor = _classify_model(target_model, model_domains)
 
         if kind == "noise" or anchor is None:
             if is_new:
@@ -224,13 +230,12 @@ def compute_domain_profile(
                 ind["loc"] += max(0, sym.end_lineno - sym.lineno)
 
     # views: classify by model, attribute to anchor
-    vs = summary.views_summary
     if vs is not None:
         for view in vs.view_list:
             vmodel = view.get("model")
             if not vmodel:
                 continue
-            vkind, vanchor = _classify_model(vmodel, kb)
+            vkind, vanchor = _classify_model(vmodel, model_domains)
             if vkind == "noise" or vanchor is None:
                 continue
             if vanchor not in anchors:
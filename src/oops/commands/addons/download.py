@@ -9,9 +9,14 @@ Download addons from a GitHub repository branch.
 Clones the repository over SSH (depth=1) into a temporary directory,
 discovers addon directories, and copies them into the current project.
 Downloaded addons are added to .gitignore (unless --no-exclude is passed).
+
+With --addons, only the selected addons are fetched: the clone is blobless
+(--filter=blob:none) with a sparse checkout of those directories, so
+transfer and disk usage follow the selection rather than the repository
+(--no-sparse clones everything). Files are hardlinked, or reflinked, into
+the project when possible instead of being copied.
 """
 
-import shutil
 import tempfile
 from pathlib import Path
 
@@ -22,11 +27,11 @@ from oops.core.compat import Optional
 from oops.core.exceptions import APIError
 from oops.core.logger import live_progress, log
 from oops.core.models import Result
-from oops.io.file import file_updater, find_addons, read_tagged_block
+from oops.io.file import copytree, file_updater, find_addons, read_tagged_block
 from oops.output.formatters import OutputFormatter, SimpleSummaryConsoleFormatter
 from oops.services.git import commit_v2, require_repository
 from oops.utils.helpers import str_to_list
-from oops.utils.net import encode_url
+from oops.utils.net import encode_url, sparse_clone
 
 from .presenters.download import DownloadPresenter
 
@@ -36,7 +41,12 @@ from .presenters.download import DownloadPresenter
 @click.argument("branch")
 @click.option("--addons", "addons_list", help="Comma-separated addon names to copy (copies all if omitted).")
 @click.option("--exclude/--no-exclude", is_flag=True, default=True, help="Add downloaded addons to .gitignore.")
-def main(url: str, branch: str, exclude: bool, addons_list: Optional[str] = None):
+@click.option(
+    "--sparse/--no-sparse",
+    default=True,
+    help="With --addons, fetch only the selected addons (blobless partial clone + sparse checkout).",
+)
+def main(url: str, branch: str, exclude: bool, sparse: bool, addons_list: Optional[str] = None):
     formatter: OutputFormatter = SimpleSummaryConsoleFormatter()
 
     result: Result[dict] = Result()
@@ -46,25 +56,34 @@ def main(url: str, branch: str, exclude: bool, addons_list: Optional[str] = None
     ssh_url = encode_url(url, "ssh")
     addons = [] if addons_list is None else str_to_list(addons_list)
 
-    with tempfile.TemporaryDirectory() as tmpdirname:
+    # Clone inside the project's git directory: on the same filesystem, so files
+    # can be hardlinked rather than copied, yet outside the worktree, so an
+    # interrupted run never leaves a nested repository behind in it.
+    with tempfile.TemporaryDirectory(dir=repo.git_dir, prefix="oops-download-") as tmpdirname:
         tmpdir = Path(tmpdirname)
 
         with live_progress("Downloading addons…"):
-            log.info(f"Cloning {ssh_url} ({branch})…")
             try:
-                git.Repo.clone_from(ssh_url, str(tmpdir), depth=1, branch=branch)
+                if addons and sparse:
+                    log.info(f"Fetching {len(addons)} addon(s) from {ssh_url} ({branch})…")
+                    sparse_clone(ssh_url, tmpdir, [f"/{name}/" for name in addons], branch)
+                else:
+                    log.info(f"Cloning {ssh_url} ({branch})…")
+                    git.Repo.clone_from(ssh_url, str(tmpdir), depth=1, branch=branch)
             except git.GitCommandError as exc:
                 raise APIError(f"Clone failed: {exc.stderr.strip()}") from exc
 
+            found = set()
             for addon in find_addons(tmpdir):
                 if addons and addon.technical_name not in addons:
                     continue
+                found.add(addon.technical_name)
 
                 target_path = repo_path / addon.technical_name
 
                 # FIXME: check version before copying
                 try:
-                    shutil.copytree(addon.path, target_path)
+                    copytree(addon.path, target_path, hardlink=True)
                 except FileExistsError:
                     result.add_warning(f"Skipped (already exists): {addon.technical_name}")
                     result.data["rows"].append({"addon": addon.technical_name, "action": "skipped"})
@@ -73,6 +92,10 @@ def main(url: str, branch: str, exclude: bool, addons_list: Optional[str] = None
                 log.info(f"Downloaded {addon.technical_name}")
                 result.data["rows"].append({"addon": addon.technical_name, "action": "downloaded"})
 
+            for name in addons:
+                if name not in found:
+                    result.add_warning(f"Not found in {url} ({branch}): {name}")
+
     new_addons = [r["addon"] for r in result.data["rows"] if r["action"] == "downloaded"]
 
     # TODO: do something here...
@@ -12,18 +12,24 @@ processed; real directories are skipped.
 
 By default all symlinks found at the repository root are processed.
 Use --include to restrict to a subset, or --exclude to skip specific addons.
+
+Addons are copied in parallel (--jobs) and files are reflinked when the
+filesystem supports it (btrfs, XFS), so no data is duplicated until a file
+is edited; elsewhere the copy happens in the kernel via copy_file_range.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import click
 from oops.commands.base import command, render_and_exit
 from oops.core.compat import Optional
 from oops.core.logger import live_progress, log
 from oops.core.models import Result
-from oops.io.file import materialize_symlink
+from oops.io.file import CopyStats, materialize_symlink
 from oops.output.formatters import OutputFormatter, SimpleSummaryConsoleFormatter
 from oops.services.git import commit_v2, require_repository
 from oops.utils.helpers import str_to_list
-from oops.utils.render import human_readable
+from oops.utils.render import format_bytes, human_readable
 
 from .presenters.materialize import MaterializePresenter
 
@@ -41,10 +47,18 @@ from .presenters.materialize import MaterializePresenter
     metavar="ADDONS",
     help="Comma-separated list of addon names to skip.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    default=4,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of addons copied in parallel.",
+)
 @click.option("--dry-run", is_flag=True, help="Show what would happen, do nothing.")
 @click.option("--no-commit", is_flag=True, help="Do not commit changes")
 @click.pass_context
-def main(ctx, include: Optional[str], exclude: Optional[str], dry_run: bool, no_commit: bool):
+def main(ctx, include: Optional[str], exclude: Optional[str], jobs: int, dry_run: bool, no_commit: bool):
     if include and exclude:
         raise click.UsageError("--include and --exclude are mutually exclusive.")
 
@@ -65,24 +79,52 @@ def main(ctx, include: Optional[str], exclude: Optional[str], dry_run: bool, no_
         candidates = [p for p in candidates if p.name not in exclude_set]
 
     changes = []
+    total = CopyStats()
+
+    def _materialize(addon_path):
+        log.info(f"Materializing {addon_path.name}…")
+        try:
+            return materialize_symlink(addon_path, dry_run=False), None
+        except Exception as error:
+            return None, error
 
     with live_progress("Materializing addons…"):
-        for addon_path in candidates:
+        if dry_run:
+            outcomes = [(None, None)] * len(candidates)
+        else:
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                outcomes = list(pool.map(_materialize, candidates))
+
+        for addon_path, (stats, error) in zip(candidates, outcomes):
             if dry_run:
                 result.data["rows"].append({"addon": addon_path.name, "action": "planned"})
                 continue
-
-            log.info(f"Materializing {addon_path.name}…")
-            try:
-                materialize_symlink(addon_path, dry_run=False)
-            except Exception as error:
+            if error is not None:
                 result.add_error(f"Failed to materialize {addon_path.name}: {error}")
                 result.data["rows"].append({"addon": addon_path.name, "action": "failed"})
                 continue
 
-            result.data["rows"].append({"addon": addon_path.name, "action": "materialized"})
+            total.merge(stats)
+            result.data["rows"].append(
+                {
+                    "addon": addon_path.name,
+                    "action": "materialized",
+                    "files": stats.files,
+                    "bytes": stats.bytes,
+                    "cloned_bytes": stats.cloned_bytes,
+                }
+            )
             changes.append(addon_path)
 
+    if changes:
+        result.data["bytes"] = total.bytes
+        result.data["cloned_bytes"] = total.cloned_bytes
+        result.data["methods"] = total.methods
+        log.info(
+            f"Materialized {format_bytes(total.bytes)}: {format_bytes(total.cloned_bytes)} cloned, "
+            f"{format_bytes(total.bytes - total.cloned_bytes)} copied"
+        )
+
     if not no_commit and changes and not dry_run:
         commit_result = commit_v2(
             repo,
@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+from typing import Iterator
+
 from oops.core.compat import TYPE_CHECKING, Optional
 from oops.core.models import (
     ClassSummary,
@@ -256,7 +258,7 @@ def _build_manifest(summary: "ModuleSummary") -> StatGroup:
     return res
 
 
-def _build_loc(data: "Optional[LocStats]", pct: float = 0.0) -> StatGroup:
+def _build_loc(data: "Optional[LocStats]", pct: Optional[float] = 0.0) -> StatGroup:
 
     # Back to default values, aka 0
     if data is None:
@@ -274,7 +276,7 @@ def _build_loc(data: "Optional[LocStats]", pct: float = 0.0) -> StatGroup:
             _l("javascript", data.javascript),
             _l("docs", data.docs),
             _l("total", data.total),
-            _l("pct", f"{pct}%", kind="text"),
+            _l("pct", f"{pct}%" if pct is not None else "—", kind="text"),
         ],
     )
 
@@ -611,6 +613,91 @@ def _loc_raw(summary: "ModuleSummary") -> dict:
     }
 
 
+def module_ir(result: "Result[ModuleSummary]") -> dict:
+    """Build the IR v2 payload of one analysed module (one ``modules[]`` entry)."""
+    summary = result.unwrap
+    module = summary.module_name
+
+    # ClassSummary (ancestor enrichment) paired with raw ClassInfo
+    # (enriched symbols/content) — aligned 1:1 by the analyze loop.
+    pairs = list(zip(summary.classes, summary.class_infos))
+    in_repo_models = {_canonical_model(ci) for _, ci in pairs}
+    in_repo_methods = {
+        (_canonical_model(ci), sym.name) for _, ci in pairs for sym in ci.symbols if sym.kind == "method"
+    }
+
+    models = _model_nodes(module, pairs)
+    fields = _field_nodes(module, pairs, in_repo_models, in_repo_methods)
+    methods = _method_nodes(module, pairs)
+    views = _view_nodes(module, summary.views_summary, in_repo_models)
+
+    s = summary.structure
+    not_analysed: list[str] = []
+    if s.data:
+        not_analysed.append("data")
+    if s.demo:
+        not_analysed.append("demo")
+    if s.controllers_py:
+        not_analysed.append("controllers/")
+    if s.wizard_py:
+        not_analysed.append("wizard/")
+    if s.report_py:
+        not_analysed.append("report/")
+    if s.static_by_ext:
+        not_analysed.append("static/")
+
+    return {
+        "module": module,
+        "manifest": _manifest_raw(summary),
+        "readme": summary.readme or {"present": False, "format": None, "path": None, "content": None},
+        "depends": summary.manifest.get("depends", []),
+        "models": models,
+        "fields": fields,
+        "methods": methods,
+        "views": views,
+        "structure": {
+            "data": s.data,
+            "demo": s.demo,
+            "controllers_py": s.controllers_py,
+            "wizard_py": s.wizard_py,
+            "report_py": s.report_py,
+            "static_by_ext": s.static_by_ext,
+        },
+        "metrics": _derived_metrics(summary, models, fields, methods),
+        "loc": _loc_raw(summary),
+        "domain_profile": summary.domain_profile,
+        "not_analysed": not_analysed,
+        "warnings": result.warnings,
+    }
+
+
+# IR v2 flat lists → JSON Lines record type (one record per node).
+_RECORD_TYPES = (
+    ("models", "model"),
+    ("fields", "field"),
+    ("methods", "method"),
+    ("views", "view"),
+)
+
+
+def iter_module_records(result: "Result[ModuleSummary]") -> Iterator[dict]:
+    """Yield the JSON Lines records of one analysed module.
+
+    The first record (``record == "module"``) carries every module-level key of
+    the IR v2 payload except the four flat lists; each node of those lists
+    follows as its own record (``model``, ``field``, ``method``, ``view``),
+    tagged with the owning ``module`` so every line is self-describing.
+    """
+    payload = module_ir(result)
+    nodes = {key: payload.pop(key) for key, _ in _RECORD_TYPES}
+    module = payload["module"]
+
+    yield {"record": "module", **payload}
+    for key, record_type in _RECORD_TYPES:
+        for node in nodes[key]:
+            yield {"record": record_type, "module": module, **node}
+
+
 class AnalyzePresenter(Presenter[ResultCollection[ModuleSummary]]):
     def to_human(self, results: ResultCollection[ModuleSummary]) -> SummaryLayout:
         """Reduced payload for console output."""
@@ -627,63 +714,7 @@ class AnalyzePresenter(Presenter[ResultCollection[ModuleSummary]]):
     def to_machine(self, results: ResultCollection[ModuleSummary]) -> dict:
         """Full IR v2 payload: four flat sibling lists of id-addressable nodes."""
 
-        def _make(result: "Result[ModuleSummary]") -> dict:
-            summary = result.unwrap
-            module = summary.module_name
-
-            # ClassSummary (ancestor enrichment) paired with raw ClassInfo
-            # (enriched symbols/content) — aligned 1:1 by the analyze loop.
-            pairs = list(zip(summary.classes, summary.class_infos))
-            in_repo_models = {_canonical_model(ci) for _, ci in pairs}
-            in_repo_methods = {
-                (_canonical_model(ci), sym.name) for _, ci in pairs for sym in ci.symbols if sym.kind == "method"
-            }
-
-            models = _model_nodes(module, pairs)
-            fields = _field_nodes(module, pairs, in_repo_models, in_repo_methods)
-            methods = _method_nodes(module, pairs)
-            views = _view_nodes(module, summary.views_summary, in_repo_models)
-
-            s = summary.structure
-            not_analysed: list[str] = []
-            if s.data:
-                not_analysed.append("data")
-            if s.demo:
-                not_analysed.append("demo")
-            if s.controllers_py:
-                not_analysed.append("controllers/")
-            if s.wizard_py:
-                not_analysed.append("wizard/")
-            if s.report_py:
-                not_analysed.append("report/")
-            if s.static_by_ext:
-                not_analysed.append("static/")
-
-            return {
-                "module": module,
-                "manifest": _manifest_raw(summary),
-                "readme": summary.readme or {"present": False, "format": None, "path": None, "content": None},
-                "depends": summary.manifest.get("depends", []),
-                "models": models,
-                "fields": fields,
-                "methods": methods,
-                "views": views,
-                "structure": {
-                    "data": s.data,
-                    "demo": s.demo,
-                    "controllers_py": s.controllers_py,
-                    "wizard_py": s.wizard_py,
-                    "report_py": s.report_py,
-                    "static_by_ext": s.static_by_ext,
-                },
-                "metrics": _derived_metrics(summary, models, fields, methods),
-                "loc": _loc_raw(summary),
-                "domain_profile": summary.domain_profile,
-                "not_analysed": not_analysed,
-                "warnings": result.warnings,
-            }
-
         return {
             "warnings": results.warnings,
-            "modules": [_make(r) for r in results],
+            "modules": [module_ir(r) for r in results],
         }
@@ -8,6 +8,7 @@ from __future__ import annotations
 from oops.core.models import Result
 from oops.output.base import SimplePresenter
 from oops.output.layout import ConclusionBlock, MetricsPanelBlock, SimpleSummaryLayout, TableBlock
+from oops.utils.render import format_bytes
 
 
 class MaterializePresenter(SimplePresenter[dict]):
@@ -27,8 +28,9 @@ class MaterializePresenter(SimplePresenter[dict]):
             columns=[
                 ("Addon", "brand.primary", "left"),
                 ("Status", "green", "left"),
+                ("Size", "dim", "right"),
             ],
-            rows=[[row["addon"], row["action"]] for row in rows],
+            rows=[[row["addon"], row["action"], format_bytes(row["bytes"]) if "bytes" in row else ""] for row in rows],
         )
 
         panel = MetricsPanelBlock(
@@ -39,6 +41,10 @@ class MaterializePresenter(SimplePresenter[dict]):
                 ["Failed", str(counts["failed"])],
             ],
         )
+        if "bytes" in data:
+            copied = data["bytes"] - data.get("cloned_bytes", 0)
+            panel.values.append(["Cloned", format_bytes(data.get("cloned_bytes", 0))])
+            panel.values.append(["Copied", format_bytes(copied)])
 
         dry_run = data.get("dry_run", False)
         all_ok = result.ok and counts["failed"] == 0
@@ -25,6 +25,11 @@ What the tool does
   `refactor/doc-multi` for several) and produces one commit per module
   whose body lists every rewritten file.
 
+With --jobs N, modules are analysed and rewritten by N worker processes,
+each with its own read-only connection to the project KB. A module's files
+are only ever written by the worker handling that module; reporting and git
+commits stay in the main process, in argument order.
+
 What the tool does NOT do
 -------------------------
 - It never modifies method bodies.
@@ -35,11 +40,16 @@ What the tool does NOT do
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterator
 
 import click
 from git import GitCommandError
 from oops.commands.base import command
+from oops.core.cache import record_access
+from oops.core.compat import Any, Dict, List, Optional
 from oops.core.config import config
 from oops.core.exceptions import OopsError
 from oops.core.logger import log
@@ -96,6 +106,14 @@ from oops.utils.render import human_readable, print_rule, print_success, print_w
     default=False,
     help="Force a project KB rebuild before running, even if the KB looks fresh.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of worker processes rewriting modules in parallel.",
+)
 @click.option("--verbose", "-v", is_flag=True, default=False)
 def main(  # noqa: C901, PLR0912, PLR0915
     module_paths: tuple[Path, ...],
@@ -104,6 +122,7 @@ def main(  # noqa: C901, PLR0912, PLR0915
     no_commit: bool,
     dry_run: bool,
     refresh: bool,
+    jobs: int,
     verbose: bool,
 ) -> None:
 
@@ -184,6 +203,7 @@ def main(  # noqa: C901, PLR0912, PLR0915
                 print_warning(w)
         elif not kb_path.exists():
             raise OopsError(f"Project KB not found: {kb_path}")
+        record_access(kb_path, "kb-project", hit=not needs_build)
     else:
         # --kb was passed explicitly; skip all staleness logic.
         local_repo = None
@@ -221,71 +241,18 @@ def main(  # noqa: C901, PLR0912, PLR0915
 
         grand_total = 0
 
-        for module_path in resolved_paths:
+        for outcome in _refactor_modules(resolved_paths, kb_path, kb, modules_index, dry_run, jobs):
+            module_path = outcome.module_path
             module_name = module_path.name
             print_rule(f"oops refactor — {module_name}")
 
-            # --- Process model files ---
-            models_dir = module_path / "models"
-            if not models_dir.is_dir():
-                print_warning(f"{module_name}: no models/ directory — skipping")
+            if outcome.skipped:
+                print_warning(outcome.skipped)
                 continue
+            for rel in outcome.would_rewrite:
+                click.echo(f"  would rewrite {rel}")
 
-            py_files = sorted(models_dir.rglob("*.py"))
-            if not py_files:
-                print_warning(f"{module_name}: no .py files in models/ — skipping")
-                continue
-
-            # Build a module-level field→method ref index so cross-file links
-            # within this module are visible to analyse_file().
-            module_local_refs = build_module_field_refs(py_files)
-
-            total_rewrites = 0
-            rewritten_rels: list[str] = []
-
-            for py_file in py_files:
-                rel = py_file.relative_to(module_path)
-                log.info("Analysing %s…", rel)
-
-                classes = analyse_file(py_file, kb, modules_index, module_name, module_local_refs)
-                if not classes:
-                    log.debug("  No Odoo model classes found, skipping.")
-                    continue
-
-                for ci in classes:
-                    model_tag = ci.model_name or "+".join(ci.inherit) or "?"
-                    n_fields = sum(1 for s in ci.symbols if s.kind == "field")
-                    n_methods = sum(1 for s in ci.symbols if s.kind == "method")
-                    n_nodoc = sum(1 for s in ci.symbols if s.kind == "method" and not s.has_docstring)
-                    n_override = sum(1 for s in ci.symbols if s.is_override)
-                    log.info(
-                        "  %s (%s): %d fields, %d methods (%d need docstring, %d overrides)",
-                        ci.class_name,
-                        model_tag,
-                        n_fields,
-                        n_methods,
-                        n_nodoc,
-                        n_override,
-                    )
-
-                if dry_run:
-                    new_source = rewrite_file(py_file, classes)
-                    if new_source != py_file.read_text(encoding="utf-8"):
-                        click.echo(f"  would rewrite {rel}")
-                    continue
-
-                original = py_file.read_text(encoding="utf-8", errors="replace")
-                new_source = rewrite_file(py_file, classes)
-
-                if new_source == original:
-                    log.debug("  No changes needed for %s", rel)
-                    continue
-
-                py_file.write_text(new_source, encoding="utf-8")
-                log.info("  Rewritten: %s", rel)
-                total_rewrites += 1
-                rewritten_rels.append(str(rel))
-
+            rewritten_rels = outcome.rewritten
             if not dry_run and rewritten_rels and local_repo is not None and repo_path is not None:
                 file_paths = [str((module_path / rel).relative_to(repo_path)) for rel in rewritten_rels]
                 if no_commit:
@@ -301,9 +268,129 @@ def main(  # noqa: C901, PLR0912, PLR0915
                         description=human_readable(rewritten_rels, sep="\n"),
                     )
 
-            grand_total += total_rewrites
+            grand_total += len(rewritten_rels)
 
         if not dry_run:
             print_success(f"Done — {grand_total} file(s) rewritten across {len(resolved_paths)} module(s).")
             if branch and grand_total:
                 click.echo(f"  Branch: {branch_name}")
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _ModuleOutcome:
+    """What refactoring one module did, reported back to the main process."""
+
+    module_path: Path
+    skipped: Optional[str] = None
+    rewritten: List[str] = field(default_factory=list)
+    would_rewrite: List[str] = field(default_factory=list)
+
+
+def _refactor_module(module_path: Path, kb: KBReader, modules_index: dict, dry_run: bool) -> _ModuleOutcome:
+    """Analyse and rewrite the model files of one module (no output, no git)."""
+    module_name = module_path.name
+    outcome = _ModuleOutcome(module_path)
+
+    # --- Process model files ---
+    models_dir = module_path / "models"
+    if not models_dir.is_dir():
+        outcome.skipped = f"{module_name}: no models/ directory — skipping"
+        return outcome
+
+    py_files = sorted(models_dir.rglob("*.py"))
+    if not py_files:
+        outcome.skipped = f"{module_name}: no .py files in models/ — skipping"
+        return outcome
+
+    # Build a module-level field→method ref index so cross-file links
+    # within this module are visible to analyse_file().
+    module_local_refs = build_module_field_refs(py_files)
+
+    for py_file in py_files:
+        rel = py_file.relative_to(module_path)
+        log.info("Analysing %s…", rel)
+
+        classes = analyse_file(py_file, kb, modules_index, module_name, module_local_refs)
+        if not classes:
+            log.debug("  No Odoo model classes found, skipping.")
+            continue
+
+        for ci in classes:
+            model_tag = ci.model_name or "+".join(ci.inherit) or "?"
+            n_fields = sum(1 for s in ci.symbols if s.kind == "field")
+            n_methods = sum(1 for s in ci.symbols if s.kind == "method")
+            n_nodoc = sum(1 for s in ci.symbols if s.kind == "method" and not s.has_docstring)
+            n_override = sum(1 for s in ci.symbols if s.is_override)
+            log.info(
+                "  %s (%s): %d fields, %d methods (%d need docstring, %d overrides)",
+                ci.class_name,
+                model_tag,
+                n_fields,
+                n_methods,
+                n_nodoc,
+                n_override,
+            )
+
+        if dry_run:
+            new_source = rewrite_file(py_file, classes)
+            if new_source != py_file.read_text(encoding="utf-8"):
+                outcome.would_rewrite.append(str(rel))
+            continue
+
+        original = py_file.read_text(encoding="utf-8", errors="replace")
+        new_source = rewrite_file(py_file, classes)
+
+        if new_source == original:
+            log.debug("  No changes needed for %s", rel)
+            continue
+
+        py_file.write_text(new_source, encoding="utf-8")
+        log.info("  Rewritten: %s", rel)
+        outcome.rewritten.append(str(rel))
+
+    return outcome
+
+
+# Per-process state of the --jobs workers, set once by _init_worker.
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(kb_path: Path, modules_index: dict, dry_run: bool) -> None:
+    """Keep what every task of this worker shares: the KB path and the module index."""
+    _WORKER.update(kb_path=kb_path, modules_index=modules_index, dry_run=dry_run)
+
+
+def _refactor_in_worker(module_path: Path) -> _ModuleOutcome:
+    # One read-only connection per task, closed with it (see addons analyze).
+    with KBReader(_WORKER["kb_path"], read_only=True) as kb:
+        return _refactor_module(module_path, kb, _WORKER["modules_index"], _WORKER["dry_run"])
+
+
+def _refactor_modules(
+    module_paths: List[Path],
+    kb_path: Path,
+    kb: KBReader,
+    modules_index: dict,
+    dry_run: bool,
+    jobs: int = 1,
+) -> Iterator[_ModuleOutcome]:
+    """Yield the outcome of every module, in ``module_paths`` order.
+
+    With ``jobs > 1`` whole modules are dispatched to worker processes, so
+    every file is written by exactly one worker.
+    """
+    if jobs <= 1 or len(module_paths) <= 1:
+        for module_path in module_paths:
+            yield _refactor_module(module_path, kb, modules_index, dry_run)
+        return
+
+    workers = min(jobs, len(module_paths))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(kb_path, modules_index, dry_run)
+    ) as pool:
+        yield from pool.map(_refactor_in_worker, module_paths)
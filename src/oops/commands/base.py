@@ -6,13 +6,15 @@
 from __future__ import annotations
 
 import time
+from pathlib import Path
 from typing import Any
 
 import click
-from oops.core.compat import TYPE_CHECKING
+from oops.core.compat import TYPE_CHECKING, Optional
 from oops.core.config import config
-from oops.core.exceptions import AppAbort, ConfigurationError, EarlyExit, OopsError
+from oops.core.exceptions import ConfigurationError, EarlyExit, OopsError
 from oops.core.metadata import collect_metadata
+from oops.core.profiling import Tracer, get_tracer, span, start_profiling, stop_profiling
 from oops.output.sinks import deliver
 from oops.services.stats import append_event, maybe_flush
 
@@ -44,8 +46,103 @@ def _cmd_name(ctx: click.Context) -> str:
     return " ".join(p for p in parts if p)
 
 
+def _store_in_meta(ctx: click.Context, param: click.Parameter, value: Any) -> Any:
+    """Keep an option out of the callback kwargs: stash it in ``ctx.meta``."""
+    ctx.meta[f"oops.{param.name}"] = value
+    return value
+
+
+def _profile_options() -> list[click.Option]:
+    """Options injected into every :class:`OopsCommand`.
+
+    They are not exposed to callbacks (``expose_value=False``): ``ctx.invoke``
+    fills in the defaults of exposed params only, so a command invoking
+    another one in-process must not receive them either.
+    """
+    return [
+        click.Option(
+            ["--profile"],
+            is_flag=True,
+            default=False,
+            expose_value=False,
+            callback=_store_in_meta,
+            help="Print per-phase timings and counters (KB queries, subprocesses, bytes written) on stderr.",
+        ),
+        click.Option(
+            ["--profile-trace", "profile_trace"],
+            type=click.Path(dir_okay=False, path_type=Path),
+            default=None,
+            expose_value=False,
+            callback=_store_in_meta,
+            help="Write a Chrome trace-event JSON file (chrome://tracing, Perfetto). Implies --profile.",
+        ),
+    ]
+
+
+def _error_label(exc: BaseException) -> Optional[str]:
+    """Return how a failed run is recorded in the usage stats, None for a clean exit."""
+    if isinstance(exc, click.Abort):
+        # User cancellation (Ctrl-C, AppAbort) — not an error.
+        return None
+    if isinstance(exc, (click.exceptions.Exit, SystemExit)):
+        code = exc.exit_code if isinstance(exc, click.exceptions.Exit) else exc.code
+        return f"Exit({code})" if isinstance(code, int) and code != 0 else None
+    return type(exc).__name__
+
+
+def _report_profile(tracer: Tracer, trace_path: Optional[Path]) -> None:
+    """Print the phase/counter summary on stderr and export the trace if asked."""
+    from oops.output.serializers import to_json_line  # noqa: PLC0415
+    from oops.utils.render import get_error_console, make_table  # noqa: PLC0415
+
+    phases = tracer.summary()
+    wall = sum(p.total for p in phases if p.depth == 0) or 1.0
+    rows = [
+        [
+            f"{'  ' * p.depth}{p.name}",
+            str(p.calls),
+            f"{p.total * 1000:.1f}",
+            f"{p.self_time * 1000:.1f}",
+            f"{100 * p.total / wall:.1f}",
+        ]
+        for p in phases
+    ]
+    console = get_error_console()
+    console.print(
+        make_table(
+            "Profile",
+            [
+                ("Phase", None, "left"),
+                ("Calls", None, "right"),
+                ("Total ms", None, "right"),
+                ("Self ms", "dim", "right"),
+                ("%", None, "right"),
+            ],
+            rows,
+            expand=False,
+        )
+    )
+    if tracer.counters:
+        counters = [[name, f"{value:,}"] for name, value in sorted(tracer.counters.items())]
+        console.print(make_table(None, [("Counter", None, "left"), ("Value", None, "right")], counters, expand=False))
+
+    if trace_path is not None:
+        trace_path.write_text(to_json_line(tracer.chrome_trace()), encoding="utf-8")
+        click.echo(f"Trace written to {trace_path}", err=True)
+
+
 class OopsCommand(click.Command):
-    """Base Click command that validates config and tracks usage."""
+    """Base Click command that validates config and tracks usage.
+
+    Every command also accepts ``--profile`` / ``--profile-trace``: the run is
+    recorded by :mod:`oops.core.profiling` and summarised on exit. A command
+    invoked in-process by another one (e.g. ``project doc`` → ``addons
+    analyze``) shows up as a nested phase of the outer profile.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.params.extend(_profile_options())
 
     def invoke(self, ctx: click.Context) -> Any:
         # Trigger lazy config load before the callback runs.
@@ -61,6 +158,12 @@ class OopsCommand(click.Command):
         t0 = time.monotonic()
         error = None
 
+        trace_path = ctx.meta.get("oops.profile_trace")
+        profile = ctx.meta.get("oops.profile", False) or trace_path is not None
+        owns_tracer = profile and get_tracer() is None
+        if owns_tracer:
+            start_profiling()
+
         # Collect metadata before the callback runs.
         # `ctx.params` is the dict of already-parsed CLI options.
         ctx.ensure_object(dict)
@@ -70,42 +173,14 @@ class OopsCommand(click.Command):
         )
 
         try:
-            return super().invoke(ctx)
+            with span(cmd or self.name or "command"):
+                return super().invoke(ctx)
         except EarlyExit:
             # Clean intentional stop requested from anywhere in the call stack.
             ctx.exit(0)
-        except AppAbort:
-            # User cancellation — Click handles display and exit code.
-            raise
-
-        except OopsError as exc:
-            # Business error — Click handles display and exit code.
-            error = type(exc).__name__
-            raise
-
-        except click.UsageError as exc:
-            # Bad CLI usage — Click prints the message and the command help.
-            error = type(exc).__name__
-            raise
-
-        except click.ClickException as exc:
-            # Any other Click-level exception not covered above.
-            error = type(exc).__name__
-            raise
-
-        except click.exceptions.Exit as exc:
-            # Exit(0) is a voluntary clean exit — not an error.
-            if exc.exit_code != 0:
-                error = f"Exit({exc.exit_code})"
-            raise
-        except click.Abort:
-            # User-initiated abort (Ctrl-C / raise Abort()) — not an error.
-            raise
-        except SystemExit as exc:
-            # Direct sys.exit() calls — record non-zero codes.
-            code = exc.code
-            if isinstance(code, int) and code != 0:
-                error = f"Exit({code})"
+        except (click.ClickException, click.Abort, click.exceptions.Exit, SystemExit) as exc:
+            # Business errors, bad usage, aborts and exits — Click handles display and exit code.
+            error = _error_label(exc)
             raise
         except Exception as exc:
             # Unexpected Python exception: wrap for consistent output.
@@ -113,11 +188,22 @@ class OopsCommand(click.Command):
             error = type(exc).__name__
             raise OopsError(f"Unexpected error: {exc}") from exc
         finally:
-            ms = round((time.monotonic() - t0) * 1000, 1)
-            try:
-                append_event(cmd, ms, error)
-            except Exception:  # noqa: BLE001
-                pass
+            self._finish(cmd, round((time.monotonic() - t0) * 1000, 1), error, owns_tracer, trace_path)
+
+    @staticmethod
+    def _finish(cmd: str, ms: float, error: Optional[str], owns_tracer: bool, trace_path: Optional[Path]) -> None:
+        """Record the run, run cache housekeeping and report the profile."""
+        try:
+            append_event(cmd, ms, error)
+        except Exception:  # noqa: BLE001
+            pass
+        from oops.core.cache import maybe_housekeep  # noqa: PLC0415  # keeps sqlite3 out of CLI startup
+
+        maybe_housekeep()
+        if owns_tracer:
+            tracer = stop_profiling()
+            if tracer is not None:
+                _report_profile(tracer, trace_path)
 
 
 def command(*args: Any, **kwargs: Any):
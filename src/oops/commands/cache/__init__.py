@@ -0,0 +1,6 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: __init__.py — oops/commands/cache/__init__.py
+
+"""Inspect and bound the oops caches (KBs, artifacts, HTTP responses, sources)."""
@@ -0,0 +1,100 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: clear.py — oops/commands/cache/clear.py
+
+"""oops cache clear — remove every evictable cache entry, or those of some caches.
+
+Pinned caches (source checkouts, usage stats) are never removed. Cleared
+caches are rebuilt on their next use — for global KBs, that means running
+oops misc build-kb (or oops kb unpack) again.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+from oops.commands.base import command
+from oops.core.cache import CacheIndex
+from oops.core.metadata import get_metadata
+from oops.core.models import Result
+from oops.output.formatters import (
+    FormatterRegistry,
+    JsonFormatter,
+    OutputFormatter,
+    SimpleSummaryConsoleFormatter,
+)
+from oops.output.sinks import deliver
+
+from .common import entry_row, owner_option
+from .presenters.cache import CacheEvictPresenter
+
+FORMATTERS: FormatterRegistry = {
+    "text": SimpleSummaryConsoleFormatter,
+    "json": JsonFormatter,
+}
+
+
+@command("clear", help=__doc__)
+@owner_option
+@click.option(
+    "--counters",
+    is_flag=True,
+    default=False,
+    help="Also reset the hit/miss counters.",
+)
+@click.option(
+    "-y",
+    "--yes",
+    is_flag=True,
+    help="Skip confirmation prompt",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Output format. 'json' is suited for downstream LLM agent consumption.",
+)
+@click.option(
+    "--output-path",
+    "output_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the output to this path instead of stdout.",
+)
+def main(
+    owners: "tuple[str, ...]",
+    counters: bool,
+    yes: bool,
+    output_format: str,
+    output_path: Path | None,
+) -> None:
+
+    formatter: OutputFormatter = FORMATTERS[output_format]()
+
+    scope = ", ".join(owners) if owners else "all evictable caches"
+    if not yes and not click.confirm(f"Clear {scope}?", default=False):
+        raise click.Abort()
+
+    with CacheIndex() as index:
+        index.scan()
+        evicted = index.evict(0, owners=list(owners) or None, grace=0)
+        if counters:
+            index.reset_counters()
+        remaining = index.total_size()
+
+    result: Result[dict] = Result()
+    result.data = {
+        "cmd": f"Clear {scope}",
+        "dry_run": False,
+        "evicted": [entry_row(entry) for entry in evicted],
+        "freed": sum(entry.size for entry in evicted),
+        "size": remaining,
+        "max_size": None,
+    }
+
+    output = CacheEvictPresenter().prepare(result, target=formatter.target, metadata=get_metadata())
+    deliver(formatter, output, output_format, output_path)
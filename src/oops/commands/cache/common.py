@@ -0,0 +1,31 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: common.py — oops/commands/cache/common.py
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import click
+from oops.core.cache import CACHE_OWNERS, CacheEntry
+from oops.core.config import config
+
+owner_option = click.option(
+    "--owner",
+    "owners",
+    multiple=True,
+    type=click.Choice(sorted(CACHE_OWNERS)),
+    help="Only consider the entries of this cache (repeatable).",
+)
+
+
+def entry_row(entry: CacheEntry) -> dict:
+    """Return the serialisable row of a cache entry."""
+    return {
+        "path": entry.path,
+        "owner": entry.owner,
+        "size": entry.size,
+        "last_access": datetime.fromtimestamp(entry.last_access).strftime(config.datetime_format),
+        "pinned": entry.pinned,
+    }
@@ -0,0 +1,114 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: cache.py — src/oops/commands/cache/presenters/cache.py
+
+
+from __future__ import annotations
+
+from oops.core.models import Result
+from oops.output.base import SimplePresenter
+from oops.output.layout import ConclusionBlock, MetricsPanelBlock, SimpleSummaryLayout, TableBlock
+from oops.utils.render import format_bytes
+
+
+def _entries_table(entries: "list[dict]") -> TableBlock:
+    return TableBlock(
+        title="",
+        columns=[
+            ("Path", "brand.primary", "left"),
+            ("Cache", "dim", "left"),
+            ("Size", "green", "right"),
+            ("Last access", "dim", "left"),
+        ],
+        rows=[[row["path"], row["owner"], format_bytes(row["size"]), row["last_access"]] for row in entries],
+    )
+
+
+class CacheShowPresenter(SimplePresenter[dict]):
+    def to_machine(self, result: "Result[dict]") -> dict:
+
+        return {
+            "warnings": result.warnings,
+            **result.unwrap,
+        }
+
+    def to_human(self, result: "Result[dict]") -> SimpleSummaryLayout:
+
+        data = result.unwrap
+
+        if data["entries"] is not None:
+            table = _entries_table(data["entries"])
+        else:
+            table = TableBlock(
+                title="",
+                columns=[
+                    ("Cache", "brand.primary", "left"),
+                    ("Entries", "dim", "right"),
+                    ("Size", "green", "right"),
+                    ("Hit rate", "green", "right"),
+                    ("Last access", "dim", "left"),
+                ],
+                rows=[
+                    [
+                        f"{row['owner']} (pinned)" if row["pinned"] else row["owner"],
+                        str(row["entries"]),
+                        format_bytes(row["size"]),
+                        f"{row['hit_rate']:.0%}" if row["hit_rate"] is not None else "—",
+                        row["last_access"] or "—",
+                    ]
+                    for row in data["owners"]
+                ],
+            )
+
+        budget = data["max_size"]
+        panel = MetricsPanelBlock(
+            "Summary",
+            [
+                ["Evictable", format_bytes(data["size"])],
+                ["Budget", format_bytes(budget) if budget is not None else "none"],
+                ["Pinned", format_bytes(data["pinned_size"])],
+            ],
+        )
+
+        over = budget is not None and data["size"] > budget
+        return SimpleSummaryLayout(
+            title=data["cmd"],
+            table=table,
+            panel=panel,
+            conclusion=ConclusionBlock(not over, "Over budget: run oops cache prune" if over else "All done"),
+            warnings=result.warnings,
+            errors=result.errors,
+        )
+
+
+class CacheEvictPresenter(SimplePresenter[dict]):
+    def to_machine(self, result: "Result[dict]") -> dict:
+
+        return {
+            "warnings": result.warnings,
+            **result.unwrap,
+        }
+
+    def to_human(self, result: "Result[dict]") -> SimpleSummaryLayout:
+
+        data = result.unwrap
+
+        panel = MetricsPanelBlock(
+            "Summary",
+            [
+                ["Evicted", str(len(data["evicted"]))],
+                ["Freed", format_bytes(data["freed"])],
+                ["Remaining", format_bytes(data["size"])],
+            ],
+        )
+
+        verb = "Would free" if data["dry_run"] else "Freed"
+        return SimpleSummaryLayout(
+            title=data["cmd"],
+            table=_entries_table(data["evicted"]),
+            panel=panel,
+            conclusion=ConclusionBlock(True, f"{verb} {format_bytes(data['freed'])}"),
+            warnings=result.warnings,
+            errors=result.errors,
+        )
@@ -0,0 +1,111 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: prune.py — oops/commands/cache/prune.py
+
+"""oops cache prune — evict the least recently used cache entries over a size budget.
+
+The budget covers every evictable cache (global and project KBs, KB
+artifacts, HTTP responses, image index); pinned source checkouts and usage
+stats never count nor get evicted. It defaults to cache.max_size from
+.oops.yaml, which oops also enforces on its own at most once an hour.
+
+Entries used in the last five minutes are kept, as another oops process
+may be reading them. Evicted caches are rebuilt on their next use.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+from oops.commands.base import command
+from oops.core.cache import CacheIndex, parse_size
+from oops.core.config import config
+from oops.core.metadata import get_metadata
+from oops.core.models import Result
+from oops.output.formatters import (
+    FormatterRegistry,
+    JsonFormatter,
+    OutputFormatter,
+    SimpleSummaryConsoleFormatter,
+)
+from oops.output.sinks import deliver
+
+from .common import entry_row, owner_option
+from .presenters.cache import CacheEvictPresenter
+
+FORMATTERS: FormatterRegistry = {
+    "text": SimpleSummaryConsoleFormatter,
+    "json": JsonFormatter,
+}
+
+
+@command("prune", help=__doc__)
+@click.option(
+    "--max-size",
+    "max_size",
+    default=None,
+    help="Size budget, e.g. 500M or 10G. Defaults to cache.max_size.",
+)
+@owner_option
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="List what would be evicted without removing anything.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Output format. 'json' is suited for downstream LLM agent consumption.",
+)
+@click.option(
+    "--output-path",
+    "output_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the output to this path instead of stdout.",
+)
+def main(
+    max_size: str | None,
+    owners: "tuple[str, ...]",
+    dry_run: bool,
+    output_format: str,
+    output_path: Path | None,
+) -> None:
+
+    formatter: OutputFormatter = FORMATTERS[output_format]()
+
+    budget = max_size if max_size is not None else config.cache.max_size
+    if budget is None:
+        raise click.UsageError("No size budget: pass --max-size or set cache.max_size in .oops.yaml.")
+    try:
+        limit = parse_size(budget)
+    except ValueError as error:
+        raise click.BadParameter(str(error), param_hint="--max-size") from None
+
+    with CacheIndex() as index:
+        index.scan()
+        evicted = index.evict(limit, owners=list(owners) or None, dry_run=dry_run)
+        remaining = index.total_size()
+
+    result: Result[dict] = Result()
+    result.data = {
+        "cmd": f"{'Would evict' if dry_run else 'Evict'} cache entries over {budget}",
+        "dry_run": dry_run,
+        "evicted": [entry_row(entry) for entry in evicted],
+        "freed": sum(entry.size for entry in evicted),
+        "size": remaining,
+        "max_size": limit,
+    }
+    if not dry_run and remaining > limit:
+        result.add_warning(
+            "Still over budget: the remaining entries were used in the last five minutes or are outside --owner."
+        )
+
+    output = CacheEvictPresenter().prepare(result, target=formatter.target, metadata=get_metadata())
+    deliver(formatter, output, output_format, output_path)
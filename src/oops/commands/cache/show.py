@@ -0,0 +1,109 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: show.py — oops/commands/cache/show.py
+
+"""oops cache show — list the caches, their size and hit rate.
+
+The cache index is first reconciled with the disk: new entries are
+registered, sizes refreshed and removed entries dropped. Source checkouts
+are pinned (never evicted) and only measured with --deep, which walks every
+file they hold.
+
+With --owner, the entries of those caches are listed one by one, least
+recently used first — the order in which oops cache prune evicts them.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+from oops.commands.base import command
+from oops.core.cache import CACHE_OWNERS, CacheIndex, parse_size
+from oops.core.config import config
+from oops.core.metadata import get_metadata
+from oops.core.models import Result
+from oops.output.formatters import (
+    FormatterRegistry,
+    JsonFormatter,
+    OutputFormatter,
+    SimpleSummaryConsoleFormatter,
+)
+from oops.output.sinks import deliver
+
+from .common import entry_row, owner_option
+from .presenters.cache import CacheShowPresenter
+
+FORMATTERS: FormatterRegistry = {
+    "text": SimpleSummaryConsoleFormatter,
+    "json": JsonFormatter,
+}
+
+
+@command("show", help=__doc__)
+@owner_option
+@click.option(
+    "--deep",
+    is_flag=True,
+    default=False,
+    help="Also measure the pinned source checkouts (slow on large trees).",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Output format. 'json' is suited for downstream LLM agent consumption.",
+)
+@click.option(
+    "--output-path",
+    "output_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the output to this path instead of stdout.",
+)
+def main(
+    owners: "tuple[str, ...]",
+    deep: bool,
+    output_format: str,
+    output_path: Path | None,
+) -> None:
+
+    formatter: OutputFormatter = FORMATTERS[output_format]()
+
+    with CacheIndex() as index:
+        index.scan(deep=deep)
+        entries = index.entries()
+        counters = index.counters()
+
+    summary = []
+    for name, spec in CACHE_OWNERS.items():
+        owned = [entry for entry in entries if entry.owner == name]
+        hits, misses = counters.get(name, (0, 0))
+        summary.append(
+            {
+                "owner": name,
+                "entries": len(owned),
+                "size": sum(entry.size for entry in owned),
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 3) if hits + misses else None,
+                "last_access": entry_row(owned[-1])["last_access"] if owned else None,
+                "pinned": spec.pinned,
+            }
+        )
+
+    result: Result[dict] = Result()
+    result.data = {
+        "cmd": "Caches",
+        "owners": summary,
+        "entries": [entry_row(entry) for entry in entries if entry.owner in owners] if owners else None,
+        "size": sum(entry.size for entry in entries if not entry.pinned),
+        "pinned_size": sum(entry.size for entry in entries if entry.pinned),
+        "max_size": parse_size(config.cache.max_size) if config.cache.max_size is not None else None,
+    }
+
+    output = CacheShowPresenter().prepare(result, target=formatter.target, metadata=get_metadata())
+    deliver(formatter, output, output_format, output_path)
@@ -69,7 +69,6 @@ def main(ctx, output_format: str, output_path: Optional[Path]) -> None:
 
     # 2. Long-running processing.
     with live_progress("Initialisation..."):
-        odoo_kb = load_odoo_kb(version)
         subs = list_submodules(repo)
 
         # 2a. Collect local addons.
@@ -86,6 +85,9 @@ def main(ctx, output_format: str, output_path: Optional[Path]) -> None:
                 }
             )
 
+        # Only the Odoo modules reachable from the local depends are loaded.
+        odoo_kb = load_odoo_kb(version, {dep for a in result.data["addons"] for dep in a["depends"]})
+
         # 2b. Walk the dependency chain to pull required Odoo modules.
         truly_unresolved = expand_to_transitive_closure(result.data["addons"], odoo_kb)
         if truly_unresolved:
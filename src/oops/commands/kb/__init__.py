@@ -0,0 +1,6 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: __init__.py — oops/commands/kb/__init__.py
+
+"""Export and import global KB artifacts."""
@@ -0,0 +1,28 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: common.py — oops/commands/kb/common.py
+
+from __future__ import annotations
+
+import click
+from oops.core.compat import Optional
+from oops.io.file import parse_odoo_version
+from oops.services.git import require_repository
+
+
+def resolve_version(version: Optional[str]) -> str:
+    """Return ``version``, or the one declared in the current project's odoo_version.txt.
+
+    Raises:
+        click.UsageError: If no version is given and none can be detected.
+    """
+    if version:
+        return version
+    try:
+        _, repo_path = require_repository()
+        return str(parse_odoo_version(repo_path).major_version)
+    except (FileNotFoundError, click.ClickException, ValueError):
+        raise click.UsageError(
+            "Could not detect Odoo version from odoo_version.txt. Use --version to specify it explicitly."
+        ) from None
@@ -0,0 +1,122 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: pack.py — oops/commands/kb/pack.py
+
+"""oops kb pack — pack the global KB of an Odoo version into an artifact.
+
+EXPERIMENTAL — This command is part of the KB pipeline. Its interface may
+change without notice between releases.
+
+The artifact is a compressed archive named after its content key: the
+SHA-256 of the Odoo source commits the KB was scanned from, the scanner
+version and the KB schema version. It is written to the artifact store
+(~/.cache/oops/kb-artifacts by default, or --store, e.g. a directory shared
+between CI agents) and can be copied elsewhere with --export.
+
+Only a KB built by oops misc build-kb from git checkouts can be packed.
+"""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import click
+from oops.commands.base import command
+from oops.core.cache import record_access
+from oops.core.logger import live_progress
+from oops.core.metadata import get_metadata
+from oops.core.models import Result
+from oops.core.paths import kb_artifacts_dir
+from oops.kb.artifact import ArtifactStore
+from oops.output.formatters import (
+    FormatterRegistry,
+    JsonFormatter,
+    OutputFormatter,
+    SimpleSummaryConsoleFormatter,
+)
+from oops.output.sinks import deliver
+from oops.services.kb import require_kb
+from oops.utils.render import warn_experimental
+
+from .common import resolve_version
+from .presenters.artifact import ArtifactPresenter
+
+FORMATTERS: FormatterRegistry = {
+    "text": SimpleSummaryConsoleFormatter,
+    "json": JsonFormatter,
+}
+
+
+@command("pack", help=__doc__)
+@click.option(
+    "--version",
+    default=None,
+    help="Odoo version string (e.g. 17.0). Defaults to the version declared in the current project's odoo_version.txt.",
+)
+@click.option(
+    "--store",
+    "store_path",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Artifact store directory. Defaults to ~/.cache/oops/kb-artifacts.",
+)
+@click.option(
+    "--export",
+    "export_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Also copy the artifact to this file.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Output format. 'json' is suited for downstream LLM agent consumption.",
+)
+@click.option(
+    "--output-path",
+    "output_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the output to this path instead of stdout.",
+)
+def main(
+    version: str | None,
+    store_path: Path | None,
+    export_path: Path | None,
+    output_format: str,
+    output_path: Path | None,
+) -> None:
+
+    formatter: OutputFormatter = FORMATTERS[output_format]()
+
+    warn_experimental()
+
+    version = resolve_version(version)
+    db_path = require_kb(version)
+    store = ArtifactStore(store_path or kb_artifacts_dir())
+
+    # 1. Pack — an unpackable KB raises ArtifactError (rendered as ✘ <message>).
+    with live_progress("Packing global KB..."):
+        info = store.put(db_path)
+
+    record_access(info.path, "kb-artifacts")
+
+    if export_path is not None:
+        export_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(info.path, export_path)
+
+    result: Result[dict] = Result()
+    result.data = {
+        "cmd": f"Pack global KB for Odoo {version}",
+        "artifact": {**info.to_dict(), "path": str(info.path)},
+        "exported": str(export_path) if export_path else None,
+    }
+
+    # 2. Presenter prepares neutral dicts according to the formatter's audience.
+    output = ArtifactPresenter().prepare(result, target=formatter.target, metadata=get_metadata())
+    deliver(formatter, output, output_format, output_path)
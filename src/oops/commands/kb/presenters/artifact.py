@@ -0,0 +1,61 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: artifact.py — src/oops/commands/kb/presenters/artifact.py
+
+
+from __future__ import annotations
+
+from oops.core.models import Result
+from oops.output.base import SimplePresenter
+from oops.output.layout import ConclusionBlock, MetricsPanelBlock, SimpleSummaryLayout, TableBlock
+from oops.utils.render import format_bytes
+
+
+class ArtifactPresenter(SimplePresenter[dict]):
+    def to_machine(self, result: "Result[dict]") -> dict:
+
+        return {
+            "warnings": result.warnings,
+            **result.unwrap,
+        }
+
+    def to_human(self, result: "Result[dict]") -> SimpleSummaryLayout:
+
+        data = result.unwrap
+        artifact = data["artifact"]
+
+        # Source commits the KB was built from
+        table = TableBlock(
+            title="",
+            columns=[
+                ("Source", "brand.primary", "left"),
+                ("Commit", "dim", "left"),
+            ],
+            rows=[[origin, commit[:12]] for origin, commit in sorted(artifact["sources"].items())],
+        )
+
+        panel = MetricsPanelBlock(
+            "Artifact",
+            [
+                ["Key", artifact["key"][:12]],
+                ["Odoo", artifact["odoo_version"]],
+                ["Schema", str(artifact["schema_version"])],
+                ["Scanner", str(artifact["scanner_version"])],
+                ["Size", format_bytes(artifact["size"])],
+            ],
+        )
+
+        if data.get("installed"):
+            conclusion = f"KB installed at {data['installed']}"
+        else:
+            conclusion = f"Artifact written to {data.get('exported') or artifact['path']}"
+
+        return SimpleSummaryLayout(
+            title=data["cmd"],
+            table=table,
+            panel=panel,
+            conclusion=ConclusionBlock(True, conclusion),
+            warnings=result.warnings,
+            errors=result.errors,
+        )
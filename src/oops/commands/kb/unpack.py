@@ -0,0 +1,152 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: unpack.py — oops/commands/kb/unpack.py
+
+"""oops kb unpack — install the global KB of an Odoo version from an artifact.
+
+EXPERIMENTAL — This command is part of the KB pipeline. Its interface may
+change without notice between releases.
+
+Without ARTIFACT, the artifact store is searched: when the Odoo sources of
+the version are git checkouts, for the artifact packed from exactly their
+commits; otherwise (e.g. a CI agent without sources) for the newest artifact
+of the version.
+
+The artifact is verified before the KB is replaced: it must match the
+current KB schema and scanner, the local source commits (unless --force),
+and its checksum. When verification fails, the existing KB is left as it
+was — rebuild it with oops misc build-kb.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+from oops.commands.base import command
+from oops.core.cache import record_access
+from oops.core.exceptions import ConfigError, OopsError
+from oops.core.logger import live_progress
+from oops.core.metadata import get_metadata
+from oops.core.models import Result
+from oops.core.paths import global_kb_path, kb_artifacts_dir
+from oops.io.file import get_odoo_sources_dirs
+from oops.kb.artifact import ArtifactError, ArtifactStore, artifact_key, read_artifact_info, source_revisions, unpack_kb
+from oops.kb.build import global_kb_sources
+from oops.kb.store import relocate_kb_sources
+from oops.output.formatters import (
+    FormatterRegistry,
+    JsonFormatter,
+    OutputFormatter,
+    SimpleSummaryConsoleFormatter,
+)
+from oops.output.sinks import deliver
+from oops.utils.render import warn_experimental
+
+from .common import resolve_version
+from .presenters.artifact import ArtifactPresenter
+
+FORMATTERS: FormatterRegistry = {
+    "text": SimpleSummaryConsoleFormatter,
+    "json": JsonFormatter,
+}
+
+
+@command("unpack", help=__doc__)
+@click.argument(
+    "artifact",
+    required=False,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--version",
+    default=None,
+    help="Odoo version string (e.g. 17.0). Defaults to the version declared in the current project's odoo_version.txt.",
+)
+@click.option(
+    "--store",
+    "store_path",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Artifact store directory. Defaults to ~/.cache/oops/kb-artifacts.",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Install even if the artifact was packed from other source commits than the local checkouts.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Output format. 'json' is suited for downstream LLM agent consumption.",
+)
+@click.option(
+    "--output-path",
+    "output_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the output to this path instead of stdout.",
+)
+def main(
+    artifact: Path | None,
+    version: str | None,
+    store_path: Path | None,
+    force: bool,
+    output_format: str,
+    output_path: Path | None,
+) -> None:
+
+    formatter: OutputFormatter = FORMATTERS[output_format]()
+
+    warn_experimental()
+
+    version = resolve_version(version)
+    store = ArtifactStore(store_path or kb_artifacts_dir())
+
+    try:
+        sources = global_kb_sources(get_odoo_sources_dirs(version))
+    except ConfigError:
+        sources = []  # no odoo.sources_dir: nothing to match against
+    revisions = source_revisions(sources) if sources else None
+    expected_key = artifact_key(version, revisions) if revisions and not force else None
+
+    # 1. Pick the artifact.
+    if artifact is None:
+        if expected_key is not None:
+            artifact = store.path_for(expected_key)
+            if not artifact.is_file():
+                raise OopsError(
+                    f"No KB artifact matches the local Odoo {version} sources in {store.root}: run oops misc build-kb"
+                )
+        else:
+            candidates = store.list(version)
+            if not candidates:
+                raise OopsError(f"No KB artifact for Odoo {version} in {store.root}")
+            artifact = candidates[0].path
+
+    if read_artifact_info(artifact).odoo_version != version:
+        raise ArtifactError(f"{artifact.name} is not a KB artifact for Odoo {version}")
+
+    # 2. Verify then install — a failed check raises ArtifactError and leaves the KB untouched.
+    dest = global_kb_path(version)
+    with live_progress("Verifying KB artifact..."):
+        info = unpack_kb(artifact, dest, expected_key=expected_key)
+    record_access(dest, "kb-global")
+    if sources:
+        relocate_kb_sources(dest, {origin: str(path) for origin, path in sources})
+
+    result: Result[dict] = Result()
+    result.data = {
+        "cmd": f"Unpack global KB for Odoo {version}",
+        "artifact": {**info.to_dict(), "path": str(info.path)},
+        "installed": str(dest),
+    }
+
+    # 3. Presenter prepares neutral dicts according to the formatter's audience.
+    output = ArtifactPresenter().prepare(result, target=formatter.target, metadata=get_metadata())
+    deliver(formatter, output, output_format, output_path)
@@ -11,7 +11,8 @@ in oops.rules.manifest (author/maintainers, key order). Reports violations
 and exits non-zero if any are found.
 
 Accepts either addon names (CLI) or file paths (pre-commit hook). When run
-without arguments, all owned installable addons are checked.
+without arguments, all owned installable addons are checked — or, with
+--staged, only those whose manifest is staged.
 
 Use oops-man-fix to apply autofixes.
 """
@@ -22,20 +23,27 @@ import click
 from oops.commands.base import command
 from oops.commands.manifest.common import collect_paths, run_fixit
 from oops.core.exceptions import EarlyExit, OopsError
-from oops.io.file import get_filtered_addon_names
+from oops.io.file import get_filtered_addon_names, is_owned_addon, load_root_addons
 from oops.io.manifest import get_manifest_path
-from oops.services.git import require_repository
+from oops.services.repository import require_repo_context
+from oops.services.staged import resolve_staged
 
 
 @command(name="check", help=__doc__)
 @click.argument("inputs", nargs=-1)
 @click.option("--diff", is_flag=True, help="Show the autofix diff alongside each violation.")
-def main(inputs: tuple, diff: bool) -> None:
-    _, repo_path = require_repository()
+@click.option("--staged", is_flag=True, help="Without inputs, only check the addons whose manifest is staged.")
+def main(inputs: tuple, diff: bool, staged: bool) -> None:
+    repo_path = require_repo_context().root
 
     if not inputs:
-        names = get_filtered_addon_names(repo_path)
-        paths = collect_paths(repo_path, names)
+        changes = resolve_staged(repo_path) if staged else None
+        if changes is not None and not changes.full_scan:
+            addons = load_root_addons(repo_path, changes.manifests)
+            paths = [Path(get_manifest_path(a.path)) for a in addons if is_owned_addon(a)]
+        else:
+            names = get_filtered_addon_names(repo_path)
+            paths = collect_paths(repo_path, names)
     else:
         paths: list[Path] = []
         names = []
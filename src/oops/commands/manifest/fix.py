@@ -18,7 +18,8 @@ from oops.commands.base import command
 from oops.commands.manifest.common import collect_paths, run_fixit
 from oops.core.exceptions import EarlyExit
 from oops.io.file import get_filtered_addon_names
-from oops.services.git import commit, require_repository
+from oops.services.git import commit
+from oops.services.repository import require_repo_context
 from oops.utils.helpers import str_to_list
 
 
@@ -26,7 +27,8 @@ from oops.utils.helpers import str_to_list
 @click.option("--names", default=None, help="Comma-separated list of addon names to fix.")
 @click.option("--no-commit", is_flag=True, help="Do not commit changes")
 def main(names: str, no_commit: bool) -> None:
-    repo, repo_path = require_repository()
+    ctx = require_repo_context()
+    repo_path = ctx.root
 
     name_filter = str_to_list(names) if names else get_filtered_addon_names(repo_path)
     paths = collect_paths(repo_path, name_filter)
@@ -43,7 +45,7 @@ def main(names: str, no_commit: bool) -> None:
         # TODO: guess what files were actually modified and only commit those, instead of all paths
         if not no_commit:
             commit(
-                repo,
+                ctx.repo,
                 repo_path,
                 paths,
                 "manifest_update",
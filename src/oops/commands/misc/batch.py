@@ -0,0 +1,128 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: batch.py — oops/commands/misc/batch.py
+
+"""
+Run an oops command in every project of the working directory.
+
+Projects are discovered under --working-dir (default: the configured
+working_dir) and processed by a pool of worker processes that stay alive
+across projects, so startup and config loading are paid once per worker.
+Commands that support --format json are run with it and their payloads are
+aggregated into one report, with per-project timings and exit codes.
+
+Example: oops misc batch -j 8 project check --strict
+
+Exits non-zero if the command failed in any project.
+"""
+
+import os
+import time
+from pathlib import Path
+
+import click
+from oops.commands.base import command, render_and_exit
+from oops.core.compat import Optional
+from oops.core.config import config
+from oops.core.exceptions import OopsError
+from oops.core.logger import live_progress, log
+from oops.core.metadata import get_metadata
+from oops.core.models import Result
+from oops.output.formatters import FormatterRegistry, JsonFormatter, SimpleSummaryConsoleFormatter
+from oops.services.batch import resolve_command, run_batch, supports_json
+from oops.services.project import find_projects
+
+from .presenters.batch import BatchPresenter
+
+FORMATTERS: FormatterRegistry = {
+    "text": SimpleSummaryConsoleFormatter,
+    "json": JsonFormatter,
+}
+
+
+# Commands reading the Odoo image list (on-disk HTTP cache + version index).
+_IMAGE_COMMANDS = {"project show", "project update", "project convert"}
+
+
+def _warm_shared_caches(command_name: str) -> None:
+    """Refresh on-disk caches once, before workers race to fill them."""
+    if command_name not in _IMAGE_COMMANDS:
+        return
+    from oops.services.docker import load_image_dicts  # noqa: PLC0415
+
+    try:
+        load_image_dicts()
+    except Exception as error:  # noqa: BLE001 - each project reports its own failure
+        log.debug(f"Image list warm-up failed: {error}")
+
+
+@command(
+    name="batch",
+    help=__doc__,
+    context_settings={"ignore_unknown_options": True, "allow_interspersed_args": False},
+)
+@click.argument("args", nargs=-1, type=click.UNPROCESSED, required=True)
+@click.option(
+    "--working-dir",
+    "working_dir",
+    type=click.Path(file_okay=False, exists=True, path_type=Path),
+    default=None,
+    help="Directory containing the projects (default: working_dir from the config).",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    default=lambda: os.cpu_count() or 1,
+    show_default="CPU count",
+    type=click.IntRange(min=1),
+    help="Number of worker processes.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Output format",
+)
+@click.option(
+    "--output-path",
+    "output_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the output to this path instead of stdout.",
+)
+def main(args: tuple, working_dir: Optional[Path], jobs: int, output_format: str, output_path: Path) -> None:
+    cmd, cmd_path = resolve_command(list(args))
+    if cmd is None:
+        raise click.UsageError(f"Unknown command: oops {' '.join(args)}")
+    if cmd_path == ["misc", "batch"]:
+        raise click.UsageError("oops misc batch cannot run itself.")
+
+    root = working_dir or (Path(config.working_dir).expanduser() if config.working_dir else None)
+    if root is None:
+        raise OopsError("No working directory: pass --working-dir or set working_dir in the config.")
+    projects = find_projects(root)
+
+    run_args = list(args)
+    if supports_json(cmd) and "--format" not in run_args:
+        run_args += ["--format", "json"]
+
+    formatter = FORMATTERS[output_format]()
+    result: Result[dict] = Result()
+    result.data = {"command": " ".join(cmd_path), "args": run_args, "working_dir": str(root), "jobs": jobs}
+
+    t0 = time.perf_counter()
+    _warm_shared_caches(" ".join(cmd_path))
+    with live_progress(f"Running oops {' '.join(cmd_path)} in {len(projects)} project(s)…"):
+        rows = run_batch(projects, run_args, jobs=jobs)
+    result.data["elapsed_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+
+    for row in rows:
+        if row["exit_code"] != 0:
+            result.add_error(f"{row['project']}: exit {row['exit_code']}")
+    result.data["rows"] = rows
+
+    output = BatchPresenter().prepare(result, target=formatter.target, metadata=get_metadata())
+    render_and_exit(result, formatter, output, output_format, output_path)
@@ -20,6 +20,11 @@ The global KB is version-specific and shared across all projects on the
 same Odoo version — it should never be stored inside a project repository.
 Run this once per Odoo version. The resulting database is shared across all
 projects on the same version.
+
+When the sources are git checkouts, a KB artifact packed from the same
+commits (oops kb pack) is installed from the artifact store instead of
+scanning; an artifact that fails verification is ignored and the KB is
+rebuilt.
 """
 
 from __future__ import annotations
@@ -28,14 +33,14 @@ from pathlib import Path
 
 import click
 from oops.commands.base import command
-from oops.core.logger import live_progress, log
+from oops.core.cache import record_access
+from oops.core.logger import live_progress
+from oops.core.metadata import get_metadata
 from oops.core.models import Result
-from oops.core.paths import global_kb_dir
+from oops.core.paths import global_kb_dir, kb_artifacts_dir
 from oops.io.file import get_odoo_sources_dirs, list_odoo_sources_versions, parse_odoo_version
-from oops.kb.build import _resolve_module_apps, _resolve_prototype_roles, _resolve_view_types
-from oops.kb.scanner import odoo_addons_roots, scan_tier
-from oops.kb.store import write_global_kb
-from oops.kb.xml_scanner import scan_tier_xml
+from oops.kb.artifact import ArtifactError, ArtifactStore, source_revisions
+from oops.kb.build import build_global_kb, global_kb_sources, restore_global_kb
 from oops.output.formatters import (
     FormatterRegistry,
     JsonFormatter,
@@ -51,8 +56,6 @@ from oops.utils.render import (
 
 from .presenters.build_global import BuildGlobalPresenter
 
-_ORIGIN_MAP = {"community": "odoo"}
-
 FORMATTERS: FormatterRegistry = {
     "text": SimpleSummaryConsoleFormatter,
     "json": JsonFormatter,
@@ -67,6 +70,19 @@ FORMATTERS: FormatterRegistry = {
         "Odoo version string (e.g. 19.0). Defaults to the version declared in the current project's odoo_version.txt."
     ),
 )
+@click.option(
+    "--artifacts/--no-artifacts",
+    default=True,
+    show_default=True,
+    help="Reuse a KB artifact packed from the same source commits instead of scanning.",
+)
+@click.option(
+    "--store",
+    "store_path",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Artifact store directory (e.g. shared between CI agents). Defaults to ~/.cache/oops/kb-artifacts.",
+)
 @click.option(
     "--format",
     "output_format",
@@ -84,6 +100,8 @@ FORMATTERS: FormatterRegistry = {
 )
 def main(
     version: str | None,
+    artifacts: bool,
+    store_path: Path | None,
     output_format: str,
     output_path: Path | None,
 ) -> None:
@@ -110,8 +128,6 @@ def main(
     cache_dir.mkdir(parents=True, exist_ok=True)
     db_path = cache_dir / f"{version}.db"
 
-    scan_results = []
-    sources: dict[str, str] = {}
     result: Result[dict] = Result()
     result.data = {
         "cmd": f"Build global KB for Odoo {version}",
@@ -121,71 +137,29 @@ def main(
 
     # 1. Long-running processing — produces a typed Result of domain dataclasses.
 
-    with live_progress("Building global KB..."):
-        for path in get_odoo_sources_dirs(version):
-            name = _ORIGIN_MAP.get(path.name, path.name)
-
-            log.info(f"Analyzing {name.capitalize()}...")
-
-            if not path.exists():
-                continue
-
-            for root in odoo_addons_roots(path):
-                local_result: Result[dict] = scan_tier(root, name)
-                for w in local_result.warnings:
-                    result.add_warning(f"[{name}] {w}")
+    sources = global_kb_sources(get_odoo_sources_dirs(version))
+    revisions = source_revisions(sources)
 
-                xml_result = scan_tier_xml(root, name)
-
-                if local_result.data is None:
-                    local_result.data = {}
-
-                if xml_result.data is None:
-                    xml_result.data = {}
-
-                local_result.data["views"] = xml_result.data["views"]
-                local_result.data["actions"] = xml_result.data["actions"]
-                local_result.data["menus"] = xml_result.data["menus"]
-                for w in xml_result.warnings:
-                    result.add_warning(f"[{name}] {w}")
-
-                scan_results.append(local_result.data)
-                data = local_result.data
-
-                result.data["stats"].append(
-                    {
-                        "name": name,
-                        "path": root,
-                        "modules": len(data.get("modules", {})),
-                        "symbols": len(data.get("symbols", [])),
-                        "field_refs": len(data.get("field_refs", [])),
-                        "origins": len(data.get("model_origins", [])),
-                        "views": len(data.get("views", [])),
-                        "actions": len(data.get("actions", [])),
-                        "menus": len(data.get("menus", [])),
-                    }
-                )
-
-            sources[name] = str(path)
-
-        log.info("Resolving prototype roles…")
-        _resolve_prototype_roles(scan_results)
-
-        log.info("Resolving view types…")
-        _resolve_view_types(scan_results)
-
-        log.info("Resolving module apps…")
-        _resolve_module_apps(scan_results)
-
-        log.info(f"Writing file to {db_path}")
-        temp_result = write_global_kb(
-            db_path=db_path,
-            odoo_version=version,
-            sources=sources,
-            scan_results=scan_results,
-        )
-        result.data["kb"] = temp_result.data
+    build_result = None
+    if artifacts and revisions is not None:
+        try:
+            with live_progress("Looking for a matching KB artifact..."):
+                store = ArtifactStore(store_path or kb_artifacts_dir())
+                build_result = restore_global_kb(db_path, version, sources, revisions, store)
+        except ArtifactError as error:
+            result.add_warning(f"{error}: rebuilding from sources")
+    if build_result is not None:
+        result.data["cmd"] = f"Restore global KB for Odoo {version} from artifact {build_result.data['key'][:12]}"
+    else:
+        with live_progress("Building global KB..."):
+            build_result = build_global_kb(db_path, version, sources, revisions)
+
+    record_access(db_path, "kb-global")
+    result.merge(build_result)
+    if build_result.data:
+        result.data["kb"] = build_result.data["kb"]
+        result.data["stats"] = build_result.data["stats"]
 
     # 2. Presenter prepares neutral dicts according to the formatter's audience.
-    output = BuildGlobalPresenter().prepare(result, target=formatter.target)
+    output = BuildGlobalPresenter().prepare(result, target=formatter.target, metadata=get_metadata())
     deliver(formatter, output, output_format, output_path)
@@ -0,0 +1,87 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: batch.py — src/oops/commands/misc/presenters/batch.py
+
+from __future__ import annotations
+
+from oops.core.models import Result
+from oops.output.base import SimplePresenter
+from oops.output.layout import ConclusionBlock, MetricsPanelBlock, SimpleSummaryLayout, TableBlock
+
+
+def _issues(row: dict, key: str) -> str:
+    """Count of ``key`` ("errors"/"warnings") in a project's JSON payload, if it reports them."""
+    payload = row.get("payload") or {}
+    items = payload.get(key)
+    return str(len(items)) if isinstance(items, list) else "—"
+
+
+class BatchPresenter(SimplePresenter[dict]):
+    def to_machine(self, result: "Result[dict]") -> dict:
+
+        data = result.unwrap
+
+        return {
+            "command": data["command"],
+            "args": data["args"],
+            "working_dir": data["working_dir"],
+            "elapsed_ms": data["elapsed_ms"],
+            "projects": data["rows"],
+            "errors": result.errors,
+        }
+
+    def to_human(self, result: "Result[dict]") -> SimpleSummaryLayout:
+        data = result.unwrap
+
+        rows = data["rows"]
+        failed = [r for r in rows if r["exit_code"] != 0]
+        busy = sum(r["duration_ms"] for r in rows)
+
+        table = TableBlock(
+            title="",
+            columns=[
+                ("Project", "brand.primary", "left"),
+                ("Exit", "green", "right"),
+                ("Errors", "red", "right"),
+                ("Warnings", "yellow", "right"),
+                ("Time (ms)", "dim", "right"),
+            ],
+            rows=[
+                [
+                    r["project"],
+                    str(r["exit_code"]),
+                    _issues(r, "errors"),
+                    _issues(r, "warnings"),
+                    f"{r['duration_ms']:.0f}",
+                ]
+                for r in rows
+            ],
+        )
+
+        panel = MetricsPanelBlock(
+            "Summary",
+            [
+                ["Projects", str(len(rows))],
+                ["Failed", str(len(failed))],
+                ["Workers", str(data["jobs"])],
+                ["Elapsed (ms)", f"{data['elapsed_ms']:.0f}"],
+                ["Sum of runs (ms)", f"{busy:.0f}"],
+            ],
+        )
+
+        if not rows:
+            conclusion = "No projects found"
+        elif failed:
+            conclusion = f"oops {data['command']} failed in {len(failed)} of {len(rows)} project(s)"
+        else:
+            conclusion = f"oops {data['command']} passed in {len(rows)} project(s)"
+
+        return SimpleSummaryLayout(
+            title=f"oops {data['command']} — {data['working_dir']}",
+            table=table,
+            panel=panel,
+            conclusion=ConclusionBlock(not failed, conclusion),
+            warnings=result.warnings,
+            errors=[f"{r['project']}: {r['stderr'] or r['output'] or 'exit ' + str(r['exit_code'])}" for r in failed],
+        )
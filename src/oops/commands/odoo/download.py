@@ -16,19 +16,27 @@ The sources directory is read from odoo.sources_dir in ~/.oops.yaml.
 
 If a directory already exists the clone step is skipped.  Pass --update to
 pull the latest changes instead.
+
+The repositories are processed concurrently.  With --reference, each one
+borrows its objects from a bare repository shared by every version:
+
+    <sources_dir>/.reference/{community,enterprise,themes}.git
+
+so a second or third version only downloads and stores what differs.
 """
 
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
 from oops.commands.base import command, render_and_exit
-from oops.core.compat import Optional
+from oops.core.compat import Dict, Optional, Tuple
 from oops.core.config import config
 from oops.core.logger import live_progress, log
 from oops.core.metadata import get_metadata
 from oops.core.models import Result
-from oops.io.file import get_odoo_sources_dirs, parse_odoo_version
+from oops.io.file import get_odoo_reference_dir, get_odoo_sources_dirs, parse_odoo_version
 from oops.output.formatters import (
     FormatterRegistry,
     JsonFormatter,
@@ -36,7 +44,7 @@ from oops.output.formatters import (
     SimpleSummaryConsoleFormatter,
 )
 from oops.services.git import require_repository
-from oops.utils.git import clone, update_latest
+from oops.utils.git import borrow_objects, clone, ensure_reference, update_latest
 from oops.utils.helpers import normalize_version
 from oops.utils.render import prompt_select
 
@@ -54,6 +62,13 @@ FORMATTERS: FormatterRegistry = {
     default=None,
 )
 @click.option("--update", "do_update", is_flag=True, help="Pull latest changes if repos already exist.")
+@click.option(
+    "--reference",
+    "use_reference",
+    is_flag=True,
+    default=False,
+    help="Share git objects across versions through a bare reference repository per upstream.",
+)
 @click.option(
     "--community/--no-community",
     "with_community",
@@ -99,6 +114,7 @@ FORMATTERS: FormatterRegistry = {
 def main(
     version: Optional[str],
     do_update: bool,
+    use_reference: bool,
     with_community: bool,
     with_enterprise: bool,
     with_themes: bool,
@@ -132,35 +148,46 @@ def main(
         ("Enterprise", config.odoo.enterprise_url, dirs.enterprise, with_enterprise),
         ("Themes", config.odoo.themes_url, dirs.themes, with_themes),
     ]
+    enabled = [(label, url, dest) for label, url, dest, flag in repos if flag]
+    quiet = not verbose
 
-    with live_progress("Downloading Odoo sources…"):
-        for label, url, dest, enabled in repos:
-            if not enabled:
-                continue
-
-            if dest.exists():
-                if do_update:
-                    log.info(f"Updating Odoo {label} {version}…")
-                    try:
-                        update_latest(dest, quiet=not verbose)
-                        result.data["rows"].append({"repo": label, "action": "updated", "status": "ok"})
-                    except subprocess.CalledProcessError as exc:
-                        msg = f"{label} update failed: {exc}"
-                        result.data["rows"].append({"repo": label, "action": "failed", "status": msg})
-                        result.add_error(msg)
-                else:
-                    msg = f"'{dest}' already exists — skipping {label} clone (use --update to pull)"
-                    result.add_warning(msg)
-                    result.data["rows"].append({"repo": label, "action": "skipped", "status": msg})
+    def _process(label: str, url: str, dest: Path) -> Tuple[Dict[str, str], Optional[str], Optional[str]]:
+        """Clone or update one repository; return (row, warning, error)."""
+        reference = get_odoo_reference_dir(label.lower()) if use_reference else None
+        if dest.exists() and not do_update:
+            msg = f"'{dest}' already exists — skipping {label} clone (use --update to pull)"
+            return {"repo": label, "action": "skipped", "status": msg}, msg, None
+
+        action = "update" if dest.exists() else "clone"
+        try:
+            if reference is not None:
+                log.info(f"Refreshing {label} reference for {version}…")
+                ensure_reference(url, reference, version, quiet=quiet)
+            if action == "update":
+                log.info(f"Updating Odoo {label} {version}…")
+                if reference is not None:
+                    borrow_objects(dest, reference, quiet=quiet)
+                update_latest(dest, quiet=quiet)
+                return {"repo": label, "action": "updated", "status": "ok"}, None, None
+            log.info(f"Cloning Odoo {label} {version}…")
+            if reference is not None:
+                clone(url, dest, version, quiet=quiet, reference=reference)
             else:
-                log.info(f"Cloning Odoo {label} {version}…")
-                try:
-                    clone(url, dest, version, quiet=not verbose)
-                    result.data["rows"].append({"repo": label, "action": "cloned", "status": "ok"})
-                except subprocess.CalledProcessError as exc:
-                    msg = f"{label} clone failed: {exc}"
-                    result.data["rows"].append({"repo": label, "action": "failed", "status": msg})
-                    result.add_error(msg)
+                clone(url, dest, version, quiet=quiet)
+            return {"repo": label, "action": "cloned", "status": "ok"}, None, None
+        except subprocess.CalledProcessError as exc:
+            msg = f"{label} {action} failed: {exc}"
+            return {"repo": label, "action": "failed", "status": msg}, None, msg
+
+    with live_progress("Downloading Odoo sources…"), ThreadPoolExecutor(max_workers=max(len(enabled), 1)) as pool:
+        outcomes = list(pool.map(lambda repo: _process(*repo), enabled))
+
+    for row, warning, error in outcomes:
+        result.data["rows"].append(row)
+        if warning:
+            result.add_warning(warning)
+        if error:
+            result.add_error(error)
 
     output = DownloadPresenter().prepare(result, target=formatter.target, metadata=metadata)
     render_and_exit(result, formatter, output, output_format, output_path)
@@ -21,19 +21,31 @@ the last commit that existed at or before midnight of that day, leaving
 the working tree in a detached-HEAD state at the chosen snapshot.
 
 Pass --no-community / --no-enterprise / --no-themes to skip individual repos.
+
+The repositories are updated concurrently.  With --reference, the shared
+bare repository of each upstream (<sources_dir>/.reference/<repo>.git) is
+refreshed first and the checkout borrows its objects, so fetches transfer
+and store only what the reference lacks.
 """
 
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date as Date
 from pathlib import Path
 
 import click
 from oops.commands.base import command, render_and_exit
-from oops.core.compat import Optional
+from oops.core.compat import Dict, Optional, Tuple
+from oops.core.config import config
 from oops.core.logger import live_progress, log
 from oops.core.metadata import get_metadata
 from oops.core.models import Result
-from oops.io.file import get_odoo_sources_dirs, parse_odoo_version, require_odoo_sources
+from oops.io.file import (
+    get_odoo_reference_dir,
+    get_odoo_sources_dirs,
+    parse_odoo_version,
+    require_odoo_sources,
+)
 from oops.output.formatters import (
     FormatterRegistry,
     JsonFormatter,
@@ -41,7 +53,7 @@ from oops.output.formatters import (
     SimpleSummaryConsoleFormatter,
 )
 from oops.services.git import require_repository
-from oops.utils.git import update_at_date, update_latest
+from oops.utils.git import borrow_objects, ensure_reference, update_at_date, update_latest
 from oops.utils.helpers import normalize_version
 from oops.utils.render import prompt_select
 
@@ -65,6 +77,13 @@ FORMATTERS: FormatterRegistry = {
     help="Checkout the last commit at or before this date.",
     type=click.DateTime(formats=["%Y-%m-%d"]),
 )
+@click.option(
+    "--reference",
+    "use_reference",
+    is_flag=True,
+    default=False,
+    help="Share git objects across versions through a bare reference repository per upstream.",
+)
 @click.option(
     "--community/--no-community",
     "with_community",
@@ -110,6 +129,7 @@ FORMATTERS: FormatterRegistry = {
 def main(
     version: Optional[str],
     date: Optional[Date],
+    use_reference: bool,
     with_community: bool,
     with_enterprise: bool,
     with_themes: bool,
@@ -139,42 +159,46 @@ def main(
     dirs = get_odoo_sources_dirs(version)
 
     repos = [
-        ("Community", dirs.community, with_community),
-        ("Enterprise", dirs.enterprise, with_enterprise),
-        ("Themes", dirs.themes, with_themes),
+        ("Community", config.odoo.community_url, dirs.community, with_community),
+        ("Enterprise", config.odoo.enterprise_url, dirs.enterprise, with_enterprise),
+        ("Themes", config.odoo.themes_url, dirs.themes, with_themes),
     ]
+    enabled = [(label, url, dest) for label, url, dest, flag in repos if flag]
+    quiet = not verbose
 
     date_str = date.strftime("%Y-%m-%d") if date else None
 
-    with live_progress("Updating Odoo sources…"):
-        for label, dest, enabled in repos:
-            if not enabled:
-                continue
-
-            if not dest.exists():
-                msg = f"'{dest}' not found — run oops-odoo-download first"
-                result.add_warning(msg)
-                result.data["rows"].append({"repo": label, "action": "skipped", "detail": "not found"})
-                continue
+    def _process(label: str, url: str, dest: Path) -> Tuple[Dict[str, str], Optional[str], Optional[str]]:
+        """Update one checkout; return (row, warning, error)."""
+        if not dest.exists():
+            msg = f"'{dest}' not found — run oops-odoo-download first"
+            return {"repo": label, "action": "skipped", "detail": "not found"}, msg, None
 
+        try:
+            if use_reference:
+                reference = get_odoo_reference_dir(label.lower())
+                log.info(f"Refreshing {label} reference for {version}…")
+                ensure_reference(url, reference, version, quiet=quiet)
+                borrow_objects(dest, reference, quiet=quiet)
             if date_str:
                 log.info(f"Updating {label} {version} to snapshot {date_str}…")
-                try:
-                    update_at_date(dest, date_str, quiet=not verbose)
-                    result.data["rows"].append({"repo": label, "action": "updated", "detail": date_str})
-                except (subprocess.CalledProcessError, click.ClickException) as exc:
-                    msg = f"{label} update failed: {exc}"
-                    result.data["rows"].append({"repo": label, "action": "failed", "detail": str(exc)})
-                    result.add_error(msg)
-            else:
-                log.info(f"Updating {label} {version} to latest…")
-                try:
-                    update_latest(dest, quiet=not verbose)
-                    result.data["rows"].append({"repo": label, "action": "updated", "detail": "latest"})
-                except subprocess.CalledProcessError as exc:
-                    msg = f"{label} update failed: {exc}"
-                    result.data["rows"].append({"repo": label, "action": "failed", "detail": str(exc)})
-                    result.add_error(msg)
+                update_at_date(dest, date_str, quiet=quiet)
+                return {"repo": label, "action": "updated", "detail": date_str}, None, None
+            log.info(f"Updating {label} {version} to latest…")
+            update_latest(dest, quiet=quiet)
+            return {"repo": label, "action": "updated", "detail": "latest"}, None, None
+        except (subprocess.CalledProcessError, click.ClickException) as exc:
+            return {"repo": label, "action": "failed", "detail": str(exc)}, None, f"{label} update failed: {exc}"
+
+    with live_progress("Updating Odoo sources…"), ThreadPoolExecutor(max_workers=max(len(enabled), 1)) as pool:
+        outcomes = list(pool.map(lambda repo: _process(*repo), enabled))
+
+    for row, warning, error in outcomes:
+        result.data["rows"].append(row)
+        if warning:
+            result.add_warning(warning)
+        if error:
+            result.add_error(error)
 
     output = UpdatePresenter().prepare(result, target=formatter.target, metadata=metadata)
     render_and_exit(result, formatter, output, output_format, output_path)
@@ -29,8 +29,8 @@ from oops.output.formatters import (
 )
 from oops.output.presenters import DefaultCheckPresenter
 from oops.services.docker import CheckImage, ImageCheckContext
-from oops.services.git import require_repository
 from oops.services.project import CheckMandatoryFiles, CheckRecommendedFiles, ProjectCheckContext
+from oops.services.repository import require_repo_context
 
 FORMATTERS: FormatterRegistry = {
     "text": SimpleSummaryConsoleFormatter,
@@ -68,7 +68,7 @@ def main(strict: bool, hook: bool, output_format: str, output_path: Path):
 
     metadata = get_metadata()
 
-    _, repo_path = require_repository()
+    repo_path = require_repo_context().root
 
     formatter: OutputFormatter = FORMATTERS[output_format]()
     if hook:
@@ -14,6 +14,9 @@ graphs.
 This command is read-only with respect to the project source. It rebuilds the
 project KB if stale (same semantics as ``oops addons analyze``) but performs no
 source rewriting, no git operations, and no manifest edits.
+
+With ``--watch`` the site is regenerated whenever an addon changes; only the
+touched addons are re-scanned and re-analysed.
 """
 
 from __future__ import annotations
@@ -21,6 +24,7 @@ from __future__ import annotations
 import json
 import shutil
 import tempfile
+import time
 from pathlib import Path
 
 import click
@@ -29,12 +33,14 @@ from oops.core.exceptions import AppAbort, EarlyExit, OopsError
 from oops.core.logger import live_progress, log
 from oops.core.metadata import get_metadata
 from oops.core.models import AddonInfo, Result
+from oops.core.profiling import span
 from oops.io.file import enrich_addon, find_addons
 from oops.output.formatters import MarkdownSiteFormatter
 from oops.output.sinks import deliver_site
 from oops.services.git import list_submodules, require_repository
 from oops.services.loc import get_addon_loc
 from oops.services.project import require_project
+from oops.services.watch import refresh_modules, report_cycle, watch_modules
 
 from .presenters.doc import ProjectDocPresenter
 
@@ -121,6 +127,38 @@ def _run_analyze(paths: list[str], refresh: bool) -> dict:
         return json.loads(tmp_json.read_text(encoding="utf-8"))
 
 
+def _reanalyse(repo_path: Path, ir: dict, inventory: dict[str, dict], touched: list[Path]) -> None:
+    """Watch cycle — refresh the KB for ``touched`` addons and splice their IR into ``ir``.
+
+    Untouched modules keep their previous IR; LOC shares are recomputed over
+    the new totals, as a full multi-module run would.
+    """
+    refreshed = refresh_modules(repo_path, touched)
+    for warning in refreshed.warnings + refreshed.errors:
+        log.warning(warning)
+
+    fresh = {m["module"]: m for m in _run_analyze([str(p) for p in touched], refresh=False).get("modules", [])}
+    modules = [fresh.pop(m["module"], m) for m in ir.get("modules", [])]
+    ir["modules"] = modules + list(fresh.values())
+
+    if len(ir["modules"]) > 1:
+        total = sum(m["loc"]["total"] for m in ir["modules"])
+        for m in ir["modules"]:
+            m["loc"]["pct"] = round(100.0 * m["loc"]["total"] / total, 1) if total else 0.0
+
+    for path in touched:
+        row = inventory.get(path.name)
+        if row is not None:
+            loc = get_addon_loc(row["path"])
+            row["loc"] = {
+                "python": loc.python,
+                "xml": loc.xml,
+                "javascript": loc.javascript,
+                "docs": loc.docs,
+                "total": loc.total,
+            }
+
+
 @command(name="doc", help=__doc__)
 @click.option(
     "--output-dir",
@@ -155,6 +193,11 @@ def _run_analyze(paths: list[str], refresh: bool) -> dict:
     is_flag=True,
     help="Wipe the output directory before writing.",
 )
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep running: regenerate the site as addons change.",
+)
 @click.pass_context
 def main(
     ctx,
@@ -163,6 +206,7 @@ def main(
     refresh: bool,
     names: tuple[str, ...],
     clean: bool,
+    watch: bool,
 ) -> None:
 
     repo, repo_path = require_repository()
@@ -176,7 +220,7 @@ def main(
 
     result: Result[dict] = Result()
 
-    with live_progress("Building inventory..."):
+    with live_progress("Building inventory..."), span("inventory"):
         inventory = _build_inventory(repo, repo_path, show_all, names)
 
     if not inventory:
@@ -204,3 +248,20 @@ def main(
         click.echo(f"⚠ {len(result.warnings)} warning(s) — see {output_dir / 'index.md'}", err=True)
     for lim in ir.get("metadata", {}).get("limitations", []):
         click.echo(f"  note: {lim}", err=True)
+
+    if not watch:
+        return
+
+    try:
+        for touched in watch_modules([Path(p) for p in paths]):
+            t0 = time.perf_counter()
+            try:
+                _reanalyse(repo_path, ir, inventory, touched)
+            except (OopsError, click.UsageError) as error:  # keep watching; the next save retries
+                log.error(f"Re-analysis failed: {error}")
+                continue
+            output = ProjectDocPresenter().prepare(result, target=formatter.target, metadata=metadata)
+            deliver_site(formatter, output, output_dir)
+            report_cycle(touched, t0)
+    except KeyboardInterrupt:
+        pass
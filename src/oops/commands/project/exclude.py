@@ -35,16 +35,23 @@ exclude: |
 Automatically, the modules to exclude will be added between the tags.
 
 If the tags are not found in the file, nothing is done.
+
+With --staged (pre-commit), the current list is updated in place for the addons whose manifest
+is staged instead of re-scanning every addon; staged global files trigger the full scan.
 """
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import click
 from oops.commands.base import command
 from oops.core.config import config
 from oops.core.exceptions import OopsError
-from oops.io.file import file_updater, get_excluded_addon_names
-from oops.services.git import commit, require_repository
+from oops.io.file import file_updater, get_excluded_addon_names, is_excluded_addon, load_root_addons, read_tagged_block
+from oops.services.git import commit
+from oops.services.repository import require_repo_context
+from oops.services.staged import resolve_staged
 from oops.utils.render import conclude, get_console, rule
 
 
@@ -52,14 +59,20 @@ from oops.utils.render import conclude, get_console, rule
 @click.option("--dry-run", is_flag=True, help="Show what would happen, do nothing.")
 @click.option("--no-commit", is_flag=True, help="Do not commit changes.")
 @click.option("--fail", is_flag=True, help="Raise an error if the exclusion list is updated (pre-commit).")
-def main(dry_run: bool = False, no_commit: bool = False, fail: bool = False):
-    repo, repo_path = require_repository()
+@click.option("--staged", is_flag=True, help="Only re-evaluate the addons whose manifest is staged (pre-commit).")
+def main(dry_run: bool = False, no_commit: bool = False, fail: bool = False, staged: bool = False):
+    ctx = require_repo_context()
+    repo_path = ctx.root
     console = get_console()
 
     rule("Pre-commit exclusion list")
 
-    addons = get_excluded_addon_names(repo_path)
     precommit_file = config.precommit.file_precommit
+    changes = resolve_staged(repo_path) if staged else None
+    if changes is not None and not changes.full_scan:
+        addons = _update_excluded(repo_path / precommit_file, changes.manifests, repo_path)
+    else:
+        addons = get_excluded_addon_names(repo_path)
 
     def _format_item(item: str) -> str:
         return f"  {item}/|"
@@ -79,9 +92,18 @@ def main(dry_run: bool = False, no_commit: bool = False, fail: bool = False):
     console.print(f"{len(addons)} addon(s) to exclude")
 
     if not no_commit and not dry_run and has_update:
-        commit(repo, repo_path, [precommit_file], "pre_commit_exclude", skip_hooks=True)
+        commit(ctx.repo, repo_path, [precommit_file], "pre_commit_exclude", skip_hooks=True)
 
     conclude(True, "Exclusion list updated" if has_update else "No changes")
 
     if fail and has_update:
         raise OopsError("The list of exclusions has been updated, please run pre-commit again")
+
+
+def _update_excluded(precommit_path: Path, names: list, repo_path: Path) -> list:
+    """Return the current exclusion list with only the named addons re-evaluated."""
+    block = read_tagged_block(precommit_path, "# oops:exclude:start", "# oops:exclude:end")
+    current = {line.strip().rstrip("|").rstrip("/") for line in block.splitlines() if line.strip()}
+    current.difference_update(names)
+    current.update(addon.technical_name for addon in load_root_addons(repo_path, names) if is_excluded_addon(addon))
+    return sorted(current)
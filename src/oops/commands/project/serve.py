@@ -6,32 +6,48 @@
 """Serve a local single-page app for consulting project documentation.
 
 Reuses the `oops project doc` data pipeline (inventory + IR v2 analysis →
-DocModel), emits a single `data.js`, and serves a vendored, offline SPA via
-the standard-library HTTP server. Read-only; no source rewriting.
+DocModel), writes it as a small index plus one JSON shard per module that
+the UI fetches on demand, and serves a vendored, offline SPA via the
+standard-library HTTP server. Shards are precompressed (gzip, plus brotli
+when installed) and served with strong ETags, so reloads only transfer what
+changed. Read-only; no source rewriting.
+
+With --watch, edited addons are re-scanned and re-analysed in the
+background, their shards rewritten, and open pages told to refresh over a
+server-sent-events channel (/api/events).
 """
 from __future__ import annotations
 
 import functools
+import hashlib
 import http.server
+import json
+import mimetypes
+import os
 import shutil
 import tempfile
+import threading
+import time
 import webbrowser
 from pathlib import Path
 
 import click
 from oops.commands.base import command
-from oops.commands.project.doc import _build_inventory, _run_analyze
+from oops.commands.project.doc import _build_inventory, _reanalyse, _run_analyze
 from oops.commands.project.presenters.doc import ProjectDocPresenter
-from oops.core.exceptions import EarlyExit
-from oops.core.logger import live_progress
+from oops.core.compat import Optional
+from oops.core.exceptions import EarlyExit, OopsError
+from oops.core.logger import live_progress, log
 from oops.core.metadata import get_metadata
 from oops.core.models import Result
 from oops.core.paths import UI
 from oops.output.base import RenderTarget
 from oops.output.descriptors import load_descriptors
-from oops.output.serializers import to_json_string
+from oops.output.serializers import to_json_line
+from oops.output.shards import join_serve_payload, read_shards, write_shards
 from oops.services.git import require_repository
 from oops.services.project import require_project
+from oops.services.watch import report_cycle, watch_modules
 
 
 def build_payload(
@@ -43,7 +59,11 @@ def build_payload(
         raise EarlyExit()
     paths = [row["path"] for row in inventory.values()]
     ir = _run_analyze(paths, refresh)
+    return render_payload(ir, inventory)
+
 
+def render_payload(ir: dict, inventory: dict) -> dict:
+    """Stage C of :func:`build_payload`, reusable when the IR is patched in place (watch mode)."""
     result: Result = Result()
     result.data = {"ir": ir, "inventory": inventory}
 
@@ -55,16 +75,174 @@ def build_payload(
     return {**docmodel, "metadata": merged_meta, "schema": load_descriptors()}
 
 
-def prepare_site_dir(payload: dict, dest: Path) -> Path:
-    """Copy UI assets into `dest` and write `data.js`."""
+# Watch mode: the SPA bundle has no hot-swap entry point, so an update reloads
+# the page; ETags turn the reload into 304s for every shard that did not change.
+_LIVE_RELOAD = """<script>
+new EventSource("/api/events").addEventListener("update", () => location.reload());
+</script>
+"""
+
+
+def prepare_site_dir(payload: dict, dest: Path, live_reload: bool = False) -> Path:
+    """Copy UI assets into `dest` and write the sharded data bundle.
+
+    With ``live_reload``, ``index.html`` also subscribes to ``/api/events``.
+    """
     shutil.copytree(str(UI), dest, dirs_exist_ok=True)
-    (dest / "data.js").write_text(
-        "window.OOPS = " + to_json_string(payload) + ";\n",
-        encoding="utf-8",
-    )
+    if live_reload:
+        index = dest / "index.html"
+        index.write_text(index.read_text(encoding="utf-8").replace("</body>", _LIVE_RELOAD + "</body>"), "utf-8")
+    write_shards(payload, dest)
     return dest
 
 
+class LiveUpdates:
+    """Fan-out of rebuild notifications to open pages (server-sent events).
+
+    Each :meth:`publish` bumps a generation counter; every ``/api/events``
+    stream waits for the counter to move and forwards the latest payload.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self.generation = 0
+        self._data = ""
+        self.closed = False
+
+    def publish(self, data: dict) -> None:
+        with self._cond:
+            self.generation += 1
+            self._data = json.dumps(data)
+            self._cond.notify_all()
+
+    def wait(self, generation: int, timeout: float) -> "tuple[int, Optional[str]]":
+        """Wait for an update newer than ``generation``.
+
+        Returns:
+            ``(generation, data)``; ``data`` is None on timeout or close.
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self.generation != generation or self.closed, timeout)
+            if self.generation == generation or self.closed:
+                return generation, None
+            return self.generation, self._data
+
+    def close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
+# Precompressed sibling suffix per content-coding, in order of preference.
+_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+class ShardRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Static handler serving precompressed files with strong ETags.
+
+    For ``GET``/``HEAD`` it picks the best precompressed sibling the client
+    accepts (``x.json.br``, ``x.json.gz``), answers ``If-None-Match`` with
+    ``304 Not Modified`` and asks the browser to revalidate every time
+    (``Cache-Control: no-cache``). ``POST /api/scan_project`` returns the
+    whole, unsharded payload for clients that cannot load shards.
+    """
+
+    # path → ((mtime_ns, size), ETag), shared by every handler instance. One
+    # entry per served file: a rewritten shard replaces its stale entry.
+    _etags: "dict[str, tuple[tuple[int, int], str]]" = {}
+
+    # Set (on a subclass) in watch mode to enable GET /api/events.
+    updates: Optional[LiveUpdates] = None
+    keepalive = 15.0
+
+    def _etag(self, path: str, st: os.stat_result) -> str:
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._etags.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        digest = hashlib.sha256()
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(65536), b""):
+                digest.update(chunk)
+        etag = f'"{digest.hexdigest()[:32]}"'
+        self._etags[path] = (stamp, etag)
+        return etag
+
+    def _pick_encoding(self, path: str) -> "tuple[str, str | None]":
+        accepted = {part.split(";")[0].strip().lower() for part in self.headers.get("Accept-Encoding", "").split(",")}
+        for coding, suffix in _ENCODINGS:
+            if coding in accepted and os.path.isfile(path + suffix):
+                return path + suffix, coding
+        return path, None
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            return super().send_head()
+
+        served, coding = self._pick_encoding(path)
+        try:
+            fh = open(served, "rb")  # noqa: SIM115 — returned to copyfile(), closed by the caller
+        except OSError:
+            self.send_error(404, "File not found")
+            return None
+
+        st = os.fstat(fh.fileno())
+        etag = self._etag(served, st)
+        if etag in {tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")}:
+            fh.close()
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return None
+
+        self.send_response(200)
+        self.send_header("Content-Type", mimetypes.guess_type(path)[0] or "application/octet-stream")
+        if coding:
+            self.send_header("Content-Encoding", coding)
+        self.send_header("Content-Length", str(st.st_size))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+        return fh
+
+    def do_GET(self):  # noqa: N802 — BaseHTTPRequestHandler naming
+        if self.updates is not None and self.path.rstrip("/") == "/api/events":
+            self._stream_events(self.updates)
+            return
+        super().do_GET()
+
+    def _stream_events(self, updates: LiveUpdates) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        generation = updates.generation
+        while not updates.closed:
+            generation, data = updates.wait(generation, self.keepalive)
+            chunk = f"event: update\ndata: {data}\n\n" if data is not None else ": keep-alive\n\n"
+            try:
+                self.wfile.write(chunk.encode("utf-8"))
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                return
+
+    def do_POST(self):  # noqa: N802 — BaseHTTPRequestHandler naming
+        if self.path.rstrip("/") != "/api/scan_project":
+            self.send_error(404, "Unknown API method")
+            return
+        index, shards = read_shards(Path(self.directory))
+        body = to_json_line(join_serve_payload(index, shards)).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
 @command(name="serve", help=__doc__)
 @click.option("--all", "show_all", is_flag=True, help="Include inactive addons.")
 @click.option(
@@ -80,24 +258,52 @@ def prepare_site_dir(payload: dict, dest: Path) -> Path:
     "--port", type=int, default=0, show_default=True, help="Port (0 = pick a free one)."
 )
 @click.option("--no-browser", is_flag=True, help="Do not open the browser.")
-def main(show_all, refresh, names, port, no_browser):
+@click.option("--watch", is_flag=True, help="Re-analyse addons as they change and refresh open pages.")
+def main(show_all, refresh, names, port, no_browser, watch):
     repo, repo_path = require_repository()
     require_project(repo_path)
 
     with live_progress("Building documentation data..."):
-        payload = build_payload(repo, repo_path, show_all, names, refresh)
+        inventory = _build_inventory(repo, repo_path, show_all, names)
+        if not inventory:
+            raise EarlyExit()
+        paths = [Path(row["path"]) for row in inventory.values()]
+        ir = _run_analyze([str(p) for p in paths], refresh)
+        payload = render_payload(ir, inventory)
 
+    updates = LiveUpdates() if watch else None
     with tempfile.TemporaryDirectory(prefix="oops-serve-") as tmp:
-        site = prepare_site_dir(payload, Path(tmp))
-        handler = functools.partial(
-            http.server.SimpleHTTPRequestHandler, directory=str(site)
-        )
+        site = prepare_site_dir(payload, Path(tmp), live_reload=watch)
+        handler_class = type("LiveShardRequestHandler", (ShardRequestHandler,), {"updates": updates})
+        handler = functools.partial(handler_class, directory=str(site))
         with http.server.ThreadingHTTPServer(("127.0.0.1", port), handler) as httpd:
             url = f"http://127.0.0.1:{httpd.server_address[1]}/"
             click.echo(f"Serving project docs at {url} (Ctrl-C to stop)", err=True)
             if not no_browser:
                 webbrowser.open(url)
             try:
-                httpd.serve_forever()
+                if updates is None:
+                    httpd.serve_forever()
+                else:
+                    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+                    _watch(repo_path, ir, inventory, paths, site, updates)
             except KeyboardInterrupt:
                 raise EarlyExit() from None
+            finally:
+                if updates is not None:
+                    updates.close()
+                    httpd.shutdown()
+
+
+def _watch(repo_path: Path, ir: dict, inventory: dict, paths: list, site: Path, updates: LiveUpdates) -> None:
+    """Rebuild touched addons' shards on every change and notify the open pages."""
+    for touched in watch_modules(paths):
+        t0 = time.perf_counter()
+        try:
+            _reanalyse(repo_path, ir, inventory, touched)
+        except (OopsError, click.UsageError) as error:  # keep serving; the next save retries
+            log.error(f"Re-analysis failed: {error}")
+            continue
+        write_shards(render_payload(ir, inventory), site, modules=[p.name for p in touched])
+        updates.publish({"modules": [p.name for p in touched]})
+        report_cycle(touched, t0)
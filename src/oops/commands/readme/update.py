@@ -12,6 +12,9 @@ The exclusion list uses a start and end tags to identify the section to update.
 - end: # [//]: # (end addons)
 
 If the tags are not found in the file, they are automatically added at the end of the file with its content.
+
+With --staged (pre-commit), the table is only rebuilt when the staged changes add, remove or edit
+an addon manifest, or touch the README itself.
 """
 
 from __future__ import annotations
@@ -23,8 +26,10 @@ from oops.core.logger import live_progress, log
 from oops.core.models import Result
 from oops.io.file import file_updater, find_addons
 from oops.output.formatters import OutputFormatter, PreCommitFormatter, SimpleSummaryConsoleFormatter
-from oops.services.git import commit_v2, require_repository
+from oops.services.git import commit_v2
 from oops.services.github import get_github_user
+from oops.services.repository import require_repo_context
+from oops.services.staged import resolve_staged
 from oops.utils.render import render_table
 
 from .presenters.update import UpdatePresenter
@@ -38,11 +43,13 @@ from .presenters.update import UpdatePresenter
     is_flag=True,
     help="Minimal output for pre-commit hooks.",
 )
-def main(dry_run: bool = False, no_commit: bool = False, hook: bool = False):
+@click.option("--staged", is_flag=True, help="Skip the rebuild unless staged changes touch a manifest (pre-commit).")
+def main(dry_run: bool = False, no_commit: bool = False, hook: bool = False, staged: bool = False):
 
     formatter: OutputFormatter = PreCommitFormatter() if hook else SimpleSummaryConsoleFormatter()
 
-    repo, repo_path = require_repository()
+    ctx = require_repo_context()
+    repo_path = ctx.root
 
     result: Result[dict] = Result()
     result.data = {"cmd": "Update README", "rows": [], "dry_run": dry_run}
@@ -56,6 +63,14 @@ def main(dry_run: bool = False, no_commit: bool = False, hook: bool = False):
         "Summary": "summary",
     }
 
+    if staged:
+        changes = resolve_staged(repo_path)
+        if not changes.full_scan and not changes.manifests and not changes.touches(readme_file):
+            log.info("No staged manifest change, README left as is")
+            result.data["rows"].append(["addons", "no change"])
+            output = UpdatePresenter().prepare(result, formatter.target)
+            render_and_exit(result, formatter, output, "text")
+
     structure = []
 
     with live_progress("Updating README…", enabled=not hook):
@@ -96,7 +111,7 @@ def main(dry_run: bool = False, no_commit: bool = False, hook: bool = False):
         result.data["rows"].append(["addons", status])
 
     if not no_commit and not dry_run and has_update:
-        commit_result: Result = commit_v2(repo, repo_path, [readme_file], "addons_update_table", skip_hooks=True)
+        commit_result: Result = commit_v2(ctx.repo, repo_path, [readme_file], "addons_update_table", skip_hooks=True)
         result.merge(commit_result)
 
     output = UpdatePresenter().prepare(result, formatter.target)
@@ -21,6 +21,10 @@ In case of changes, it will be displayed like this:
 
 See the requirements documentation for merging rules
 and name-mapping details.
+
+With --staged (pre-commit), the check is skipped unless the staged changes add,
+remove or edit an addon manifest, or touch a global file (requirements,
+.gitmodules, config).
 """
 
 from __future__ import annotations
@@ -41,7 +45,8 @@ from oops.output.formatters import (
     SimpleSummaryConsoleFormatter,
 )
 from oops.output.presenters import DefaultCheckPresenter
-from oops.services.git import require_repository
+from oops.services.repository import require_repo_context
+from oops.services.staged import resolve_staged
 
 from .common import ImportsCheck, RequirementsCheck, RequirementsCheckContext
 
@@ -63,6 +68,7 @@ FORMATTERS: FormatterRegistry = {
     is_flag=True,
     help="Minimal output for pre-commit hooks.",
 )
+@click.option("--staged", is_flag=True, help="Skip the check unless staged changes touch a manifest (pre-commit).")
 @click.option(
     "--format",
     "output_format",
@@ -78,11 +84,11 @@ FORMATTERS: FormatterRegistry = {
     default=None,
     help="Write the output to this path instead of stdout (json) or a temp file (html).",
 )
-def main(no_fail: bool, hook: bool, output_format: str, output_path: Path):
+def main(no_fail: bool, hook: bool, staged: bool, output_format: str, output_path: Path):
 
     metadata = get_metadata()
 
-    _, repo_path = require_repository()
+    repo_path = require_repo_context().root
 
     formatter: OutputFormatter = FORMATTERS[output_format]()
     if hook:
@@ -90,10 +96,16 @@ def main(no_fail: bool, hook: bool, output_format: str, output_path: Path):
 
     results: ResultCollection[CheckOutcome] = ResultCollection(title="Check Requirements")
 
+    enabled = ["external_dep"]
+    if staged:
+        changes = resolve_staged(repo_path)
+        if not changes.full_scan and not changes.manifests:
+            enabled = []
+
     ctx: RequirementsCheckContext = RequirementsCheckContext(
         requirement_file=Path(config.project.file_requirements),
         path=repo_path,
-        enabled=["external_dep"],
+        enabled=enabled,
     )
 
     # TODO: add a test to identify dependencies that cannot be resolved by the algorithm
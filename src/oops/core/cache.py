@@ -0,0 +1,425 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: cache.py — oops/core/cache.py
+
+"""
+Index of the oops caches: sizes, last accesses, hit/miss counters, LRU eviction.
+
+Every cache oops keeps on disk belongs to an *owner* (:data:`CACHE_OWNERS`):
+global KBs, KB artifacts, HTTP responses, the image index, project KBs, Odoo
+source checkouts and usage stats. Entries (one file or directory each) are
+tracked in a small SQLite index (:func:`~oops.core.paths.cache_index_path`)
+together with the hit and miss counters of each owner.
+
+Callers report accesses with :func:`record_access`, which is cheap (one
+short write transaction) and never raises. :class:`CacheIndex` reconciles
+the index with the disk (:meth:`~CacheIndex.scan`) and evicts the least
+recently used entries over a size budget (:meth:`~CacheIndex.evict`).
+
+Pinned owners (source checkouts, stats) are reported but never evicted.
+The index runs in WAL mode and eviction holds the write lock, so several
+oops processes can record accesses and clean up concurrently; entries
+accessed in the last few minutes are never evicted, since another process
+may be reading them.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+from oops.core.compat import Dict, List, Optional, Tuple
+from oops.core.paths import (
+    cache_housekeeping_marker,
+    cache_index_path,
+    global_kb_dir,
+    http_cache_dir,
+    images_index_dir,
+    kb_artifacts_dir,
+    stats_dir,
+)
+
+_HOUSEKEEPING_INTERVAL = 3600  # seconds between automatic scans/evictions
+_EVICT_GRACE = 300  # entries accessed more recently than this are never evicted
+_BUSY_TIMEOUT = 2.0  # seconds record_access waits for another writer
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS entries (
+    path        TEXT    NOT NULL PRIMARY KEY,
+    owner       TEXT    NOT NULL,
+    size        INTEGER NOT NULL DEFAULT 0,
+    last_access REAL    NOT NULL,
+    pinned      INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_entries_lru ON entries (pinned, last_access);
+CREATE TABLE IF NOT EXISTS counters (
+    owner  TEXT    NOT NULL PRIMARY KEY,
+    hits   INTEGER NOT NULL DEFAULT 0,
+    misses INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmgt]?)(?:i?b)?\s*$", re.IGNORECASE)
+
+
+def _sources_root() -> Optional[Path]:
+    from oops.core.config import config  # local import to avoid circular deps
+
+    return config.odoo.sources_dir
+
+
+@dataclass(frozen=True)
+class CacheOwner:
+    """A family of cache entries.
+
+    Attributes:
+        name: Owner name, as shown by ``oops cache show``.
+        root: Directory holding the entries; None when entries are only
+            registered on use (project KBs live in each repository).
+        pattern: Glob of the entries under ``root``; None when ``root``
+            itself is the single entry.
+        pinned: Reported but never evicted.
+        companions: Suffixes of files removed along with an entry
+            (``<key>.body`` → ``<key>.meta.json``).
+    """
+
+    name: str
+    root: Callable[[], Optional[Path]]
+    pattern: Optional[str] = None
+    pinned: bool = False
+    companions: Tuple[str, ...] = ()
+
+    def discover(self) -> List[Path]:
+        """Return the entries currently on disk."""
+        root = self.root()
+        if root is None or not root.exists():
+            return []
+        if self.pattern is None:
+            return [root]
+        return sorted(root.glob(self.pattern))
+
+
+CACHE_OWNERS: Dict[str, CacheOwner] = {
+    owner.name: owner
+    for owner in (
+        CacheOwner("kb-global", global_kb_dir, "*.db"),
+        CacheOwner("kb-project", lambda: None),
+        CacheOwner("kb-artifacts", kb_artifacts_dir, "*.tar.gz"),
+        CacheOwner("http", http_cache_dir, "*.body", companions=(".meta.json",)),
+        CacheOwner("images", images_index_dir),
+        CacheOwner("sources", _sources_root, "*", pinned=True),
+        CacheOwner("stats", stats_dir, "stats.jsonl", pinned=True),
+    )
+}
+
+
+@dataclass
+class CacheEntry:
+    """One tracked file or directory.
+
+    Attributes:
+        path: Absolute path of the entry.
+        owner: Owner name (see :data:`CACHE_OWNERS`).
+        size: Bytes on disk, companions included.
+        last_access: Epoch seconds of the last recorded access (the
+            modification time until one is recorded).
+        pinned: Never evicted.
+    """
+
+    path: str
+    owner: str
+    size: int
+    last_access: float
+    pinned: bool = False
+
+
+def parse_size(value: "int | str") -> int:
+    """Parse a size budget such as ``"10G"``, ``"500MiB"`` or ``1048576``.
+
+    Units are binary (``K`` = 1024 bytes); a bare number is a byte count.
+
+    Raises:
+        ValueError: If the value is not a size.
+    """
+    if isinstance(value, int):
+        return value
+    match = _SIZE_RE.match(value)
+    if not match:
+        raise ValueError(f"Invalid size: {value!r} (expected e.g. 500M, 10G)")
+    number, unit = match.groups()
+    return int(float(number) * 1024 ** " kmgt".index(unit.lower() or " "))
+
+
+def _entry_size(path: Path, companions: Tuple[str, ...] = ()) -> int:
+    try:
+        if path.is_dir() and not path.is_symlink():
+            total = 0
+            for dirpath, _, filenames in os.walk(path):
+                for name in filenames:
+                    try:
+                        total += os.lstat(os.path.join(dirpath, name)).st_size
+                    except OSError:
+                        continue
+            return total
+        total = path.lstat().st_size
+    except OSError:
+        return 0
+    for suffix in companions:
+        try:
+            total += path.with_suffix(suffix).lstat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def _is_under(path: Path, root: Path) -> bool:
+    try:
+        path.resolve().relative_to(root.resolve())
+    except ValueError:
+        return False
+    return True
+
+
+def _remove(path: Path, companions: Tuple[str, ...] = ()) -> None:
+    """Remove an entry so that no other process ever sees it half-deleted."""
+    for target in [path, *(path.with_suffix(s) for s in companions)]:
+        doomed = target.with_name(f".evict-{os.getpid()}-{target.name}")
+        try:
+            os.replace(target, doomed)
+        except FileNotFoundError:
+            continue
+        if doomed.is_dir() and not doomed.is_symlink():
+            shutil.rmtree(doomed, ignore_errors=True)
+        else:
+            doomed.unlink()
+
+
+class CacheIndex:
+    """SQLite index of the cache entries and of the per-owner hit/miss counters.
+
+    Args:
+        path: Index database; defaults to :func:`~oops.core.paths.cache_index_path`.
+        timeout: Seconds to wait for another process holding the write lock.
+    """
+
+    def __init__(self, path: Optional[Path] = None, timeout: float = _BUSY_TIMEOUT) -> None:
+        self.path = path or cache_index_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._con = sqlite3.connect(str(self.path), timeout=timeout, isolation_level=None)
+        self._con.execute("PRAGMA journal_mode=WAL")
+        self._con.execute("PRAGMA synchronous=NORMAL")
+        self._con.executescript(_DDL)
+
+    def close(self) -> None:
+        self._con.close()
+
+    def __enter__(self) -> "CacheIndex":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction, taking the lock up front (no upgrade deadlocks)."""
+        self._con.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._con
+        except BaseException:
+            self._con.execute("ROLLBACK")
+            raise
+        self._con.execute("COMMIT")
+
+    # --- recording ---
+
+    def record(self, path: Path, owner: str, hit: Optional[bool] = None) -> None:
+        """Record an access to ``path`` and, when ``hit`` is given, a hit or a miss.
+
+        A path that does not exist (yet), or lies outside its owner's root
+        (e.g. an artifact store shared between machines), only updates the
+        counters.
+        """
+        spec = CACHE_OWNERS.get(owner)
+        companions = spec.companions if spec else ()
+        root = spec.root() if spec else None
+        tracked = path.exists() and (root is None or _is_under(path, root))
+        size = _entry_size(path, companions) if tracked else None
+        with self._write() as con:
+            if size is not None:
+                updated = con.execute(
+                    "UPDATE entries SET size = ?, last_access = ? WHERE path = ?",
+                    (size, time.time(), str(path)),
+                ).rowcount
+                if not updated:
+                    con.execute(
+                        "INSERT INTO entries (path, owner, size, last_access, pinned) VALUES (?, ?, ?, ?, ?)",
+                        (str(path), owner, size, time.time(), int(bool(spec and spec.pinned))),
+                    )
+            if hit is not None:
+                column = "hits" if hit else "misses"
+                con.execute("INSERT OR IGNORE INTO counters (owner) VALUES (?)", (owner,))
+                con.execute(f"UPDATE counters SET {column} = {column} + 1 WHERE owner = ?", (owner,))
+
+    # --- reading ---
+
+    def entries(self, owners: Optional[List[str]] = None) -> List[CacheEntry]:
+        """Return the tracked entries, least recently used first."""
+        rows = self._con.execute(
+            "SELECT path, owner, size, last_access, pinned FROM entries ORDER BY last_access"
+        ).fetchall()
+        return [
+            CacheEntry(path, owner, size, last_access, bool(pinned))
+            for path, owner, size, last_access, pinned in rows
+            if owners is None or owner in owners
+        ]
+
+    def counters(self) -> Dict[str, Tuple[int, int]]:
+        """Return ``{owner: (hits, misses)}``."""
+        return {owner: (hits, misses) for owner, hits, misses in self._con.execute("SELECT * FROM counters")}
+
+    def total_size(self, pinned: bool = False) -> int:
+        """Return the size of the evictable entries (or of the pinned ones)."""
+        query = "SELECT COALESCE(SUM(size), 0) FROM entries WHERE pinned = ?"
+        return self._con.execute(query, (int(pinned),)).fetchone()[0]
+
+    # --- housekeeping ---
+
+    def scan(self, deep: bool = False) -> None:
+        """Reconcile the index with the disk.
+
+        Registers the entries found under each owner's root (their
+        modification time standing in for a last access), refreshes sizes
+        and drops entries that no longer exist.
+
+        Args:
+            deep: Also measure pinned directories (source checkouts), which
+                means walking every file they hold.
+        """
+        known = {entry.path: entry for entry in self.entries()}
+        candidates = [(path, owner) for owner in CACHE_OWNERS.values() for path in owner.discover()]
+        # Entries registered on use (project KBs) or left behind by a moved root.
+        candidates += [
+            (Path(entry.path), CACHE_OWNERS.get(entry.owner, CacheOwner(entry.owner, lambda: None)))
+            for entry in known.values()
+        ]
+
+        found: Dict[str, Tuple[str, int, float, bool]] = {}
+        for path, owner in candidates:
+            if str(path) in found:
+                continue
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            previous = known.get(str(path))
+            if owner.pinned and path.is_dir() and not deep:
+                size = previous.size if previous else 0
+            else:
+                size = _entry_size(path, owner.companions)
+            found[str(path)] = (owner.name, size, mtime, owner.pinned)
+
+        with self._write() as con:
+            for path in set(known) - set(found):
+                con.execute("DELETE FROM entries WHERE path = ?", (path,))
+            for path, (owner, size, mtime, pinned) in found.items():
+                if path in known:
+                    con.execute("UPDATE entries SET size = ? WHERE path = ?", (size, path))
+                else:
+                    con.execute(
+                        "INSERT INTO entries (path, owner, size, last_access, pinned) VALUES (?, ?, ?, ?, ?)",
+                        (path, owner, size, mtime, int(pinned)),
+                    )
+
+    def evict(
+        self,
+        max_size: int,
+        owners: Optional[List[str]] = None,
+        dry_run: bool = False,
+        grace: float = _EVICT_GRACE,
+    ) -> List[CacheEntry]:
+        """Evict least recently used entries until the evictable total fits ``max_size``.
+
+        Args:
+            max_size: Budget in bytes for all evictable entries (``0`` evicts
+                everything outside the grace period).
+            owners: Only evict entries of these owners.
+            dry_run: Report what would be evicted without removing anything.
+            grace: Entries accessed within this many seconds are kept.
+
+        Returns:
+            The evicted entries, least recently used first.
+        """
+        evicted: List[CacheEntry] = []
+        now = time.time()
+        with self._write() as con:
+            candidates = [entry for entry in self.entries() if not entry.pinned]
+            total = sum(entry.size for entry in candidates)
+            for entry in candidates:
+                if total <= max_size:
+                    break
+                if now - entry.last_access < grace or (owners is not None and entry.owner not in owners):
+                    continue
+                if not dry_run:
+                    spec = CACHE_OWNERS.get(entry.owner)
+                    _remove(Path(entry.path), spec.companions if spec else ())
+                    con.execute("DELETE FROM entries WHERE path = ?", (entry.path,))
+                total -= entry.size
+                evicted.append(entry)
+        return evicted
+
+    def reset_counters(self) -> None:
+        with self._write() as con:
+            con.execute("DELETE FROM counters")
+
+
+def record_access(path: Path, owner: str, hit: Optional[bool] = None) -> None:
+    """Record an access to a cache entry (see :meth:`CacheIndex.record`).
+
+    Never raises: a busy, unwritable or corrupt index only loses the record.
+
+    Args:
+        path: The entry (file or directory).
+        owner: Owner name (see :data:`CACHE_OWNERS`).
+        hit: True for a cache hit, False for a miss, None to only note the access.
+    """
+    try:
+        with CacheIndex() as index:
+            index.record(path, owner, hit)
+    except (OSError, sqlite3.Error):
+        pass
+
+
+def _housekeeping_due() -> bool:
+    try:
+        return time.time() - cache_housekeeping_marker().stat().st_mtime > _HOUSEKEEPING_INTERVAL
+    except OSError:
+        return True
+
+
+def maybe_housekeep() -> None:
+    """Scan the caches and evict over ``cache.max_size``, at most once an hour.
+
+    Does nothing when no budget is configured, when housekeeping ran
+    recently, or when another process is already at it. Never raises.
+    """
+    try:
+        from oops.core.config import config  # local import to avoid circular deps
+
+        if config.cache.max_size is None or not _housekeeping_due():
+            return
+        marker = cache_housekeeping_marker()
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()  # claim the slot first: concurrent processes skip
+        with CacheIndex(timeout=0) as index:
+            index.scan()
+            index.evict(parse_size(config.cache.max_size))
+    except Exception:  # noqa: BLE001
+        pass
@@ -3,17 +3,21 @@
 #
 # File: config.py — oops/core/config.py
 
+import contextlib
+import hashlib
 import logging
+import marshal
 import os
+import time
 import warnings
 from dataclasses import dataclass, field, fields, is_dataclass
 from pathlib import Path
 
 import click
-import yaml
 from oops.core.compat import Dict, Final, List, Optional, Union, get_type_hints
 from oops.core.exceptions import ConfigurationError
 from oops.core.paths import CONFIG_PATHS as _CONFIG_PATHS
+from oops.core.paths import config_cache_dir
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +26,12 @@ _MISSING: Final[object] = object()
 
 _SUPPORTED_VERSIONS: Final[set] = {1}
 
+# Bumped whenever the layout of the compiled config cache changes.
+_COMPILED_FORMAT: Final[int] = 1
+# Files modified this recently are not cached: a second edit within the same
+# mtime tick that keeps the size unchanged would go unnoticed.
+_RACY_WINDOW: Final[float] = 2.0
+
 DOCS_URL = "https://apikcloud.github.io/oops/"
 
 
@@ -103,6 +113,7 @@ class ImagesConfig:
     collections: List[str] = field(default_factory=lambda: [])
     registries: ImageRegistriesConfig = field(default_factory=lambda: ImageRegistriesConfig())
     release_warn_age_days: int = 30
+    cache_ttl: int = 3600
 
 
 @dataclass
@@ -184,6 +195,11 @@ class StatsConfig:
     endpoint: Optional[str] = None
 
 
+@dataclass
+class CacheConfig:
+    max_size: Optional[str] = None  # budget of the evictable caches, e.g. "10G"; no eviction when unset
+
+
 @dataclass
 class GithubConfig:
     owner: Optional[str] = None  # GitHub org or user that will own the new repo
@@ -252,6 +268,7 @@ class Config:
     precommit: PrecommitConfig = field(default_factory=PrecommitConfig)
     github: GithubConfig = field(default_factory=GithubConfig)
     stats: StatsConfig = field(default_factory=StatsConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
     requirements: RequirementsConfig = field(default_factory=RequirementsConfig)
     analyze: AnalyzeConfig = field(default_factory=AnalyzeConfig)
 
@@ -260,6 +277,9 @@ class Config:
     # Internal / misc (not exposed in .oops.yaml)
     manifest_names: List[str] = field(default_factory=lambda: ["__manifest__.py", "__openerp__.py", "__terp__.py"])
     default_timeout: int = 60
+    http_max_connections: int = 8
+    http_retries: int = 3
+    http_backoff: float = 0.5
     github_api: str = "https://api.github.com"
     new_line: str = "\n"
     datetime_format: str = "%Y-%m-%d %H:%M:%S"
@@ -348,6 +368,56 @@ def _check_version(data: dict, path: Path) -> None:
         )
 
 
+def _compiled_path() -> Path:
+    """Return the compiled cache file for the current set of candidate config paths."""
+    candidates = "\0".join(str(p.resolve()) for p in _CONFIG_PATHS)
+    return config_cache_dir() / f"{hashlib.sha1(candidates.encode()).hexdigest()[:16]}.marshal"
+
+
+def _read_documents(found: List[Path]) -> List[dict]:
+    """Return the parsed YAML document of each config file in *found*.
+
+    Documents are served from a marshal-compiled copy under the user cache
+    dir while every file keeps its resolved path, mtime and size, so an
+    unchanged config never goes through the YAML parser (nor imports it).
+    A missing, stale or unreadable copy is rebuilt from the YAML files.
+    """
+    stats = [p.stat() for p in found]
+    key = (
+        _COMPILED_FORMAT,
+        tuple((str(p.resolve()), st.st_mtime_ns, st.st_size) for p, st in zip(found, stats)),
+    )
+    compiled = _compiled_path()
+    try:
+        cached_key, documents = marshal.loads(compiled.read_bytes())
+        if cached_key == key:
+            logger.debug("Config read from compiled cache %s", compiled)
+            return documents
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    import yaml  # noqa: PLC0415  # only needed when the compiled cache is cold
+
+    documents = []
+    for path in found:
+        logger.debug("Loading config from %s", path)
+        documents.append(yaml.safe_load(path.read_text()) or {})
+
+    if all(time.time() - st.st_mtime > _RACY_WINDOW for st in stats):
+        tmp = compiled.with_name(f"{compiled.name}.{os.getpid()}.tmp")
+        try:
+            # ValueError: YAML timestamps and other non-core types do not marshal.
+            payload = marshal.dumps((key, documents))
+            compiled.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(payload)
+            os.replace(tmp, compiled)
+        except (OSError, ValueError) as error:
+            logger.debug("Config not cached: %s", error)
+            with contextlib.suppress(OSError):
+                tmp.unlink()
+    return documents
+
+
 def load_config() -> Config:
     found = [p for p in _CONFIG_PATHS if p.exists()]
     if not found:
@@ -359,9 +429,7 @@ def load_config() -> Config:
         raise ConfigurationError("No config file found. Create ~/.oops.yaml or .oops.yaml") from None
 
     cfg = Config()
-    for path in found:
-        logger.debug("Loading config from %s", path)
-        data = yaml.safe_load(path.read_text()) or {}
+    for path, data in zip(found, _read_documents(found)):
         _check_version(data, path)
         _apply(cfg, data)
 
@@ -397,3 +465,8 @@ class _LazyConfig:
 
 
 config: Config = _LazyConfig()  # type: ignore[assignment]
+
+
+def reset_config() -> None:
+    """Drop the loaded config; the next access reloads it from the current directory."""
+    _LazyConfig._cfg = None
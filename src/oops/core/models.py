@@ -274,7 +274,7 @@ class ModuleSummary:
     classes: "list[ClassSummary]"
     structure: StructureSummary
     loc: "Optional[LocStats]" = None
-    loc_pct: float = 0.0
+    loc_pct: Optional[float] = 0.0  # None: project share unknown (no cached project count)
     views_summary: "Optional[ViewsSummary]" = None
     method_symbols: "list[dict]" = field(default_factory=list)
     class_infos: "list[Any]" = field(default_factory=list)
@@ -45,6 +45,15 @@ def project_kb_path(repo_root: Path) -> Path:
     return repo_root / CACHE_DIR_NAME / "kb.db"
 
 
+def project_loc_path(repo_root: Path) -> Path:
+    """Return the path of the cached per-addon LOC summary of a repo.
+
+    Returns:
+        ``<repo_root>/.oops-cache/loc.json`` (does not check for existence).
+    """
+    return repo_root / CACHE_DIR_NAME / "loc.json"
+
+
 def global_kb_dir() -> Path:
     """Return the default global KB cache directory.
 
@@ -66,6 +75,76 @@ def global_kb_path(version: str) -> Path:
     return global_kb_dir() / f"{version}.db"
 
 
+# ---------------------------------------------------------------------------
+# User cache (HTTP responses and derived indexes)
+# ---------------------------------------------------------------------------
+
+
+def user_cache_dir() -> Path:
+    """Return the oops cache directory, respecting ``XDG_CACHE_HOME``.
+
+    Returns:
+        ``$XDG_CACHE_HOME/oops`` when the env var is set, otherwise
+        ``~/.cache/oops``.
+    """
+    base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / "oops"
+
+
+def http_cache_dir() -> Path:
+    """Return the directory of the persistent HTTP response cache.
+
+    Returns:
+        ``<user_cache_dir>/http``
+    """
+    return user_cache_dir() / "http"
+
+
+def kb_artifacts_dir() -> Path:
+    """Return the default directory of the local KB artifact store.
+
+    Returns:
+        ``<user_cache_dir>/kb-artifacts``
+    """
+    return user_cache_dir() / "kb-artifacts"
+
+
+def images_index_dir() -> Path:
+    """Return the directory of the per-version Odoo image index.
+
+    Returns:
+        ``<user_cache_dir>/images``
+    """
+    return user_cache_dir() / "images"
+
+
+def cache_index_path() -> Path:
+    """Return the path of the cache index (entry sizes, accesses, hit/miss counters).
+
+    Returns:
+        ``<user_cache_dir>/index.db``
+    """
+    return user_cache_dir() / "index.db"
+
+
+def cache_housekeeping_marker() -> Path:
+    """Return the path to the last-housekeeping marker file.
+
+    Returns:
+        ``<user_cache_dir>/housekeeping_last_run``
+    """
+    return user_cache_dir() / "housekeeping_last_run"
+
+
+def config_cache_dir() -> Path:
+    """Return the directory of the compiled (pre-parsed) config files.
+
+    Returns:
+        ``<user_cache_dir>/config``
+    """
+    return user_cache_dir() / "config"
+
+
 # ---------------------------------------------------------------------------
 # Stats / usage-tracking data directory
 # ---------------------------------------------------------------------------
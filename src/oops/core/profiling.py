@@ -0,0 +1,222 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: profiling.py — src/oops/core/profiling.py
+
+"""Lightweight phase tracer behind the global ``--profile`` option.
+
+Code marks its expensive phases with :func:`span` and bumps counters with
+:func:`count`. Both are no-ops until :func:`start_profiling` installs a
+:class:`Tracer`, so instrumentation can stay in hot paths at the cost of a
+single global lookup.
+
+Usage::
+
+    from oops.core.profiling import count, span
+
+    with span("kb.build", modules=len(modules)):
+        ...
+    count("subprocess.git")
+
+Spans nest per thread; the tracer aggregates them into a summary table
+(:meth:`Tracer.summary`) and exports Chrome trace-event JSON
+(:meth:`Tracer.chrome_trace`), loadable in ``chrome://tracing`` or Perfetto.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from oops.core.compat import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class Span:
+    """One closed phase: wall-clock bounds in seconds relative to the tracer start."""
+
+    name: str
+    start: float
+    end: float
+    depth: int
+    thread: int
+    args: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """Elapsed wall time in seconds."""
+        return self.end - self.start
+
+
+@dataclass
+class PhaseStats:
+    """Aggregated timings of every span sharing the same nesting path."""
+
+    path: Tuple[str, ...]
+    calls: int = 0
+    total: float = 0.0
+    child: float = 0.0
+
+    @property
+    def name(self) -> str:
+        """Leaf phase name."""
+        return self.path[-1]
+
+    @property
+    def depth(self) -> int:
+        """Nesting depth (0 for top-level phases)."""
+        return len(self.path) - 1
+
+    @property
+    def self_time(self) -> float:
+        """Time spent in the phase itself, excluding nested phases."""
+        return max(self.total - self.child, 0.0)
+
+
+class Tracer:
+    """Collects nested spans and named counters for one profiled run.
+
+    Thread-safe: each thread keeps its own span stack, closed spans and
+    counters are appended under a lock.
+    """
+
+    def __init__(self) -> None:
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.spans: List[Span] = []
+        self._paths: List[Tuple[str, ...]] = []
+        self.counters: Dict[str, int] = {}
+
+    def _stack(self) -> List[str]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def now(self) -> float:
+        """Seconds elapsed since the tracer was created."""
+        return time.perf_counter() - self._t0
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[None]:
+        """Record the enclosed block as a phase named ``name``."""
+        stack = self._stack()
+        stack.append(name)
+        path = tuple(stack)
+        start = self.now()
+        try:
+            yield
+        finally:
+            end = self.now()
+            stack.pop()
+            record = Span(name, start, end, len(path) - 1, threading.get_ident(), args)
+            with self._lock:
+                self.spans.append(record)
+                self._paths.append(path)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Add ``n`` to the counter ``name``."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def summary(self) -> List[PhaseStats]:
+        """Aggregate spans by nesting path, in depth-first order of first start.
+
+        Returns:
+            One :class:`PhaseStats` per distinct path; parents precede their
+            children so the list renders directly as an indented tree.
+        """
+        stats: Dict[Tuple[str, ...], PhaseStats] = {}
+        first_start: Dict[Tuple[str, ...], float] = {}
+        for span_, path in zip(self.spans, self._paths):
+            entry = stats.setdefault(path, PhaseStats(path))
+            entry.calls += 1
+            entry.total += span_.duration
+            first_start[path] = min(first_start.get(path, span_.start), span_.start)
+            if len(path) > 1:
+                # Children close before their parent: the parent entry may not exist yet.
+                stats.setdefault(path[:-1], PhaseStats(path[:-1])).child += span_.duration
+
+        def _key(path: Tuple[str, ...]) -> Tuple[float, ...]:
+            return tuple(first_start.get(path[: i + 1], 0.0) for i in range(len(path)))
+
+        return [stats[p] for p in sorted(stats, key=_key) if stats[p].calls]
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Export spans and counters as Chrome trace-event JSON.
+
+        Spans become complete (``"ph": "X"``) events in microseconds; final
+        counter values are attached as a single counter (``"ph": "C"``) event
+        at the end of the trace.
+        """
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {
+                "name": s.name,
+                "cat": "oops",
+                "ph": "X",
+                "ts": round(s.start * 1e6, 1),
+                "dur": round(s.duration * 1e6, 1),
+                "pid": pid,
+                "tid": s.thread,
+                "args": s.args,
+            }
+            for s in sorted(self.spans, key=lambda s: s.start)
+        ]
+        if self.counters:
+            events.append(
+                {
+                    "name": "counters",
+                    "cat": "oops",
+                    "ph": "C",
+                    "ts": round(self.now() * 1e6, 1),
+                    "pid": pid,
+                    "args": dict(sorted(self.counters.items())),
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+_tracer: Optional[Tracer] = None
+
+
+def start_profiling() -> Tracer:
+    """Install a fresh global tracer and return it."""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop_profiling() -> Optional[Tracer]:
+    """Uninstall the global tracer and return it (None if none was active)."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Return the active tracer, or None when profiling is off."""
+    return _tracer
+
+
+@contextmanager
+def span(name: str, **args: Any) -> Iterator[None]:
+    """Record a phase on the active tracer; no-op when profiling is off."""
+    tracer = _tracer
+    if tracer is None:
+        yield
+        return
+    with tracer.span(name, **args):
+        yield
+
+
+def count(name: str, n: int = 1) -> None:
+    """Bump a counter on the active tracer; no-op when profiling is off."""
+    tracer = _tracer
+    if tracer is not None:
+        tracer.count(name, n)
@@ -0,0 +1,256 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: archive.py — oops/io/archive.py
+
+"""
+Incremental ZIP extraction from a byte stream.
+
+A ZIP archive can be read front to back: every entry starts with a *local
+file header* carrying its name, compression method and (usually) sizes, so
+entries can be written to disk while the archive is still downloading. The
+central directory at the end is not needed and is skipped.
+
+Only the two methods GitHub archives use are supported: *stored* and
+*deflate*. Entries whose sizes are deferred to a trailing data descriptor
+(flag bit 3) are supported for deflate, whose stream marks its own end.
+Each entry's CRC-32 and size are checked as soon as it is complete.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from pathlib import Path, PurePosixPath
+from typing import IO
+
+from oops.core.compat import List, Optional
+from oops.core.exceptions import OopsError
+
+_LOCAL_SIG = b"PK\x03\x04"
+_DESCRIPTOR_SIG = b"PK\x07\x08"
+_CENTRAL_SIGS = (b"PK\x01\x02", b"PK\x05\x06", b"PK\x06\x06")
+_LOCAL_HEADER = struct.Struct("<4sHHHHHIIIHH")
+_ZIP64_EXTRA_ID = 0x0001
+_FLAG_DESCRIPTOR = 0x08
+_FLAG_ENCRYPTED = 0x01
+_STORED, _DEFLATED = 0, 8
+_U32_MAX = 0xFFFFFFFF
+
+
+class CorruptArchiveError(OopsError):
+    """Raised when a streamed archive is malformed or fails its checksums."""
+
+
+class StreamingZipExtractor:
+    """Extract a ZIP archive fed as successive byte chunks.
+
+    Usage::
+
+        extractor = StreamingZipExtractor(out_dir)
+        for chunk in response_chunks:
+            extractor.feed(chunk)
+        extractor.close()
+
+    Args:
+        dest: Directory the entries are extracted into.
+
+    Attributes:
+        names: Entry names extracted so far, in archive order.
+        bytes_fed: Archive bytes consumed so far.
+    """
+
+    def __init__(self, dest: "str | os.PathLike[str]") -> None:
+        self.dest = Path(dest)
+        self.names: List[str] = []
+        self.bytes_fed = 0
+        self._buf = bytearray()
+        self._done = False
+        # Current entry state (None between entries).
+        self._name: Optional[str] = None
+        self._out: Optional[IO[bytes]] = None
+        self._method = _STORED
+        self._descriptor = False
+        self._zip64 = False
+        self._remaining = 0
+        self._crc_expected = 0
+        self._size_expected = 0
+        self._crc = 0
+        self._size = 0
+        self._inflater: Optional["zlib._Decompress"] = None
+
+    @property
+    def root(self) -> Optional[str]:
+        """Top-level directory shared by every entry, if any (GitHub: ``<repo>-<sha>``)."""
+        tops = {n.split("/", 1)[0] for n in self.names}
+        if len(tops) == 1 and any("/" in n for n in self.names):
+            return tops.pop()
+        return None
+
+    # -- feeding -----------------------------------------------------------
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume ``chunk`` and write out every entry part it completes."""
+        self.bytes_fed += len(chunk)
+        if self._done:
+            return
+        self._buf += chunk
+        while not self._done and self._step():
+            pass
+
+    def close(self) -> None:
+        """Finish extraction.
+
+        Raises:
+            CorruptArchiveError: If the stream ended inside an entry.
+        """
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+        if not self._done:
+            raise CorruptArchiveError(f"Archive truncated after {self.bytes_fed} bytes.")
+
+    def _step(self) -> bool:
+        """Advance the state machine; return False when more input is needed."""
+        if self._name is None:
+            return self._read_header()
+        if self._descriptor and self._inflater is not None and self._inflater.eof:
+            return self._read_descriptor()
+        return self._read_data()
+
+    def _read_header(self) -> bool:
+        if len(self._buf) < 4:
+            return False
+        sig = bytes(self._buf[:4])
+        if sig in _CENTRAL_SIGS:
+            self._done = True
+            self._buf.clear()
+            return False
+        if sig != _LOCAL_SIG:
+            raise CorruptArchiveError(f"Unexpected signature {sig!r} at offset {self.bytes_fed - len(self._buf)}.")
+        if len(self._buf) < _LOCAL_HEADER.size:
+            return False
+        (_, _, flags, method, _, _, crc, csize, usize, name_len, extra_len) = _LOCAL_HEADER.unpack_from(self._buf)
+        end = _LOCAL_HEADER.size + name_len + extra_len
+        if len(self._buf) < end:
+            return False
+
+        name = bytes(self._buf[_LOCAL_HEADER.size : _LOCAL_HEADER.size + name_len]).decode("utf-8", "replace")
+        extra = bytes(self._buf[_LOCAL_HEADER.size + name_len : end])
+        del self._buf[:end]
+
+        if flags & _FLAG_ENCRYPTED:
+            raise CorruptArchiveError(f"Encrypted entry not supported: {name}")
+        if method not in (_STORED, _DEFLATED):
+            raise CorruptArchiveError(f"Unsupported compression method {method} for {name}")
+        self._descriptor = bool(flags & _FLAG_DESCRIPTOR)
+        if self._descriptor and method == _STORED:
+            raise CorruptArchiveError(f"Stored entry without sizes cannot be streamed: {name}")
+
+        self._zip64 = False
+        if _U32_MAX in (csize, usize):
+            usize, csize = _zip64_sizes(extra, usize, csize)
+            self._zip64 = True
+
+        self._start_entry(name, method, crc, csize, usize)
+        return True
+
+    def _start_entry(self, name: str, method: int, crc: int, csize: int, usize: int) -> None:
+        self._name = name
+        self._method = method
+        self._crc_expected, self._size_expected = crc, usize
+        self._remaining = csize
+        self._crc = self._size = 0
+        self._inflater = zlib.decompressobj(-zlib.MAX_WBITS) if method == _DEFLATED else None
+        self.names.append(name)
+
+        target = _safe_target(self.dest, name)
+        if name.endswith("/"):
+            target.mkdir(parents=True, exist_ok=True)
+            self._out = None
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            self._out = open(target, "wb")  # noqa: SIM115 - closed in _finish_entry/close
+
+    def _read_data(self) -> bool:
+        if self._descriptor or self._remaining:
+            if not self._buf:
+                return False
+            self._consume()
+        if not self._descriptor and self._remaining == 0:
+            if self._inflater is not None:
+                self._write(self._inflater.flush())
+            self._finish_entry()
+        return True
+
+    def _consume(self) -> None:
+        if self._descriptor:
+            data = bytes(self._buf)
+            self._buf.clear()
+        else:
+            take = min(self._remaining, len(self._buf))
+            data = bytes(self._buf[:take])
+            del self._buf[:take]
+            self._remaining -= take
+
+        if self._inflater is not None:
+            self._write(self._inflater.decompress(data))
+            if self._inflater.eof:
+                # Bytes past the end of the deflate stream belong to the next record.
+                self._buf[:0] = self._inflater.unused_data
+        else:
+            self._write(data)
+
+    def _read_descriptor(self) -> bool:
+        has_sig = self._buf[:4] == _DESCRIPTOR_SIG
+        size_fmt = "<IQQ" if self._zip64 else "<III"
+        needed = (4 if has_sig else 0) + struct.calcsize(size_fmt)
+        if len(self._buf) < needed:
+            return False
+        crc, _, usize = struct.unpack_from(size_fmt, self._buf, 4 if has_sig else 0)
+        del self._buf[:needed]
+        self._crc_expected, self._size_expected = crc, usize
+        self._finish_entry()
+        return True
+
+    def _write(self, data: bytes) -> None:
+        if not data:
+            return
+        self._crc = zlib.crc32(data, self._crc)
+        self._size += len(data)
+        if self._out is not None:
+            self._out.write(data)
+
+    def _finish_entry(self) -> None:
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+        if self._crc != self._crc_expected or self._size != self._size_expected:
+            raise CorruptArchiveError(f"Checksum mismatch for {self._name}")
+        self._name = None
+        self._inflater = None
+
+
+def _zip64_sizes(extra: bytes, usize: int, csize: int) -> "tuple[int, int]":
+    """Read the sizes saturated in the local header from the ZIP64 extra field."""
+    pos = 0
+    while pos + 4 <= len(extra):
+        tag, length = struct.unpack_from("<HH", extra, pos)
+        if tag == _ZIP64_EXTRA_ID:
+            values = iter(struct.unpack_from(f"<{length // 8}Q", extra, pos + 4))
+            if usize == _U32_MAX:
+                usize = next(values)
+            if csize == _U32_MAX:
+                csize = next(values)
+            return usize, csize
+        pos += 4 + length
+    raise CorruptArchiveError("ZIP64 entry without a ZIP64 extra field.")
+
+
+def _safe_target(dest: Path, name: str) -> Path:
+    """Map an entry name below ``dest``, refusing absolute and ``..`` paths."""
+    parts = PurePosixPath(name).parts
+    if not parts or name.startswith("/") or ".." in parts:
+        raise CorruptArchiveError(f"Unsafe path in archive: {name}")
+    return dest.joinpath(*parts)
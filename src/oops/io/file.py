@@ -20,19 +20,22 @@ import difflib
 import os
 import re
 import shutil
+import threading
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from os import PathLike
 from pathlib import Path
-from typing import NamedTuple
+from typing import TYPE_CHECKING, NamedTuple
 
 import click
-from git.repo import Repo
-from oops.core.compat import List, Optional, Union
+from oops.core.compat import Dict, List, Optional, Set, Union
 from oops.core.config import config
 from oops.core.exceptions import ConfigError, OopsError
 from oops.core.logger import log
 from oops.core.models import AddonInfo, ImageInfo
 from oops.core.paths import PR_DIR, UNPORTED_DIR
+from oops.core.profiling import count
 from oops.io.manifest import load_manifest
 from oops.io.templates import COMPOSE_TEMPLATE, MAILDEV_ENV, MAILDEV_SERVICE, SFTP_SERVICE
 from oops.services.docker import parse_image_tag
@@ -42,6 +45,9 @@ from oops.utils.net import parse_repository_url
 from oops.utils.render import print_warning
 from packaging import version
 
+if TYPE_CHECKING:
+    from git.repo import Repo
+
 # ---------------------------------------------------------------------------
 # Path utilities
 # ---------------------------------------------------------------------------
@@ -206,24 +212,197 @@ def write_text_file(path: Path, lines: list, new_line: str = "\n", add_final_new
     content = new_line.join(lines)
     if add_final_newline:
         content += new_line
-    path.write_text(content)
+    count("io.bytes_written", path.write_text(content))
+
+
+_FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+_NO_REFLINK: Set[int] = set()  # st_dev of filesystems that refused a reflink
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Share ``src``'s extents with a new ``dst`` (btrfs, XFS, ...); False if unsupported."""
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover - Windows
+        return False
+    device = src.stat().st_dev
+    if device in _NO_REFLINK:
+        return False
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return True
+        except OSError:
+            _NO_REFLINK.add(device)
+            return False
 
 
-def copytree(src: Path, dst: Path, ignore_git: bool = True) -> None:
-    """Copy a directory tree from src to dst, preserving symlinks.
+def _copy_file_range(src: Path, dst: Path) -> bool:
+    """Copy in the kernel with ``copy_file_range`` (Linux, Python 3.8+); False if unavailable."""
+    if not hasattr(os, "copy_file_range"):
+        return False
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            return False
+    return True
+
+
+def clone_file(src: Path, dst: Path, hardlink: bool = False) -> str:
+    """Copy one regular file with the cheapest mechanism available.
+
+    Tried in order: a hardlink (only when ``hardlink`` is set, and on the
+    same filesystem), a reflink (copy-on-write clone), ``copy_file_range``,
+    then a plain buffered copy. Mode and timestamps are preserved.
+
+    Args:
+        src: Source file.
+        dst: Destination file; overwritten if it exists.
+        hardlink: Allow sharing the inode with ``src``. Only safe when the
+            source is discarded afterwards or never modified in place.
+
+    Returns:
+        The mechanism used: ``"hardlink"``, ``"reflink"``, ``"copy_file_range"`` or ``"copy"``.
+    """
+    src, dst = Path(src), Path(dst)
+    if hardlink:
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except OSError:
+            pass
+    if _reflink(src, dst):
+        method = "reflink"
+    elif _copy_file_range(src, dst):
+        method = "copy_file_range"
+    else:
+        shutil.copyfile(src, dst)
+        method = "copy"
+    shutil.copystat(src, dst)
+    return method
+
+
+_CLONE_METHODS = ("hardlink", "reflink")
+
+
+@dataclass
+class CopyStats:
+    """Outcome of a :func:`copytree` run.
+
+    Attributes:
+        files: Regular files copied.
+        bytes: Their total size.
+        cloned_bytes: Part of ``bytes`` shared instead of written
+            (hardlinks and reflinks) — no extra disk space, no data copied.
+        methods: Files per mechanism (see :func:`clone_file`).
+    """
+
+    files: int = 0
+    bytes: int = 0
+    cloned_bytes: int = 0
+    methods: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, method: str, size: int) -> None:
+        """Account for one file copied with ``method``."""
+        self.files += 1
+        self.bytes += size
+        if method in _CLONE_METHODS:
+            self.cloned_bytes += size
+        self.methods[method] = self.methods.get(method, 0) + 1
+
+    def merge(self, other: "CopyStats") -> None:
+        """Add ``other``'s totals to this one."""
+        self.files += other.files
+        self.bytes += other.bytes
+        self.cloned_bytes += other.cloned_bytes
+        for method, n in other.methods.items():
+            self.methods[method] = self.methods.get(method, 0) + n
+
+
+_copy_pool: Optional[ThreadPoolExecutor] = None
+_copy_pool_lock = threading.Lock()
+
+
+def _get_copy_pool() -> ThreadPoolExecutor:
+    """Process-wide pool shared by every :func:`copytree` call.
+
+    Concurrent copies (e.g. several addons materialized at once) queue their
+    files on the same workers, so the number of files in flight stays
+    bounded however many trees are copied.
+    """
+    global _copy_pool
+    with _copy_pool_lock:
+        if _copy_pool is None:
+            _copy_pool = ThreadPoolExecutor(
+                max_workers=min(16, (os.cpu_count() or 1) * 4), thread_name_prefix="oops-copy"
+            )
+        return _copy_pool
+
+
+def copytree(src: Path, dst: Path, ignore_git: bool = True, hardlink: bool = False) -> CopyStats:
+    """Copy a directory tree from src to dst, preserving symlinks, modes and mtimes.
+
+    Directories and symlinks are created up front; regular files are then
+    copied on a bounded worker pool through :func:`clone_file`, so
+    same-filesystem copies are reflinked (or hardlinked when allowed) rather
+    than rewritten. Directory timestamps are restored last.
 
     Args:
         src: Source directory to copy.
         dst: Destination path, must not already exist.
         ignore_git: If True, skip .git directories. Defaults to True.
+        hardlink: Hardlink files instead of copying them when possible.
+
+    Returns:
+        A :class:`CopyStats` with file, byte and per-mechanism counts.
+
+    Raises:
+        FileExistsError: If ``dst`` already exists.
     """
+    src, dst = Path(src), Path(dst)
+    dst.mkdir(parents=True, exist_ok=False)
 
-    def _ignore(_dir, names):
-        if not ignore_git:
-            return set()
-        return {n for n in names if n == ".git"}
+    files: List[tuple] = []
+    dirs: List[tuple] = [(src, dst)]
+    for dirpath, dirnames, filenames in os.walk(src):
+        if ignore_git and ".git" in dirnames:
+            dirnames.remove(".git")
+        if ignore_git and ".git" in filenames:
+            filenames.remove(".git")  # submodule gitfile
+        source_dir = Path(dirpath)
+        target_dir = dst / source_dir.relative_to(src)
+        for name in list(dirnames):
+            source = source_dir / name
+            if source.is_symlink():
+                dirnames.remove(name)  # kept as a link, not followed
+                os.symlink(os.readlink(source), target_dir / name)
+                continue
+            (target_dir / name).mkdir()
+            dirs.append((source, target_dir / name))
+        for name in filenames:
+            source = source_dir / name
+            if source.is_symlink():
+                os.symlink(os.readlink(source), target_dir / name)
+            else:
+                files.append((source, target_dir / name))
+
+    def _copy(pair: tuple) -> tuple:
+        source, target = pair
+        return clone_file(source, target, hardlink=hardlink), source.stat().st_size
 
-    shutil.copytree(src, dst, symlinks=True, ignore=_ignore)
+    stats = CopyStats()
+    for method, size in _get_copy_pool().map(_copy, files):
+        stats.add(method, size)
+    for source, target in reversed(dirs):
+        shutil.copystat(source, target)
+    count("io.bytes_written", stats.bytes - stats.cloned_bytes)
+    return stats
 
 
 def parse_packages(path: Path) -> list:
@@ -613,13 +792,20 @@ def rewrite_symlink(link: Path, old_prefix: str, new_prefix: str) -> bool:
     return False
 
 
-def materialize_symlink(symlink_path: Path, dry_run: bool) -> None:
+def materialize_symlink(symlink_path: Path, dry_run: bool) -> Optional[CopyStats]:
     """Replace a symlink pointing to a directory with a physical copy of its target.
 
+    The copy goes through :func:`copytree`: files are reflinked where the
+    filesystem allows it (btrfs, XFS), so materializing is close to instant
+    and costs no extra space until the files are edited.
+
     Args:
         symlink_path: Path to the symlink to materialize.
         dry_run: If True, validate inputs but make no filesystem changes.
 
+    Returns:
+        Copy statistics, or None on a dry run.
+
     Raises:
         ValueError: If the path does not exist, is not a symlink, its target
             is not a directory, or materialization fails.
@@ -644,10 +830,10 @@ def materialize_symlink(symlink_path: Path, dry_run: bool) -> None:
     log.debug(f"[oops] tmp copy:   {tmp}")
 
     if dry_run:
-        return
+        return None
 
     try:
-        copytree(target, tmp)
+        stats = copytree(target, tmp)
         # Remove the symlink and atomically replace with the copied tree
         symlink_path.unlink()
         os.replace(tmp, symlink_path)  # atomic on same filesystem
@@ -657,6 +843,7 @@ def materialize_symlink(symlink_path: Path, dry_run: bool) -> None:
             if tmp.exists():
                 shutil.rmtree(tmp)
         raise ValueError(f"Failed to materialize {symlink_path}: {e}") from e
+    return stats
 
 
 # ---------------------------------------------------------------------------
@@ -814,11 +1001,7 @@ def get_excluded_addon_names(repo_path: Path) -> list:
     Returns:
         Sorted list of technical addon names to exclude.
     """
-    res = []
-    for addon in find_addons(repo_path, shallow=True):
-        if not addon.installable or config.manifest.author.lower() not in addon.author.lower():
-            res.append(addon.technical_name)
-    return sorted(res)
+    return sorted(addon.technical_name for addon in find_addons(repo_path, shallow=True) if is_excluded_addon(addon))
 
 
 def get_filtered_addon_names(repo_path: Path) -> list:
@@ -835,11 +1018,39 @@ def get_filtered_addon_names(repo_path: Path) -> list:
     Returns:
         Sorted list of technical addon names matching the criteria.
     """
-    res = []
-    for addon in find_addons(repo_path, shallow=True):
-        if not addon.symlink and addon.installable and config.manifest.author.lower() in addon.author.lower():
-            res.append(addon.technical_name)
-    return sorted(res)
+    return sorted(addon.technical_name for addon in find_addons(repo_path, shallow=True) if is_owned_addon(addon))
+
+
+def is_excluded_addon(addon: AddonInfo) -> bool:
+    """Return True if an addon is excluded from pre-commit checks (not installable or third-party)."""
+    return not addon.installable or config.manifest.author.lower() not in addon.author.lower()
+
+
+def is_owned_addon(addon: AddonInfo) -> bool:
+    """Return True if an addon is owned, installable and not symlinked (default manifest lint scope)."""
+    return not addon.symlink and addon.installable and config.manifest.author.lower() in addon.author.lower()
+
+
+def load_root_addons(repo_path: Path, names: List[str]) -> List[AddonInfo]:
+    """Return the AddonInfo of the named root addons, without scanning the repository.
+
+    The targeted counterpart of ``find_addons(repo_path, shallow=True)`` used by
+    the staged-only hook runs; names with no addon on disk (removed addons,
+    plain files) are skipped.
+
+    Args:
+        repo_path: Root directory of the local repository.
+        names: Root entry names to load.
+
+    Returns:
+        AddonInfo for each name that is an addon, in ``names`` order.
+    """
+    addons = []
+    for name in names:
+        path = repo_path / name
+        if any((path / manifest).is_file() for manifest in config.manifest_names):
+            addons.append(AddonInfo.from_path(path, root_path=repo_path, manifest=load_manifest(path)))
+    return addons
 
 
 # Standard OCA fragment order for a readme/ directory (concatenated in this order).
@@ -1187,6 +1398,25 @@ def get_odoo_sources_dirs(version: str, base_dir: Optional[Path] = None) -> Odoo
     )
 
 
+def get_odoo_reference_dir(name: str, base_dir: Optional[Path] = None) -> Path:
+    """Return the bare reference repository path shared by all versions of one upstream.
+
+    Args:
+        name: Upstream name (``"community"``, ``"enterprise"`` or ``"themes"``).
+        base_dir: Optional explicit root for Odoo sources. Overrides the config value.
+
+    Returns:
+        ``<base_dir>/.reference/<name>.git`` (not created).
+
+    Raises:
+        ConfigError: When neither ``base_dir`` nor ``odoo.sources_dir`` is set.
+    """
+    resolved = base_dir or config.odoo.sources_dir
+    if resolved is None:
+        raise ConfigError("No base directory provided. Set odoo.sources_dir in ~/.oops.yaml.")
+    return resolved / ".reference" / f"{name}.git"
+
+
 class OdooSourcesStatus(NamedTuple):
     """Availability of community, enterprise, and themes sources for one Odoo version."""
 
@@ -1238,7 +1468,7 @@ def list_odoo_sources_versions(base_dir: Optional[Path] = None) -> "List[OdooSou
             path=d,
         )
         for d in sorted(resolved.iterdir())
-        if d.is_dir()
+        if d.is_dir() and not d.name.startswith(".")
     ]
 
 
@@ -1259,5 +1489,5 @@ def require_odoo_sources(base_dir: Optional[Path] = None) -> "List[OdooSourcesSt
             path=d,
         )
         for d in sorted(resolved.iterdir())
-        if d.is_dir()
+        if d.is_dir() and not d.name.startswith(".")
     ]
@@ -20,6 +20,7 @@ import subprocess
 from functools import lru_cache
 from pathlib import Path
 
+from oops.core.profiling import count
 from oops.utils.render import print_warning
 
 
@@ -37,6 +38,7 @@ def _has(binary: str) -> bool:
 
 def _run(cmd: list, cwd: Path) -> None:
     """Run a formatter subprocess; ignore errors (best-effort)."""
+    count(f"subprocess.{Path(cmd[0]).name}")
     subprocess.run(cmd, cwd=str(cwd), check=False, capture_output=True)
 
 
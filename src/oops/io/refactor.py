@@ -312,7 +312,7 @@ def analyse_file(
             if fld:
                 fname, lineno, ftype = fld
                 kb_entries = kb.get_symbol(model_name, fname, "field")
-                kb_entry = resolve_symbol(kb_entries, custom_module, modules_index)
+                kb_entry = resolve_symbol(kb_entries, custom_module, modules_index, kb)
                 section = "BASE FIELDS" if is_new_model else ("INHERITED FIELDS" if kb_entry else "NEW FIELDS")
                 ci.symbols.append(
                     SymbolInfo(
@@ -344,8 +344,8 @@ def analyse_file(
             has_super, super_methods = _detect_super(source, stmt.name)
 
             kb_entries = kb.get_symbol(model_name, stmt.name, "method")
-            kb_entry = resolve_symbol(kb_entries, custom_module, modules_index)
-            kb_root_entry = resolve_symbol_root(kb_entries, custom_module, modules_index)
+            kb_entry = resolve_symbol(kb_entries, custom_module, modules_index, kb)
+            kb_root_entry = resolve_symbol_root(kb_entries, custom_module, modules_index, kb)
 
             ci.symbols.append(
                 SymbolInfo(
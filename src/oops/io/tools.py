@@ -13,9 +13,11 @@ Sections:
 import json
 import subprocess
 import sys
+from pathlib import Path
 
 from oops.core.compat import List, Optional
 from oops.core.logger import log
+from oops.core.profiling import count
 
 # ---------------------------------------------------------------------------
 # Subprocess
@@ -48,6 +50,7 @@ def run(
         kwargs["stderr"] = subprocess.PIPE
 
     log.debug(f"[{name or 'run'}] {' '.join(cmd)}")
+    count(f"subprocess.{name or Path(cmd[0]).name}")
 
     res = subprocess.run(cmd, check=check, **kwargs)
     return res.stdout if capture else None
@@ -61,6 +64,7 @@ def run_oops(args: List[str], cwd: str, timeout: int = 180) -> dict:
     A non-JSON stdout (a real crash) surfaces stderr as an error payload that
     the SPA renders via its "error" view.
     """
+    count("subprocess.run_oops")
     proc = subprocess.run(
         [sys.executable, "-m", "oops", *args, "--format", "json"],
         cwd=cwd,
@@ -0,0 +1,236 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: watch.py — oops/io/watch.py
+
+"""
+File-change notifications for the ``--watch`` modes.
+
+On Linux the kernel's inotify API is used directly through ctypes (no extra
+dependency); elsewhere, or when inotify is unavailable, trees are polled for
+mtime/size changes. Either way events are debounced: the burst of writes of
+an editor save or a ``git checkout`` comes out as a single batch of paths.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Iterator
+
+from oops.core.compat import Dict, List, Optional, Set, Tuple
+from oops.core.logger import log
+
+# Quiet period closing a batch of events.
+DEBOUNCE_SECONDS = 0.15
+
+# Interval between two scans of the polling fallback.
+POLL_INTERVAL = 0.5
+
+IGNORED_DIRS = {".git", "__pycache__", "node_modules", ".oops-cache"}
+
+# Editor droppings and compiled files: never a meaningful change.
+_IGNORED_SUFFIXES = (".pyc", ".pyo", ".swp", ".swx", ".swo", ".tmp", "~")
+
+# <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len — then len bytes of name
+
+
+def is_ignored(name: str) -> bool:
+    """Return True for file names whose changes never matter (swap files, bytecode…)."""
+    return name.startswith(".") or name.endswith(_IGNORED_SUFFIXES) or name == "4913"  # vim write probe
+
+
+def _walk_dirs(root: Path) -> Iterator[Path]:
+    for current, dirs, _ in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in IGNORED_DIRS and not d.startswith(".")]
+        yield Path(current)
+
+
+class _Inotify:
+    """Recursive inotify watch over a set of directory trees."""
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, Path] = {}
+        self._roots: List[Path] = []
+
+    def add_tree(self, root: Path) -> None:
+        if root not in self._roots and root.is_dir():
+            self._roots.append(root)
+        for directory in _walk_dirs(root):
+            wd = self._add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+            if wd < 0:
+                log.debug(f"inotify: cannot watch {directory} (errno {ctypes.get_errno()})")
+                continue
+            self._dirs[wd] = directory
+
+    def read(self, timeout: Optional[float]) -> Set[Path]:
+        """Wait up to ``timeout`` seconds (None: forever) and return the changed paths."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed: Set[Path] = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0").decode(errors="surrogateescape")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:  # events were lost: report every tree
+                changed.update(self._roots)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & _IN_IGNORED:
+                del self._dirs[wd]
+                continue
+            if not name:
+                changed.add(directory)
+                continue
+            if is_ignored(name) or name in IGNORED_DIRS:
+                continue
+            path = directory / name
+            if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                self.add_tree(path)
+            changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class _Poller:
+    """Portable fallback: compare (mtime, size) snapshots of every file."""
+
+    def __init__(self, interval: float = POLL_INTERVAL) -> None:
+        self.interval = interval
+        self._roots: List[Path] = []
+        self._state: Dict[Path, Tuple[int, int]] = {}
+
+    def _snapshot(self, root: Path) -> Dict[Path, Tuple[int, int]]:
+        state: Dict[Path, Tuple[int, int]] = {}
+        for directory in _walk_dirs(root):
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_file() and not is_ignored(entry.name):
+                    st = entry.stat()
+                    state[Path(entry.path)] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def add_tree(self, root: Path) -> None:
+        self._roots.append(root)
+        self._state.update(self._snapshot(root))
+
+    def read(self, timeout: Optional[float]) -> Set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.interval if deadline is None else min(self.interval, max(deadline - time.monotonic(), 0))
+            time.sleep(wait)
+            state: Dict[Path, Tuple[int, int]] = {}
+            for root in self._roots:
+                state.update(self._snapshot(root))
+            changed = {p for p in state.keys() | self._state.keys() if state.get(p) != self._state.get(p)}
+            self._state = state
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        self._roots = []
+
+
+class FileWatcher:
+    """Watch directory trees and yield debounced batches of changed paths.
+
+    Usage::
+
+        with FileWatcher([module_a, module_b]) as watcher:
+            for paths in watcher:
+                ...
+
+    Args:
+        roots: Directories to watch recursively (hidden, VCS and cache
+            directories are skipped).
+        debounce: Quiet period, in seconds, that closes a batch.
+        polling: Force the polling backend (default: inotify when available).
+    """
+
+    def __init__(self, roots: List[Path], debounce: float = DEBOUNCE_SECONDS, polling: bool = False) -> None:
+        self.debounce = debounce
+        self._backend: "_Inotify | _Poller"
+        if not polling and sys.platform.startswith("linux"):
+            try:
+                self._backend = _Inotify()
+            except (OSError, AttributeError) as error:  # no libc / inotify limits reached
+                log.debug(f"inotify unavailable ({error}), polling instead")
+                self._backend = _Poller()
+        else:
+            self._backend = _Poller()
+        for root in roots:
+            self._backend.add_tree(Path(root))
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if isinstance(self._backend, _Inotify) else "polling"
+
+    def next_batch(self, timeout: Optional[float] = None) -> Set[Path]:
+        """Block until something changes (or ``timeout`` expires) and return the batch.
+
+        Returns:
+            The changed paths, empty when ``timeout`` expired first.
+        """
+        changed = self._backend.read(timeout)
+        if not changed:
+            return changed
+        while True:
+            more = self._backend.read(self.debounce)
+            if not more:
+                return changed
+            changed |= more
+
+    def __iter__(self) -> Iterator[Set[Path]]:
+        while True:
+            batch = self.next_batch()
+            if batch:
+                yield batch
+
+    def close(self) -> None:
+        self._backend.close()
+
+    def __enter__(self) -> "FileWatcher":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
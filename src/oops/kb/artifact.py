@@ -0,0 +1,396 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: artifact.py — oops/kb/artifact.py
+
+"""
+Content-addressed, compressed global KB artifacts.
+
+A global KB is fully determined by the Odoo sources it was scanned from, the
+scanner and the schema, so its key is the SHA-256 of exactly that::
+
+    {"odoo_version": "17.0", "schema_version": 10, "scanner_version": 1,
+     "sources": {"enterprise": "<commit>", "odoo": "<commit>", ...}}
+
+An artifact is a gzipped tar holding ``manifest.json`` (the key, its inputs
+and the SHA-256 of the database) followed by ``kb.db``. A store is a plain
+directory of ``<key>.tar.gz`` files — local, or shared between CI agents —
+so a machine whose sources match reuses the KB instead of scanning.
+
+Unpacking verifies everything before installing: the manifest must describe
+the current schema and scanner, the key must match its inputs (and the one
+asked for), the database must match its checksum and pass SQLite's quick
+check. Any mismatch raises :class:`ArtifactError` and leaves the destination
+untouched, so callers can fall back to a rebuild.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+import tarfile
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable
+
+from oops.core.compat import Any, Dict, List, Optional, Tuple
+from oops.core.exceptions import OopsError
+from oops.kb.scanner import SCANNER_VERSION
+from oops.kb.store import SCHEMA_VERSION, KBReader
+from oops.utils.git import _git_output
+
+ARTIFACT_FORMAT = 1
+ARTIFACT_SUFFIX = ".tar.gz"
+_MANIFEST = "manifest.json"
+_DATABASE = "kb.db"
+_CHUNK = 1 << 20
+
+
+class ArtifactError(OopsError):
+    """Raised when a KB artifact is missing, mismatched or corrupt."""
+
+
+@dataclass
+class ArtifactInfo:
+    """Manifest of a KB artifact.
+
+    Attributes:
+        key: Content key (see :func:`artifact_key`).
+        odoo_version: e.g. ``"17.0"``.
+        sources: ``{origin: commit}`` of the scanned source trees.
+        schema_version: KB schema of the packed database.
+        scanner_version: Scanner that produced it.
+        sha256: Digest of the uncompressed database.
+        size: Size of the uncompressed database, in bytes.
+        created_at: ISO timestamp of the pack.
+        path: Artifact file, when read from disk.
+    """
+
+    key: str
+    odoo_version: str
+    sources: Dict[str, str]
+    schema_version: int = SCHEMA_VERSION
+    scanner_version: int = SCANNER_VERSION
+    sha256: str = ""
+    size: int = 0
+    created_at: str = ""
+    path: Optional[Path] = field(default=None, compare=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "format": ARTIFACT_FORMAT,
+            "key": self.key,
+            "odoo_version": self.odoo_version,
+            "sources": self.sources,
+            "schema_version": self.schema_version,
+            "scanner_version": self.scanner_version,
+            "sha256": self.sha256,
+            "size": self.size,
+            "created_at": self.created_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], path: Optional[Path] = None) -> "ArtifactInfo":
+        if data.get("format") != ARTIFACT_FORMAT:
+            raise ArtifactError(f"Unsupported KB artifact format {data.get('format')!r}")
+        try:
+            return cls(
+                key=data["key"],
+                odoo_version=data["odoo_version"],
+                sources=dict(data["sources"]),
+                schema_version=int(data["schema_version"]),
+                scanner_version=int(data["scanner_version"]),
+                sha256=data["sha256"],
+                size=int(data["size"]),
+                created_at=data.get("created_at", ""),
+                path=path,
+            )
+        except (KeyError, TypeError, ValueError) as error:
+            raise ArtifactError(f"Malformed KB artifact manifest: {error}") from None
+
+
+def artifact_key(
+    odoo_version: str,
+    sources: Dict[str, str],
+    schema_version: int = SCHEMA_VERSION,
+    scanner_version: int = SCANNER_VERSION,
+) -> str:
+    """Return the content key of a global KB built from ``sources``.
+
+    Args:
+        odoo_version: e.g. ``"17.0"``.
+        sources: ``{origin: commit}`` of every scanned source tree.
+        schema_version: KB schema version.
+        scanner_version: Scanner version.
+
+    Returns:
+        Hex SHA-256 of the canonical JSON of these inputs.
+    """
+    payload = {
+        "odoo_version": odoo_version,
+        "schema_version": schema_version,
+        "scanner_version": scanner_version,
+        "sources": dict(sorted(sources.items())),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def source_revisions(sources: Iterable[Tuple[str, Path]]) -> Optional[Dict[str, str]]:
+    """Return the checked-out commit of each source tree.
+
+    Local edits to a checkout are not part of the key: rebuild with
+    ``oops misc build-kb --no-artifacts`` after patching Odoo sources.
+
+    Args:
+        sources: ``(origin, path)`` of the source trees.
+
+    Returns:
+        ``{origin: commit}``, or None when a tree is not a git checkout.
+    """
+    revisions: Dict[str, str] = {}
+    for origin, path in sources:
+        try:
+            revisions[origin] = _git_output("rev-parse", "HEAD", cwd=path)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+    return revisions
+
+
+def kb_artifact_info(db_path: Path) -> ArtifactInfo:
+    """Describe a global KB as the artifact it would be packed into.
+
+    Raises:
+        ArtifactError: If the KB is not a global KB built with recorded
+            source revisions, or is not on the current schema.
+    """
+    with KBReader(db_path) as kb:
+        meta = kb.get_meta()
+    if meta.get("layer") != "global":
+        raise ArtifactError(f"{db_path} is not a global KB")
+    if meta.get("schema_version") != str(SCHEMA_VERSION):
+        raise ArtifactError(f"{db_path} is on schema {meta.get('schema_version')!r}, expected {SCHEMA_VERSION}")
+    if not meta.get("source_revisions"):
+        raise ArtifactError(
+            f"{db_path} records no source revisions (sources not git checkouts, or an older build): "
+            "rebuild it with oops misc build-kb"
+        )
+    sources = json.loads(meta["source_revisions"])
+    scanner_version = int(meta.get("scanner_version") or 0)
+    odoo_version = meta.get("odoo_version", "")
+    return ArtifactInfo(
+        key=artifact_key(odoo_version, sources, scanner_version=scanner_version),
+        odoo_version=odoo_version,
+        sources=sources,
+        scanner_version=scanner_version,
+    )
+
+
+def _discard(path: Path) -> None:
+    with contextlib.suppress(FileNotFoundError):
+        path.unlink()
+
+
+def _digest(path: Path) -> Tuple[str, int]:
+    digest = hashlib.sha256()
+    size = 0
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def pack_kb(db_path: Path, dest: Path) -> ArtifactInfo:
+    """Pack a global KB into an artifact file.
+
+    Args:
+        db_path: Global KB to pack.
+        dest: Artifact file to write (replaced atomically).
+
+    Returns:
+        The manifest written into the artifact.
+
+    Raises:
+        ArtifactError: If the KB cannot be packed (see :func:`kb_artifact_info`).
+    """
+    info = kb_artifact_info(db_path)
+    info.sha256, info.size = _digest(db_path)
+    info.created_at = datetime.now(timezone.utc).isoformat()
+
+    manifest = json.dumps(info.to_dict(), indent=2, sort_keys=True).encode()
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".pack-", suffix=ARTIFACT_SUFFIX, dir=dest.parent)
+    try:
+        with os.fdopen(fd, "wb") as raw, tarfile.open(fileobj=raw, mode="w:gz") as tar:
+            entry = tarfile.TarInfo(_MANIFEST)
+            entry.size = len(manifest)
+            tar.addfile(entry, io.BytesIO(manifest))  # first, so listing never reads the database
+            tar.add(str(db_path), arcname=_DATABASE)
+        os.replace(tmp, dest)
+    except BaseException:
+        _discard(Path(tmp))
+        raise
+    info.path = dest
+    return info
+
+
+def read_artifact_info(path: Path) -> ArtifactInfo:
+    """Read the manifest of an artifact file without extracting the database.
+
+    Raises:
+        ArtifactError: If the file is not a readable KB artifact.
+    """
+    try:
+        with tarfile.open(path, mode="r:gz") as tar:
+            member = tar.next()
+            if member is None or member.name != _MANIFEST:
+                raise ArtifactError(f"{path} is not a KB artifact (no leading {_MANIFEST})")
+            handle = tar.extractfile(member)
+            data = json.loads(handle.read()) if handle else None
+    except (OSError, tarfile.TarError, EOFError, ValueError) as error:
+        raise ArtifactError(f"Unreadable KB artifact {path}: {error}") from None
+    if not isinstance(data, dict):
+        raise ArtifactError(f"Malformed KB artifact manifest in {path}")
+    return ArtifactInfo.from_dict(data, path)
+
+
+def _check_database(path: Path, info: ArtifactInfo) -> None:
+    try:
+        con = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            check = con.execute("PRAGMA quick_check").fetchone()[0]
+            meta = dict(con.execute("SELECT key, value FROM meta").fetchall())
+        finally:
+            con.close()
+    except sqlite3.Error as error:
+        raise ArtifactError(f"Packed KB is not a readable database: {error}") from None
+    if check != "ok":
+        raise ArtifactError(f"Packed KB failed its integrity check: {check}")
+    if meta.get("odoo_version") != info.odoo_version or meta.get("schema_version") != str(info.schema_version):
+        raise ArtifactError("Packed KB metadata does not match its manifest")
+
+
+def unpack_kb(path: Path, dest: Path, expected_key: Optional[str] = None) -> ArtifactInfo:
+    """Verify an artifact and install its KB at ``dest``.
+
+    ``dest`` is only replaced once every check passed.
+
+    Args:
+        path: Artifact file.
+        dest: KB file to install (e.g. ``global_kb_path(version)``).
+        expected_key: Key the artifact must carry (the key computed from the
+            local sources, or the one asked for).
+
+    Returns:
+        The verified manifest.
+
+    Raises:
+        ArtifactError: If the artifact is unreadable, does not match the
+            current schema and scanner, or is corrupt.
+    """
+    info = read_artifact_info(path)
+    if info.schema_version != SCHEMA_VERSION or info.scanner_version != SCANNER_VERSION:
+        raise ArtifactError(
+            f"Artifact {info.key[:12]} was built with schema {info.schema_version} / scanner "
+            f"{info.scanner_version}, this oops uses schema {SCHEMA_VERSION} / scanner {SCANNER_VERSION}"
+        )
+    actual_key = artifact_key(info.odoo_version, info.sources, info.schema_version, info.scanner_version)
+    if info.key != actual_key:
+        raise ArtifactError(f"Artifact {path.name} carries key {info.key[:12]} but describes {actual_key[:12]}")
+    if expected_key is not None and info.key != expected_key:
+        raise ArtifactError(f"Artifact {info.key[:12]} does not match the expected key {expected_key[:12]}")
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".unpack-", suffix=".db", dir=dest.parent)
+    tmp_path = Path(tmp)
+    try:
+        digest = hashlib.sha256()
+        size = 0
+        with os.fdopen(fd, "wb") as out:
+            try:
+                with tarfile.open(path, mode="r:gz") as tar:
+                    member = tar.getmember(_DATABASE)
+                    source = tar.extractfile(member)
+                    if source is None:
+                        raise ArtifactError(f"{path} holds no database")
+                    for chunk in iter(lambda: source.read(_CHUNK), b""):
+                        digest.update(chunk)
+                        size += len(chunk)
+                        out.write(chunk)
+            except (OSError, tarfile.TarError, EOFError, KeyError) as error:
+                raise ArtifactError(f"Corrupt KB artifact {path}: {error}") from None
+        if digest.hexdigest() != info.sha256 or size != info.size:
+            raise ArtifactError(f"Artifact {info.key[:12]} failed its checksum")
+        _check_database(tmp_path, info)
+        os.replace(tmp_path, dest)
+    except BaseException:
+        _discard(tmp_path)
+        raise
+    info.path = path
+    return info
+
+
+class ArtifactStore:
+    """A directory of KB artifacts, one ``<key>.tar.gz`` per key.
+
+    Args:
+        root: Store directory (created on first write).
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def path_for(self, key: str) -> Path:
+        return self.root / f"{key}{ARTIFACT_SUFFIX}"
+
+    def __contains__(self, key: str) -> bool:
+        return self.path_for(key).is_file()
+
+    def put(self, db_path: Path) -> ArtifactInfo:
+        """Pack a global KB into the store (replacing an artifact with the same key)."""
+        return pack_kb(db_path, self.path_for(kb_artifact_info(db_path).key))
+
+    def add(self, path: Path) -> ArtifactInfo:
+        """Copy an exported artifact file into the store, under its key."""
+        info = read_artifact_info(path)
+        dest = self.path_for(info.key)
+        if path.resolve() != dest.resolve():
+            self.root.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(path, dest)
+        info.path = dest
+        return info
+
+    def get(self, key: str, dest: Path) -> ArtifactInfo:
+        """Verify the artifact stored under ``key`` and install its KB at ``dest``.
+
+        Raises:
+            ArtifactError: If there is no such artifact or it fails verification.
+        """
+        path = self.path_for(key)
+        if not path.is_file():
+            raise ArtifactError(f"No KB artifact {key[:12]} in {self.root}")
+        return unpack_kb(path, dest, expected_key=key)
+
+    def list(self, odoo_version: Optional[str] = None) -> List[ArtifactInfo]:
+        """Return the readable artifacts of the store, newest first.
+
+        Args:
+            odoo_version: Keep only artifacts of this Odoo version.
+        """
+        found = []
+        for path in self.root.glob(f"*{ARTIFACT_SUFFIX}"):
+            try:
+                info = read_artifact_info(path)
+            except ArtifactError:
+                continue
+            if odoo_version is None or info.odoo_version == odoo_version:
+                found.append(info)
+        return sorted(found, key=lambda info: info.created_at, reverse=True)
@@ -6,22 +6,41 @@
 from __future__ import annotations
 
 import json
+import os
+import sqlite3
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable
 
+from oops.core.cache import record_access
 from oops.core.logger import log
 from oops.core.models import Result
 from oops.core.paths import CACHE_DIR_NAME, global_kb_path, project_kb_path
+from oops.core.profiling import span
 from oops.io.file import find_addons
 from oops.io.installed_modules import installed_modules_path
+from oops.kb.artifact import ArtifactStore, artifact_key
+from oops.kb.records import ActionRow, FieldRefRow, MenuRow, ModelOriginRow, SymbolRow, ViewRow
 from oops.kb.resolve import build_depends_chain
 from oops.kb.scanner import (
+    SCANNER_VERSION,
     discover_root_addons,
+    iter_tier_modules,
+    odoo_addons_roots,
     scan_module,
     tier_root_from_real_path,
 )
-from oops.kb.store import SCHEMA_VERSION, KBReader, write_project_kb
+from oops.kb.store import (
+    SCHEMA_VERSION,
+    KBReader,
+    KBWriter,
+    MigrationImpossible,
+    _get_stats,
+    migrate_kb,
+    relocate_kb_sources,
+    replace_kb_modules,
+)
 from oops.kb.xml_scanner import scan_module_xml
 
 
@@ -52,7 +71,7 @@ def _resolve_prototype_roles(scan_results: list[dict]) -> None:
                 entry["role"] = "prototype"
 
 
-def _resolve_module_apps(scan_results: list[dict]) -> None:
+def _resolve_module_apps(scan_results: list[dict], only: "set[str] | None" = None) -> None:
     """In-place: set each module's owning ``app`` (closest ancestor application).
 
     A module that is itself an application owns itself. Otherwise its app is the
@@ -61,6 +80,7 @@ def _resolve_module_apps(scan_results: list[dict]) -> None:
 
     Args:
         scan_results: List of ScanResult dicts, mutated in place.
+        only: Resolve just these modules (the others still serve as the index).
     """
     index: dict[str, dict] = {}
     for result in scan_results:
@@ -70,6 +90,8 @@ def _resolve_module_apps(scan_results: list[dict]) -> None:
 
     for result in scan_results:
         for name, data in result.get("modules", {}).items():
+            if only is not None and name not in only:
+                continue
             if name in apps:
                 data["app"] = name
                 continue
@@ -119,6 +141,187 @@ def _resolve_view_types(scan_results: list[dict]) -> None:
                 view["view_type"] = resolve(view)
 
 
+def _empty_scan() -> dict:
+    return {
+        "modules": {},
+        "symbols": [],
+        "field_refs": [],
+        "model_origins": [],
+        "views": [],
+        "actions": [],
+        "menus": [],
+    }
+
+
+def _scan_into(scan_result: dict, module_path: Path, origin: str, tier_root: Path) -> bool:
+    """Scan one module (Python + XML) and append its rows to ``scan_result``.
+
+    Returns:
+        False when the directory has no manifest (nothing appended).
+    """
+    manifest = module_path / "__manifest__.py"
+    if not manifest.exists():
+        manifest = module_path / "__openerp__.py"
+    if not manifest.exists():
+        log.info(f"No manifest in {module_path}, skipping.")
+        return False
+
+    scan = scan_module(module_path, origin, tier_root)
+    scan_result["modules"].update(scan["modules"])
+    scan_result["symbols"].extend(scan["symbols"])
+    scan_result["field_refs"].extend(scan.get("field_refs", []))
+    scan_result["model_origins"].extend(scan.get("model_origins", []))
+
+    xml_scan = scan_module_xml(module_path, origin, tier_root)
+    scan_result["views"].extend(xml_scan.get("views", []))
+    scan_result["actions"].extend(xml_scan.get("actions", []))
+    scan_result["menus"].extend(xml_scan.get("menus", []))
+    return True
+
+
+# Source checkout directory name → KB origin.
+SOURCE_ORIGINS = {"community": "odoo"}
+
+# Rows the cross-tier resolvers (prototype roles, view types, module apps)
+# read: kept in memory until every tier is scanned. Everything else goes
+# straight to the writer.
+_RESOLVED_KEYS = ("modules", "model_origins", "views")
+_STREAMED_KEYS = ("symbols", "field_refs", "actions", "menus")
+
+
+def _stream_scan(writer: KBWriter, held: dict, scan: dict) -> None:
+    """Write the streamed rows of ``scan`` now and hold the rows the resolvers need."""
+    writer.insert({key: scan.get(key, []) for key in _STREAMED_KEYS})
+    held["modules"].update(scan.get("modules", {}))
+    held["model_origins"].extend(scan.get("model_origins", []))
+    held["views"].extend(scan.get("views", []))
+
+
+def build_global_kb(
+    db_path: Path,
+    odoo_version: str,
+    sources: "list[tuple[str, Path]]",
+    revisions: "dict[str, str] | None" = None,
+) -> "Result[dict]":
+    """Scan Odoo source trees into a global KB.
+
+    Symbols, field references, actions and menus are written as each module
+    is scanned; only modules, model origins and views — what the resolvers
+    need across tiers — stay in memory until every tier is done.
+
+    Args:
+        db_path: Destination KB file (replaced).
+        odoo_version: e.g. ``"17.0"``.
+        sources: ``(origin, path)`` of each source tree, in scan order; a
+            later tier wins on duplicate rows.
+        revisions: ``{origin: commit}`` of the source trees, recorded so the
+            KB can be packed as an artifact (see :mod:`oops.kb.artifact`).
+
+    Returns:
+        Result whose ``.data`` is ``{"kb": <KB stats>, "stats": [<per addons root counts>]}``.
+    """
+    result: "Result[dict]" = Result()
+    tier_stats: list[dict] = []
+    held: dict = {key: {} if key == "modules" else [] for key in _RESOLVED_KEYS}
+
+    try:
+        meta = {"scanner_version": str(SCANNER_VERSION)}
+        if revisions:
+            meta["source_revisions"] = json.dumps(revisions, sort_keys=True)
+        writer = KBWriter(db_path, "global", odoo_version, meta=meta)
+        with writer:
+            for origin, path in sources:
+                log.info(f"Analyzing {origin.capitalize()}...")
+                for root in odoo_addons_roots(path):
+                    if not root.is_dir():
+                        result.add_warning(f"[{origin}] Tier root not found, skipping: {root}")
+                        continue
+                    counts = dict.fromkeys(("modules",) + _STREAMED_KEYS + ("model_origins", "views"), 0)
+                    with span("kb.scan", tier=origin):
+                        for module_path in iter_tier_modules(root):
+                            scan = scan_module(module_path, origin, root)
+                            scan.update(scan_module_xml(module_path, origin, root))
+                            for key in counts:
+                                counts[key] += len(scan.get(key, ()))
+                            _stream_scan(writer, held, scan)
+                    counts["origins"] = counts.pop("model_origins")
+                    tier_stats.append({"name": origin, "path": root, **counts})
+                writer.add_sources({origin: str(path)})
+
+            log.info("Resolving prototype roles, view types and module apps…")
+            with span("kb.resolve"):
+                _resolve_prototype_roles([held])
+                _resolve_view_types([held])
+                _resolve_module_apps([held])
+
+            log.info(f"Writing file to {db_path}")
+            with span("kb.write"):
+                writer.insert(held)
+    except sqlite3.Error as exc:
+        result.add_error(f"KB write failed: {exc}")
+        result.data = {"kb": {}, "stats": tier_stats}
+        return result
+
+    with span("kb.write"):
+        kb_result = writer.close()
+    result.merge(kb_result)
+    result.data = {"kb": kb_result.data or {}, "stats": tier_stats}
+    return result
+
+
+def global_kb_sources(dirs: Iterable[Path]) -> "list[tuple[str, Path]]":
+    """Return the ``(origin, path)`` pairs of the Odoo source trees that exist.
+
+    Args:
+        dirs: Source checkouts, e.g. ``get_odoo_sources_dirs(version)``;
+            the ``community`` checkout is the ``odoo`` origin.
+    """
+    return [(SOURCE_ORIGINS.get(path.name, path.name), path) for path in dirs if path.exists()]
+
+
+def restore_global_kb(
+    db_path: Path,
+    odoo_version: str,
+    sources: "list[tuple[str, Path]]",
+    revisions: "dict[str, str]",
+    store: ArtifactStore,
+) -> "Result[dict] | None":
+    """Install the stored KB artifact built from exactly these sources.
+
+    Args:
+        db_path: Destination KB file (replaced only once the artifact is verified).
+        odoo_version: e.g. ``"17.0"``.
+        sources: ``(origin, path)`` of the local source trees; the installed
+            KB's source roots are pointed at them.
+        revisions: ``{origin: commit}`` of those trees (see :func:`source_revisions`).
+        store: Artifact store to look in.
+
+    Returns:
+        Result shaped like :func:`build_global_kb`'s plus the artifact
+        ``"key"``, or None when the store holds no matching artifact.
+
+    Raises:
+        ArtifactError: If the matching artifact fails verification;
+            ``db_path`` is left untouched.
+    """
+    key = artifact_key(odoo_version, revisions)
+    record_access(store.path_for(key), "kb-artifacts", hit=key in store)
+    if key not in store:
+        return None
+    store.get(key, db_path)
+    relocate_kb_sources(db_path, {origin: str(path) for origin, path in sources})
+
+    result: "Result[dict]" = _get_stats(db_path)
+    with KBReader(db_path) as kb:
+        counts = Counter(module["origin"] for module in kb.get_modules().values())
+    result.data = {
+        "kb": result.data,
+        "stats": [{"name": origin, "path": path, "modules": counts.get(origin, 0)} for origin, path in sources],
+        "key": key,
+    }
+    return result
+
+
 def build_project_kb(
     repo_path: Path,
     version: str,
@@ -154,13 +357,17 @@ def build_project_kb(
     if not global_kb.exists():
         raise FileNotFoundError(f"Global KB not found: {global_kb}\nRun oops misc build-kb first.")
 
-    # Verify the global KB is on the expected schema before reading from it.
+    # Bring the global KB to the expected schema before reading from it.
     with KBReader(global_kb) as _gkb:
         _sv = _gkb.get_meta().get("schema_version")
     if _sv != str(SCHEMA_VERSION):
-        raise FileNotFoundError(
-            f"Global KB at {global_kb} is on schema {_sv!r}, expected {SCHEMA_VERSION!r}. Re-run oops misc build-kb."
-        )
+        try:
+            migrate_kb(global_kb)
+        except MigrationImpossible as error:
+            raise FileNotFoundError(
+                f"Global KB at {global_kb} is on schema {_sv!r}, expected {SCHEMA_VERSION!r} "
+                f"({error.message}). Re-run oops misc build-kb."
+            ) from error
 
     cache_dir = repo_path / CACHE_DIR_NAME
     cache_dir.mkdir(parents=True, exist_ok=True)
@@ -168,153 +375,198 @@ def build_project_kb(
 
     allowed_modules: set[str] = set(modules_list)
 
-    # --- Seed from global KB ---
+    # --- Discover root addons (symlinks + non-symlink dirs at root) ---
+    tiers = discover_root_addons(repo_path, allowed_modules)
 
-    log.info(f"Loading global KB: {global_kb}")
+    # --- Scope (input list, not actually-scanned set) ---
+    scope = sorted(modules_list)
 
-    with KBReader(global_kb) as kb:
-        global_meta = kb.get_meta()
-        global_sources = kb.get_sources()
-        global_modules = kb.get_modules()
-        global_symbols = [
-            dict(r)
-            for r in kb._con.execute(
-                "SELECT model, name, kind, origin, module, source_file, source_line, field_type, section FROM symbols"
-            ).fetchall()
-        ]
-        global_field_refs = [
-            dict(r)
-            for r in kb._con.execute(
-                "SELECT model, field_name, module, kwarg, target_method FROM field_refs"
-            ).fetchall()
-        ]
-        global_model_origins = [
-            dict(r)
-            for r in kb._con.execute(
-                "SELECT model, module, origin, role, model_type, "
-                "inherit_json, inherits_json, source_file, source_line, description "
-                "FROM model_origins"
-            ).fetchall()
-        ]
-        global_views = [
-            dict(r)
-            for r in kb._con.execute(
-                "SELECT xml_id, module, origin, name, model, view_type, inherit_id, "
-                "mode, source_file, source_line, fields_json, buttons_json FROM views"
-            ).fetchall()
-        ]
-        global_actions = [
-            dict(r)
-            for r in kb._con.execute(
-                "SELECT xml_id, module, origin, name, model, view_id, domain, source_file, source_line FROM actions"
-            ).fetchall()
-        ]
-        global_menus = [
-            dict(r)
-            for r in kb._con.execute(
-                "SELECT xml_id, module, origin, name, action, parent_id, source_file, source_line FROM menus"
-            ).fetchall()
-        ]
-
-    global_scan = {
-        "modules": global_modules,
-        "symbols": global_symbols,
-        "field_refs": global_field_refs,
-        "model_origins": global_model_origins,
-        "views": global_views,
-        "actions": global_actions,
-        "menus": global_menus,
-    }
+    held: dict = {key: {} if key == "modules" else [] for key in _RESOLVED_KEYS}
 
-    global_odoo_version = global_meta.get("odoo_version", version)
-    sources: dict[str, str] = dict(global_sources)
+    log.info(f"Loading global KB: {global_kb}")
 
-    # --- Discover root addons (symlinks + non-symlink dirs at root) ---
-    tiers = discover_root_addons(repo_path, allowed_modules)
+    try:
+        with KBReader(global_kb) as kb:
+            global_meta = kb.get_meta()
+            writer = KBWriter(
+                db_path,
+                "project",
+                global_meta.get("odoo_version", version),
+                project=project,
+                scope=scope,
+                sources=kb.get_sources(),
+            )
+            with writer:
+                # --- Seed from global KB: facts are copied through, resolver inputs held ---
+                with span("kb.seed"):
+                    _seed_from_global(kb, writer, held)
+
+                # Scan order: apik (owned via apik-addons/), local (owned at root),
+                # third-party (selected community modules).
+                for origin in ("apik", "local", "third-party"):
+                    tier_modules = tiers.get(origin, [])
+                    if not tier_modules:
+                        continue
+
+                    log.info(f"Scanning {origin} tier ({len(tier_modules)}) modules)…")
+
+                    if origin == "local":
+                        tier_root = repo_path
+                    else:
+                        tier_root = None
+                        for _, real_path in tier_modules:
+                            tier_root = tier_root_from_real_path(origin, real_path)
+                            if tier_root:
+                                break
+
+                    if tier_root is None:
+                        result.add_warning(f"Could not determine tier root for {origin}, skipping.")
+                        continue
+
+                    writer.add_sources({origin: str(tier_root)})
+
+                    scanned = 0
+                    with span("kb.scan", tier=origin, modules=len(tier_modules)):
+                        for _, real_module_path in tier_modules:
+                            scan = _empty_scan()
+                            if _scan_into(scan, real_module_path, origin, tier_root):
+                                _stream_scan(writer, held, scan)
+                                scanned += 1
+
+                    log.info(f"{scanned} modules scanned")
+
+                # --- Resolve prototype roles, view types, and module apps across all tiers ---
+                with span("kb.resolve"):
+                    _resolve_prototype_roles([held])
+                    _resolve_view_types([held])
+                    _resolve_module_apps([held])
+
+                log.info(f"Writing project KB → {db_path}")
+                with span("kb.write"):
+                    writer.insert(held)
+    except sqlite3.Error as exc:
+        result.add_error(f"KB write failed: {exc}")
+        result.data = db_path
+        return result
+
+    with span("kb.write"):
+        result.merge(writer.close())
+    result.data = db_path
+    return result
 
-    # Scan order: apik (owned via apik-addons/), local (owned at root),
-    # third-party (selected community modules).
-    tier_scan_order = ["apik", "local", "third-party"]
-    project_scan_results: list[dict] = []
 
-    for origin in tier_scan_order:
-        tier_modules = tiers.get(origin, [])
-        if not tier_modules:
-            continue
+# Global KB columns copied into a project KB, per ScanResult key.
+_SEED_QUERIES = {
+    "symbols": (
+        SymbolRow,
+        "SELECT model, name, kind, origin, module, source_file, source_line, field_type, section FROM symbols",
+    ),
+    "field_refs": (FieldRefRow, "SELECT model, field_name, module, kwarg, target_method FROM field_refs"),
+    "model_origins": (
+        ModelOriginRow,
+        "SELECT model, module, origin, role, model_type, "
+        "inherit_json, inherits_json, source_file, source_line, description "
+        "FROM model_origins",
+    ),
+    "views": (
+        ViewRow,
+        "SELECT xml_id, module, origin, name, model, view_type, inherit_id, "
+        "mode, source_file, source_line, fields_json, buttons_json FROM views",
+    ),
+    "actions": (
+        ActionRow,
+        "SELECT xml_id, module, origin, name, model, view_id, domain, source_file, source_line FROM actions",
+    ),
+    "menus": (
+        MenuRow,
+        "SELECT xml_id, module, origin, name, action, parent_id, source_file, source_line FROM menus",
+    ),
+}
+
+
+def _seed_from_global(kb: KBReader, writer: KBWriter, held: dict) -> None:
+    """Copy the global KB into a project KB being written.
+
+    Streamed tables go from the global cursor to the writer batch by batch;
+    the resolver inputs are loaded into ``held`` as compact rows.
+    """
+    held["modules"].update(kb.get_modules())
+    for key, (row_type, query) in _SEED_QUERIES.items():
+        rows = (row_type(**row) for row in kb._con.execute(query))
+        if key in _STREAMED_KEYS:
+            writer.insert({key: rows})
+        else:
+            held[key].extend(rows)
 
-        log.info(f"Scanning {origin} tier ({len(tier_modules)}) modules)…")
 
-        scanned = 0
+def refresh_project_kb(repo_path: Path, modules: Iterable[str]) -> "Result[list[str]]":
+    """Re-scan a few modules into the existing project KB.
 
-        if origin == "local":
-            tier_root = repo_path
-        else:
-            tier_root = None
-            for _, real_path in tier_modules:
-                tier_root = tier_root_from_real_path(origin, real_path)
-                if tier_root:
-                    break
-
-        if tier_root is None:
-            result.add_warning(f"Could not determine tier root for {origin}, skipping.")
-            continue
-
-        sources[origin] = str(tier_root)
-
-        tier_result: dict = {
-            "modules": {},
-            "symbols": [],
-            "field_refs": [],
-            "model_origins": [],
-            "views": [],
-            "actions": [],
-            "menus": [],
-        }
-        for _, real_module_path in tier_modules:
-            manifest = real_module_path / "__manifest__.py"
-            if not manifest.exists():
-                manifest = real_module_path / "__openerp__.py"
-            if not manifest.exists():
-                log.info(f"No manifest in {real_module_path}, skipping.")
-                continue
+    The fast path behind ``--watch``: only ``modules`` are scanned and their
+    rows swapped in place (:func:`~oops.kb.store.replace_kb_modules`).
+    Prototype roles, view types and owning apps are resolved against the
+    rest of the KB. Effects on untouched modules (a new concrete model
+    turning another module's ``create`` into ``prototype``) wait for the
+    next full build.
 
-            scan = scan_module(real_module_path, origin, tier_root)
-            tier_result["modules"].update(scan["modules"])
-            tier_result["symbols"].extend(scan["symbols"])
-            tier_result["field_refs"].extend(scan.get("field_refs", []))
-            tier_result["model_origins"].extend(scan.get("model_origins", []))
+    Args:
+        repo_path: Repository root.
+        modules: Module names to refresh. Names outside the KB scope are ignored.
 
-            xml_scan = scan_module_xml(real_module_path, origin, tier_root)
-            tier_result["views"].extend(xml_scan.get("views", []))
-            tier_result["actions"].extend(xml_scan.get("actions", []))
-            tier_result["menus"].extend(xml_scan.get("menus", []))
+    Returns:
+        Result whose ``.data`` lists the refreshed module names.
 
-            scanned += 1
+    Raises:
+        FileNotFoundError: If the project KB does not exist.
+    """
+    result: "Result[list[str]]" = Result()
+    db_path = project_kb_path(repo_path)
+    if not db_path.exists():
+        raise FileNotFoundError(f"Project KB not found: {db_path}")
+
+    with KBReader(db_path) as kb:
+        scope = set(json.loads(kb.get_meta().get("scope") or "[]"))
+        wanted = sorted(set(modules) & scope)
+        if not wanted:
+            result.data = []
+            return result
+        sources = kb.get_sources()
+        marks = ", ".join("?" * len(wanted))
+        # Just what the resolvers read, for every module not being replaced.
+        context = {
+            "modules": {n: d for n, d in kb.get_modules().items() if n not in wanted},
+            "model_origins": [
+                dict(r)
+                for r in kb._con.execute(
+                    f"SELECT model, role, model_type, inherit_json FROM model_origins WHERE module NOT IN ({marks})",
+                    wanted,
+                )
+            ],
+            "views": [
+                dict(r)
+                for r in kb._con.execute(
+                    f"SELECT xml_id, view_type, inherit_id FROM views WHERE module NOT IN ({marks})", wanted
+                )
+            ],
+        }
 
-        log.info(f"{scanned} modules scanned")
-        project_scan_results.append(tier_result)
+    fresh = _empty_scan()
+    for origin, tier_modules in discover_root_addons(repo_path, set(wanted)).items():
+        tier_root = repo_path if origin == "local" else Path(sources[origin]) if origin in sources else None
+        for _, real_module_path in tier_modules:
+            root = tier_root or tier_root_from_real_path(origin, real_module_path)
+            if root is None:
+                result.add_warning(f"Could not determine tier root for {real_module_path.name}, skipping.")
+                continue
+            _scan_into(fresh, real_module_path, origin, root)
 
-    # --- Scope (input list, not actually-scanned set) ---
-    scope = sorted(modules_list)
+    _resolve_prototype_roles([context, fresh])
+    _resolve_view_types([context, fresh])
+    _resolve_module_apps([context, fresh], only=set(fresh["modules"]))
 
-    # --- Resolve prototype roles, view types, and module apps across all scan results ---
-    all_scan_results = [global_scan] + project_scan_results
-    _resolve_prototype_roles(all_scan_results)
-    _resolve_view_types(all_scan_results)
-    _resolve_module_apps(all_scan_results)
-
-    # --- Write ---
-    log.info(f"Writing project KB → {db_path}")
-    write_result = write_project_kb(
-        db_path=db_path,
-        odoo_version=global_odoo_version,
-        project=project,
-        scope=scope,
-        sources=sources,
-        scan_results=all_scan_results,
-    )
-    result.merge(write_result)
-    result.data = db_path
+    with span("kb.refresh", modules=len(wanted)):
+        result.merge(replace_kb_modules(db_path, wanted, fresh))
+    result.data = wanted
     return result
 
 
@@ -350,6 +602,7 @@ def is_project_kb_stale(repo_path: Path, version: str) -> tuple[bool, str]:
 
         - ``"no project KB at <path>"``
         - ``"project KB schema version <x> differs from current <y> ..."``
+          (only when :func:`~oops.kb.store.migrate_kb` cannot upgrade it)
         - ``"project KB has no generated_at metadata"``
         - ``"installed_modules.txt is newer than project KB"``
         - ``"global KB is newer than project KB"``
@@ -360,13 +613,17 @@ def is_project_kb_stale(repo_path: Path, version: str) -> tuple[bool, str]:
         return True, f"no project KB at {project}"
 
     with KBReader(project) as kb:
-        meta = kb.get_meta()
-        sv = meta.get("schema_version")
-        if sv != str(SCHEMA_VERSION):
+        sv = kb.get_meta().get("schema_version")
+    if sv != str(SCHEMA_VERSION):
+        try:
+            migrate_kb(project)
+        except MigrationImpossible:
             return True, (
                 f"project KB schema version {sv!r} differs from current {SCHEMA_VERSION!r} — rebuild required"
             )
-        project_ts = parse_kb_timestamp(meta.get("generated_at"))
+
+    with KBReader(project) as kb:
+        project_ts = parse_kb_timestamp(kb.get_meta().get("generated_at"))
 
     if project_ts is None:
         return True, "project KB has no generated_at metadata"
@@ -387,6 +644,48 @@ def is_project_kb_stale(repo_path: Path, version: str) -> tuple[bool, str]:
     return False, ""
 
 
+def _newer_than(module_path: Path, threshold: float) -> bool:
+    """Return True if any file of a module (bytecode and dot-dirs aside) is newer than ``threshold``."""
+    for current, dirs, files in os.walk(module_path):
+        dirs[:] = [d for d in dirs if d != "__pycache__" and not d.startswith(".")]
+        for name in files:
+            try:
+                if os.stat(os.path.join(current, name)).st_mtime > threshold:
+                    return True
+            except OSError:
+                continue
+    return False
+
+
+def changed_project_modules(repo_path: Path, modules: Iterable[str], db_path: Path | None = None) -> list[str]:
+    """Return the project modules whose files changed since the project KB was written.
+
+    Only ``modules`` are looked at, so the cost follows their size rather
+    than the repository's. The KB write time is its last full build or
+    partial refresh, whichever is later.
+
+    Args:
+        repo_path: Repository root.
+        modules: Candidate module names; names outside the KB scope (Odoo
+            modules, uninstalled addons) are ignored.
+        db_path: Project KB. Defaults to ``project_kb_path(repo_path)``.
+
+    Returns:
+        The changed in-scope names, in ``modules`` order.
+    """
+    with KBReader(db_path or project_kb_path(repo_path)) as kb:
+        meta = kb.get_meta()
+    scope = set(json.loads(meta.get("scope") or "[]"))
+    stamps = [parse_kb_timestamp(meta.get(key)) for key in ("generated_at", "updated_at")]
+    written = max((ts for ts in stamps if ts is not None), default=None)
+
+    candidates = [name for name in modules if name in scope]
+    if written is None:
+        return candidates
+    threshold = written.timestamp()
+    return [name for name in candidates if _newer_than(repo_path / name, threshold)]
+
+
 def compute_root_drift(
     repo_path: Path,
     installed_modules: Iterable[str],
@@ -3,7 +3,14 @@
 #
 # File: domains.py — oops/kb/domains.py
 
-"""Static domain-profiling constants. Edit freely."""
+"""Static domain-profiling constants. Edit freely.
+
+The classification they drive is precomputed into the KB ``model_domains``
+table at write time: after editing, rebuild KBs with ``oops misc build-kb``
+(or ``--refresh``) for the change to show up.
+"""
+
+from oops.core.compat import Optional, Tuple
 
 # Transversal pillar modules: meaningful anchors but not applications.
 PILLAR_MODULES: frozenset = frozenset({
@@ -40,3 +47,31 @@ DOMAIN_LABELS: dict = {
 def domain_label(app: str) -> str:
     """Return the human-readable label for an app technical name."""
     return DOMAIN_LABELS.get(app, app.replace("_", " ").title())
+
+
+def classify_creator(module: Optional[str], app: Optional[str]) -> Tuple[str, Optional[str]]:
+    """Return (kind, anchor) for a model from its creator module and that module's owning app.
+
+    kind:   'noise'  — technical or unknown; skip.
+            'pillar' — transversal pillar module.
+            'domain' — functional Odoo application.
+    anchor: app or pillar technical name (None for noise).
+    """
+    if module is None or module in EXCLUDED_TECHNICAL_MODULES:
+        return ("noise", None)
+
+    if module in PILLAR_MODULES:
+        return ("pillar", module)
+
+    if app is None:
+        return ("noise", None)
+
+    if app in EXCLUDED_TECHNICAL_MODULES:
+        # Owning app is a technical module (e.g. mail=application in Odoo 18).
+        # The creator module itself is not technical — use it as the domain anchor.
+        return ("domain", module)
+
+    if app in PILLAR_MODULES:
+        return ("pillar", app)
+
+    return ("domain", app)
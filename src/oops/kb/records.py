@@ -0,0 +1,180 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: records.py — oops/kb/records.py
+
+"""
+Compact rows of a ScanResult.
+
+The scanners emit one row per symbol, field reference, model origin, view,
+action and menu — hundreds of thousands for an Odoo enterprise tree. Rows
+keep their values in ``__slots__`` instead of a per-row dict, and the strings
+repeated across rows (model, module, origin, source file, kind…) are
+interned so each distinct value is stored once.
+
+Rows still read and write like the dicts they replace (``row["model"]``,
+``row.get("section")``, ``row["role"] = "prototype"``), so the KB writer,
+the resolvers and hand-built ScanResults in tests accept either.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Iterator
+
+from oops.core.compat import Any, Dict, List, Tuple
+
+
+class ScanRow:
+    """Base class: slot-backed storage with a read/write mapping interface.
+
+    Subclasses declare their columns in ``__slots__``, the subset of string
+    columns worth interning in ``_interned``, and defaults in ``_defaults``
+    (``None`` otherwise).
+    """
+
+    __slots__ = ()
+    _interned: Tuple[str, ...] = ()
+    _defaults: Dict[str, Any] = {}
+
+    def __init__(self, **values: Any) -> None:
+        for name in self.__slots__:
+            value = values.pop(name, self._defaults.get(name))
+            if type(value) is str and name in self._interned:
+                value = sys.intern(value)
+            object.__setattr__(self, name, value)
+        if values:
+            raise TypeError(f"{type(self).__name__}: unexpected column(s) {', '.join(sorted(values))}")
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.__slots__
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(name, getattr(self, name)) for name in self.__slots__]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ScanRow, dict)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]  # mutable, like the dicts it replaces
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+
+class SymbolRow(ScanRow):
+    """A field or method defined on a model (``symbols`` table)."""
+
+    __slots__ = (
+        "model",
+        "name",
+        "kind",
+        "origin",
+        "module",
+        "source_file",
+        "source_line",
+        "source_end_line",
+        "field_type",
+        "section",
+    )
+    _interned = ("model", "name", "kind", "origin", "module", "source_file", "field_type", "section")
+
+
+class FieldRefRow(ScanRow):
+    """A field keyword pointing at a method (``field_refs`` table)."""
+
+    __slots__ = ("model", "field_name", "module", "kwarg", "target_method")
+    _interned = __slots__
+
+
+class ModelOriginRow(ScanRow):
+    """A class creating or extending a model (``model_origins`` table)."""
+
+    __slots__ = (
+        "model",
+        "module",
+        "origin",
+        "role",
+        "model_type",
+        "inherit_json",
+        "inherits_json",
+        "source_file",
+        "source_line",
+        "description",
+    )
+    _interned = ("model", "module", "origin", "role", "model_type", "inherit_json", "inherits_json", "source_file")
+    _defaults = {"model_type": "model", "inherit_json": "[]", "inherits_json": "{}"}
+
+
+class ViewRow(ScanRow):
+    """An ``ir.ui.view`` record or QWeb template (``views`` table)."""
+
+    __slots__ = (
+        "xml_id",
+        "name",
+        "model",
+        "view_type",
+        "inherit_id",
+        "mode",
+        "origin",
+        "module",
+        "source_file",
+        "source_line",
+        "source_end_line",
+        "fields_json",
+        "buttons_json",
+    )
+    _interned = (
+        "model",
+        "view_type",
+        "inherit_id",
+        "mode",
+        "origin",
+        "module",
+        "source_file",
+        "fields_json",
+        "buttons_json",
+    )
+    _defaults = {"fields_json": "[]", "buttons_json": "[]"}
+
+
+class ActionRow(ScanRow):
+    """An ``ir.actions.act_window`` record (``actions`` table)."""
+
+    __slots__ = ("xml_id", "name", "model", "view_id", "domain", "origin", "module", "source_file", "source_line")
+    _interned = ("model", "view_id", "origin", "module", "source_file")
+
+
+class MenuRow(ScanRow):
+    """An ``ir.ui.menu`` record (``menus`` table)."""
+
+    __slots__ = ("xml_id", "name", "action", "parent_id", "origin", "module", "source_file", "source_line")
+    _interned = ("action", "parent_id", "origin", "module", "source_file")
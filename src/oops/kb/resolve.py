@@ -19,13 +19,20 @@ Algorithm
 4. Tie-break with the static tier order: third-party > apik > enterprise > odoo.
 5. If the symbol is not found in the depends chain at all, fall back to
    tier order and emit a warning.
+
+When a KBReader is passed, chains are read from the KB's precomputed
+``module_closure`` table instead of being walked again for every symbol.
 """
 
 from collections import deque
+from typing import TYPE_CHECKING
 
 from oops.core.compat import Any, Dict, List, Optional, Tuple
 from oops.core.logger import log
 
+if TYPE_CHECKING:
+    from oops.kb.store import KBReader
+
 # Static tier precedence used as tie-breaker (lower index = higher precedence).
 TIER_PRECEDENCE = ["third-party", "apik", "enterprise", "odoo"]
 
@@ -38,6 +45,37 @@ def _tier_rank(origin: str) -> int:
         return len(TIER_PRECEDENCE)
 
 
+def walk_depends(
+    module: str,
+    modules_index: Dict[str, Dict[str, Any]],
+) -> List[Tuple[str, int]]:
+    """Return the transitive dependencies of a module with their BFS distance.
+
+    Args:
+        module:         the starting module name.
+        modules_index:  { name: {"origin": str, "depends": [str, ...]} }
+                        as returned by KBReader.get_modules().
+
+    Returns:
+        ``(name, distance)`` pairs in breadth-first order, closest first
+        (distance 1 = direct depends). ``module`` itself is not included;
+        modules absent from the index are listed but not expanded.
+    """
+    visited = {module}
+    chain: List[Tuple[str, int]] = []
+    queue: deque = deque([(module, 0)])
+
+    while queue:
+        current, distance = queue.popleft()
+        for dep in modules_index.get(current, {}).get("depends", []):
+            if dep not in visited:
+                visited.add(dep)
+                queue.append((dep, distance + 1))
+                chain.append((dep, distance + 1))
+
+    return chain
+
+
 def build_depends_chain(
     module: str,
     modules_index: Dict[str, Dict[str, Any]],
@@ -57,33 +95,20 @@ def build_depends_chain(
         Ordered list of module names, closest first.
         Modules absent from the index are silently skipped.
     """
-    visited = {module}
-    chain: List[str] = []
-    queue: deque = deque()
+    return [name for name, _ in walk_depends(module, modules_index)]
 
-    # Seed with direct depends.
-    for dep in modules_index.get(module, {}).get("depends", []):
-        if dep not in visited:
-            visited.add(dep)
-            queue.append(dep)
-            chain.append(dep)
 
-    # BFS for transitive depends.
-    while queue:
-        current = queue.popleft()
-        for dep in modules_index.get(current, {}).get("depends", []):
-            if dep not in visited:
-                visited.add(dep)
-                queue.append(dep)
-                chain.append(dep)
-
-    return chain
+def _depends_chain(module: str, modules_index: Dict[str, Dict[str, Any]], kb: "Optional[KBReader]") -> List[str]:
+    if kb is not None:
+        return kb.get_depends_chain(module)
+    return build_depends_chain(module, modules_index)
 
 
 def resolve_symbol(
     entries: List[Dict[str, Any]],
     custom_module: str,
     modules_index: Dict[str, Dict[str, Any]],
+    kb: "Optional[KBReader]" = None,
 ) -> Optional[Dict[str, Any]]:
     """Select the most relevant KB entry for a symbol.
 
@@ -92,6 +117,8 @@ def resolve_symbol(
                         at least 'module' and 'origin' keys.
         custom_module:  name of the module being refactored.
         modules_index:  full modules dict from KBReader.get_modules().
+        kb:             when given, depends chains come from its
+                        ``module_closure`` table instead of ``modules_index``.
 
     Returns:
         The selected entry dict, or None if entries is empty.
@@ -105,7 +132,7 @@ def resolve_symbol(
     if len(entries) == 1:
         return entries[0]
 
-    chain = build_depends_chain(custom_module, modules_index)
+    chain = _depends_chain(custom_module, modules_index, kb)
     chain_index = {mod: i for i, mod in enumerate(chain)}
 
     def sort_key(entry: Dict[str, Any]) -> Tuple[int, int]:
@@ -136,6 +163,7 @@ def resolve_symbol_root(
     entries: List[Dict[str, Any]],
     custom_module: str,
     modules_index: Dict[str, Dict[str, Any]],
+    kb: "Optional[KBReader]" = None,
 ) -> Optional[Dict[str, Any]]:
     """Select the original definer of a symbol.
 
@@ -151,6 +179,8 @@ def resolve_symbol_root(
     3. If exactly one root, return it.  Multiple roots: prefer most-core tier
        (odoo > enterprise > apik > third-party).
     4. Fallback (all have upstreams / missing data): most-core tier entry.
+
+    ``kb`` is used as in :func:`resolve_symbol`.
     """
     if not entries:
         return None
@@ -161,7 +191,7 @@ def resolve_symbol_root(
         return entries[0]
 
     def has_upstream(entry: Dict[str, Any]) -> bool:
-        chain_set = set(build_depends_chain(entry["module"], modules_index))
+        chain_set = set(_depends_chain(entry["module"], modules_index, kb))
         return any(e["module"] in chain_set for e in entries if e["module"] != entry["module"])
 
     roots = [e for e in entries if not has_upstream(e)]
@@ -9,25 +9,31 @@ Sections:
     - Constants: ODOO_BASE_CLASSES, FIELD_TYPES, METHOD_SECTION_*, tier marker helpers
     - AST helpers: parse, extract, classify Odoo model nodes
     - Manifest parsing: delegated to oops.io.manifest
-    - Scanning: scan_module, scan_tier, odoo_addons_roots
+    - Scanning: scan_module, iter_tier_modules, scan_tier, odoo_addons_roots
     - Root addon discovery: discover_root_addons, tier_root_from_real_path
 """
 
 import ast
 import json
+import sys
 from pathlib import Path
-from typing import Set
+from typing import Iterator, Set
 
 from oops.core.compat import Any, Dict, Iterable, List, Optional, Tuple, Union
 from oops.core.config import config
 from oops.core.logger import log
 from oops.core.models import Result
 from oops.io.manifest import load_manifest
+from oops.kb.records import FieldRefRow, ModelOriginRow, SymbolRow
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
+# Bump whenever the scanners emit different rows for the same sources: it is
+# part of the key of packed KB artifacts (see oops.kb.artifact).
+SCANNER_VERSION = 1
+
 ODOO_BASE_CLASSES = {"Model", "TransientModel", "AbstractModel"}
 
 FIELD_TYPES = {
@@ -233,7 +239,7 @@ def _dedup_model_origins(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     from whichever contributing row declared one.
 
     Args:
-        entries: model_origins dicts for a single module.
+        entries: model_origins rows for a single module.
 
     Returns:
         Deduplicated list, one entry per model name, order-preserving.
@@ -243,7 +249,7 @@ def _dedup_model_origins(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         model = entry["model"]
         current = chosen.get(model)
         if current is None:
-            chosen[model] = dict(entry)
+            chosen[model] = type(entry)(**entry)
             continue
         # Fill a missing description from any contributing row.
         if not current.get("description") and entry.get("description"):
@@ -251,7 +257,7 @@ def _dedup_model_origins(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         # Higher-ranked role (create/prototype) wins the structural fields.
         if _ROLE_RANK.get(entry["role"], 0) > _ROLE_RANK.get(current["role"], 0):
             description = current.get("description") or entry.get("description")
-            chosen[model] = dict(entry)
+            chosen[model] = type(entry)(**entry)
             chosen[model]["description"] = description
     return list(chosen.values())
 
@@ -621,14 +627,14 @@ def build_module_field_refs(
 
 
 # ---------------------------------------------------------------------------
-# ScanResult dataclass (plain dict for simplicity)
+# ScanResult (plain dict of compact rows, see oops.kb.records)
 # ---------------------------------------------------------------------------
 # ScanResult = {
 #   "modules": {
 #       module_name: {"origin": str, "depends": [str, ...]}
 #   },
 #   "symbols": [
-#       {
+#       SymbolRow(
 #           "model":       str,
 #           "name":        str,
 #           "kind":        "field" | "method",
@@ -639,21 +645,21 @@ def build_module_field_refs(
 #           "source_end_line": int,  # last source line of the definition (degrades to source_line on py3.7)
 #           "field_type":  str | None,  # set when kind == 'field'; e.g. 'Boolean'
 #           "section":     str | None,  # set when kind == 'method'; canonical section name
-#       },
+#       ),
 #       ...
 #   ],
 #   "field_refs": [
-#       {
+#       FieldRefRow(
 #           "model":         str,
 #           "field_name":    str,
 #           "module":        str,
 #           "kwarg":         str,   # 'compute' | 'inverse' | 'search' | 'default' | 'selection'
 #           "target_method": str,
-#       },
+#       ),
 #       ...
 #   ],
 #   "model_origins": [
-#       {
+#       ModelOriginRow(
 #           "model":         str,   # model name being acted upon
 #           "module":        str,
 #           "origin":        str,
@@ -663,7 +669,7 @@ def build_module_field_refs(
 #           "inherits_json": str,   # JSON object of _inherits dict
 #           "source_file":   str,
 #           "source_line":   int,
-#       },
+#       ),
 #       ...
 #   ],
 # }
@@ -689,7 +695,7 @@ def scan_module(  # noqa: C901
 
     # --- manifest ---
     manifest = load_manifest(module_dir)
-    depends = manifest.get("depends", [])
+    depends = [sys.intern(d) if isinstance(d, str) else d for d in manifest.get("depends", [])]
     result["modules"][module_name] = {
         "origin": origin,
         "depends": depends,
@@ -716,7 +722,7 @@ def scan_module(  # noqa: C901
     # ---- Pass 1: collect field symbols and field_refs across the whole module. ----
     # Keyed by (model, target_method) → list of kwargs
     refs_by_target: Dict[Tuple[str, str], List[str]] = {}
-    field_symbols: List[Dict[str, Any]] = []
+    field_symbols: List[SymbolRow] = []
     pending_methods: List[Tuple[str, str, ast.FunctionDef, str, int, int]] = []
 
     for _, rel_path, tree in parsed_files:
@@ -734,34 +740,34 @@ def scan_module(  # noqa: C901
             if _name is not None:
                 role = "extend" if _name in _inherit else "create"
                 result["model_origins"].append(
-                    {
-                        "model": _name,
-                        "module": module_name,
-                        "origin": origin,
-                        "role": role,
-                        "model_type": model_type,
-                        "inherit_json": json.dumps(_inherit),
-                        "inherits_json": json.dumps(_inherits_dict),
-                        "source_file": rel_path,
-                        "source_line": node.lineno,
-                        "description": _description,
-                    }
+                    ModelOriginRow(
+                        model=_name,
+                        module=module_name,
+                        origin=origin,
+                        role=role,
+                        model_type=model_type,
+                        inherit_json=json.dumps(_inherit),
+                        inherits_json=json.dumps(_inherits_dict),
+                        source_file=rel_path,
+                        source_line=node.lineno,
+                        description=_description,
+                    )
                 )
             else:
                 for inh in _inherit:
                     result["model_origins"].append(
-                        {
-                            "model": inh,
-                            "module": module_name,
-                            "origin": origin,
-                            "role": "extend",
-                            "model_type": model_type,
-                            "inherit_json": json.dumps([]),
-                            "inherits_json": json.dumps({}),
-                            "source_file": rel_path,
-                            "source_line": node.lineno,
-                            "description": _description,
-                        }
+                        ModelOriginRow(
+                            model=inh,
+                            module=module_name,
+                            origin=origin,
+                            role="extend",
+                            model_type=model_type,
+                            inherit_json="[]",
+                            inherits_json="{}",
+                            source_file=rel_path,
+                            source_line=node.lineno,
+                            description=_description,
+                        )
                     )
 
             target_models: List[str] = [_name] if _name else _inherit
@@ -773,29 +779,28 @@ def scan_module(  # noqa: C901
                         fname, lineno, ftype = fld
                         end_lineno = getattr(stmt, "end_lineno", None) or lineno
                         field_symbols.append(
-                            {
-                                "model": model_name,
-                                "name": fname,
-                                "kind": "field",
-                                "origin": origin,
-                                "module": module_name,
-                                "source_file": rel_path,
-                                "source_line": lineno,
-                                "source_end_line": end_lineno,
-                                "field_type": ftype,
-                                "section": None,
-                            }
+                            SymbolRow(
+                                model=model_name,
+                                name=fname,
+                                kind="field",
+                                origin=origin,
+                                module=module_name,
+                                source_file=rel_path,
+                                source_line=lineno,
+                                source_end_line=end_lineno,
+                                field_type=ftype,
+                            )
                         )
                         for kwarg, target in extract_field_refs(stmt).items():
                             refs_by_target.setdefault((model_name, target), []).append(kwarg)
                             result["field_refs"].append(
-                                {
-                                    "model": model_name,
-                                    "field_name": fname,
-                                    "module": module_name,
-                                    "kwarg": kwarg,
-                                    "target_method": target,
-                                }
+                                FieldRefRow(
+                                    model=model_name,
+                                    field_name=fname,
+                                    module=module_name,
+                                    kwarg=kwarg,
+                                    target_method=target,
+                                )
                             )
                         continue
                     if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
@@ -811,24 +816,23 @@ def scan_module(  # noqa: C901
                         )
 
     # ---- Pass 2: classify methods using the collected field refs. ----
-    method_symbols: List[Dict[str, Any]] = []
+    method_symbols: List[SymbolRow] = []
     for model_name, rel_path, fn_node, mname, lineno, end_lineno in pending_methods:
         ref_kwargs = refs_by_target.get((model_name, mname), [])
         decs = _get_decorator_names(fn_node)
         section = classify_method(mname, decs, ref_kwargs)
         method_symbols.append(
-            {
-                "model": model_name,
-                "name": mname,
-                "kind": "method",
-                "origin": origin,
-                "module": module_name,
-                "source_file": rel_path,
-                "source_line": lineno,
-                "source_end_line": end_lineno,
-                "field_type": None,
-                "section": section,
-            }
+            SymbolRow(
+                model=model_name,
+                name=mname,
+                kind="method",
+                origin=origin,
+                module=module_name,
+                source_file=rel_path,
+                source_line=lineno,
+                source_end_line=end_lineno,
+                section=section,
+            )
         )
 
     result["symbols"] = field_symbols + method_symbols
@@ -836,6 +840,23 @@ def scan_module(  # noqa: C901
     return result
 
 
+def iter_tier_modules(tier_root: Path, allowed_modules: Optional[Set[str]] = None) -> Iterator[Path]:
+    """Yield the module directories of a tier root, sorted by name.
+
+    Args:
+        tier_root:       directory whose immediate children are Odoo modules.
+        allowed_modules: if set, only modules whose name is in this set are yielded.
+    """
+    for entry in sorted(tier_root.iterdir()):
+        if not entry.is_dir():
+            continue
+        if allowed_modules and entry.name not in allowed_modules:
+            continue
+        if not load_manifest(entry):
+            continue
+        yield entry
+
+
 def scan_tier(
     tier_root: Path,
     origin: str,
@@ -860,14 +881,7 @@ def scan_tier(
         return result
 
     count = 0
-    for entry in sorted(tier_root.iterdir()):
-        if not entry.is_dir():
-            continue
-        if allowed_modules and entry.name not in allowed_modules:
-            continue
-        if not load_manifest(entry):
-            continue
-
+    for entry in iter_tier_modules(tier_root, allowed_modules):
         data = scan_module(entry, origin, tier_root)
         merged["modules"].update(data["modules"])
         merged["symbols"].extend(data["symbols"])
@@ -9,73 +9,127 @@ Two databases, same schema:
 - kb_global.db   : Odoo community + enterprise, generated once per version.
 - kb_project.db  : global + third-party + apik, scoped to a project.
 
-Schema (v7)
------------
+Schema (v10)
+------------
+Model names, module names, source files and origins repeat on almost every
+fact row, so the fact tables store integer ids into four dictionary tables
+and are read back through views carrying the historical table names and
+columns (``symbols``, ``field_refs``, ``model_origins``, ``views``).
+
+Dictionaries
+models        (id, name)
+module_names  (id, name)
+files         (id, path)
+origins       (id, name)
+
+Tables
 meta          (key, value)
 sources       (origin, path)
 modules       (name, origin, depends,         -- depends is a JSON array string
                application, app)             -- application flag + owning app
-symbols       (model, name, kind, origin, module, source_file, source_line,
-               source_end_line, field_type, section)
+symbol_facts  (model_id, name, kind, origin_id, module_id, file_id,
+               source_line, source_end_line, field_type, section)
               source_end_line: last source line of the definition (nullable —
               fields may omit it)
-field_refs    (model, field_name, module, kwarg, target_method)
-model_origins (model, module, origin, role, model_type,
-               inherit_json, inherits_json, source_file, source_line,
-               description)
+field_ref_facts    (model_id, field_name, module_id, kwarg, target_method)
+model_origin_facts (model_id, module_id, origin_id, role, model_type,
+                    inherit_json, inherits_json, file_id, source_line,
+                    description)
               role: 'create' | 'extend' | 'prototype'
               model_type: 'model' | 'transient' | 'abstract'
               description: literal _description string (nullable)
-views         (xml_id, module, origin, name, model, view_type, inherit_id,
-               mode, source_file, source_line, source_end_line,
+view_facts    (xml_id, module_id, origin_id, name, model_id, view_type,
+               inherit_id, mode, file_id, source_line, source_end_line,
                fields_json, buttons_json)
               mode: 'primary' | 'extension'
               view_type: NULL during pass 1, 'unresolved' if pass 2 fails
               source_end_line: closing-element line (nullable)
+model_domains (model_id, creator_id, app, kind, anchor, extensions_json)
+              derived from model_origin_facts + modules on every write:
+              creator_id: first creating module (origin, module order)
+              kind: 'domain' | 'pillar' | 'noise' (see kb/domains.py)
+              anchor: domain app / pillar module, NULL for noise
+              extensions_json: {app: number of extending modules}
+module_depends (module, depends_on, tier, seq)
+              one edge per manifest depends entry, derived from modules:
+              tier: origin of ``module``; seq: position in its depends
+module_closure (module, ancestor, distance, position)
+              transitive depends, derived from module_depends:
+              distance: 1 for direct depends (breadth-first)
+              position: breadth-first rank in the module's depends chain
 actions       (xml_id, module, origin, name, model, view_id, domain,
                source_file, source_line)
 menus         (xml_id, module, origin, name, action, parent_id,
                source_file, source_line)
 
+Views (decoded facts, same columns as the v7 tables)
+symbols       (model, name, kind, origin, module, source_file, source_line,
+               source_end_line, field_type, section)
+field_refs    (model, field_name, module, kwarg, target_method)
+model_origins (model, module, origin, role, model_type, inherit_json,
+               inherits_json, source_file, source_line, description)
+views         (xml_id, module, origin, name, model, view_type, inherit_id,
+               mode, source_file, source_line, source_end_line,
+               fields_json, buttons_json)
+
 Indexes
 -------
-idx_symbols_lookup      on symbols(model, name, kind)
-idx_symbols_module      on symbols(module)
-idx_modules_origin      on modules(origin)
-idx_field_refs_target   on field_refs(model, target_method)
-idx_model_origins_model on model_origins(model)
-idx_model_origins_role  on model_origins(model, role)
-idx_views_model         on views(model)
-idx_views_inherit       on views(inherit_id)
-idx_views_module        on views(module)
-idx_views_origin        on views(origin)
-idx_actions_model       on actions(model)
-idx_actions_module      on actions(module)
-idx_menus_action        on menus(action)
-idx_menus_parent        on menus(parent_id)
-idx_menus_module        on menus(module)
+symbol_facts, field_ref_facts and model_origin_facts are WITHOUT ROWID tables
+clustered on their primary key, which also serves the (model, name, kind),
+(model, field_name) and (model, module) lookups.
+
+idx_symbol_facts_module       on symbol_facts(module_id)
+idx_modules_origin            on modules(origin)
+idx_field_ref_facts_target    on field_ref_facts(model_id, target_method)
+idx_model_origin_facts_role   on model_origin_facts(model_id, role)
+idx_view_facts_model          on view_facts(model_id)
+idx_view_facts_inherit        on view_facts(inherit_id)
+idx_view_facts_module         on view_facts(module_id)
+idx_view_facts_origin         on view_facts(origin_id)
+idx_module_depends_reverse    on module_depends(depends_on, module)
+idx_module_closure_ancestor   on module_closure(ancestor, distance)
+idx_actions_model             on actions(model)
+idx_actions_module            on actions(module)
+idx_menus_action              on menus(action)
+idx_menus_parent              on menus(parent_id)
+idx_menus_module              on menus(module)
+
+Migrations
+----------
+Older KBs are upgraded in place by :func:`migrate_kb`, one registered step
+per version, each in its own transaction with the ``schema_version`` bump.
+Steps that need data the KB never stored (v6 → v7 manifest flags) raise
+:class:`MigrationImpossible` and the KB is rebuilt from source instead.
 """
 
+import contextlib
 import json
+import os
 import sqlite3
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable, Iterable
 
-from oops.core.compat import Any, Dict, List, Optional
+from oops.core.compat import Any, Dict, List, Optional, Tuple
+from oops.core.exceptions import OopsError
 from oops.core.logger import log
 from oops.core.models import Result
+from oops.core.profiling import count, get_tracer
+from oops.kb.domains import EXCLUDED_TECHNICAL_MODULES, PILLAR_MODULES, classify_creator
+from oops.kb.resolve import walk_depends
 
 # ---------------------------------------------------------------------------
 # Schema versioning
 # ---------------------------------------------------------------------------
 
-SCHEMA_VERSION = 7  # added application, app to modules
+SCHEMA_VERSION = 10  # module_depends edges + module_closure
 
 # ---------------------------------------------------------------------------
 # DDL
 # ---------------------------------------------------------------------------
 
-_DDL = """
+_BASE_DDL = """
 PRAGMA journal_mode = WAL;
 PRAGMA synchronous  = NORMAL;
 PRAGMA foreign_keys = ON;
@@ -98,69 +152,166 @@ CREATE TABLE IF NOT EXISTS modules (
     app         TEXT                          -- owning app technical name, NULL if none
 );
 CREATE INDEX IF NOT EXISTS idx_modules_origin ON modules (origin);
+"""
+
+# v8 dictionary encoding. The DDL constants below build fresh KBs only: each
+# migration step carries a frozen copy of what its version created.
+_ENCODED_DDL = """
+-- Dictionaries: one row per distinct string, referenced by integer id.
+CREATE TABLE IF NOT EXISTS models (
+    id   INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS module_names (
+    id   INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS files (
+    id   INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS origins (
+    id   INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
 
-CREATE TABLE IF NOT EXISTS symbols (
-    model       TEXT    NOT NULL,
+CREATE TABLE IF NOT EXISTS symbol_facts (
+    model_id    INTEGER NOT NULL REFERENCES models (id),
     name        TEXT    NOT NULL,
     kind        TEXT    NOT NULL,           -- 'field' | 'method'
-    origin      TEXT    NOT NULL,
-    module      TEXT    NOT NULL,
-    source_file TEXT    NOT NULL,
+    origin_id   INTEGER NOT NULL REFERENCES origins (id),
+    module_id   INTEGER NOT NULL REFERENCES module_names (id),
+    file_id     INTEGER NOT NULL REFERENCES files (id),
     source_line INTEGER NOT NULL,
     source_end_line INTEGER,                 -- last source line / NULL for fields without one
     field_type  TEXT,                       -- e.g. 'Boolean' / NULL for methods
     section     TEXT,                       -- canonical section name / NULL for fields
-    PRIMARY KEY (model, name, kind, module)
-);
-CREATE INDEX IF NOT EXISTS idx_symbols_lookup ON symbols (model, name, kind);
-CREATE INDEX IF NOT EXISTS idx_symbols_module ON symbols (module);
-
-CREATE TABLE IF NOT EXISTS field_refs (
-    model         TEXT NOT NULL,
-    field_name    TEXT NOT NULL,
-    module        TEXT NOT NULL,
-    kwarg         TEXT NOT NULL,            -- 'compute' | 'inverse' | 'search' | 'default' | 'selection'
-    target_method TEXT NOT NULL,
-    PRIMARY KEY (model, field_name, module, kwarg)
-);
-CREATE INDEX IF NOT EXISTS idx_field_refs_target ON field_refs (model, target_method);
-
-CREATE TABLE IF NOT EXISTS model_origins (
-    model         TEXT    NOT NULL,
-    module        TEXT    NOT NULL,
-    origin        TEXT    NOT NULL,
+    PRIMARY KEY (model_id, name, kind, module_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_symbol_facts_module ON symbol_facts (module_id);
+
+CREATE TABLE IF NOT EXISTS field_ref_facts (
+    model_id      INTEGER NOT NULL REFERENCES models (id),
+    field_name    TEXT    NOT NULL,
+    module_id     INTEGER NOT NULL REFERENCES module_names (id),
+    kwarg         TEXT    NOT NULL,         -- 'compute' | 'inverse' | 'search' | 'default' | 'selection'
+    target_method TEXT    NOT NULL,
+    PRIMARY KEY (model_id, field_name, module_id, kwarg)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_field_ref_facts_target ON field_ref_facts (model_id, target_method);
+
+CREATE TABLE IF NOT EXISTS model_origin_facts (
+    model_id      INTEGER NOT NULL REFERENCES models (id),
+    module_id     INTEGER NOT NULL REFERENCES module_names (id),
+    origin_id     INTEGER NOT NULL REFERENCES origins (id),
     role          TEXT    NOT NULL,         -- 'create' | 'extend' | 'prototype'
     model_type    TEXT    NOT NULL DEFAULT 'model', -- 'model' | 'transient' | 'abstract'
     inherit_json  TEXT    NOT NULL DEFAULT '[]',
     inherits_json TEXT    NOT NULL DEFAULT '{}',
-    source_file   TEXT    NOT NULL,
+    file_id       INTEGER NOT NULL REFERENCES files (id),
     source_line   INTEGER NOT NULL,
     description   TEXT,                       -- literal _description / NULL when absent
-    PRIMARY KEY (model, module)
-);
-CREATE INDEX IF NOT EXISTS idx_model_origins_model ON model_origins (model);
-CREATE INDEX IF NOT EXISTS idx_model_origins_role  ON model_origins (model, role);
-
-CREATE TABLE IF NOT EXISTS views (
-    xml_id       TEXT NOT NULL PRIMARY KEY,
-    module       TEXT NOT NULL,
-    origin       TEXT NOT NULL,
+    PRIMARY KEY (model_id, module_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_model_origin_facts_role ON model_origin_facts (model_id, role);
+
+CREATE TABLE IF NOT EXISTS view_facts (
+    xml_id       TEXT    NOT NULL PRIMARY KEY,
+    module_id    INTEGER NOT NULL REFERENCES module_names (id),
+    origin_id    INTEGER NOT NULL REFERENCES origins (id),
     name         TEXT,
-    model        TEXT,
+    model_id     INTEGER REFERENCES models (id),
     view_type    TEXT,
     inherit_id   TEXT,
-    mode         TEXT NOT NULL,
-    source_file  TEXT NOT NULL,
+    mode         TEXT    NOT NULL,
+    file_id      INTEGER NOT NULL REFERENCES files (id),
     source_line  INTEGER NOT NULL,
     source_end_line INTEGER,
-    fields_json  TEXT NOT NULL DEFAULT '[]',
-    buttons_json TEXT NOT NULL DEFAULT '[]'
+    fields_json  TEXT    NOT NULL DEFAULT '[]',
+    buttons_json TEXT    NOT NULL DEFAULT '[]'
 );
-CREATE INDEX IF NOT EXISTS idx_views_model   ON views (model);
-CREATE INDEX IF NOT EXISTS idx_views_inherit ON views (inherit_id);
-CREATE INDEX IF NOT EXISTS idx_views_module  ON views (module);
-CREATE INDEX IF NOT EXISTS idx_views_origin  ON views (origin);
+CREATE INDEX IF NOT EXISTS idx_view_facts_model   ON view_facts (model_id);
+CREATE INDEX IF NOT EXISTS idx_view_facts_inherit ON view_facts (inherit_id);
+CREATE INDEX IF NOT EXISTS idx_view_facts_module  ON view_facts (module_id);
+CREATE INDEX IF NOT EXISTS idx_view_facts_origin  ON view_facts (origin_id);
+
+-- Decoded views: the v7 table names and columns, read by KBReader.
+CREATE VIEW IF NOT EXISTS symbols AS
+    SELECT m.name AS model, s.name AS name, s.kind AS kind, o.name AS origin,
+           mn.name AS module, f.path AS source_file, s.source_line AS source_line,
+           s.source_end_line AS source_end_line, s.field_type AS field_type,
+           s.section AS section
+    FROM   symbol_facts s
+    JOIN   models m        ON m.id  = s.model_id
+    JOIN   origins o       ON o.id  = s.origin_id
+    JOIN   module_names mn ON mn.id = s.module_id
+    JOIN   files f         ON f.id  = s.file_id;
+
+CREATE VIEW IF NOT EXISTS field_refs AS
+    SELECT m.name AS model, r.field_name AS field_name, mn.name AS module,
+           r.kwarg AS kwarg, r.target_method AS target_method
+    FROM   field_ref_facts r
+    JOIN   models m        ON m.id  = r.model_id
+    JOIN   module_names mn ON mn.id = r.module_id;
+
+CREATE VIEW IF NOT EXISTS model_origins AS
+    SELECT m.name AS model, mn.name AS module, o.name AS origin, mo.role AS role,
+           mo.model_type AS model_type, mo.inherit_json AS inherit_json,
+           mo.inherits_json AS inherits_json, f.path AS source_file,
+           mo.source_line AS source_line, mo.description AS description
+    FROM   model_origin_facts mo
+    JOIN   models m        ON m.id  = mo.model_id
+    JOIN   module_names mn ON mn.id = mo.module_id
+    JOIN   origins o       ON o.id  = mo.origin_id
+    JOIN   files f         ON f.id  = mo.file_id;
+
+CREATE VIEW IF NOT EXISTS views AS
+    SELECT v.xml_id AS xml_id, mn.name AS module, o.name AS origin, v.name AS name,
+           m.name AS model, v.view_type AS view_type, v.inherit_id AS inherit_id,
+           v.mode AS mode, f.path AS source_file, v.source_line AS source_line,
+           v.source_end_line AS source_end_line, v.fields_json AS fields_json,
+           v.buttons_json AS buttons_json
+    FROM   view_facts v
+    JOIN   module_names mn ON mn.id = v.module_id
+    JOIN   origins o       ON o.id  = v.origin_id
+    JOIN   files f         ON f.id  = v.file_id
+    LEFT JOIN models m     ON m.id  = v.model_id;
+"""
+
+# v9 derived domain classification, rebuilt by _build_model_domains.
+_DOMAINS_DDL = """
+CREATE TABLE IF NOT EXISTS model_domains (
+    model_id        INTEGER NOT NULL PRIMARY KEY REFERENCES models (id),
+    creator_id      INTEGER REFERENCES module_names (id), -- NULL when no module creates it
+    app             TEXT,                     -- owning app of the creator
+    kind            TEXT    NOT NULL,         -- 'domain' | 'pillar' | 'noise'
+    anchor          TEXT,                     -- domain / pillar name, NULL for noise
+    extensions_json TEXT    NOT NULL DEFAULT '{}'
+) WITHOUT ROWID;
+"""
 
+# v10 module dependency graph, rebuilt by _build_module_graph.
+_GRAPH_DDL = """
+CREATE TABLE IF NOT EXISTS module_depends (
+    module     TEXT    NOT NULL,
+    depends_on TEXT    NOT NULL,
+    tier       TEXT    NOT NULL,            -- origin of ``module``
+    seq        INTEGER NOT NULL,            -- position in the manifest depends
+    PRIMARY KEY (module, depends_on)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_module_depends_reverse ON module_depends (depends_on, module);
+
+CREATE TABLE IF NOT EXISTS module_closure (
+    module   TEXT    NOT NULL,
+    ancestor TEXT    NOT NULL,
+    distance INTEGER NOT NULL,              -- 1 = direct depends
+    position INTEGER NOT NULL,              -- breadth-first rank, closest first
+    PRIMARY KEY (module, ancestor)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_module_closure_ancestor ON module_closure (ancestor, distance);
+"""
+
+_XML_DDL = """
 CREATE TABLE IF NOT EXISTS actions (
     xml_id       TEXT NOT NULL PRIMARY KEY,
     module       TEXT NOT NULL,
@@ -190,6 +341,8 @@ CREATE INDEX IF NOT EXISTS idx_menus_parent  ON menus (parent_id);
 CREATE INDEX IF NOT EXISTS idx_menus_module  ON menus (module);
 """
 
+_DDL = _BASE_DDL + _ENCODED_DDL + _DOMAINS_DDL + _GRAPH_DDL + _XML_DDL
+
 
 # ---------------------------------------------------------------------------
 # Connection helper
@@ -206,6 +359,45 @@ def _connect(db_path: Path) -> sqlite3.Connection:
     return con
 
 
+class _Dictionary:
+    """Assign integer ids to the distinct strings of one dictionary table.
+
+    Ids are allocated in memory while fact rows are built; :meth:`flush`
+    inserts the values seen since the previous flush. ``None`` maps to
+    ``None`` (nullable references).
+    """
+
+    def __init__(self, table: str, column: str) -> None:
+        self.table = table
+        self.column = column
+        self.ids: Dict[str, int] = {}
+        self._next = 1
+        self._pending: List[tuple] = []
+
+    def __call__(self, value: Optional[str]) -> Optional[int]:
+        if value is None:
+            return None
+        key = self.ids.get(value)
+        if key is None:
+            key = self.ids[value] = self._next
+            self._next += 1
+            self._pending.append((key, value))
+        return key
+
+    def load(self, con: sqlite3.Connection) -> "_Dictionary":
+        """Seed the ids already stored in the table (partial rewrites)."""
+        for key, value in con.execute(f"SELECT id, {self.column} FROM {self.table}"):
+            self.ids[value] = key
+            self._next = max(self._next, key + 1)
+        return self
+
+    def flush(self, con: sqlite3.Connection) -> None:
+        """Insert the values allocated since the last flush."""
+        if self._pending:
+            con.executemany(f"INSERT INTO {self.table} (id, {self.column}) VALUES (?, ?)", self._pending)
+            self._pending = []
+
+
 # ---------------------------------------------------------------------------
 # Write
 # ---------------------------------------------------------------------------
@@ -265,6 +457,173 @@ def write_project_kb(
     )
 
 
+def replace_kb_modules(db_path: Path, modules: List[str], scan: Dict[str, Any]) -> Result[dict]:
+    """Swap every row owned by ``modules`` for the rows of a fresh ScanResult.
+
+    Used by watch modes to re-scan a few edited modules without rebuilding
+    the whole KB. Dictionaries keep their existing ids; strings no longer
+    referenced stay behind until the next full write. ``generated_at`` is
+    left untouched so staleness checks still compare against the last full
+    build; ``updated_at`` records the partial write.
+
+    Args:
+        db_path: existing KB database.
+        modules: module names whose rows are replaced (a module missing from
+                 ``scan`` is simply removed).
+        scan:    ScanResult dict holding the new rows of those modules.
+    """
+    kb_result: "Result[dict]" = Result()
+    con = _connect(db_path)
+    marks = ", ".join("?" * len(modules))
+    try:
+        with con:
+            ids = [row[0] for row in con.execute(f"SELECT id FROM module_names WHERE name IN ({marks})", modules)]
+            id_marks = ", ".join("?" * len(ids))
+            for table in ("symbol_facts", "field_ref_facts", "model_origin_facts", "view_facts"):
+                con.execute(f"DELETE FROM {table} WHERE module_id IN ({id_marks})", ids)
+            for table in ("actions", "menus"):
+                con.execute(f"DELETE FROM {table} WHERE module IN ({marks})", modules)
+            con.execute(f"DELETE FROM modules WHERE name IN ({marks})", modules)
+
+            _insert_scan(con, scan, _dictionaries(con))
+            _build_model_domains(con)
+            _build_module_graph(con)
+            con.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('updated_at', ?)",
+                (datetime.now(timezone.utc).isoformat(),),
+            )
+    except sqlite3.Error as exc:
+        kb_result.add_error(f"KB update failed: {exc}")
+        return kb_result
+    finally:
+        con.close()
+
+    kb_result.data = {"file": db_path, "modules": list(modules)}
+    return kb_result
+
+
+def relocate_kb_sources(db_path: Path, sources: Dict[str, str]) -> None:
+    """Point the ``sources`` roots of a KB at local checkouts.
+
+    Used after installing a KB built on another machine: its rows are
+    relative to the source roots, only the roots themselves move.
+
+    Args:
+        db_path: existing KB database.
+        sources: ``{origin: absolute path}``; origins absent from the KB are ignored.
+    """
+    con = _connect(db_path)
+    try:
+        with con:
+            con.executemany("UPDATE sources SET path = ? WHERE origin = ?", [(p, o) for o, p in sources.items()])
+    finally:
+        con.close()
+
+
+def _discard_db(path: Path) -> None:
+    """Remove a database file and its rollback journal, if present."""
+    for stale in (path, path.with_name(path.name + "-journal")):
+        with contextlib.suppress(FileNotFoundError):
+            stale.unlink()
+
+
+class KBWriter:
+    """Write a KB incrementally, replacing any previous content.
+
+    Builders feed ScanResults (or any subset of their keys) as modules are
+    scanned, so facts reach the database instead of piling up in memory for
+    every tier. Rows go to a sibling ``<name>.<pid>.tmp`` file, so the
+    previous KB stays readable, and unlocked, for the whole build.
+    :meth:`close` derives the model domains and the module graph, commits,
+    moves the new file over ``db_path`` and returns the stats.
+    Used as a context manager, an exception discards the new file and leaves
+    the previous KB untouched.
+
+    Args:
+        db_path:      destination .db file (created if absent).
+        layer:        'global' or 'project'.
+        odoo_version: e.g. '17.0'.
+        project:      project slug (project layer only).
+        scope:        sorted module names in scope (project layer only).
+        sources:      { origin: absolute_path_string }.
+        meta:         extra ``meta`` rows (e.g. the source revisions of a global KB).
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        layer: str,
+        odoo_version: str,
+        project: Optional[str] = None,
+        scope: Optional[List[str]] = None,
+        sources: Optional[Dict[str, str]] = None,
+        meta: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.db_path = db_path
+        self._tmp_path = db_path.with_name(f"{db_path.name}.{os.getpid()}.tmp")
+        _discard_db(self._tmp_path)  # left over by a killed build
+        self._con = _connect(self._tmp_path)
+
+        meta_rows = [
+            ("layer", layer),
+            ("odoo_version", odoo_version),
+            ("schema_version", str(SCHEMA_VERSION)),
+            ("generated_at", datetime.now(timezone.utc).isoformat()),
+        ]
+        if project:
+            meta_rows.append(("project", project))
+        if scope is not None:
+            meta_rows.append(("scope", json.dumps(scope)))
+        meta_rows.extend((meta or {}).items())
+        self._con.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", meta_rows)
+        self.add_sources(sources or {})
+        self._dictionaries = _dictionaries()
+
+    def add_sources(self, sources: Dict[str, str]) -> None:
+        """Record tier roots (``{origin: path}``); a later call for an origin wins."""
+        self._con.executemany("INSERT OR REPLACE INTO sources (origin, path) VALUES (?, ?)", sources.items())
+
+    def insert(self, scan: Dict[str, Any]) -> None:
+        """Insert the modules and facts of a (partial) ScanResult.
+
+        Rows are written in call order; a later row with the same key
+        replaces an earlier one, as when all ScanResults are written at once.
+        """
+        _insert_scan(self._con, scan, self._dictionaries)
+
+    def close(self) -> Result[dict]:
+        """Derive the model domains and module graph, commit, and return the KB stats."""
+        kb_result: "Result[dict]" = Result()
+        try:
+            _build_model_domains(self._con)
+            _build_module_graph(self._con)
+            self._con.commit()
+        except sqlite3.Error as exc:
+            self.abort()
+            kb_result.add_error(f"KB write failed: {exc}")
+            return kb_result
+        self._con.close()
+        os.replace(self._tmp_path, self.db_path)
+
+        count("io.bytes_written", self.db_path.stat().st_size)
+        stats = _get_stats(self.db_path)
+        kb_result.merge(stats)
+        kb_result.data = stats.data
+        return kb_result
+
+    def abort(self) -> None:
+        """Close the connection and discard the new file; the previous KB is kept."""
+        self._con.close()
+        _discard_db(self._tmp_path)
+
+    def __enter__(self) -> "KBWriter":
+        return self
+
+    def __exit__(self, exc_type, *_) -> None:
+        if exc_type is not None:
+            self.abort()
+
+
 def _write_kb(
     db_path: Path,
     layer: str,
@@ -275,210 +634,298 @@ def _write_kb(
     scan_results: List[Dict[str, Any]],
 ) -> Result[dict]:
     """Internal: write all KB data to db_path, replacing any previous content."""
-    kb_result: "Result[dict]" = Result()
-    con = _connect(db_path)
     try:
-        with con:
-            # Schema may have evolved: drop and re-create all data tables so column
-            # additions always land on existing on-disk databases.
-            for table in (
-                "views",
-                "actions",
-                "menus",
-                "field_refs",
-                "symbols",
-                "model_origins",
-                "modules",
-                "sources",
-                "meta",
-            ):
-                con.execute(f"DROP TABLE IF EXISTS {table}")
-            con.executescript(_DDL)
-
-            # --- meta ---
-            meta_rows = [
-                ("layer", layer),
-                ("odoo_version", odoo_version),
-                ("schema_version", str(SCHEMA_VERSION)),
-                ("generated_at", datetime.now(timezone.utc).isoformat()),
-            ]
-            if project:
-                meta_rows.append(("project", project))
-            if scope is not None:
-                meta_rows.append(("scope", json.dumps(scope)))
-            con.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", meta_rows)
-
-            # --- sources ---
-            con.executemany(
-                "INSERT INTO sources (origin, path) VALUES (?, ?)",
-                sources.items(),
-            )
-
-            # --- modules + symbols + field_refs from all scan results ---
+        writer = KBWriter(db_path, layer, odoo_version, project=project, scope=scope, sources=sources)
+        with writer:
             for scan in scan_results:
-                for mod_name, mod_data in scan.get("modules", {}).items():
-                    con.execute(
-                        """
-                        INSERT OR REPLACE INTO modules (name, origin, depends, application, app)
-                        VALUES (?, ?, ?, ?, ?)
-                        """,
-                        (
-                            mod_name,
-                            mod_data["origin"],
-                            json.dumps(mod_data["depends"]),
-                            mod_data.get("application", 0),
-                            mod_data.get("app"),
-                        ),
-                    )
+                writer.insert(scan)
+    except sqlite3.Error as exc:
+        kb_result: "Result[dict]" = Result()
+        kb_result.add_error(f"KB write failed: {exc}")
+        return kb_result
+    return writer.close()
 
-                for sym in scan.get("symbols", []):
-                    con.execute(
-                        """
-                        INSERT OR REPLACE INTO symbols
-                            (model, name, kind, origin, module, source_file, source_line,
-                             source_end_line, field_type, section)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            sym["model"],
-                            sym["name"],
-                            sym["kind"],
-                            sym["origin"],
-                            sym["module"],
-                            sym["source_file"],
-                            sym["source_line"],
-                            sym.get("source_end_line"),
-                            sym.get("field_type"),
-                            sym.get("section"),
-                        ),
-                    )
 
-                for ref in scan.get("field_refs", []):
-                    con.execute(
-                        """
-                        INSERT OR REPLACE INTO field_refs
-                            (model, field_name, module, kwarg, target_method)
-                        VALUES (?, ?, ?, ?, ?)
-                        """,
-                        (
-                            ref["model"],
-                            ref["field_name"],
-                            ref["module"],
-                            ref["kwarg"],
-                            ref["target_method"],
-                        ),
-                    )
+def _dictionaries(con: Optional[sqlite3.Connection] = None) -> "tuple[_Dictionary, ...]":
+    """The four string dictionaries, seeded from ``con`` when rewriting part of a KB."""
+    dictionaries = (
+        _Dictionary("models", "name"),
+        _Dictionary("module_names", "name"),
+        _Dictionary("files", "path"),
+        _Dictionary("origins", "name"),
+    )
+    if con is not None:
+        for dictionary in dictionaries:
+            dictionary.load(con)
+    return dictionaries
 
-                for orig in scan.get("model_origins", []):
-                    con.execute(
-                        """
-                        INSERT OR REPLACE INTO model_origins
-                            (model, module, origin, role, model_type,
-                             inherit_json, inherits_json, source_file, source_line,
-                             description)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            orig["model"],
-                            orig["module"],
-                            orig["origin"],
-                            orig["role"],
-                            orig.get("model_type", "model"),
-                            orig.get("inherit_json", "[]"),
-                            orig.get("inherits_json", "{}"),
-                            orig["source_file"],
-                            orig["source_line"],
-                            orig.get("description"),
-                        ),
-                    )
 
-                for view in scan.get("views", []):
-                    con.execute(
-                        """
-                        INSERT OR REPLACE INTO views
-                            (xml_id, module, origin, name, model, view_type, inherit_id,
-                             mode, source_file, source_line, source_end_line,
-                             fields_json, buttons_json)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            view["xml_id"],
-                            view["module"],
-                            view["origin"],
-                            view.get("name"),
-                            view.get("model"),
-                            view.get("view_type"),
-                            view.get("inherit_id"),
-                            view["mode"],
-                            view["source_file"],
-                            view["source_line"],
-                            view.get("source_end_line"),
-                            view.get("fields_json", "[]"),
-                            view.get("buttons_json", "[]"),
-                        ),
-                    )
+# Rows encoded and inserted per executemany call: bounds the memory of a
+# write to one batch of tuples whatever the size of the scan.
+_INSERT_BATCH = 5000
 
-                for action in scan.get("actions", []):
-                    con.execute(
-                        """
-                        INSERT OR REPLACE INTO actions
-                            (xml_id, module, origin, name, model, view_id, domain,
-                             source_file, source_line)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            action["xml_id"],
-                            action["module"],
-                            action["origin"],
-                            action.get("name"),
-                            action.get("model"),
-                            action.get("view_id"),
-                            action.get("domain"),
-                            action["source_file"],
-                            action["source_line"],
-                        ),
-                    )
 
-                for menu in scan.get("menus", []):
-                    con.execute(
-                        """
-                        INSERT OR REPLACE INTO menus
-                            (xml_id, module, origin, name, action, parent_id,
-                             source_file, source_line)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            menu["xml_id"],
-                            menu["module"],
-                            menu["origin"],
-                            menu.get("name"),
-                            menu.get("action"),
-                            menu.get("parent_id"),
-                            menu["source_file"],
-                            menu["source_line"],
-                        ),
-                    )
-    except sqlite3.Error as exc:
-        kb_result.add_error(f"KB write failed: {exc}")
-        return kb_result
+def _insert_rows(
+    con: sqlite3.Connection,
+    sql: str,
+    rows: Iterable[Any],
+    encode: Callable[[Any], tuple],
+    dictionaries: "tuple[_Dictionary, ...]" = (),
+) -> None:
+    """Encode ``rows`` and insert them in batches.
 
-    con.close()
-    stats = _get_stats(db_path)
-    kb_result.merge(stats)
-    kb_result.data = stats.data
-    return kb_result
+    Dictionary values allocated while encoding a batch are flushed before
+    the batch itself, so fact rows never reference a missing id. ``rows``
+    may be any iterable (a list of scan rows, a cursor) and is read once.
+    """
+    batch: List[tuple] = []
+    for row in rows:
+        batch.append(encode(row))
+        if len(batch) >= _INSERT_BATCH:
+            for dictionary in dictionaries:
+                dictionary.flush(con)
+            con.executemany(sql, batch)
+            batch = []
+    if batch:
+        for dictionary in dictionaries:
+            dictionary.flush(con)
+        con.executemany(sql, batch)
+
+
+def _insert_scan(con: sqlite3.Connection, scan: Dict[str, Any], dictionaries: "tuple[_Dictionary, ...]") -> None:
+    """Insert the modules and facts of one ScanResult, encoding strings through ``dictionaries``.
+
+    ``scan`` may hold any subset of the ScanResult keys, so facts can be
+    streamed in as they are scanned (see :class:`KBWriter`).
+    """
+    model_id, module_id, file_id, origin_id = dictionaries
+
+    _insert_rows(
+        con,
+        """
+        INSERT OR REPLACE INTO modules (name, origin, depends, application, app)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        scan.get("modules", {}).items(),
+        lambda item: (
+            item[0],
+            item[1]["origin"],
+            json.dumps(item[1]["depends"]),
+            item[1].get("application", 0),
+            item[1].get("app"),
+        ),
+    )
+    _insert_rows(
+        con,
+        """
+        INSERT OR REPLACE INTO symbol_facts
+            (model_id, name, kind, origin_id, module_id, file_id, source_line,
+             source_end_line, field_type, section)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        scan.get("symbols", []),
+        lambda sym: (
+            model_id(sym["model"]),
+            sym["name"],
+            sym["kind"],
+            origin_id(sym["origin"]),
+            module_id(sym["module"]),
+            file_id(sym["source_file"]),
+            sym["source_line"],
+            sym.get("source_end_line"),
+            sym.get("field_type"),
+            sym.get("section"),
+        ),
+        dictionaries,
+    )
+    _insert_rows(
+        con,
+        """
+        INSERT OR REPLACE INTO field_ref_facts
+            (model_id, field_name, module_id, kwarg, target_method)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        scan.get("field_refs", []),
+        lambda ref: (
+            model_id(ref["model"]),
+            ref["field_name"],
+            module_id(ref["module"]),
+            ref["kwarg"],
+            ref["target_method"],
+        ),
+        dictionaries,
+    )
+    _insert_rows(
+        con,
+        """
+        INSERT OR REPLACE INTO model_origin_facts
+            (model_id, module_id, origin_id, role, model_type,
+             inherit_json, inherits_json, file_id, source_line,
+             description)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        scan.get("model_origins", []),
+        lambda orig: (
+            model_id(orig["model"]),
+            module_id(orig["module"]),
+            origin_id(orig["origin"]),
+            orig["role"],
+            orig.get("model_type") or "model",
+            orig.get("inherit_json") or "[]",
+            orig.get("inherits_json") or "{}",
+            file_id(orig["source_file"]),
+            orig["source_line"],
+            orig.get("description"),
+        ),
+        dictionaries,
+    )
+    _insert_rows(
+        con,
+        """
+        INSERT OR REPLACE INTO view_facts
+            (xml_id, module_id, origin_id, name, model_id, view_type, inherit_id,
+             mode, file_id, source_line, source_end_line,
+             fields_json, buttons_json)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        scan.get("views", []),
+        lambda view: (
+            view["xml_id"],
+            module_id(view["module"]),
+            origin_id(view["origin"]),
+            view.get("name"),
+            model_id(view.get("model")),
+            view.get("view_type"),
+            view.get("inherit_id"),
+            view["mode"],
+            file_id(view["source_file"]),
+            view["source_line"],
+            view.get("source_end_line"),
+            view.get("fields_json") or "[]",
+            view.get("buttons_json") or "[]",
+        ),
+        dictionaries,
+    )
+    _insert_rows(
+        con,
+        """
+        INSERT OR REPLACE INTO actions
+            (xml_id, module, origin, name, model, view_id, domain,
+             source_file, source_line)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        scan.get("actions", []),
+        lambda action: (
+            action["xml_id"],
+            action["module"],
+            action["origin"],
+            action.get("name"),
+            action.get("model"),
+            action.get("view_id"),
+            action.get("domain"),
+            action["source_file"],
+            action["source_line"],
+        ),
+    )
+    _insert_rows(
+        con,
+        """
+        INSERT OR REPLACE INTO menus
+            (xml_id, module, origin, name, action, parent_id,
+             source_file, source_line)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        scan.get("menus", []),
+        lambda menu: (
+            menu["xml_id"],
+            menu["module"],
+            menu["origin"],
+            menu.get("name"),
+            menu.get("action"),
+            menu.get("parent_id"),
+            menu["source_file"],
+            menu["source_line"],
+        ),
+    )
+
+
+def _build_model_domains(con: sqlite3.Connection) -> None:
+    """(Re)derive ``model_domains`` from the model origins and module apps.
+
+    Domain profiles then classify every model a module touches with one
+    lookup instead of a creator query and an app query per model.
+    """
+    rows = con.execute(
+        """
+        SELECT mo.model_id, mo.module_id, mn.name AS module, mo.role, md.app
+        FROM   model_origin_facts mo
+        JOIN   module_names mn ON mn.id = mo.module_id
+        JOIN   origins o       ON o.id  = mo.origin_id
+        LEFT JOIN modules md   ON md.name = mn.name
+        ORDER  BY mo.model_id, o.name, mn.name
+        """
+    ).fetchall()
+
+    # model_id → [creator_id, creator, creator app, {app: extensions}]
+    domains: Dict[int, list] = {}
+    for model_id, module_id, module, role, app in rows:
+        entry = domains.setdefault(model_id, [None, None, None, {}])
+        if role in ("create", "prototype"):
+            if entry[0] is None:
+                entry[0:3] = [module_id, module, app]
+        elif role == "extend":
+            owner = app or module
+            entry[3][owner] = entry[3].get(owner, 0) + 1
+
+    con.execute("DELETE FROM model_domains")
+    con.executemany(
+        """
+        INSERT INTO model_domains (model_id, creator_id, app, kind, anchor, extensions_json)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (model_id, creator_id, app, *classify_creator(creator, app), json.dumps(extensions, sort_keys=True))
+            for model_id, (creator_id, creator, app, extensions) in domains.items()
+        ],
+    )
+
+
+def _build_module_graph(con: sqlite3.Connection) -> None:
+    """(Re)derive ``module_depends`` and ``module_closure`` from ``modules.depends``.
+
+    The closure is walked breadth-first exactly like
+    :func:`~oops.kb.resolve.build_depends_chain`, so ordering a module's
+    ancestors by ``position`` reproduces its depends chain.
+    """
+    rows = con.execute("SELECT name, origin, depends FROM modules").fetchall()
+    index = {name: {"depends": json.loads(depends)} for name, _, depends in rows}
+
+    con.execute("DELETE FROM module_depends")
+    con.execute("DELETE FROM module_closure")
+    con.executemany(
+        "INSERT OR IGNORE INTO module_depends (module, depends_on, tier, seq) VALUES (?, ?, ?, ?)",
+        [(name, dep, origin, seq) for name, origin, _ in rows for seq, dep in enumerate(index[name]["depends"])],
+    )
+    con.executemany(
+        "INSERT INTO module_closure (module, ancestor, distance, position) VALUES (?, ?, ?, ?)",
+        [
+            (name, ancestor, distance, position)
+            for name in index
+            for position, (ancestor, distance) in enumerate(walk_depends(name, index))
+        ],
+    )
 
 
 def _get_stats(db_path: Path) -> Result[dict]:
     result = Result()
     con = _connect(db_path)
     n_mod = con.execute("SELECT COUNT(*) FROM modules").fetchone()[0]
-    n_sym = con.execute("SELECT COUNT(*) FROM symbols").fetchone()[0]
-    n_fld = con.execute("SELECT COUNT(*) FROM symbols WHERE kind='field'").fetchone()[0]
-    n_mth = con.execute("SELECT COUNT(*) FROM symbols WHERE kind='method'").fetchone()[0]
-    n_refs = con.execute("SELECT COUNT(*) FROM field_refs").fetchone()[0]
-    n_orig = con.execute("SELECT COUNT(*) FROM model_origins").fetchone()[0]
-    n_views = con.execute("SELECT COUNT(*) FROM views").fetchone()[0]
+    n_sym = con.execute("SELECT COUNT(*) FROM symbol_facts").fetchone()[0]
+    n_fld = con.execute("SELECT COUNT(*) FROM symbol_facts WHERE kind='field'").fetchone()[0]
+    n_mth = con.execute("SELECT COUNT(*) FROM symbol_facts WHERE kind='method'").fetchone()[0]
+    n_refs = con.execute("SELECT COUNT(*) FROM field_ref_facts").fetchone()[0]
+    n_orig = con.execute("SELECT COUNT(*) FROM model_origin_facts").fetchone()[0]
+    n_views = con.execute("SELECT COUNT(*) FROM view_facts").fetchone()[0]
     n_actions = con.execute("SELECT COUNT(*) FROM actions").fetchone()[0]
     n_menus = con.execute("SELECT COUNT(*) FROM menus").fetchone()[0]
     con.close()
@@ -513,6 +960,448 @@ def _get_stats(db_path: Path) -> Result[dict]:
     return result
 
 
+# ---------------------------------------------------------------------------
+# Migrations
+# ---------------------------------------------------------------------------
+
+
+class MigrationImpossible(OopsError):
+    """Raised when a KB cannot be upgraded in place and must be rebuilt from source."""
+
+
+Migration = Callable[[sqlite3.Connection], None]
+
+# from_version → step upgrading a KB from that version to from_version + 1.
+# Steps spell out the DDL and the derived rows of their target version rather
+# than reusing the live constants and builders, so later schema changes never
+# alter an older step.
+_MIGRATIONS: Dict[int, Migration] = {}
+
+
+def _migration(from_version: int) -> Callable[[Migration], Migration]:
+    """Register the step upgrading a KB from ``from_version`` to the next version."""
+
+    def register(fn: Migration) -> Migration:
+        _MIGRATIONS[from_version] = fn
+        return fn
+
+    return register
+
+
+def _run_script(con: sqlite3.Connection, script: str) -> None:
+    """Execute a DDL script statement by statement, inside the current transaction.
+
+    ``executescript`` would commit first, breaking the atomicity of a step.
+    """
+    for statement in script.split(";\n"):
+        lines = [line for line in statement.splitlines() if line.strip() and not line.lstrip().startswith("--")]
+        if lines:
+            con.execute("\n".join(lines))
+
+
+@_migration(6)
+def _add_module_apps(con: sqlite3.Connection) -> None:
+    # v7 added modules.application / modules.app, read from manifests that
+    # the KB never stored.
+    raise MigrationImpossible("v7 needs the manifest application flags, which only a rescan provides")
+
+
+@_migration(7)
+def _encode_strings(con: sqlite3.Connection) -> None:
+    """v7 → v8: move the text fact tables behind the dictionary encoding."""
+    for table in ("symbols", "field_refs", "model_origins", "views"):
+        con.execute(f"ALTER TABLE {table} RENAME TO v7_{table}")
+    _run_script(
+        con,
+        """
+        -- Dictionaries: one row per distinct string, referenced by integer id.
+        CREATE TABLE IF NOT EXISTS models (
+            id   INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS module_names (
+            id   INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS files (
+            id   INTEGER PRIMARY KEY,
+            path TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS origins (
+            id   INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        );
+
+        CREATE TABLE IF NOT EXISTS symbol_facts (
+            model_id    INTEGER NOT NULL REFERENCES models (id),
+            name        TEXT    NOT NULL,
+            kind        TEXT    NOT NULL,           -- 'field' | 'method'
+            origin_id   INTEGER NOT NULL REFERENCES origins (id),
+            module_id   INTEGER NOT NULL REFERENCES module_names (id),
+            file_id     INTEGER NOT NULL REFERENCES files (id),
+            source_line INTEGER NOT NULL,
+            source_end_line INTEGER,                 -- last source line / NULL for fields without one
+            field_type  TEXT,                       -- e.g. 'Boolean' / NULL for methods
+            section     TEXT,                       -- canonical section name / NULL for fields
+            PRIMARY KEY (model_id, name, kind, module_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_symbol_facts_module ON symbol_facts (module_id);
+
+        CREATE TABLE IF NOT EXISTS field_ref_facts (
+            model_id      INTEGER NOT NULL REFERENCES models (id),
+            field_name    TEXT    NOT NULL,
+            module_id     INTEGER NOT NULL REFERENCES module_names (id),
+            kwarg         TEXT    NOT NULL,         -- 'compute' | 'inverse' | 'search' | 'default' | 'selection'
+            target_method TEXT    NOT NULL,
+            PRIMARY KEY (model_id, field_name, module_id, kwarg)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_field_ref_facts_target ON field_ref_facts (model_id, target_method);
+
+        CREATE TABLE IF NOT EXISTS model_origin_facts (
+            model_id      INTEGER NOT NULL REFERENCES models (id),
+            module_id     INTEGER NOT NULL REFERENCES module_names (id),
+            origin_id     INTEGER NOT NULL REFERENCES origins (id),
+            role          TEXT    NOT NULL,         -- 'create' | 'extend' | 'prototype'
+            model_type    TEXT    NOT NULL DEFAULT 'model', -- 'model' | 'transient' | 'abstract'
+            inherit_json  TEXT    NOT NULL DEFAULT '[]',
+            inherits_json TEXT    NOT NULL DEFAULT '{}',
+            file_id       INTEGER NOT NULL REFERENCES files (id),
+            source_line   INTEGER NOT NULL,
+            description   TEXT,                       -- literal _description / NULL when absent
+            PRIMARY KEY (model_id, module_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_model_origin_facts_role ON model_origin_facts (model_id, role);
+
+        CREATE TABLE IF NOT EXISTS view_facts (
+            xml_id       TEXT    NOT NULL PRIMARY KEY,
+            module_id    INTEGER NOT NULL REFERENCES module_names (id),
+            origin_id    INTEGER NOT NULL REFERENCES origins (id),
+            name         TEXT,
+            model_id     INTEGER REFERENCES models (id),
+            view_type    TEXT,
+            inherit_id   TEXT,
+            mode         TEXT    NOT NULL,
+            file_id      INTEGER NOT NULL REFERENCES files (id),
+            source_line  INTEGER NOT NULL,
+            source_end_line INTEGER,
+            fields_json  TEXT    NOT NULL DEFAULT '[]',
+            buttons_json TEXT    NOT NULL DEFAULT '[]'
+        );
+        CREATE INDEX IF NOT EXISTS idx_view_facts_model   ON view_facts (model_id);
+        CREATE INDEX IF NOT EXISTS idx_view_facts_inherit ON view_facts (inherit_id);
+        CREATE INDEX IF NOT EXISTS idx_view_facts_module  ON view_facts (module_id);
+        CREATE INDEX IF NOT EXISTS idx_view_facts_origin  ON view_facts (origin_id);
+
+        -- Decoded views: the v7 table names and columns, read by KBReader.
+        CREATE VIEW IF NOT EXISTS symbols AS
+            SELECT m.name AS model, s.name AS name, s.kind AS kind, o.name AS origin,
+                   mn.name AS module, f.path AS source_file, s.source_line AS source_line,
+                   s.source_end_line AS source_end_line, s.field_type AS field_type,
+                   s.section AS section
+            FROM   symbol_facts s
+            JOIN   models m        ON m.id  = s.model_id
+            JOIN   origins o       ON o.id  = s.origin_id
+            JOIN   module_names mn ON mn.id = s.module_id
+            JOIN   files f         ON f.id  = s.file_id;
+
+        CREATE VIEW IF NOT EXISTS field_refs AS
+            SELECT m.name AS model, r.field_name AS field_name, mn.name AS module,
+                   r.kwarg AS kwarg, r.target_method AS target_method
+            FROM   field_ref_facts r
+            JOIN   models m        ON m.id  = r.model_id
+            JOIN   module_names mn ON mn.id = r.module_id;
+
+        CREATE VIEW IF NOT EXISTS model_origins AS
+            SELECT m.name AS model, mn.name AS module, o.name AS origin, mo.role AS role,
+                   mo.model_type AS model_type, mo.inherit_json AS inherit_json,
+                   mo.inherits_json AS inherits_json, f.path AS source_file,
+                   mo.source_line AS source_line, mo.description AS description
+            FROM   model_origin_facts mo
+            JOIN   models m        ON m.id  = mo.model_id
+            JOIN   module_names mn ON mn.id = mo.module_id
+            JOIN   origins o       ON o.id  = mo.origin_id
+            JOIN   files f         ON f.id  = mo.file_id;
+
+        CREATE VIEW IF NOT EXISTS views AS
+            SELECT v.xml_id AS xml_id, mn.name AS module, o.name AS origin, v.name AS name,
+                   m.name AS model, v.view_type AS view_type, v.inherit_id AS inherit_id,
+                   v.mode AS mode, f.path AS source_file, v.source_line AS source_line,
+                   v.source_end_line AS source_end_line, v.fields_json AS fields_json,
+                   v.buttons_json AS buttons_json
+            FROM   view_facts v
+            JOIN   module_names mn ON mn.id = v.module_id
+            JOIN   origins o       ON o.id  = v.origin_id
+            JOIN   files f         ON f.id  = v.file_id
+            LEFT JOIN models m     ON m.id  = v.model_id;
+        """,
+    )
+
+    con.execute(
+        """
+        INSERT INTO models (name)
+        SELECT model FROM v7_symbols
+        UNION SELECT model FROM v7_field_refs
+        UNION SELECT model FROM v7_model_origins
+        UNION SELECT model FROM v7_views WHERE model IS NOT NULL
+        """
+    )
+    con.execute(
+        """
+        INSERT INTO module_names (name)
+        SELECT module FROM v7_symbols
+        UNION SELECT module FROM v7_field_refs
+        UNION SELECT module FROM v7_model_origins
+        UNION SELECT module FROM v7_views
+        """
+    )
+    con.execute(
+        """
+        INSERT INTO files (path)
+        SELECT source_file FROM v7_symbols
+        UNION SELECT source_file FROM v7_model_origins
+        UNION SELECT source_file FROM v7_views
+        """
+    )
+    con.execute(
+        """
+        INSERT INTO origins (name)
+        SELECT origin FROM v7_symbols
+        UNION SELECT origin FROM v7_model_origins
+        UNION SELECT origin FROM v7_views
+        """
+    )
+
+    con.execute(
+        """
+        INSERT INTO symbol_facts
+            (model_id, name, kind, origin_id, module_id, file_id, source_line,
+             source_end_line, field_type, section)
+        SELECT m.id, s.name, s.kind, o.id, mn.id, f.id, s.source_line,
+               s.source_end_line, s.field_type, s.section
+        FROM   v7_symbols s
+        JOIN   models m        ON m.name  = s.model
+        JOIN   origins o       ON o.name  = s.origin
+        JOIN   module_names mn ON mn.name = s.module
+        JOIN   files f         ON f.path  = s.source_file
+        """
+    )
+    con.execute(
+        """
+        INSERT INTO field_ref_facts (model_id, field_name, module_id, kwarg, target_method)
+        SELECT m.id, r.field_name, mn.id, r.kwarg, r.target_method
+        FROM   v7_field_refs r
+        JOIN   models m        ON m.name  = r.model
+        JOIN   module_names mn ON mn.name = r.module
+        """
+    )
+    con.execute(
+        """
+        INSERT INTO model_origin_facts
+            (model_id, module_id, origin_id, role, model_type,
+             inherit_json, inherits_json, file_id, source_line, description)
+        SELECT m.id, mn.id, o.id, mo.role, mo.model_type,
+               mo.inherit_json, mo.inherits_json, f.id, mo.source_line, mo.description
+        FROM   v7_model_origins mo
+        JOIN   models m        ON m.name  = mo.model
+        JOIN   module_names mn ON mn.name = mo.module
+        JOIN   origins o       ON o.name  = mo.origin
+        JOIN   files f         ON f.path  = mo.source_file
+        """
+    )
+    con.execute(
+        """
+        INSERT INTO view_facts
+            (xml_id, module_id, origin_id, name, model_id, view_type, inherit_id,
+             mode, file_id, source_line, source_end_line, fields_json, buttons_json)
+        SELECT v.xml_id, mn.id, o.id, v.name, m.id, v.view_type, v.inherit_id,
+               v.mode, f.id, v.source_line, v.source_end_line, v.fields_json, v.buttons_json
+        FROM   v7_views v
+        JOIN   module_names mn ON mn.name = v.module
+        JOIN   origins o       ON o.name  = v.origin
+        JOIN   files f         ON f.path  = v.source_file
+        LEFT JOIN models m     ON m.name  = v.model
+        """
+    )
+
+    for table in ("symbols", "field_refs", "model_origins", "views"):
+        con.execute(f"DROP TABLE v7_{table}")
+
+
+def _v9_classify(module: Optional[str], app: Optional[str]) -> Tuple[str, Optional[str]]:
+    """(kind, anchor) of a model from its creator and owning app, as of v9."""
+    if module is None or module in EXCLUDED_TECHNICAL_MODULES:
+        return ("noise", None)
+    if module in PILLAR_MODULES:
+        return ("pillar", module)
+    if app is None:
+        return ("noise", None)
+    if app in EXCLUDED_TECHNICAL_MODULES:
+        return ("domain", module)
+    if app in PILLAR_MODULES:
+        return ("pillar", app)
+    return ("domain", app)
+
+
+@_migration(8)
+def _add_model_domains(con: sqlite3.Connection) -> None:
+    """v8 → v9: precompute the model domain classification."""
+    _run_script(
+        con,
+        """
+        CREATE TABLE IF NOT EXISTS model_domains (
+            model_id        INTEGER NOT NULL PRIMARY KEY REFERENCES models (id),
+            creator_id      INTEGER REFERENCES module_names (id), -- NULL when no module creates it
+            app             TEXT,                     -- owning app of the creator
+            kind            TEXT    NOT NULL,         -- 'domain' | 'pillar' | 'noise'
+            anchor          TEXT,                     -- domain / pillar name, NULL for noise
+            extensions_json TEXT    NOT NULL DEFAULT '{}'
+        ) WITHOUT ROWID;
+        """,
+    )
+    rows = con.execute(
+        """
+        SELECT mo.model_id, mo.module_id, mn.name AS module, mo.role, md.app
+        FROM   model_origin_facts mo
+        JOIN   module_names mn ON mn.id = mo.module_id
+        JOIN   origins o       ON o.id  = mo.origin_id
+        LEFT JOIN modules md   ON md.name = mn.name
+        ORDER  BY mo.model_id, o.name, mn.name
+        """
+    ).fetchall()
+    domains: Dict[int, list] = {}
+    for model_id, module_id, module, role, app in rows:
+        entry = domains.setdefault(model_id, [None, None, None, {}])
+        if role in ("create", "prototype"):
+            if entry[0] is None:
+                entry[0:3] = [module_id, module, app]
+        elif role == "extend":
+            owner = app or module
+            entry[3][owner] = entry[3].get(owner, 0) + 1
+    con.executemany(
+        """
+        INSERT INTO model_domains (model_id, creator_id, app, kind, anchor, extensions_json)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (model_id, creator_id, app, *_v9_classify(creator, app), json.dumps(extensions, sort_keys=True))
+            for model_id, (creator_id, creator, app, extensions) in domains.items()
+        ],
+    )
+
+
+@_migration(9)
+def _add_module_graph(con: sqlite3.Connection) -> None:
+    """v9 → v10: normalise the depends graph and precompute its closure."""
+    _run_script(
+        con,
+        """
+        CREATE TABLE IF NOT EXISTS module_depends (
+            module     TEXT    NOT NULL,
+            depends_on TEXT    NOT NULL,
+            tier       TEXT    NOT NULL,            -- origin of ``module``
+            seq        INTEGER NOT NULL,            -- position in the manifest depends
+            PRIMARY KEY (module, depends_on)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_module_depends_reverse ON module_depends (depends_on, module);
+
+        CREATE TABLE IF NOT EXISTS module_closure (
+            module   TEXT    NOT NULL,
+            ancestor TEXT    NOT NULL,
+            distance INTEGER NOT NULL,              -- 1 = direct depends
+            position INTEGER NOT NULL,              -- breadth-first rank, closest first
+            PRIMARY KEY (module, ancestor)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_module_closure_ancestor ON module_closure (ancestor, distance);
+        """,
+    )
+    rows = con.execute("SELECT name, origin, depends FROM modules").fetchall()
+    depends = {name: json.loads(deps) for name, _, deps in rows}
+    con.executemany(
+        "INSERT OR IGNORE INTO module_depends (module, depends_on, tier, seq) VALUES (?, ?, ?, ?)",
+        [(name, dep, origin, seq) for name, origin, _ in rows for seq, dep in enumerate(depends[name])],
+    )
+    closure = []
+    for name in depends:
+        # Breadth-first, closest first: the order of the v10 depends chains.
+        visited, queue, position = {name}, deque([(name, 0)]), 0
+        while queue:
+            current, distance = queue.popleft()
+            for dep in depends.get(current, []):
+                if dep not in visited:
+                    visited.add(dep)
+                    queue.append((dep, distance + 1))
+                    closure.append((name, dep, distance + 1, position))
+                    position += 1
+    con.executemany("INSERT INTO module_closure (module, ancestor, distance, position) VALUES (?, ?, ?, ?)", closure)
+
+
+def _stored_version(con: sqlite3.Connection) -> Optional[int]:
+    try:
+        row = con.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    except sqlite3.OperationalError:  # no meta table
+        return None
+    try:
+        return int(row[0]) if row else None
+    except ValueError:
+        return None
+
+
+def migrate_kb(db_path: Path) -> List[int]:
+    """Upgrade a KB to :data:`SCHEMA_VERSION` in place, one version at a time.
+
+    Each step runs in its own transaction together with the ``schema_version``
+    bump, so an interrupted upgrade leaves the KB on the last completed
+    version. The file is vacuumed once after the last step.
+
+    Args:
+        db_path: KB database to upgrade.
+
+    Returns:
+        The versions upgraded from, in order (empty when already current).
+
+    Raises:
+        MigrationImpossible: If the KB has no schema version, comes from a
+            newer oops, or a step cannot be done without rescanning the
+            sources. The KB is left on the last version reached.
+    """
+    con = sqlite3.connect(str(db_path), isolation_level=None)
+    applied: List[int] = []
+    try:
+        while True:
+            con.execute("BEGIN IMMEDIATE")  # re-read under the write lock: another process may be migrating
+            version = _stored_version(con)
+            if version == SCHEMA_VERSION:
+                con.execute("COMMIT")
+                break
+            try:
+                if version is None:
+                    raise MigrationImpossible(f"{db_path} has no schema version")
+                if version > SCHEMA_VERSION:
+                    raise MigrationImpossible(
+                        f"{db_path} is on schema {version}, newer than this oops ({SCHEMA_VERSION})"
+                    )
+                step = _MIGRATIONS.get(version)
+                if step is None:
+                    raise MigrationImpossible(f"no migration from schema {version}")
+                log.info(f"Migrating KB {db_path.name}: schema {version} → {version + 1}")
+                step(con)
+                con.execute("UPDATE meta SET value = ? WHERE key = 'schema_version'", (str(version + 1),))
+                con.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_at', ?)",
+                    (datetime.now(timezone.utc).isoformat(),),
+                )
+                con.execute("COMMIT")
+            except BaseException:
+                con.execute("ROLLBACK")
+                raise
+            applied.append(version)
+        if applied:
+            con.execute("VACUUM")
+    finally:
+        con.close()
+    return applied
+
+
 # ---------------------------------------------------------------------------
 # Read helpers (used by refactor.py and resolve.py)
 # ---------------------------------------------------------------------------
@@ -526,13 +1415,24 @@ class KBReader:
         with KBReader(Path(".oops-cache/kb_project.db")) as kb:
             entries = kb.get_symbol("sale.order", "action_confirm", "method")
             modules = kb.get_modules()
+
+    Args:
+        db_path: Path to the KB database.
+        read_only: Open the database with ``mode=ro`` — for worker processes
+            sharing a KB that must never take a write lock on it.
     """
 
-    def __init__(self, db_path: Path) -> None:
+    def __init__(self, db_path: Path, read_only: bool = False) -> None:
         if not db_path.exists():
             raise FileNotFoundError(f"KB database not found: {db_path}")
-        self._con = sqlite3.connect(str(db_path))
+        if read_only:
+            self._con = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+        else:
+            self._con = sqlite3.connect(str(db_path))
         self._con.row_factory = sqlite3.Row
+        self._chains: Dict[str, List[str]] = {}
+        if get_tracer() is not None:
+            self._con.set_trace_callback(lambda _stmt: count("kb.queries"))
 
     def close(self) -> None:
         """Close the underlying SQLite connection."""
@@ -633,6 +1533,88 @@ class KBReader:
         ).fetchone()
         return bool(row["application"]) if row else False
 
+    def get_depends_chain(self, module: str) -> List[str]:
+        """Return the transitive depends of a module, closest first.
+
+        Same result as :func:`~oops.kb.resolve.build_depends_chain` over
+        :meth:`get_modules`, read from ``module_closure``; cached per reader.
+
+        Args:
+            module: Module technical name.
+
+        Returns:
+            Ancestor module names in breadth-first order (``module`` excluded).
+        """
+        chain = self._chains.get(module)
+        if chain is None:
+            rows = self._con.execute(
+                "SELECT ancestor FROM module_closure WHERE module = ? ORDER BY position", (module,)
+            ).fetchall()
+            chain = self._chains[module] = [r["ancestor"] for r in rows]
+        return chain
+
+    def get_dependents(
+        self,
+        module: str,
+        tiers: Optional[Iterable[str]] = None,
+        direct: bool = False,
+    ) -> List[str]:
+        """Return the modules depending on ``module`` (reverse lookup).
+
+        Args:
+            module: Module technical name, e.g. ``"stock"``.
+            tiers: Keep only dependents of these origins (e.g. ``["apik"]``).
+            direct: Only modules listing ``module`` in their manifest depends.
+
+        Returns:
+            Sorted dependent module names.
+        """
+        if direct:
+            query = "SELECT module FROM module_depends WHERE depends_on = ?"
+        else:
+            query = "SELECT module FROM module_closure WHERE ancestor = ?"
+        params: List[Any] = [module]
+        if tiers is not None:
+            tiers = list(tiers)
+            query = f"SELECT d.module FROM ({query}) d JOIN modules m ON m.name = d.module"
+            query += f" WHERE m.origin IN ({', '.join('?' * len(tiers))})"
+            params += tiers
+        rows = self._con.execute(query + " ORDER BY 1", params).fetchall()
+        return [r[0] for r in rows]
+
+    def get_modules_closure(self, names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Return :meth:`get_modules` entries for ``names`` and all their ancestors.
+
+        Args:
+            names: Module technical names.
+
+        Returns:
+            The same mapping as :meth:`get_modules`, restricted to the known
+            modules among ``names`` and their transitive depends.
+        """
+        names = sorted(set(names))
+        if not names:
+            return {}
+        marks = ", ".join("?" * len(names))
+        rows = self._con.execute(
+            f"""
+            SELECT name, origin, depends, application, app
+            FROM   modules
+            WHERE  name IN ({marks})
+               OR  name IN (SELECT ancestor FROM module_closure WHERE module IN ({marks}))
+            """,
+            names + names,
+        ).fetchall()
+        return {
+            r["name"]: {
+                "origin": r["origin"],
+                "depends": json.loads(r["depends"]),
+                "application": bool(r["application"]),
+                "app": r["app"],
+            }
+            for r in rows
+        }
+
     def get_model_inherits(self, model: str) -> List[str]:
         """Return the union of _inherits parent model names across all model_origins rows.
 
@@ -774,6 +1756,41 @@ class KBReader:
         ).fetchall()
         return [dict(r) for r in rows]
 
+    def get_model_domains(self, models: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Return the precomputed domain classification of ``models``, in one query.
+
+        Args:
+            models: Dotted model names.
+
+        Returns:
+            ``{model: {"creator", "app", "kind", "anchor", "extensions"}}`` —
+            ``extensions`` maps an app to its number of extending modules.
+            Models the KB has no origin for are absent.
+        """
+        names = sorted(set(models))
+        if not names:
+            return {}
+        rows = self._con.execute(
+            f"""
+            SELECT m.name AS model, mn.name AS creator, d.app, d.kind, d.anchor, d.extensions_json
+            FROM   model_domains d
+            JOIN   models m            ON m.id  = d.model_id
+            LEFT JOIN module_names mn  ON mn.id = d.creator_id
+            WHERE  m.name IN ({", ".join("?" * len(names))})
+            """,
+            names,
+        ).fetchall()
+        return {
+            r["model"]: {
+                "creator": r["creator"],
+                "app": r["app"],
+                "kind": r["kind"],
+                "anchor": r["anchor"],
+                "extensions": json.loads(r["extensions_json"]),
+            }
+            for r in rows
+        }
+
     def get_model_description(self, model: str) -> Optional[str]:
         """Return the _description of the first creator/prototype row, or None."""
         row = self._con.execute(
@@ -23,6 +23,7 @@ from typing import Set
 from oops.core.compat import Any, Dict, List, Optional, Tuple
 from oops.core.logger import log
 from oops.core.models import Result
+from oops.kb.records import ActionRow, MenuRow, ViewRow
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -300,7 +301,7 @@ def _parse_view_record(
     module: str,
     origin: str,
     rel_path: str,
-) -> Optional[Dict[str, Any]]:
+) -> Optional[ViewRow]:
     raw_id = record.get("id")
     if not raw_id:
         log.warning("View record missing id in %s:%d", rel_path, _line_of(record))
@@ -323,21 +324,21 @@ def _parse_view_record(
 
     fields, buttons = _extract_content(arch, view_type) if arch is not None else ([], [])
 
-    return {
-        "xml_id": xml_id,
-        "name": name,
-        "model": model,
-        "view_type": view_type,
-        "inherit_id": inherit_id,
-        "mode": mode,
-        "origin": origin,
-        "module": module,
-        "source_file": rel_path,
-        "source_line": _line_of(record),
-        "source_end_line": _end_line_of(record),
-        "fields_json": json.dumps(fields),
-        "buttons_json": json.dumps(buttons),
-    }
+    return ViewRow(
+        xml_id=xml_id,
+        name=name,
+        model=model,
+        view_type=view_type,
+        inherit_id=inherit_id,
+        mode=mode,
+        origin=origin,
+        module=module,
+        source_file=rel_path,
+        source_line=_line_of(record),
+        source_end_line=_end_line_of(record),
+        fields_json=json.dumps(fields),
+        buttons_json=json.dumps(buttons),
+    )
 
 
 def _parse_template(
@@ -345,7 +346,7 @@ def _parse_template(
     module: str,
     origin: str,
     rel_path: str,
-) -> Optional[Dict[str, Any]]:
+) -> Optional[ViewRow]:
     raw_id = elem.get("id")
     if not raw_id:
         log.warning("Template missing id in %s:%d", rel_path, _line_of(elem))
@@ -353,21 +354,21 @@ def _parse_template(
     inherit_ref = elem.get("inherit_id")
     inherit_id = _qualify(inherit_ref, module) if inherit_ref else None
     mode = "extension" if inherit_id else "primary"
-    return {
-        "xml_id": _qualify(raw_id, module),
-        "name": elem.get("name"),
-        "model": None,
-        "view_type": "qweb",
-        "inherit_id": inherit_id,
-        "mode": mode,
-        "origin": origin,
-        "module": module,
-        "source_file": rel_path,
-        "source_line": _line_of(elem),
-        "source_end_line": _end_line_of(elem),
-        "fields_json": json.dumps([]),
-        "buttons_json": json.dumps([]),
-    }
+    return ViewRow(
+        xml_id=_qualify(raw_id, module),
+        name=elem.get("name"),
+        model=None,
+        view_type="qweb",
+        inherit_id=inherit_id,
+        mode=mode,
+        origin=origin,
+        module=module,
+        source_file=rel_path,
+        source_line=_line_of(elem),
+        source_end_line=_end_line_of(elem),
+        fields_json="[]",
+        buttons_json="[]",
+    )
 
 
 def _parse_action_record(
@@ -375,22 +376,22 @@ def _parse_action_record(
     module: str,
     origin: str,
     rel_path: str,
-) -> Optional[Dict[str, Any]]:
+) -> Optional[ActionRow]:
     raw_id = record.get("id")
     if not raw_id:
         log.warning("Action record missing id in %s:%d", rel_path, _line_of(record))
         return None
-    return {
-        "xml_id": _qualify(raw_id, module),
-        "name": _extract_record_field(record, "name"),
-        "model": _extract_record_field(record, "res_model"),
-        "view_id": _qualify_optional(_extract_record_field(record, "view_id"), module),
-        "domain": _extract_record_field(record, "domain"),
-        "origin": origin,
-        "module": module,
-        "source_file": rel_path,
-        "source_line": _line_of(record),
-    }
+    return ActionRow(
+        xml_id=_qualify(raw_id, module),
+        name=_extract_record_field(record, "name"),
+        model=_extract_record_field(record, "res_model"),
+        view_id=_qualify_optional(_extract_record_field(record, "view_id"), module),
+        domain=_extract_record_field(record, "domain"),
+        origin=origin,
+        module=module,
+        source_file=rel_path,
+        source_line=_line_of(record),
+    )
 
 
 def _parse_act_window_shorthand(
@@ -398,21 +399,21 @@ def _parse_act_window_shorthand(
     module: str,
     origin: str,
     rel_path: str,
-) -> Optional[Dict[str, Any]]:
+) -> Optional[ActionRow]:
     raw_id = elem.get("id")
     if not raw_id:
         return None
-    return {
-        "xml_id": _qualify(raw_id, module),
-        "name": elem.get("name"),
-        "model": elem.get("res_model"),
-        "view_id": _qualify_optional(elem.get("view_id"), module),
-        "domain": elem.get("domain"),
-        "origin": origin,
-        "module": module,
-        "source_file": rel_path,
-        "source_line": _line_of(elem),
-    }
+    return ActionRow(
+        xml_id=_qualify(raw_id, module),
+        name=elem.get("name"),
+        model=elem.get("res_model"),
+        view_id=_qualify_optional(elem.get("view_id"), module),
+        domain=elem.get("domain"),
+        origin=origin,
+        module=module,
+        source_file=rel_path,
+        source_line=_line_of(elem),
+    )
 
 
 def _parse_menu_record(
@@ -420,20 +421,20 @@ def _parse_menu_record(
     module: str,
     origin: str,
     rel_path: str,
-) -> Optional[Dict[str, Any]]:
+) -> Optional[MenuRow]:
     raw_id = record.get("id")
     if not raw_id:
         return None
-    return {
-        "xml_id": _qualify(raw_id, module),
-        "name": _extract_record_field(record, "name"),
-        "action": _qualify_optional(_extract_record_field(record, "action"), module),
-        "parent_id": _qualify_optional(_extract_record_field(record, "parent_id"), module),
-        "origin": origin,
-        "module": module,
-        "source_file": rel_path,
-        "source_line": _line_of(record),
-    }
+    return MenuRow(
+        xml_id=_qualify(raw_id, module),
+        name=_extract_record_field(record, "name"),
+        action=_qualify_optional(_extract_record_field(record, "action"), module),
+        parent_id=_qualify_optional(_extract_record_field(record, "parent_id"), module),
+        origin=origin,
+        module=module,
+        source_file=rel_path,
+        source_line=_line_of(record),
+    )
 
 
 def _parse_menuitem_shorthand(
@@ -441,20 +442,20 @@ def _parse_menuitem_shorthand(
     module: str,
     origin: str,
     rel_path: str,
-) -> Optional[Dict[str, Any]]:
+) -> Optional[MenuRow]:
     raw_id = elem.get("id")
     if not raw_id:
         return None
-    return {
-        "xml_id": _qualify(raw_id, module),
-        "name": elem.get("name"),
-        "action": _qualify_optional(elem.get("action"), module),
-        "parent_id": _qualify_optional(elem.get("parent"), module),
-        "origin": origin,
-        "module": module,
-        "source_file": rel_path,
-        "source_line": _line_of(elem),
-    }
+    return MenuRow(
+        xml_id=_qualify(raw_id, module),
+        name=elem.get("name"),
+        action=_qualify_optional(elem.get("action"), module),
+        parent_id=_qualify_optional(elem.get("parent"), module),
+        origin=origin,
+        module=module,
+        source_file=rel_path,
+        source_line=_line_of(elem),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -511,7 +512,8 @@ def scan_module_xml(
     """Scan all XML data files in a module.
 
     Returns a dict with keys 'views', 'actions', 'menus' — each a list of
-    record dicts. Empty lists if no XML files or all records ignored.
+    compact rows (see oops.kb.records). Empty lists if no XML files or all
+    records ignored.
     """
     module = module_dir.name
     result: Dict[str, Any] = {"views": [], "actions": [], "menus": []}
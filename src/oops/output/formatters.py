@@ -8,8 +8,9 @@ from oops.core.compat import Dict, Type
 from oops.core.exceptions import get_error_console
 from oops.output.base import OutputFormatter, RenderTarget, SiteFormatter
 from oops.output.layout import MetricsLayout, MinimalLayout, Output, SimpleSummaryLayout, SummaryLayout
-from oops.output.serializers import to_json_string
+from oops.output.serializers import to_json_line, to_json_string
 from oops.utils.render import (
+    STREAM_THRESHOLD,
     conclude,
     counter_rule,
     error_section,
@@ -19,6 +20,7 @@ from oops.utils.render import (
     metrics_panel,
     print_error,
     print_result,
+    print_table,
     print_warning,
     rule,
     warning_section,
@@ -111,7 +113,7 @@ class SummaryConsoleFormatter(RichFormatter):
                 else:
                     rule(table.title)
 
-                self.console.print(make_table(title=None, columns=table.columns, rows=table.rows, expand=True))
+                print_table(table.columns, table.rows, self.console)
                 self.console.print()
 
         conclude(data.conclusion.status, data.conclusion.message)
@@ -125,14 +127,21 @@ class SimpleSummaryConsoleFormatter(RichFormatter):
         rule(data.title)
         self.console.print()
 
-        table = make_table(title=None, columns=data.table.columns, rows=data.table.rows, expand=True)
         panel = metrics_panel(data.panel.title, data.panel.values)
 
-        # automatic ratio based on the number of columns
-        # TODO: check whether this is a good idea
-        ratios = [2, 1] if len(data.table.columns) <= MAX_COLUMNS else [3, 1]
+        if len(data.table.rows) > STREAM_THRESHOLD:
+            # Too long for the side-by-side grid: stream the table, panel below.
+            print_table(data.table.columns, data.table.rows, self.console)
+            self.console.print()
+            self.console.print(panel)
+        else:
+            table = make_table(title=None, columns=data.table.columns, rows=data.table.rows, expand=True)
+
+            # automatic ratio based on the number of columns
+            # TODO: check whether this is a good idea
+            ratios = [2, 1] if len(data.table.columns) <= MAX_COLUMNS else [3, 1]
 
-        self.console.print(metrics_grid(table, panel, ratios=ratios))
+            self.console.print(metrics_grid(table, panel, ratios=ratios))
 
         # TODO: improve this
         if data.info:
@@ -258,6 +267,29 @@ class JsonFormatter(OutputFormatter):
         print(to_json_string({"success": True, "message": message}))
 
 
+class JsonLinesFormatter(OutputFormatter):
+    """Machine-readable JSON Lines output: one compact, self-describing record per line.
+
+    ``render`` serializes a layout that is already a list of records in one
+    go; commands that can produce records incrementally should write them
+    through :class:`~oops.output.sinks.JsonLinesSink` instead.
+    """
+
+    target = RenderTarget(audience="machine", verbosity="full")
+
+    def render(self, output: "Output[list]") -> str:
+        records = list(output.unwrap)
+        if output.metadata is not None:
+            records.insert(0, {"record": "metadata", **output.metadata.to_dict()})
+        return "\n".join(to_json_line(record) for record in records)
+
+    def error(self, message: str, code: int = 1) -> None:
+        print(to_json_line({"record": "error", "error": message, "code": code}), file=sys.stderr)
+
+    def success(self, message: str) -> None:
+        print(to_json_line({"record": "success", "success": True, "message": message}))
+
+
 class CsvFormatter(OutputFormatter):
     """Machine-readable CSV output (unimplemented — emits empty body)."""
 
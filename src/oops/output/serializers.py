@@ -21,3 +21,12 @@ def to_json_string(data: Any, **kwargs) -> str:
 
     # original commands is:
     # click.echo(json.dumps(payload, indent=2, default=str))
+
+
+def to_json_line(data: Any) -> str:
+    """Serialize one record to a compact, single-line JSON string.
+
+    Used by JSON Lines output: no indentation and no whitespace after
+    separators, so each record fits on exactly one line.
+    """
+    return json.dumps(data, ensure_ascii=False, default=str, separators=(",", ":"))
@@ -0,0 +1,227 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: shards.py — src/oops/output/shards.py
+
+"""Sharded data bundle for ``oops project serve``.
+
+The serve payload (DocModel + descriptor schema) is split into a small
+``index.json`` — everything the landing page, navigation and model lookup
+need — plus one JSON shard per module holding its heavy node lists (fields,
+methods, models, views) and README. The UI fetches a shard only when a page
+needs it, so first paint no longer waits for the whole project. The search
+view reads the compact field and method entries of the index (``search``)
+and fetches no shard at all.
+
+Every file is written compact, with precompressed siblings (``.gz`` always,
+``.br`` when the optional ``brotli`` package is installed) so the server can
+hand them out without compressing on the fly.
+
+Layout under the site root::
+
+    data/index.json
+    data/modules/<module>.json      (+ .json.gz, .json.br)
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+from typing import Iterable
+
+from oops.core.compat import Any, Dict, List, Optional, Tuple
+from oops.core.profiling import count
+from oops.output.markdown.pages import humanize
+from oops.output.serializers import to_json_line
+
+DATA_DIR = "data"
+INDEX_FILE = "index.json"
+SHARD_TEMPLATE = "modules/{module}.json"
+
+# Module keys that only live in the shard (the index keeps everything else).
+_SHARD_ONLY_KEYS = ("models", "fields", "methods", "views", "readme")
+
+
+def _light_readme(readme: "Dict[str, Any] | None") -> Dict[str, Any]:
+    readme = readme or {}
+    return {"present": bool(readme.get("present")), "format": readme.get("format")}
+
+
+def _search_entries(mod: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Field and method entries of the search view, without the node lists."""
+    name = mod["module"]
+    entries: List[Dict[str, Any]] = []
+    for field in mod.get("fields") or []:
+        bare = (field.get("model") or "").split(":", 1)[-1]
+        label = field.get("label") or (humanize(field["name"]) if field.get("label_inferred") else field["name"])
+        entries.append(
+            {
+                "kind": "field",
+                "id": field.get("id") or f"{name}:{bare}#{field['name']}",
+                "label": label,
+                "module": name,
+                "model": bare,
+                "text": " ".join(str(v) for v in (field["name"], label, field.get("help"), field.get("type")) if v),
+            }
+        )
+    for method in mod.get("methods") or []:
+        bare = (method.get("model") or "").split(":", 1)[-1]
+        summary = (method.get("docstring") or "").strip().split("\n", 1)[0]
+        entry = {
+            "kind": "method",
+            "id": method.get("id") or f"{name}:{bare}#method:{method['name']}",
+            "label": method["name"],
+            "module": name,
+            "model": bare,
+            "text": " ".join(v for v in (method["name"], summary) if v),
+        }
+        if method.get("section"):
+            entry["section"] = method["section"]
+        entries.append(entry)
+    return entries
+
+
+def split_serve_payload(payload: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """Split a serve payload into a small index and per-module shards.
+
+    The id ``index`` of the DocModel is dropped: the UI resolves references
+    through the ``*_ref`` keys already carried by each node.
+
+    Args:
+        payload: the dict returned by ``project serve``'s ``build_payload``.
+
+    Returns:
+        ``(index, shards)`` where ``shards`` maps module name → shard dict.
+        :func:`join_serve_payload` reverses the split.
+    """
+    shards: Dict[str, Dict[str, Any]] = {}
+    modules: List[Dict[str, Any]] = []
+    search: List[Dict[str, Any]] = []
+
+    for mod in payload.get("modules", []):
+        name = mod["module"]
+        search.extend(_search_entries(mod))
+        shards[name] = {"module": name, **{k: mod[k] for k in _SHARD_ONLY_KEYS if k in mod}}
+        light = {k: v for k, v in mod.items() if k not in _SHARD_ONLY_KEYS}
+        light["readme"] = _light_readme(mod.get("readme"))
+        light["counts"] = {k: len(mod.get(k) or []) for k in ("models", "fields", "methods", "views")}
+        light["shard"] = SHARD_TEMPLATE.format(module=name)
+        modules.append(light)
+
+    models_by_bare: Dict[str, Dict[str, Any]] = {}
+    for bare, entry in payload.get("models_by_bare", {}).items():
+        models_by_bare[bare] = {
+            **{k: v for k, v in entry.items() if k != "contributions"},
+            "contributions": [
+                {
+                    "module": c["module"],
+                    "model_node": c["model_node"],
+                    "fields_count": len(c.get("fields") or []),
+                    "methods_count": len(c.get("methods") or []),
+                }
+                for c in entry.get("contributions", [])
+            ],
+        }
+
+    index = {
+        **{k: v for k, v in payload.items() if k not in ("modules", "models_by_bare", "index")},
+        "modules": modules,
+        "models_by_bare": models_by_bare,
+        "search": search,
+        "shards": {"base": f"{DATA_DIR}/", "modules": SHARD_TEMPLATE},
+    }
+    return index, shards
+
+
+def join_serve_payload(index: Dict[str, Any], shards: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Rebuild a full (unsharded) serve payload from an index and its shards.
+
+    Contributions regain their ``fields``/``methods`` lists by model id, as
+    :func:`~oops.output.docmodel.group_models_by_bare` built them.
+    """
+    modules = []
+    for light in index.get("modules", []):
+        mod = {k: v for k, v in light.items() if k not in ("counts", "shard")}
+        mod.update(shards.get(light["module"], {}))
+        modules.append(mod)
+    by_name = {mod["module"]: mod for mod in modules}
+
+    models_by_bare = {}
+    for bare, entry in index.get("models_by_bare", {}).items():
+        contributions = []
+        for c in entry.get("contributions", []):
+            mod = by_name.get(c["module"], {})
+            model_id = c["model_node"]["id"]
+            contributions.append(
+                {
+                    "module": c["module"],
+                    "model_node": c["model_node"],
+                    "fields": [f for f in mod.get("fields", []) if f.get("model") == model_id],
+                    "methods": [m for m in mod.get("methods", []) if m.get("model") == model_id],
+                }
+            )
+        models_by_bare[bare] = {**entry, "contributions": contributions}
+
+    payload = {k: v for k, v in index.items() if k not in ("search", "shards")}
+    payload["modules"] = modules
+    payload["models_by_bare"] = models_by_bare
+    return payload
+
+
+def _brotli_compress(data: bytes) -> "bytes | None":
+    try:
+        import brotli  # noqa: PLC0415 — optional dependency
+    except ImportError:
+        return None
+    return brotli.compress(data)
+
+
+def write_precompressed(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` plus its ``.gz`` (and ``.br``) siblings.
+
+    Gzip output uses ``mtime=0`` so identical content always yields identical
+    bytes — and therefore identical strong ETags across rebuilds.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    written = path.write_bytes(data)
+    written += path.with_name(path.name + ".gz").write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    compressed = _brotli_compress(data)
+    if compressed is not None:
+        written += path.with_name(path.name + ".br").write_bytes(compressed)
+    count("io.bytes_written", written)
+
+
+def write_shards(payload: Dict[str, Any], site_dir: Path, modules: "Optional[Iterable[str]]" = None) -> Path:
+    """Split ``payload`` and write the index and module shards under ``site_dir``.
+
+    Args:
+        payload: the serve payload.
+        site_dir: site root.
+        modules: only rewrite these modules' shards (the index is always
+            rewritten); ``None`` writes them all.
+
+    Returns:
+        The data directory (``<site_dir>/data``).
+    """
+    index, shards = split_serve_payload(payload)
+    data_dir = site_dir / DATA_DIR
+    only = None if modules is None else set(modules)
+    for name, shard in shards.items():
+        if only is not None and name not in only:
+            continue
+        write_precompressed(data_dir / SHARD_TEMPLATE.format(module=name), to_json_line(shard).encode("utf-8"))
+    write_precompressed(data_dir / INDEX_FILE, to_json_line(index).encode("utf-8"))
+    return data_dir
+
+
+def read_shards(site_dir: Path) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """Load the index and every module shard written by :func:`write_shards`."""
+    data_dir = site_dir / DATA_DIR
+    index = json.loads((data_dir / INDEX_FILE).read_text(encoding="utf-8"))
+    shards = {}
+    for light in index.get("modules", []):
+        shard_path = data_dir / light["shard"]
+        if shard_path.is_file():
+            shards[light["module"]] = json.loads(shard_path.read_text(encoding="utf-8"))
+    return index, shards
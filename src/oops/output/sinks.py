@@ -14,6 +14,7 @@ Each format declares its own policy (default sink, suffix, browser).
 from __future__ import annotations
 
 import os
+import sys
 import tempfile
 import webbrowser
 from dataclasses import dataclass
@@ -21,8 +22,10 @@ from pathlib import Path
 
 import click
 from oops.core.compat import Literal, Optional
+from oops.core.profiling import count, span
 from oops.output.base import OutputFormatter, SiteFormatter
 from oops.output.layout import Output
+from oops.output.serializers import to_json_line
 
 DefaultSink = Literal["stdout", "tempfile"]
 
@@ -47,6 +50,7 @@ class SinkPolicy:
 
 SINK_POLICIES: dict[str, SinkPolicy] = {
     "json": SinkPolicy(default="stdout", suffix=".json", open_browser=False),
+    "jsonl": SinkPolicy(default="stdout", suffix=".jsonl", open_browser=False),
     "html": SinkPolicy(default="tempfile", suffix=".html", open_browser=True),
     "csv": SinkPolicy(default="stdout", suffix=".csv", open_browser=False),
 }
@@ -73,6 +77,8 @@ def write_output(
         raise ValueError(f"Unsupported output format: {output_format}")
 
     # Explicit path always wins, regardless of the format's default sink.
+    count("io.bytes_written", len(content.encode("utf-8")))
+
     if output_path is not None:
         output_path.write_text(content, encoding="utf-8")
         return output_path
@@ -101,13 +107,54 @@ def deliver(
 ) -> None:
     """Render then route: human formatters return None; machine formatters
     return a string sent through write_output."""
-    content = formatter.render(output)
+    with span("render", format=output_format):
+        content = formatter.render(output)
     if content is not None:
         path = write_output(content, output_format, output_path)
         if path is not None:
             click.echo(f"Report written to {path}", err=True)
 
 
+class JsonLinesSink:
+    """Streaming JSON Lines sink: one compact record per line, flushed as written.
+
+    Unlike :func:`write_output`, nothing is buffered: each record reaches
+    stdout (or ``output_path``) as soon as it is produced, so consumers such
+    as ``jq`` can start working before the command finishes and memory stays
+    bounded by the size of a single record.
+
+    Use as a context manager::
+
+        with JsonLinesSink(output_path) as sink:
+            sink.write({"record": "module", ...})
+    """
+
+    def __init__(self, output_path: Optional[Path] = None):
+        self.output_path = output_path
+        self.count = 0
+        self._fh = None
+
+    def __enter__(self) -> "JsonLinesSink":
+        if self.output_path is not None:
+            self._fh = self.output_path.open("w", encoding="utf-8")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            click.echo(f"Report written to {self.output_path}", err=True)
+
+    def write(self, record: dict) -> None:
+        """Serialize ``record`` on its own line and flush it immediately."""
+        fh = self._fh if self._fh is not None else sys.stdout
+        line = to_json_line(record) + "\n"
+        fh.write(line)
+        count("io.bytes_written", len(line.encode("utf-8")))
+        fh.flush()
+        self.count += 1
+
+
 def write_site(files: "dict[str, str]", output_dir: Path) -> Path:
     """Write a ``{relative_path: content}`` tree under ``output_dir``.
 
@@ -117,11 +164,13 @@ def write_site(files: "dict[str, str]", output_dir: Path) -> Path:
         dest = output_dir / rel_path
         dest.parent.mkdir(parents=True, exist_ok=True)
         dest.write_text(content, encoding="utf-8")
+        count("io.bytes_written", len(content.encode("utf-8")))
     return output_dir
 
 
 def deliver_site(formatter: SiteFormatter, output: Output, output_dir: Path) -> None:
     """Render a site formatter to a file tree and report the root path."""
-    files = formatter.render_site(output)
+    with span("render", format="site"):
+        files = formatter.render_site(output)
     root = write_site(files, output_dir)
     click.echo(f"Documentation written to {root}", err=True)
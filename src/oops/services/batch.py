@@ -0,0 +1,171 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: batch.py — oops/services/batch.py
+
+"""
+Run one oops command against many projects from a pool of worker processes.
+
+Commands resolve their repository from the current directory, so each run
+needs its own working directory: projects are dispatched to worker
+*processes*, each of which ``chdir``-s into the project and invokes the Click
+command in-process. Workers are long-lived, so imports and the caches keyed
+by path (submodule listings, staged files…) stay warm from one project to the
+next; the config and the caches tied to the current directory are reset
+before each run, so every project sees its own ``.oops.yaml``. On-disk caches
+(image index, global KB) are shared by every worker.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+import click
+from oops.core.compat import Any, Dict, List, Optional
+
+
+def resolve_command(args: List[str]) -> "tuple[Optional[click.Command], List[str]]":
+    """Find the Click command ``args`` designate in the ``oops`` CLI.
+
+    Args:
+        args: Command words followed by their arguments, e.g. ``["project", "check", "--strict"]``.
+
+    Returns:
+        The command (None if unknown) and its path, e.g. ``["project", "check"]``.
+    """
+    from oops.cli import main as cli  # noqa: PLC0415
+
+    cmd: click.Command = cli
+    path: List[str] = []
+    ctx = click.Context(cli)
+    for word in args:
+        if not isinstance(cmd, click.Group):
+            break
+        sub = cmd.get_command(ctx, word)
+        if sub is None:
+            return None, path
+        cmd = sub
+        path.append(word)
+    if isinstance(cmd, click.Group):
+        return None, path
+    return cmd, path
+
+
+def supports_json(cmd: click.Command) -> bool:
+    """Return True when ``cmd`` has a ``--format`` option accepting ``json``."""
+    for param in cmd.params:
+        if param.name == "output_format" and isinstance(param.type, click.Choice):
+            return "json" in param.type.choices
+    return False
+
+
+def _parse_payload(out: str) -> Optional[Dict[str, Any]]:
+    """Extract the JSON object from a command's stdout (progress text may precede it)."""
+    start = out.find("{")
+    if start < 0:
+        return None
+    try:
+        payload = json.loads(out[start:])
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _reset_project_state() -> None:
+    """Forget the state a previous run loaded from its working directory."""
+    from oops.core.config import reset_config  # noqa: PLC0415
+    from oops.rules import _helpers  # noqa: PLC0415
+
+    reset_config()
+    for cached in (
+        _helpers.git_repo_root,
+        _helpers._staged_files,
+        _helpers.last_tag,
+        _helpers.file_at_ref,
+        _helpers.staged_addon_manifest_relpaths,
+    ):
+        cached.cache_clear()
+
+
+def run_in_project(project: str, args: List[str]) -> Dict[str, Any]:
+    """Run ``oops <args>`` with ``project`` as working directory, in this process.
+
+    The config is reloaded from ``project``, output is captured rather than
+    printed, and the previous working directory is restored afterwards.
+
+    Args:
+        project: Project root.
+        args: Full command line; add ``--format json`` to get a parsed payload.
+
+    Returns:
+        A row: ``project``, ``path``, ``exit_code``, ``duration_ms``,
+        ``payload`` (parsed JSON or None), ``output`` (stdout when it was not
+        JSON) and ``stderr``.
+    """
+    from oops.cli import main as cli  # noqa: PLC0415
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    previous = os.getcwd()
+    t0 = time.perf_counter()
+    try:
+        os.chdir(project)
+        _reset_project_state()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                code = cli.main(args=list(args), prog_name="oops", standalone_mode=False)
+                exit_code = code if isinstance(code, int) else 0
+            except click.ClickException as exc:
+                exc.show()
+                exit_code = exc.exit_code
+            except click.Abort:
+                exit_code = 1
+            except SystemExit as exc:
+                exit_code = exc.code if isinstance(exc.code, int) else 1
+            except Exception as exc:  # noqa: BLE001 - reported per project
+                print(f"Unexpected error: {exc}", file=stderr)
+                exit_code = 1
+    finally:
+        os.chdir(previous)
+        _reset_project_state()
+
+    out = stdout.getvalue()
+    payload = _parse_payload(out)
+    return {
+        "project": Path(project).name,
+        "path": str(project),
+        "exit_code": exit_code,
+        "duration_ms": round((time.perf_counter() - t0) * 1000, 1),
+        "payload": payload,
+        "output": None if payload is not None else out.strip(),
+        "stderr": stderr.getvalue().strip(),
+    }
+
+
+def _init_worker() -> None:
+    """Import the CLI once per worker process."""
+    from oops.cli import main  # noqa: F401, PLC0415
+
+
+def run_batch(projects: List[Path], args: List[str], jobs: int = 1) -> List[Dict[str, Any]]:
+    """Run ``oops <args>`` in every project and collect one row per project.
+
+    Args:
+        projects: Project roots, typically from
+            :func:`~oops.services.project.find_projects`.
+        args: Command line passed to every run.
+        jobs: Worker processes. ``1`` runs sequentially in this process.
+
+    Returns:
+        Rows as returned by :func:`run_in_project`, in ``projects`` order.
+    """
+    if jobs <= 1 or len(projects) <= 1:
+        return [run_in_project(str(p), args) for p in projects]
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(projects)), initializer=_init_worker) as pool:
+        return list(pool.map(run_in_project, [str(p) for p in projects], [args] * len(projects)))
@@ -3,18 +3,22 @@
 #
 # File: docker.py — oops/services/docker.py
 
+import json
 import re
 import warnings
 from dataclasses import dataclass
 from datetime import date
+from pathlib import Path
 
+from oops.core.cache import record_access
 from oops.core.checks import Check, CheckContext, CheckOutcome
-from oops.core.compat import Optional
+from oops.core.compat import Dict, List, Optional
 from oops.core.config import ImagesConfig, config
 from oops.core.exceptions import DeprecatedRegistryWarning, UnusualRegistryWarning
 from oops.core.models import ImageInfo, Result
-from oops.utils.helpers import date_from_string
-from oops.utils.net import make_json_get
+from oops.core.paths import images_index_dir
+from oops.utils.helpers import date_from_string, write_atomic
+from oops.utils.net import CachedResponse, cached_json_get
 from requests import RequestException
 
 # try:
@@ -120,11 +124,77 @@ def parse_image_tag(tag: str) -> ImageInfo:
     )
 
 
-def fetch_odoo_images(collections: Optional[list] = None) -> list:
+_INDEX_FILE = "index.json"
+
+
+def _version_key(version: "float | int | str") -> str:
+    """Index key of an Odoo version: ``19`` / ``"19"`` / ``19.0`` → ``"19.0"``."""
+    return str(float(version))
+
+
+def _build_image_index(response: CachedResponse, index_dir: Path) -> dict:
+    """Split the image list by Odoo version into ``<version>.json`` files.
+
+    ``index.json`` is written last and records the digest of the source body,
+    so an interrupted rebuild is simply redone on the next lookup.
+    """
+    by_version: Dict[str, List[dict]] = {}
+    for vals in response.data:
+        by_version.setdefault(_version_key(vals["version"]), []).append(vals)
+
+    for key, items in by_version.items():
+        write_atomic(index_dir / f"{key}.json", json.dumps(items).encode("utf-8"))
+    index = {
+        "source": response.url,
+        "digest": response.digest,
+        "versions": {key: len(items) for key, items in sorted(by_version.items())},
+    }
+    write_atomic(index_dir / _INDEX_FILE, json.dumps(index).encode("utf-8"))
+    return index
+
+
+def load_image_dicts(version: "float | None" = None) -> List[dict]:
+    """Return the raw image entries of the configured source, optionally for one version.
+
+    The source goes through the on-disk HTTP cache
+    (:func:`~oops.utils.net.cached_json_get`, TTL ``images.cache_ttl``). Its
+    entries are indexed by Odoo version under
+    :func:`~oops.core.paths.images_index_dir`; while the cached body is
+    unchanged, a per-version lookup only reads that version's small file.
+
+    Args:
+        version: Odoo major version (e.g. ``19.0``); all entries when None.
+
+    Returns:
+        Raw image dicts, in source order.
+    """
+    response = cached_json_get(config.images.source.url, ttl=config.images.cache_ttl)
+    if version is None:
+        return list(response.data)
+
+    index_dir = images_index_dir()
+    try:
+        index = json.loads((index_dir / _INDEX_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        index = {}
+    reused = index.get("digest") == response.digest and index.get("source") == response.url
+    if not reused:
+        index = _build_image_index(response, index_dir)
+    record_access(index_dir, "images", hit=reused)
+
+    key = _version_key(version)
+    if key not in index["versions"]:
+        return []
+    return json.loads((index_dir / f"{key}.json").read_text(encoding="utf-8"))
+
+
+def fetch_odoo_images(collections: Optional[list] = None, version: "float | None" = None) -> list:
     """Fetch available Odoo Docker images filtered by collection.
 
     Args:
         collections: List of collection names to include. Defaults to config.images.collections.
+        version: Only return images of this Odoo major version (served from
+            the local per-version index). Defaults to all versions.
 
     Returns:
         List of ImageInfo objects matching the requested collections.
@@ -147,7 +217,7 @@ def fetch_odoo_images(collections: Optional[list] = None) -> list:
 
     if collections is None:
         collections = config.images.collections
-    data = make_json_get(config.images.source.url)
+    data = load_image_dicts(version)
 
     items = [ImageInfo.from_raw_dict(vals) for vals in data]
 
@@ -259,7 +329,7 @@ def find_available_images(
         List of matching ImageInfo objects annotated with a ``delta`` attribute
         (days from the anchor date).
     """
-    available = fetch_odoo_images()
+    available = fetch_odoo_images(version=version)
 
     items = [
         i
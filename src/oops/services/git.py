@@ -10,21 +10,23 @@ from functools import lru_cache
 from pathlib import Path, PurePosixPath
 from typing import TYPE_CHECKING, Generator
 
+# GitPython is imported inside the functions that use it: hooks that only need
+# the repository root (services.repository) never pay for it.
 if TYPE_CHECKING:
+    from git import Repo, Submodule
+    from git.config import GitConfigParser
     from git.util import IterableList
 
 import click
-from git import GitCommandError, InvalidGitRepositoryError, Repo, Submodule
-from git.config import GitConfigParser
 from oops.core.compat import List, Optional, Tuple
 from oops.core.exceptions import OopsError
 from oops.core.messages import commit_messages
-from oops.core.metadata import update_metadata
 from oops.core.models import CommitInfo, Result
 from oops.core.paths import PR_DIR
 from oops.io.format import format_file
 from oops.io.manifest import find_addons_extended
 from oops.io.tools import run
+from oops.services.repository import require_repo_context
 from oops.utils.net import encode_url
 from oops.utils.render import print_success, print_warning
 
@@ -45,6 +47,8 @@ def read_gitmodules(repo: Repo) -> GitConfigParser:
     if repo.working_tree_dir is None:
         raise ValueError("Repository does not have a working tree directory")
 
+    from git.config import GitConfigParser  # noqa: PLC0415
+
     gitmodules_path = Path(repo.working_tree_dir) / ".gitmodules"
     cfg = GitConfigParser(str(gitmodules_path), read_only=False)
 
@@ -75,15 +79,22 @@ def is_pull_request(submodule: Submodule) -> bool:
 def require_repository() -> "tuple[Repo, Path]":
     """Guard: locate and return the git repository containing the current directory.
 
+    The repository is located by :func:`oops.services.repository.require_repo_context`
+    (which also fills the output metadata); commands that only need the root
+    should call that instead and skip GitPython altogether.
+
     Returns:
         Tuple of (Repo, repo_root_path).
 
     Raises:
         click.ClickException: If no git repository is found or it has no working tree.
     """
+    ctx = require_repo_context()
+
+    from git import InvalidGitRepositoryError  # noqa: PLC0415
 
     try:
-        repo = Repo(Path.cwd(), search_parent_directories=True)
+        repo = ctx.repo
     except InvalidGitRepositoryError as error:
         raise OopsError("Not inside a git repository.") from error
     except Exception as err:
@@ -92,14 +103,7 @@ def require_repository() -> "tuple[Repo, Path]":
     if repo.working_tree_dir is None:
         raise OopsError("Not inside a git repository.")
 
-    update_metadata(
-        project_path=str(Path(repo.working_tree_dir)),
-        project_name=Path(repo.working_tree_dir).name,
-        git_commit=repo.head.commit.hexsha,
-        git_branch=repo.active_branch.name,
-    )
-
-    return repo, Path(repo.working_tree_dir)
+    return repo, ctx.root
 
 
 def require_submodules(repo: "Repo") -> "IterableList[Submodule]":
@@ -156,6 +160,8 @@ def show_diff(tmpdir: Path, files: list, local_repo: Repo, repo_root: Path) -> b
             continue
 
         # git diff --no-index compares two arbitrary paths (outside a repo)
+        from git import GitCommandError  # noqa: PLC0415
+
         try:
             diff_output = local_repo.git.diff("--no-index", "--color", str(dst), str(src))
             # No exception = exit code 0 = no differences
@@ -389,6 +395,8 @@ def list_available_addons(repo: Repo, repo_path: Path) -> "Generator[tuple[str,
 
 @lru_cache()
 def _list_submodules_cached(working_dir: str) -> dict:
+    from git import Repo  # noqa: PLC0415
+
     repo = Repo(working_dir)
     subs = {}
     for sub in repo.submodules:
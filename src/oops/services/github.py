@@ -3,9 +3,10 @@
 #
 # File: github.py — oops/services/github.py
 
+import hashlib
 import os
 import subprocess
-import zipfile
+from pathlib import Path
 
 import requests
 from oops.core.compat import Optional, Tuple
@@ -13,7 +14,9 @@ from oops.core.config import config
 from oops.core.exceptions import APIError
 from oops.core.logger import log
 from oops.core.models import WorkflowRunInfo
-from oops.utils.net import make_json_get
+from oops.core.profiling import count
+from oops.io.archive import CorruptArchiveError, StreamingZipExtractor
+from oops.utils.net import get_http_client, make_json_get
 
 
 def _get_headers(token: Optional[str]) -> dict:
@@ -47,6 +50,93 @@ def _get_api_url(owner: str, repo: str, endpoint: str) -> str:
     return f"{config.github_api}/repos/{owner}/{repo}/{endpoint}"
 
 
+_DOWNLOAD_ATTEMPTS = 3
+_CHUNK_SIZE = 64 * 1024  # small reads: a dropped connection loses at most one chunk
+
+
+def _download_resumable(url: str, headers: dict, part_path: str, sinks: list) -> None:
+    """Stream ``url`` into ``part_path``, resuming a previous partial download.
+
+    An existing ``part_path`` is continued with ``Range`` (guarded by
+    ``If-Range`` on the ETag saved alongside it); its bytes are replayed into
+    ``sinks`` first so every sink sees the whole body in order. A server that
+    ignores the range (``200``) restarts the file from scratch — sinks must
+    then not have seen any byte yet. A connection dropped mid-body is resumed
+    in place, up to ``_DOWNLOAD_ATTEMPTS`` times.
+
+    Args:
+        url: URL to download.
+        headers: Request headers (auth, accept).
+        part_path: Partial file, kept on failure so the next call can resume.
+        sinks: Callables receiving each body chunk in order.
+    """
+    client = get_http_client()
+    etag_path = part_path + ".etag"
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    etag = Path(etag_path).read_text(encoding="utf-8").strip() if offset and os.path.exists(etag_path) else None
+    fed = 0  # bytes already passed to the sinks
+
+    for attempt in range(1, _DOWNLOAD_ATTEMPTS + 1):
+        request_headers = dict(headers)
+        if offset:
+            request_headers["Range"] = f"bytes={offset}-"
+            if etag:
+                request_headers["If-Range"] = etag
+        try:
+            with client.get(url, headers=request_headers, stream=True) as r:
+                if r.status_code == 416 and offset:  # noqa: PLR2004 - already complete
+                    _replay(part_path, fed, offset, sinks)
+                    break
+                r.raise_for_status()
+                resumed = r.status_code == 206  # noqa: PLR2004
+                if resumed:
+                    fed += _replay(part_path, fed, offset, sinks)
+                elif fed:
+                    raise APIError(f"{url} changed while resuming the download; retry.")
+                else:
+                    offset = 0
+                if r.headers.get("ETag"):
+                    etag = r.headers["ETag"]
+                    Path(etag_path).write_text(etag, encoding="utf-8")
+                with open(part_path, "ab" if resumed else "wb") as f:
+                    for chunk in client.iter_content(r, chunk_size=_CHUNK_SIZE):
+                        f.write(chunk)
+                        offset += len(chunk)
+                        fed += len(chunk)
+                        for sink in sinks:
+                            sink(chunk)
+            break
+        except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+            if attempt == _DOWNLOAD_ATTEMPTS:
+                raise
+            log.warning(f"Download of {url} interrupted at {offset} bytes ({e}); resuming.")
+
+    if os.path.exists(etag_path):
+        os.remove(etag_path)
+
+
+def _discard_partial(part_path: str) -> None:
+    """Remove a partial download and its saved ETag, so the next call starts over."""
+    for path in (part_path, part_path + ".etag"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _replay(path: str, start: int, end: int, sinks: list) -> int:
+    """Feed bytes ``start:end`` of ``path`` into ``sinks``; return the count fed."""
+    size = end - start
+    with open(path, "rb") as f:
+        f.seek(start)
+        while size > 0:
+            chunk = f.read(min(size, _CHUNK_SIZE))
+            if not chunk:
+                break
+            size -= len(chunk)
+            for sink in sinks:
+                sink(chunk)
+    return end - start - size
+
+
 def fetch_branch_zip(  # noqa: PLR0913
     owner: str,
     repo: str,
@@ -54,43 +144,62 @@ def fetch_branch_zip(  # noqa: PLR0913
     out_dir: str,
     token: Optional[str] = None,
     extract: bool = True,
+    sha256: Optional[str] = None,
 ) -> Tuple[str, Optional[str]]:
     """Download the latest zipball of a repository branch from GitHub.
 
+    Entries are extracted while the archive streams in (see
+    :class:`~oops.io.archive.StreamingZipExtractor`), each one checked against
+    its CRC-32. The archive is written to ``<repo>-<branch>.zip.part`` and
+    renamed once complete; after an interrupted run the next call resumes from
+    the partial file with an HTTP ``Range`` request.
+
     Args:
         owner: Repository owner (user or organisation).
         repo: Repository name.
         branch: Branch name to download.
         out_dir: Local directory where the zip file (and extracted content) will be written.
         token: GitHub personal access token for private repositories. Defaults to None.
-        extract: If True, extract the zip after downloading. Defaults to True.
+        extract: If True, extract the zip while downloading. Defaults to True.
+        sha256: Expected SHA-256 of the whole archive; verified when given.
 
     Returns:
         Tuple of (zip_file_path, extracted_root_dir_or_None). The second element is
         None when extract is False.
+
+    Raises:
+        APIError: If the archive does not match ``sha256``.
+        CorruptArchiveError: If the archive is malformed or an entry fails its CRC.
+            The partial file is removed, so the next call downloads it again.
     """
     os.makedirs(out_dir, exist_ok=True)
     zip_path = os.path.join(out_dir, f"{repo}-{branch}.zip")
+    part_path = zip_path + ".part"
 
-    with requests.get(
-        _get_api_url(owner, repo, f"zipball/{branch}"),
-        headers=_get_headers(token),
-        stream=True,
-    ) as r:
-        r.raise_for_status()
-        with open(zip_path, "wb") as f:
-            for chunk in r.iter_content(chunk_size=1024 * 1024):
-                if chunk:
-                    f.write(chunk)
-
-    if not extract:
-        return zip_path, None
+    digest = hashlib.sha256()
+    sinks = [digest.update]
+    extractor = StreamingZipExtractor(out_dir) if extract else None
+    if extractor is not None:
+        sinks.append(extractor.feed)
 
-    with zipfile.ZipFile(zip_path) as zf:
-        # GitHub zipballs have a single top-level folder like "<repo>-<sha>/"
-        top = zf.namelist()[0].split("/")[0] + "/"
-        zf.extractall(out_dir)
-    extracted_root = os.path.join(out_dir, top.rstrip("/"))
+    try:
+        _download_resumable(_get_api_url(owner, repo, f"zipball/{branch}"), _get_headers(token), part_path, sinks)
+        if extractor is not None:
+            extractor.close()
+    except CorruptArchiveError:
+        # Resuming would replay the same bad bytes: start over next time.
+        _discard_partial(part_path)
+        raise
+
+    if sha256 and digest.hexdigest() != sha256.lower():
+        _discard_partial(part_path)
+        raise APIError(f"Checksum mismatch for {owner}/{repo}@{branch}: got {digest.hexdigest()}")
+    os.replace(part_path, zip_path)
+
+    if extractor is None:
+        return zip_path, None
+    # GitHub zipballs have a single top-level folder like "<repo>-<sha>/"
+    extracted_root = os.path.join(out_dir, extractor.root or "")
     return zip_path, extracted_root
 
 
@@ -157,6 +266,7 @@ def check_gh() -> None:
 
 def gh(*args: str) -> subprocess.CompletedProcess:
     """Run a gh CLI command, raising ClickException on failure."""
+    count("subprocess.gh")
     try:
         return subprocess.run(["gh", *args], check=True)
     except subprocess.CalledProcessError as e:
@@ -1,10 +1,13 @@
 from pathlib import Path
+from typing import Iterable
 
+from oops.core.cache import record_access
+from oops.core.compat import Optional
 from oops.core.exceptions import OopsError
 from oops.core.metadata import update_metadata
 from oops.core.paths import global_kb_path
 from oops.kb.build import parse_kb_timestamp, project_kb_path
-from oops.kb.store import KBReader
+from oops.kb.store import KBReader, MigrationImpossible, migrate_kb
 
 
 def require_kb(version: str) -> Path:
@@ -19,6 +22,7 @@ def require_kb(version: str) -> Path:
         Path to the global KB directory.
     """
     kb_path = global_kb_path(version)
+    record_access(kb_path, "kb-global", hit=kb_path.exists())
     if not kb_path.exists():
         raise OopsError("This command requires an initialised global KB")
 
@@ -26,16 +30,29 @@ def require_kb(version: str) -> Path:
     return kb_path
 
 
-def load_odoo_kb(version: str) -> dict:
-    """Read the global KB for the given Odoo version.
+def load_odoo_kb(version: str, names: Optional[Iterable[str]] = None) -> dict:
+    """Read the global KB modules for the given Odoo version.
 
     Returns an empty dict if the KB doesn't exist — the command will still
     work, but unresolved warnings will be louder.
+
+    Args:
+        version: Odoo major version string (e.g. ``"17"``).
+        names: Only load these modules and their transitive depends (one
+            query on the KB's ``module_closure``); all modules when None.
     """
     kb_path = global_kb_path(version)
+    record_access(kb_path, "kb-global", hit=kb_path.exists())
     if not kb_path.exists():
         return {}
+    if names is not None:
+        try:
+            migrate_kb(kb_path)
+        except MigrationImpossible:
+            names = None  # too old for module_closure: load every module
     with KBReader(kb_path) as kb:
+        if names is not None:
+            return kb.get_modules_closure(names)
         return kb.get_modules()
 
 
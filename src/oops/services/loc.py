@@ -10,6 +10,10 @@ a zeroed LocStats and a single warning is printed on the first lookup.
 
 Only the `code` field is exposed; `blank` and `comment` are intentionally
 dropped. Markdown and reStructuredText are merged into `docs`.
+
+Project-wide totals are expensive (one cloc run per root addon), so the
+per-addon totals of the last full count are kept in ``.oops-cache/loc.json``
+for commands that only need the project as a denominator.
 """
 
 from __future__ import annotations
@@ -18,9 +22,14 @@ import json
 import shutil
 import subprocess
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from functools import lru_cache
+from pathlib import Path
 
+from oops.core.compat import Dict, Optional
 from oops.core.logger import log
+from oops.core.paths import project_loc_path
+from oops.io.file import find_addons
 from oops.io.tools import run
 from oops.utils.render import print_warning
 
@@ -88,3 +97,33 @@ def get_addon_loc(path: str) -> LocStats:
         javascript=int(data.get("JavaScript", {}).get("code", 0)),
         docs=int(md.get("code", 0)) + int(rst.get("code", 0)),
     )
+
+
+def count_project_loc(repo_path: Path) -> Dict[str, int]:
+    """Count the lines of code of every root addon and cache the totals.
+
+    Args:
+        repo_path: Repository root.
+
+    Returns:
+        ``{addon: total}`` for every addon at the repository root.
+    """
+    totals = {a.technical_name: get_addon_loc(a.path).total for a in find_addons(repo_path, shallow=True)}
+    path = project_loc_path(repo_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"generated_at": datetime.now(timezone.utc).isoformat(), "addons": totals}
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    return totals
+
+
+def load_project_loc(repo_path: Path) -> Optional[Dict[str, int]]:
+    """Return the per-addon totals of the last :func:`count_project_loc`, or None.
+
+    The totals are as of that count: addons edited since are not recounted.
+    """
+    try:
+        payload = json.loads(project_loc_path(repo_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    addons = payload.get("addons") if isinstance(payload, dict) else None
+    return dict(addons) if isinstance(addons, dict) else None
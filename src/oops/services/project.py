@@ -13,7 +13,6 @@ from dataclasses import dataclass
 from pathlib import Path
 
 import click
-import git
 from oops.core.checks import Check, CheckContext, CheckOutcome
 from oops.core.config import ProjectConfig, config
 from oops.core.exceptions import (
@@ -130,9 +129,11 @@ def fetch_project_files(
     Raises:
         APIError: If the remote clone fails.
     """
+    from git import GitCommandError  # noqa: PLC0415
+
     try:
         sparse_clone(url, tmpdir, files, branch)
-    except git.GitCommandError as exc:
+    except GitCommandError as exc:
         raise APIError(f"Clone failed: {exc.stderr.strip()}") from exc
 
 
@@ -0,0 +1,209 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: repository.py — oops/services/repository.py
+
+"""
+Lightweight repository context, read straight from the ``.git`` directory.
+
+Locating the working tree, the checked-out branch and the HEAD commit only
+takes a few small files: walk up to ``.git`` (a directory, or a gitfile
+pointing at the git dir of a linked worktree or submodule), then read
+``HEAD``, the loose refs and ``packed-refs``. Pre-commit hooks that only need
+the repository root get it without importing GitPython; the ``Repo`` object
+is built on first access to :attr:`RepoContext.repo`, by the commands that
+run real git operations.
+
+Detached and unborn HEADs are ordinary states here (``branch`` / ``head_commit``
+are None) rather than GitPython exceptions.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from oops.core.compat import Any, Dict, Optional
+from oops.core.exceptions import OopsError
+from oops.core.metadata import update_metadata
+
+if TYPE_CHECKING:
+    from git import Repo
+
+_OBJECT_ID = re.compile(r"^(?:[0-9a-f]{40}|[0-9a-f]{64})$")  # SHA-1 or SHA-256
+_MAX_SYMREF_DEPTH = 5
+
+
+@dataclass
+class RepoContext:
+    """Where a repository lives and what is checked out, without GitPython.
+
+    Attributes:
+        root: Working tree root.
+        git_dir: Git dir of this working tree (``<root>/.git``, or the
+            per-worktree dir a gitfile points to).
+        common_dir: Git dir holding the shared refs and objects; differs from
+            ``git_dir`` in linked worktrees.
+        head_ref: Ref HEAD points to (``refs/heads/main``); None when detached.
+        head_commit: Commit id HEAD resolves to; None on an unborn branch.
+    """
+
+    root: Path
+    git_dir: Path
+    common_dir: Path
+    head_ref: Optional[str] = None
+    head_commit: Optional[str] = None
+    _repo: Any = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def branch(self) -> Optional[str]:
+        """Short name of the checked-out branch, None when HEAD is detached."""
+        if self.head_ref and self.head_ref.startswith("refs/heads/"):
+            return self.head_ref[len("refs/heads/") :]
+        return None
+
+    @property
+    def repo(self) -> "Repo":
+        """GitPython ``Repo`` of the working tree, built on first access."""
+        if self._repo is None:
+            from git import Repo  # noqa: PLC0415  # keeps GitPython out of hook startup
+
+            self._repo = Repo(self.root)
+        return self._repo
+
+    def read_ref(self, ref: str) -> Optional[str]:
+        """Return the commit id *ref* resolves to, following symbolic refs.
+
+        Args:
+            ref: Full ref name (``HEAD``, ``refs/heads/main``, ``refs/tags/v1``).
+
+        Returns:
+            The object id, or None if the ref does not exist (unborn branch).
+        """
+        return read_ref(self.git_dir, self.common_dir, ref)
+
+
+def _read_text(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _packed_refs(common_dir: Path) -> Dict[str, str]:
+    """Parse ``packed-refs`` into ``{ref: object id}`` (peeled tag lines skipped)."""
+    refs: Dict[str, str] = {}
+    for line in (_read_text(common_dir / "packed-refs") or "").splitlines():
+        if not line or line[0] in "#^":
+            continue
+        oid, _, name = line.partition(" ")
+        refs[name.strip()] = oid
+    return refs
+
+
+def read_ref(git_dir: Path, common_dir: Path, ref: str) -> Optional[str]:
+    """Resolve *ref* from loose refs and ``packed-refs``.
+
+    Per-worktree refs (``HEAD``) are looked up in *git_dir* first, shared refs
+    in *common_dir*, then in ``packed-refs``.
+
+    Args:
+        git_dir: Git dir of the working tree.
+        common_dir: Shared git dir (same as *git_dir* outside linked worktrees).
+        ref: Full ref name.
+
+    Returns:
+        The object id, or None if the ref is missing, dangling or malformed.
+    """
+    packed: Optional[Dict[str, str]] = None
+    for _ in range(_MAX_SYMREF_DEPTH):
+        value = _read_text(git_dir / ref)
+        if value is None and common_dir != git_dir:
+            value = _read_text(common_dir / ref)
+        if value is None:
+            if packed is None:
+                packed = _packed_refs(common_dir)
+            value = packed.get(ref)
+        if value is None:
+            return None
+        if not value.startswith("ref:"):
+            return value if _OBJECT_ID.match(value) else None
+        ref = value[len("ref:") :].strip()
+    return None
+
+
+def _git_dir_of(dot_git: Path) -> Optional[Path]:
+    """Return the git dir behind a ``.git`` entry (directory or gitfile)."""
+    if dot_git.is_dir():
+        git_dir = dot_git
+    else:
+        content = _read_text(dot_git)
+        if not content or not content.startswith("gitdir:"):
+            return None
+        git_dir = dot_git.parent / content[len("gitdir:") :].strip()
+    return git_dir if (git_dir / "HEAD").is_file() else None
+
+
+def find_repository(start: Optional[Path] = None) -> Optional[RepoContext]:
+    """Locate the repository containing *start* by walking up to ``.git``.
+
+    Args:
+        start: Directory to search from (defaults to the current directory).
+
+    Returns:
+        The context of the innermost working tree, or None outside a
+        repository (bare repositories have no working tree and are skipped).
+    """
+    start = (start or Path.cwd()).absolute()
+    for directory in (start, *start.parents):
+        git_dir = _git_dir_of(directory / ".git")
+        if git_dir is None:
+            continue
+
+        common = _read_text(git_dir / "commondir")
+        common_dir = (git_dir / common).resolve() if common else git_dir
+
+        head = _read_text(git_dir / "HEAD") or ""
+        if head.startswith("ref:"):
+            head_ref: Optional[str] = head[len("ref:") :].strip()
+            head_commit = read_ref(git_dir, common_dir, head_ref)
+        else:
+            head_ref = None
+            head_commit = head if _OBJECT_ID.match(head) else None
+
+        return RepoContext(
+            root=directory,
+            git_dir=git_dir,
+            common_dir=common_dir,
+            head_ref=head_ref,
+            head_commit=head_commit,
+        )
+    return None
+
+
+def require_repo_context() -> RepoContext:
+    """Guard: locate the repository containing the current directory, without GitPython.
+
+    The lightweight counterpart of :func:`oops.services.git.require_repository`
+    for commands that only need the root (and, at most, the commit and branch
+    for the output metadata).
+
+    Returns:
+        The repository context.
+
+    Raises:
+        OopsError: If the current directory is not inside a working tree.
+    """
+    ctx = find_repository()
+    if ctx is None:
+        raise OopsError("Not inside a git repository.")
+
+    update_metadata(
+        project_path=str(ctx.root),
+        project_name=ctx.root.name,
+        git_commit=ctx.head_commit,
+        git_branch=ctx.branch,
+    )
+    return ctx
@@ -0,0 +1,128 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: staged.py — oops/services/staged.py
+
+"""
+Staged-change resolver shared by the pre-commit hooks (``--staged``).
+
+The index is read once (``git diff --cached --name-only -z``) and the staged
+paths are mapped to the root addons they belong to, so each hook only looks
+at the addons the commit actually touches instead of scanning the whole
+repository. Staging a global file (``.gitmodules``, the requirements file,
+the oops or pre-commit config) or a submodule bump makes every hook fall
+back to its full scan, and so does an empty index (``pre-commit run
+--all-files`` on a clean tree, CI).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+
+from oops.core.compat import List, Optional, Set
+from oops.core.config import config
+from oops.core.paths import CONFIG_FILENAME
+from oops.io.tools import run
+
+
+@dataclass
+class StagedChanges:
+    """Staged paths of a commit, mapped to root addons.
+
+    Attributes:
+        paths: Repository-relative staged paths (added, modified, removed).
+        full_scan: True when a global file or a submodule is staged: hooks
+            must ignore ``addons`` / ``manifests`` and scan everything.
+        addons: Root addons with at least one staged file, sorted.
+        manifests: Root addons whose manifest or root entry (symlink) is
+            staged — i.e. added, removed or re-described addons, sorted.
+    """
+
+    paths: List[str] = field(default_factory=list)
+    full_scan: bool = False
+    addons: List[str] = field(default_factory=list)
+    manifests: List[str] = field(default_factory=list)
+
+    def touches(self, *paths: str) -> bool:
+        """Return True if any of ``paths`` (repository-relative) is staged."""
+        return any(str(PurePosixPath(p)) in self.paths for p in paths)
+
+
+def global_files() -> Set[str]:
+    """Return the repository-relative files whose change invalidates every addon-scoped check."""
+    return {
+        ".gitmodules",
+        CONFIG_FILENAME,
+        config.project.file_requirements,
+        config.precommit.file_precommit,
+    }
+
+
+@lru_cache()
+def staged_paths(repo_path: str) -> "tuple[str, ...]":
+    """Return the paths staged in the index of a repository (read once per process).
+
+    Renames are reported as a removal plus an addition so both sides are seen.
+
+    Args:
+        repo_path: Repository root.
+
+    Returns:
+        Repository-relative POSIX paths, in git order.
+    """
+    output = run(
+        ["git", "-C", repo_path, "diff", "--cached", "--name-only", "--no-renames", "-z"],
+        capture=True,
+        name="git-staged",
+    )
+    return tuple(p for p in (output or "").split("\0") if p)
+
+
+def _is_addon_dir(path: Path) -> bool:
+    return any((path / name).is_file() for name in config.manifest_names)
+
+
+def resolve_staged(repo_path: Path, paths: Optional[List[str]] = None) -> StagedChanges:
+    """Map the staged paths of a repository to the root addons they touch.
+
+    Args:
+        repo_path: Repository root.
+        paths: Staged paths to map; read from the index when omitted.
+
+    Returns:
+        The :class:`StagedChanges` of the commit being prepared.
+    """
+    if paths is None:
+        paths = list(staged_paths(str(repo_path)))
+    changes = StagedChanges(paths=list(paths), full_scan=not paths)
+    specials = global_files()
+
+    addons: Set[str] = set()
+    manifests: Set[str] = set()
+    for raw in paths:
+        path = PurePosixPath(raw)
+        if raw in specials:
+            changes.full_scan = True
+            continue
+        top = path.parts[0]
+        entry = repo_path / top
+        if len(path.parts) == 1:
+            if entry.is_symlink() or not entry.exists():
+                # Root symlink added, retargeted or removed: the addon set may change.
+                manifests.add(top)
+            elif entry.is_dir():
+                changes.full_scan = True  # submodule bump: linked addons may change
+            continue
+        if path.name in config.manifest_names and len(path.parts) == 2:
+            addons.add(top)
+            manifests.add(top)
+        elif _is_addon_dir(entry):
+            addons.add(top)
+        elif (repo_path / raw).is_dir():
+            changes.full_scan = True  # nested submodule bump (e.g. .third-party/<repo>)
+
+    changes.addons = sorted(addons)
+    changes.manifests = sorted(manifests)
+    return changes
@@ -18,7 +18,6 @@ import json
 import secrets
 from pathlib import Path
 
-import requests
 from oops.core.paths import stats_file, stats_flush_marker
 
 _FLUSH_INTERVAL_DAYS = 7
@@ -134,6 +133,7 @@ def flush_stats() -> None:
     :func:`maybe_flush` can catch and swallow them silently.
     """
     from oops.core.config import config  # local import to avoid circular deps
+    from oops.utils.net import get_http_client  # keeps GitPython out of CLI startup
 
     path = stats_file()
     if not path.exists():
@@ -151,7 +151,7 @@ def flush_stats() -> None:
 
     events = [json.loads(line) for line in raw.splitlines() if line.strip()]
 
-    requests.post(
+    get_http_client().post(
         endpoint,
         json={"events": events},
         headers={"X-Oops-Token": secrets.token_hex(16)},
@@ -0,0 +1,74 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: watch.py — oops/services/watch.py
+
+"""
+Shared plumbing of the ``--watch`` modes (``addons analyze``, ``project doc``,
+``project serve``).
+
+File changes are mapped back to the addons being watched, those addons are
+re-scanned into the project KB in place, and the caller re-analyses just
+them — instead of paying the staleness checks, a full KB rebuild and a full
+re-analysis on every save.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Iterator
+
+import click
+from oops.core.compat import List, Set
+from oops.core.models import Result
+from oops.io.watch import DEBOUNCE_SECONDS, FileWatcher
+from oops.kb.build import refresh_project_kb
+
+
+def touched_modules(paths: Set[Path], modules: List[Path]) -> List[Path]:
+    """Return the addons of ``modules`` containing at least one of ``paths``.
+
+    Args:
+        paths: Changed paths, as reported by :class:`~oops.io.watch.FileWatcher`.
+        modules: Watched addon directories; symlinked addons match through
+            their real path.
+
+    Returns:
+        The touched entries of ``modules``, in ``modules`` order.
+    """
+    real = [(module, module.resolve()) for module in modules]
+    touched = []
+    for module, root in real:
+        if any(path == root or root in path.parents for path in paths):
+            touched.append(module)
+    return touched
+
+
+def watch_modules(modules: List[Path], debounce: float = DEBOUNCE_SECONDS) -> Iterator[List[Path]]:
+    """Yield the addons touched by each debounced burst of file changes.
+
+    Blocks until interrupted (Ctrl-C); announces itself on stderr.
+
+    Args:
+        modules: Addon directories to watch.
+        debounce: Quiet period, in seconds, closing a burst.
+    """
+    with FileWatcher([m.resolve() for m in modules], debounce=debounce) as watcher:
+        click.echo(f"Watching {len(modules)} addon(s) for changes ({watcher.backend}, Ctrl-C to stop)…", err=True)
+        for batch in watcher:
+            touched = touched_modules(batch, modules)
+            if touched:
+                yield touched
+
+
+def refresh_modules(repo_path: Path, modules: List[Path]) -> "Result[List[str]]":
+    """Re-scan the touched addons into the project KB (see :func:`~oops.kb.build.refresh_project_kb`)."""
+    return refresh_project_kb(repo_path, [m.name for m in modules])
+
+
+def report_cycle(modules: List[Path], started: float) -> None:
+    """Print the one-line summary of a watch cycle on stderr."""
+    elapsed = (time.perf_counter() - started) * 1000
+    names = ", ".join(m.name for m in modules)
+    click.echo(f"↻ {names} updated in {elapsed:.0f} ms", err=True)
@@ -11,6 +11,7 @@ from pathlib import Path
 import click
 from oops.core.compat import Optional
 from oops.core.exceptions import APIError
+from oops.core.profiling import count
 
 
 def _git(*args: str, cwd: Optional[Path] = None, quiet: bool = False) -> None:
@@ -21,6 +22,7 @@ def _git(*args: str, cwd: Optional[Path] = None, quiet: bool = False) -> None:
         cwd: Working directory for the command. Defaults to None (inherit).
         quiet: Suppress stdout/stderr (e.g. when inside a Rich Live context).
     """
+    count("subprocess.git")
     sink = subprocess.DEVNULL if quiet else None
     subprocess.run(["git", *args], check=True, cwd=cwd, stdout=sink, stderr=sink)
 
@@ -35,6 +37,7 @@ def _git_output(*args: str, cwd: Optional[Path] = None) -> str:
     Returns:
         Stripped stdout of the git command.
     """
+    count("subprocess.git")
     result = subprocess.run(
         ["git", *args],
         check=True,
@@ -45,7 +48,7 @@ def _git_output(*args: str, cwd: Optional[Path] = None) -> str:
     return result.stdout.strip()
 
 
-def clone(url: str, dest: Path, branch: str, quiet: bool = False) -> None:
+def clone(url: str, dest: Path, branch: str, quiet: bool = False, reference: Optional[Path] = None) -> None:
     """Shallow-clone a git repository to a local destination.
 
     Args:
@@ -53,7 +56,19 @@ def clone(url: str, dest: Path, branch: str, quiet: bool = False) -> None:
         dest: Local path where the repository will be created.
         branch: Branch name to check out.
         quiet: Suppress git stdout/stderr.
+        reference: Bare repository to borrow objects from (see
+            :func:`ensure_reference`). Its tip of ``branch`` is already there,
+            so the shallow fetch neither downloads nor stores it again.
     """
+    if reference is not None:
+        # `git clone --reference` refuses shallow references: wire the
+        # alternate by hand, then fetch like `clone --depth 1 --single-branch`.
+        _git("init", "--quiet", str(dest), quiet=quiet)
+        _add_alternate(dest, reference)
+        _git("remote", "add", "-t", branch, "origin", url, cwd=dest, quiet=quiet)
+        _git("fetch", "--depth", "1", "--no-tags", "origin", cwd=dest, quiet=quiet)
+        _git("checkout", "--quiet", "-b", branch, "--track", f"origin/{branch}", cwd=dest, quiet=quiet)
+        return
     _git(
         "clone",
         url,
@@ -67,6 +82,102 @@ def clone(url: str, dest: Path, branch: str, quiet: bool = False) -> None:
     )
 
 
+def ensure_reference(url: str, path: Path, branch: str, quiet: bool = False) -> Path:
+    """Create or refresh a bare reference repository holding the tip of *branch* of *url*.
+
+    One reference per upstream is shared by the checkouts of every version:
+    branches are fetched side by side (``--depth 1``, like the checkouts), so
+    objects common to the 16.0, 17.0 and 18.0 tips are transferred and stored
+    once. Garbage collection never prunes it (``gc.auto=0``,
+    ``gc.pruneExpire=never``): checkouts still borrow the objects of tips a
+    later fetch moved away from.
+
+    Args:
+        url: Upstream remote URL.
+        path: Bare repository path (created when missing).
+        branch: Branch to fetch into the reference.
+        quiet: Suppress git stdout/stderr.
+
+    Returns:
+        ``path``.
+    """
+    if not (path / "HEAD").exists():
+        path.mkdir(parents=True, exist_ok=True)
+        _git("init", "--bare", "--quiet", str(path), quiet=quiet)
+        # URL only, no fetch refspec: branches land in refs/heads, nothing is mirrored twice.
+        _git("config", "remote.origin.url", url, cwd=path, quiet=quiet)
+        # Checkouts read their objects from here: a tip left behind by a later
+        # fetch must never be pruned, by an auto-gc or an explicit one.
+        _git("config", "gc.auto", "0", cwd=path, quiet=quiet)
+        _git("config", "gc.pruneExpire", "never", cwd=path, quiet=quiet)
+    _git(
+        "fetch",
+        "--depth",
+        "1",
+        "--no-tags",
+        "origin",
+        f"+refs/heads/{branch}:refs/heads/{branch}",
+        cwd=path,
+        quiet=quiet,
+    )
+    return path
+
+
+def _git_path(dest: Path, name: str) -> Path:
+    path = Path(_git_output("rev-parse", "--git-path", name, cwd=dest))
+    return path if path.is_absolute() else dest / path
+
+
+def _add_alternate(dest: Path, reference: Path, share_shallow: bool = True) -> bool:
+    """Register *reference* as an object alternate of *dest*.
+
+    With ``share_shallow``, the reference's shallow boundaries are copied
+    along: without them, git walks the alternate's branch tips into parents
+    that were never fetched. Only for shallow checkouts — in a full clone
+    they would hide history the checkout has.
+
+    Returns:
+        False when *dest* already used the reference, True otherwise.
+    """
+    if share_shallow and (reference / "shallow").exists():
+        shallow = _git_path(dest, "shallow")
+        known = shallow.read_text(encoding="utf-8").split() if shallow.exists() else []
+        missing = [sha for sha in (reference / "shallow").read_text(encoding="utf-8").split() if sha not in known]
+        if missing:
+            shallow.write_text("\n".join([*known, *missing]) + "\n", encoding="utf-8")
+
+    objects = _git_path(dest, "objects")
+    alternates = objects / "info" / "alternates"
+    target = str((reference / "objects").resolve())
+    existing = alternates.read_text(encoding="utf-8").splitlines() if alternates.exists() else []
+    if target in existing:
+        return False
+    alternates.parent.mkdir(parents=True, exist_ok=True)
+    alternates.write_text("\n".join([*existing, target]) + "\n", encoding="utf-8")
+    return True
+
+
+def borrow_objects(dest: Path, reference: Path, quiet: bool = False) -> bool:
+    """Make an existing checkout borrow objects from *reference*.
+
+    Registers the reference in ``objects/info/alternates`` and repacks
+    without the objects it provides, reclaiming their disk space.
+
+    Args:
+        dest: Local repository path.
+        reference: Bare reference repository.
+        quiet: Suppress git stdout/stderr.
+
+    Returns:
+        False when the checkout already used the reference, True otherwise.
+    """
+    shallow = _git_output("rev-parse", "--is-shallow-repository", cwd=dest) == "true"
+    if not _add_alternate(dest, reference, share_shallow=shallow):
+        return False
+    _git("repack", "-a", "-d", "-l", "-q", cwd=dest, quiet=quiet)
+    return True
+
+
 def update_latest(dest: Path, quiet: bool = False) -> None:
     """Fetch and reset to the tip of the remote branch (shallow).
 
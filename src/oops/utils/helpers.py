@@ -5,10 +5,13 @@
 
 from __future__ import annotations
 
+import os
 import re
+import tempfile
 import unicodedata
 from collections.abc import Generator
 from datetime import date
+from pathlib import Path
 
 import click
 from oops.core.compat import PY38, Any, List
@@ -151,3 +154,24 @@ def slugify(name: str) -> str:
     slug = ascii_name.lower().strip()
     slug = re.sub(r"[^a-z0-9]+", "-", slug)
     return slug.strip("-")
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` through a temp file and a rename.
+
+    Concurrent readers see either the previous content or the new one, never
+    a partially written file.
+
+    Args:
+        path: Destination file; parent directories are created.
+        data: Bytes to write.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
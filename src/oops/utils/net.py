@@ -3,15 +3,160 @@
 #
 # File: net.py — oops/utils/net.py
 
+import hashlib
+import json
 import re
+import threading
+import time
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Iterator
+from urllib.parse import urlencode, urlparse
 
 import requests
-from git import Repo
-from oops.core.compat import Optional, Tuple
+from oops.core.cache import record_access
+from oops.core.compat import Any, Dict, Optional, Tuple
 from oops.core.config import config
-from oops.utils.helpers import removesuffix
+from oops.core.logger import log
+from oops.core.paths import http_cache_dir
+from oops.core.profiling import count
+from oops.utils.helpers import removesuffix, write_atomic
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class HttpClient:
+    """Process-wide HTTP client: pooled keep-alive connections with retries.
+
+    Wraps a single :class:`requests.Session` so successive calls to the same
+    host (paginated listings, GitHub API calls, zipball downloads) reuse
+    their TCP/TLS connection instead of reconnecting each time.
+
+    - at most ``max_connections`` requests run per host at once; extra
+      threads block until a connection is returned to the pool;
+    - idempotent requests answered with 429/5xx (or failing to connect) are
+      retried up to ``retries`` times with exponential backoff, honouring
+      ``Retry-After``; the last response is returned, not raised;
+    - responses are requested gzip-encoded and decoded transparently.
+
+    Counters (also reported as ``http.*`` under ``--profile``) are in
+    :attr:`stats`: ``requests``, ``retries`` and ``bytes`` (decoded body
+    bytes read by the caller).
+
+    Args:
+        max_connections: Pooled connections per host.
+        retries: Retries per request (0 disables retrying).
+        backoff: Backoff factor in seconds: waits ``backoff * 2**(n-1)``.
+        timeout: Default timeout in seconds (``config.default_timeout`` if None).
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 8,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.max_connections = max_connections
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.stats: Dict[str, int] = {"requests": 0, "retries": 0, "bytes": 0}
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+
+    @property
+    def session(self) -> requests.Session:
+        """The underlying session, created on first use."""
+        with self._lock:
+            if self._session is None:
+                self._session = self._make_session()
+            return self._session
+
+    def _make_session(self) -> requests.Session:
+        retry = Retry(
+            total=self.retries,
+            backoff_factor=self.backoff,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.max_connections,
+            pool_maxsize=self.max_connections,
+            pool_block=True,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Accept-Encoding"] = "gzip, deflate"
+        return session
+
+    def _record(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.stats[name] += n
+        count(f"http.{name}", n)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the pool.
+
+        Keyword arguments are those of :meth:`requests.Session.request`;
+        ``timeout`` defaults to the client timeout.
+
+        Raises:
+            requests.RequestException: On connection errors once retries are
+                exhausted (HTTP error statuses are returned, not raised).
+        """
+        kwargs.setdefault("timeout", self.timeout or config.default_timeout)
+        r = self.session.request(method, url, **kwargs)
+        history = getattr(getattr(r.raw, "retries", None), "history", ())
+        self._record("requests")
+        if history:
+            self._record("retries", len(history))
+        if not kwargs.get("stream"):
+            self._record("bytes", len(r.content))
+        return r
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request (see :meth:`request`)."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request (see :meth:`request`); POSTs are never retried."""
+        return self.request("POST", url, **kwargs)
+
+    def iter_content(self, response: requests.Response, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Yield the body of a ``stream=True`` response, counting bytes read."""
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if chunk:
+                self._record("bytes", len(chunk))
+                yield chunk
+
+    def close(self) -> None:
+        """Close pooled connections; the next request opens a new session."""
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Return the process-wide :class:`HttpClient`, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient(
+                max_connections=config.http_max_connections,
+                retries=config.http_retries,
+                backoff=config.http_backoff,
+            )
+        return _client
 
 
 def make_json_get(url: str, headers: Optional[dict] = None, params: Optional[dict] = None) -> dict:
@@ -35,16 +180,128 @@ def make_json_get(url: str, headers: Optional[dict] = None, params: Optional[dic
     if params:
         options["params"] = params
 
-    r = requests.get(
-        url,
-        **options,
-        timeout=config.default_timeout,
-    )
+    r = get_http_client().get(url, **options)
     r.raise_for_status()
 
     return r.json()
 
 
+class CachedResponse:
+    """A JSON response served through the on-disk HTTP cache.
+
+    The body is only read and parsed on first access to :attr:`data`, so
+    callers that merely need :attr:`digest` (e.g. to validate a derived
+    index) never pay for parsing.
+
+    Attributes:
+        url: Requested URL (query string included).
+        path: Cached body file.
+        digest: SHA-256 of the body — stable across ETag-less servers.
+        from_cache: True when no body was downloaded (fresh, 304 or offline).
+        stale: True when served from cache because the network failed.
+    """
+
+    def __init__(self, url: str, path: Path, digest: str, from_cache: bool, stale: bool = False) -> None:
+        self.url = url
+        self.path = path
+        self.digest = digest
+        self.from_cache = from_cache
+        self.stale = stale
+        self._data: Any = None
+
+    @property
+    def data(self) -> Any:
+        """Parsed JSON body."""
+        if self._data is None:
+            self._data = json.loads(self.path.read_bytes())
+        return self._data
+
+
+def cached_json_get(
+    url: str,
+    ttl: int,
+    headers: Optional[dict] = None,
+    params: Optional[dict] = None,
+    cache_dir: Optional[Path] = None,
+) -> CachedResponse:
+    """GET a JSON resource through a persistent, revalidating HTTP cache.
+
+    Entries live under :func:`~oops.core.paths.http_cache_dir` as a body file
+    plus a small metadata file (validators and fetch time):
+
+    - younger than ``ttl`` seconds: served from disk, no request is sent;
+    - older: revalidated with ``If-None-Match`` / ``If-Modified-Since``; a
+      ``304`` refreshes the timestamp and keeps the cached body;
+    - network failure with a cached body: the stale body is served and a
+      warning logged, so lookups keep working offline.
+
+    Args:
+        url: URL to request.
+        ttl: Freshness lifetime in seconds (``0`` always revalidates).
+        headers: Optional HTTP headers to include.
+        params: Optional query parameters (part of the cache key).
+        cache_dir: Override the cache directory (tests).
+
+    Returns:
+        A :class:`CachedResponse`.
+
+    Raises:
+        requests.RequestException: On HTTP errors, or network errors with no
+            cached copy to fall back on.
+    """
+    full_url = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+    key = hashlib.sha256(full_url.encode("utf-8")).hexdigest()[:32]
+    directory = cache_dir or http_cache_dir()
+    body_path = directory / f"{key}.body"
+    meta_path = directory / f"{key}.meta.json"
+
+    meta: dict = {}
+    if body_path.exists() and meta_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            meta = {}
+
+    if meta and time.time() - meta.get("fetched_at", 0) < ttl:
+        record_access(body_path, "http", hit=True)
+        return CachedResponse(full_url, body_path, meta["sha256"], from_cache=True)
+
+    request_headers = dict(headers or {})
+    if meta.get("etag"):
+        request_headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        request_headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        r = get_http_client().get(url, headers=request_headers, params=params)
+    except requests.RequestException as exc:
+        if not meta:
+            raise
+        log.warning(f"Could not reach {url} ({exc}); using the cached copy.")
+        record_access(body_path, "http", hit=True)
+        return CachedResponse(full_url, body_path, meta["sha256"], from_cache=True, stale=True)
+
+    if r.status_code == 304 and meta:  # noqa: PLR2004
+        meta["fetched_at"] = time.time()
+        write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        record_access(body_path, "http", hit=True)
+        return CachedResponse(full_url, body_path, meta["sha256"], from_cache=True)
+
+    r.raise_for_status()
+    body = r.content
+    meta = {
+        "url": full_url,
+        "etag": r.headers.get("ETag"),
+        "last_modified": r.headers.get("Last-Modified"),
+        "sha256": hashlib.sha256(body).hexdigest(),
+        "fetched_at": time.time(),
+    }
+    write_atomic(body_path, body)
+    write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+    record_access(body_path, "http", hit=False)
+    return CachedResponse(full_url, body_path, meta["sha256"], from_cache=False)
+
+
 def clean_url(url: str) -> str:
     """Strip credentials from a URL and normalise the scheme to https.
 
@@ -181,21 +438,36 @@ def parse_repository_url(url: str) -> Tuple[str, str, str]:
     return canonical_url, normalized_owner, repo
 
 
-def sparse_clone(remote_url: str, tmpdir: Path, files: list, branch: Optional[str] = None) -> None:
+def sparse_clone(
+    remote_url: str,
+    tmpdir: Path,
+    files: list,
+    branch: Optional[str] = None,
+    blobless: bool = True,
+) -> None:
     """Clone a remote repository with sparse checkout limited to specific paths.
 
     Performs a shallow clone (depth=1) and enables sparse checkout so only
-    the listed files or directories are materialised.
+    the listed files or directories are materialised. With ``blobless``, the
+    clone is also a partial clone (``--filter=blob:none``): only the commit
+    and trees are transferred up front, and the checkout then fetches just
+    the blobs under the sparse paths. Servers without partial-clone support
+    ignore the filter and send everything.
 
     Args:
         remote_url: URL of the remote repository to clone.
         tmpdir: Local directory where the repository will be cloned.
         files: List of file or directory patterns to include in the sparse checkout.
         branch: Branch to clone. If None, clones the remote default branch.
+        blobless: Defer blob downloads to the sparse checkout. Defaults to True.
     """
     kwargs = {"depth": 1, "no_checkout": True}
+    if blobless:
+        kwargs["filter"] = "blob:none"
     if branch:
         kwargs["branch"] = branch
+    from git import Repo  # noqa: PLC0415
+
     remote_repo = Repo.clone_from(remote_url, str(tmpdir), **kwargs)
 
     # Enable sparse checkout
@@ -204,6 +476,7 @@ def sparse_clone(remote_url: str, tmpdir: Path, files: list, branch: Optional[st
 
     # Write the list of patterns to .git/info/sparse-checkout
     sparse_file = tmpdir / ".git" / "info" / "sparse-checkout"
+    sparse_file.parent.mkdir(parents=True, exist_ok=True)
     sparse_file.write_text("\n".join(files) + "\n", encoding="utf-8")
 
     # Perform the actual checkout
@@ -5,8 +5,12 @@
 
 from __future__ import annotations
 
+import csv
+import sys
 import textwrap
 from datetime import date, datetime
+from itertools import chain, islice
+from typing import IO, Iterable
 
 import questionary
 from oops.core.compat import Any, List, Optional
@@ -14,12 +18,15 @@ from oops.core.config import config
 from oops.core.exceptions import OopsError
 from oops.core.logger import log
 from rich import box
+from rich.cells import cell_len
 from rich.columns import Columns
 from rich.console import Console
+from rich.errors import MarkupError
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.style import Style
 from rich.table import Table
+from rich.text import Text
 from rich.theme import Theme
 from tabulate import tabulate
 
@@ -31,6 +38,12 @@ RICH_THEME = Theme(
     }
 )
 
+# Tables with more rows than this are streamed (or written as TSV when stdout
+# is not a terminal) instead of being laid out as a single Rich ``Table``.
+STREAM_THRESHOLD = 500
+_WIDTH_SAMPLE = 200  # rows measured to size the columns of a streamed table
+_STREAM_CHUNK = 100  # rows rendered per Rich call while streaming
+
 
 def get_console() -> Console:
     """Return a stdout-bound Rich Console.
@@ -203,6 +216,23 @@ def human_readable(raw: Any, sep: str = ", ", width: Optional[int] = None) -> st
     return str(raw)
 
 
+def format_bytes(size: int) -> str:
+    """Format a byte count with a binary unit (``"0 B"``, ``"1.5 KiB"``, ``"3.2 GiB"``).
+
+    Args:
+        size: Number of bytes.
+
+    Returns:
+        Human-readable size, one decimal above bytes.
+    """
+    value = float(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if value < 1024 or unit == "GiB":
+            return f"{int(value)} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} TiB"  # pragma: no cover - loop always returns
+
+
 def render_boolean(raw: bool) -> str:
     """Render a boolean as a check symbol or an empty string.
 
@@ -396,6 +426,115 @@ def make_table(title: Optional[str], columns: list[tuple], rows: list, expand: b
     return t
 
 
+def plain_cell(value: Any) -> str:
+    """Return the text of a table cell, without Rich markup or styles.
+
+    Args:
+        value: Cell as given to a table: markup string, Rich ``Text`` or any value.
+
+    Returns:
+        The text a reader would see, empty for None.
+    """
+    if isinstance(value, Text):
+        return value.plain
+    text = "" if value is None else str(value)
+    if "[" not in text:
+        return text
+    try:
+        return Text.from_markup(text).plain
+    except MarkupError:
+        return text
+
+
+def write_delimited(columns: list[tuple], rows: Iterable, file: Optional[IO[str]] = None, delimiter: str = "\t") -> int:
+    """Write a table as delimiter-separated values, one line per row as it comes.
+
+    Args:
+        columns: Column specs ``(label, style, justify)``; only labels are used.
+        rows: Rows of cells; consumed lazily.
+        file: Destination (defaults to stdout).
+        delimiter: Field separator (``"\\t"`` for TSV, ``","`` for CSV).
+
+    Returns:
+        The number of rows written (header excluded).
+    """
+    writer = csv.writer(file or sys.stdout, delimiter=delimiter, lineterminator="\n")
+    writer.writerow([label for label, *_ in columns])
+    count = 0
+    for row in rows:
+        writer.writerow([plain_cell(cell) for cell in row])
+        count += 1
+    return count
+
+
+def _fit_widths(widths: List[int], available: int, minimum: int = 3) -> List[int]:
+    """Shrink the widest columns until *widths* fit in *available* cells."""
+    widths = list(widths)
+    while sum(widths) > available:
+        widest = max(range(len(widths)), key=widths.__getitem__)
+        if widths[widest] <= minimum:
+            break
+        widths[widest] -= 1
+    return widths
+
+
+def stream_table(columns: list[tuple], rows: Iterable, console: Optional[Console] = None) -> None:
+    """Print a table incrementally instead of laying it out all at once.
+
+    On a terminal, column widths are measured on the first rows and fixed,
+    then rows are printed in small chunks as *rows* yields them (cells too
+    wide are ellipsised). Anywhere else (pipe, file) the table is written as
+    TSV without going through Rich at all.
+
+    Args:
+        columns: Column specs ``(label, style, justify)``, as for :func:`make_table`.
+        rows: Rows of cells; may be a generator.
+        console: Target console (defaults to :func:`get_console`).
+    """
+    console = console or get_console()
+    if not console.is_terminal:
+        write_delimited(columns, rows, console.file)
+        return
+
+    rows = iter(rows)
+    sample = list(islice(rows, _WIDTH_SAMPLE))
+    widths = [cell_len(label) for label, *_ in columns]
+    for row in sample:
+        for i, cell in enumerate(row):
+            widths[i] = max(widths[i], cell_len(plain_cell(cell)))
+    widths = _fit_widths(widths, console.width - 2 * len(columns))
+
+    def chunk(show_header: bool) -> Table:
+        t = Table(box=box.SIMPLE_HEAD, show_edge=False, show_header=show_header, expand=False)
+        for (label, style, justify), width in zip(columns, widths):
+            t.add_column(label, style=style, justify=justify, width=width, no_wrap=True, overflow="ellipsis")
+        return t
+
+    table = chunk(show_header=True)
+    for row in chain(sample, rows):
+        table.add_row(*row)
+        if table.row_count >= _STREAM_CHUNK:
+            console.print(table)
+            table = chunk(show_header=False)
+    if table.row_count or table.show_header:
+        console.print(table)
+
+
+def print_table(columns: list[tuple], rows: list, console: Optional[Console] = None) -> None:
+    """Print a table, streaming it when it has more than :data:`STREAM_THRESHOLD` rows.
+
+    Args:
+        columns: Column specs ``(label, style, justify)``.
+        rows: Rows of cells.
+        console: Target console (defaults to :func:`get_console`).
+    """
+    console = console or get_console()
+    if len(rows) > STREAM_THRESHOLD:
+        stream_table(columns, rows, console)
+    else:
+        console.print(make_table(title=None, columns=columns, rows=rows, expand=True))
+
+
 def metrics(data: dict[str, str]):
     """Render a row of equally-sized metric panels from a label→value dict."""
     console = get_console()
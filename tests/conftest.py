@@ -41,3 +41,9 @@ def _patch_config(tmp_path, monkeypatch):
     monkeypatch.setattr("oops.core.config._CONFIG_PATHS", [cfg_file])
     # Reset the lazy singleton so the next access triggers a fresh load.
     monkeypatch.setattr(config_module._LazyConfig, "_cfg", None)
+
+
+@pytest.fixture(autouse=True)
+def _isolate_user_cache(tmp_path, monkeypatch):
+    """Point the user cache (HTTP responses, image index) at a per-test directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
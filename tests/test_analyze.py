@@ -15,6 +15,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from click.testing import CliRunner
+from oops.commands.addons import analyze as analyze_module
 from oops.commands.addons.analyze import main
 from oops.core.models import Result
 from oops.kb.store import write_project_kb
@@ -450,11 +451,9 @@ class TestAnalyzeJson:
             models={"my_model.py": NEW_MODEL_SOURCE},
         )
         fake_loc = LocStats(python=120, xml=10, javascript=0, docs=5)
-        fake_addon = MagicMock()
-        fake_addon.path = str(module_path)
         with _mock_analyze(tmp_path, db_path), \
                 patch("oops.commands.addons.analyze.get_addon_loc", return_value=fake_loc), \
-                patch("oops.commands.addons.analyze.find_addons", return_value=[fake_addon]):
+                patch("oops.commands.addons.analyze.load_project_loc", return_value={"my_module": 0}):
             result = CliRunner().invoke(main, ["--format", "json", str(module_path)])
         assert result.exit_code == 0
         data = json.loads(result.output)
@@ -634,6 +633,8 @@ class TestAnalyzeJsonWarnings:
             "my_module",
             manifest={"name": "My Module", "depends": ["base"]},
         )
+        # Several modules: the single-module fast path skips the drift check.
+        other_path = _make_module_full(tmp_path, "other_module", manifest={"name": "Other", "depends": ["base"]})
         with patch("oops.commands.addons.analyze.require_repository") as mock_repo, \
                 patch("oops.commands.addons.analyze.require_project", return_value=MagicMock(major_version=17.0)), \
                 patch("oops.commands.addons.analyze.read_installed_modules") as mock_info, \
@@ -647,7 +648,7 @@ class TestAnalyzeJsonWarnings:
             mock_stale.return_value = (False, "")
             mock_drift.return_value = (["ghost_module"], [])
             mock_gkb.return_value = db_path
-            result = CliRunner().invoke(main, ["--format", "json", str(module_path)])
+            result = CliRunner().invoke(main, ["--format", "json", str(module_path), str(other_path)])
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert any("ghost_module" in w for w in data["warnings"])
@@ -670,6 +671,8 @@ class TestAnalyzeJsonWarnings:
             "my_module",
             manifest={"name": "My Module", "depends": ["base"]},
         )
+        # Several modules: the single-module fast path skips the drift check.
+        other_path = _make_module_full(tmp_path, "other_module", manifest={"name": "Other", "depends": ["base"]})
         with patch("oops.commands.addons.analyze.require_repository") as mock_repo, \
                 patch("oops.commands.addons.analyze.require_project", return_value=MagicMock(major_version=17.0)), \
                 patch("oops.commands.addons.analyze.read_installed_modules") as mock_info, \
@@ -685,7 +688,7 @@ class TestAnalyzeJsonWarnings:
             mock_stale.return_value = (False, "")
             mock_drift.return_value = ([], [])
             mock_gkb.return_value = db_path
-            result = CliRunner().invoke(main, ["--format", "json", str(module_path)])
+            result = CliRunner().invoke(main, ["--format", "json", str(module_path), str(other_path)])
 
         assert result.exit_code == 0
         assert mock_drift.call_count == 1
@@ -811,6 +814,114 @@ class TestAnalyzeMultiModule:
         assert "good_mod" in result.output
 
 
+class TestAnalyzeFastPath:
+    def _module(self, tmp_path: Path) -> Path:
+        return _make_module_full(
+            tmp_path,
+            "my_module",
+            manifest={"name": "My Module", "depends": ["base"]},
+            models={"my_model.py": NEW_MODEL_SOURCE},
+        )
+
+    def test_single_module_skips_project_checks(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "kb.db"
+        _make_kb(db_path)
+        module_path = self._module(tmp_path)
+        with _mock_analyze(tmp_path, db_path), patch(
+            "oops.commands.addons.analyze.read_installed_modules"
+        ) as mock_info, patch("oops.commands.addons.analyze.compute_root_drift") as mock_drift:
+            mock_info.return_value = type("I", (), {"modules": ["my_module"]})()
+            result = CliRunner().invoke(main, ["--format", "json", str(module_path)])
+        assert result.exit_code == 0, result.output
+        mock_drift.assert_not_called()
+
+    def test_loc_share_left_out_without_cached_count(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "kb.db"
+        _make_kb(db_path)
+        module_path = self._module(tmp_path)
+        with _mock_analyze(tmp_path, db_path), patch(
+            "oops.commands.addons.analyze.get_addon_loc", return_value=LocStats(python=10)
+        ):
+            result = CliRunner().invoke(main, ["--format", "json", str(module_path)])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["modules"][0]["loc"]["pct"] is None
+
+    def test_project_loc_recounts_and_caches(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "kb.db"
+        _make_kb(db_path)
+        module_path = self._module(tmp_path)
+        other = MagicMock(technical_name="other", path=str(tmp_path / "other"))
+        mine = MagicMock(technical_name="my_module", path=str(module_path))
+        loc = LocStats(python=30)
+        with _mock_analyze(tmp_path, db_path), patch(
+            "oops.commands.addons.analyze.get_addon_loc", return_value=loc
+        ), patch("oops.services.loc.get_addon_loc", return_value=loc), patch(
+            "oops.services.loc.find_addons", return_value=[mine, other]
+        ):
+            first = CliRunner().invoke(main, ["--format", "json", "--project-loc", str(module_path)])
+            # The next run reuses the cached count instead of recounting.
+            second = CliRunner().invoke(main, ["--format", "json", str(module_path)])
+        assert first.exit_code == 0, first.output
+        assert json.loads(first.output)["modules"][0]["loc"]["pct"] == 50.0
+        assert json.loads(second.output)["modules"][0]["loc"]["pct"] == 50.0
+        assert (tmp_path / ".oops-cache" / "loc.json").exists()
+
+    def test_refreshes_only_changed_closure(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "kb.db"
+        _make_kb(db_path, modules={"my_module": {"origin": "local", "depends": ["base"]}})
+        module_path = self._module(tmp_path)
+        with _mock_analyze(tmp_path, db_path), patch(
+            "oops.commands.addons.analyze.changed_project_modules", return_value=["my_module"]
+        ) as changed, patch(
+            "oops.commands.addons.analyze.refresh_project_kb", return_value=Result(data=["my_module"])
+        ) as refresh:
+            result = CliRunner().invoke(main, ["--format", "json", str(module_path)])
+        assert result.exit_code == 0, result.output
+        assert changed.call_args.args[1] == ["my_module", "base"]  # the module, then its depends
+        refresh.assert_called_once_with(tmp_path, ["my_module"])
+
+
+class TestAnalyzeJobs:
+    def _modules(self, tmp_path: Path) -> list[Path]:
+        return [
+            _make_module_full(
+                tmp_path, name, manifest={"name": name, "depends": ["base"]}, models={"my_model.py": source}
+            )
+            for name, source in (
+                ("mod_alpha", NEW_MODEL_SOURCE),
+                ("mod_beta", INHERIT_MODEL_SOURCE),
+                ("mod_gamma", NEW_MODEL_SOURCE),
+            )
+        ]
+
+    def test_parallel_ir_matches_serial(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "kb.db"
+        _make_kb(db_path, model_origins=[_kb_model_origin("res.partner", "base")])
+        args = [str(m) for m in self._modules(tmp_path)] + ["--format", "json"]
+
+        with _mock_analyze(tmp_path, db_path):
+            serial = CliRunner().invoke(main, args)
+            parallel = CliRunner().invoke(main, [*args, "--jobs", "2"])
+
+        assert serial.exit_code == 0 and parallel.exit_code == 0, parallel.output
+        # stderr notices (e.g. missing cloc) may precede the payload.
+        modules = json.loads(parallel.output[parallel.output.index("{") :])["modules"]
+        assert [m["module"] for m in modules] == ["mod_alpha", "mod_beta", "mod_gamma"]
+        assert modules == json.loads(serial.output[serial.output.index("{") :])["modules"]
+
+    def test_parallel_jsonl_keeps_module_order(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "kb.db"
+        _make_kb(db_path)
+        args = [str(m) for m in self._modules(tmp_path)] + ["--format", "jsonl", "-j", "3"]
+
+        with _mock_analyze(tmp_path, db_path):
+            result = CliRunner().invoke(main, args)
+
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in result.output.splitlines() if line.startswith("{")]
+        assert [r["module"] for r in records if r["record"] == "module"] == ["mod_alpha", "mod_beta", "mod_gamma"]
+
+
 # ---------------------------------------------------------------------------
 # TestAnalyzeSymlinks
 # ---------------------------------------------------------------------------
@@ -1640,3 +1751,118 @@ class TestAnalyzeAcceptanceV2:
         assert metrics["inherited_methods"] == sum(1 for m in methods if m["is_inherited"])
         assert metrics["own_fields"] == sum(1 for f in fields if f["origin_status"] in ("base", "new"))
         assert metrics["inherited_fields"] == sum(1 for f in fields if f["origin_status"] == "extended")
+
+
+# ---------------------------------------------------------------------------
+# TestAnalyzeJsonLines
+# ---------------------------------------------------------------------------
+
+
+class TestAnalyzeJsonLines:
+    def _records(self, output: str) -> list[dict]:
+        # stderr notices (e.g. missing cloc) may be mixed into CliRunner output.
+        return [json.loads(line) for line in output.splitlines() if line.startswith("{")]
+
+    def test_one_compact_record_per_line(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "kb.db"
+        _make_kb(db_path)
+        module_path = _make_module_full(
+            tmp_path,
+            "my_module",
+            manifest={"name": "My Module", "version": "17.0.1.0.0", "depends": ["base"]},
+            models={"my_model.py": NEW_MODEL_SOURCE},
+        )
+        with _mock_analyze(tmp_path, db_path):
+            result = CliRunner().invoke(main, ["--format", "jsonl", str(module_path)])
+        assert result.exit_code == 0
+        lines = [line for line in result.output.splitlines() if line.startswith("{")]
+        assert all(line.startswith('{"record":') for line in lines)
+        records = self._records(result.output)
+        assert records[0]["record"] == "metadata"
+        assert records[0]["schema_version"] == 2
+        assert records[-1] == {"record": "summary", "modules": 1, "warnings": []}
+        types = [r["record"] for r in records]
+        assert types.count("module") == 1
+        assert types.count("model") == 1
+        assert types.count("field") == 2
+        assert types.count("method") == 2
+
+    def test_records_match_json_payload(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "kb.db"
+        _make_kb(db_path)
+        m1 = _make_module_full(
+            tmp_path, "mod1", manifest={"name": "Mod1", "depends": ["base"]}, models={"my_model.py": NEW_MODEL_SOURCE}
+        )
+        m2 = _make_module_full(tmp_path, "mod2", manifest={"name": "Mod2", "depends": ["base"]})
+        with _mock_analyze(tmp_path, db_path):
+            as_json = CliRunner().invoke(main, ["--format", "json", str(m1), str(m2)])
+            as_jsonl = CliRunner().invoke(main, ["--format", "jsonl", str(m1), str(m2)])
+        assert as_json.exit_code == 0 and as_jsonl.exit_code == 0
+        modules = json.loads(as_json.output)["modules"]
+        records = self._records(as_jsonl.output)
+
+        for module in modules:
+            name = module["module"]
+            header = next(r for r in records if r["record"] == "module" and r["module"] == name)
+            for key in ("manifest", "metrics", "loc", "structure", "not_analysed", "warnings"):
+                assert header[key] == module[key]
+            for key, record_type in (("models", "model"), ("fields", "field"), ("methods", "method")):
+                nodes = [
+                    {k: v for k, v in r.items() if k not in ("record", "module")}
+                    for r in records
+                    if r["record"] == record_type and r["module"] == name
+                ]
+                assert nodes == module[key]
+
+    def test_output_path_written(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "kb.db"
+        _make_kb(db_path)
+        module_path = _make_module_full(tmp_path, "my_module", manifest={"name": "My Module", "depends": []})
+        out = tmp_path / "out.jsonl"
+        with _mock_analyze(tmp_path, db_path):
+            result = CliRunner().invoke(main, ["--format", "jsonl", "--output-path", str(out), str(module_path)])
+        assert result.exit_code == 0
+        records = self._records(out.read_text(encoding="utf-8"))
+        assert [r["record"] for r in records] == ["metadata", "module", "summary"]
+
+
+# ---------------------------------------------------------------------------
+# TestAnalyzeWatch — --watch re-analyses only the touched modules
+# ---------------------------------------------------------------------------
+
+
+class TestAnalyzeWatch:
+    def test_touched_module_is_reanalysed_and_rerendered(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "kb.db"
+        _make_kb(db_path)
+        m1 = _make_module_full(tmp_path, "mod1", manifest={"name": "Mod1", "depends": ["base"]})
+        m2 = _make_module_full(tmp_path, "mod2", manifest={"name": "Mod2", "depends": ["base"]})
+        out = tmp_path / "out.json"
+
+        def one_change(modules):
+            (m2 / "__manifest__.py").write_text("{'name': 'Renamed', 'depends': ['base']}")
+            yield [m2.resolve()]
+
+        refreshed = Result()
+        refreshed.data = ["mod2"]
+        with _mock_analyze(tmp_path, db_path), patch(
+            "oops.commands.addons.analyze.watch_modules", side_effect=one_change
+        ), patch("oops.commands.addons.analyze.refresh_modules", return_value=refreshed) as refresh, patch(
+            "oops.commands.addons.analyze._analyse_module", wraps=analyze_module._analyse_module
+        ) as analyse:
+            result = CliRunner().invoke(
+                main, ["--format", "json", "--output-path", str(out), "--watch", str(m1), str(m2)]
+            )
+
+        assert result.exit_code == 0, result.output
+        assert [c.args[0].name for c in analyse.call_args_list] == ["mod1", "mod2", "mod2"]
+        assert refresh.call_args.args[1] == [m2.resolve()]
+        data = json.loads(out.read_text(encoding="utf-8"))
+        assert [m["manifest"]["name"] for m in data["modules"]] == ["Mod1", "Renamed"]
+        assert "mod2 updated in" in result.output
+
+    @pytest.mark.parametrize("args", [["--format", "jsonl"], ["--format", "html"]])
+    def test_rejected_formats(self, tmp_path: Path, args: list) -> None:
+        result = CliRunner().invoke(main, ["--watch", *args, str(tmp_path)])
+
+        assert result.exit_code == 2
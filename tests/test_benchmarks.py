@@ -0,0 +1,115 @@
+"""Tests for the benchmarks package: generator determinism, comparison logic,
+and (opt-in, ``pytest -m bench``) the regression run against the baseline."""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from benchmarks.generator import TreeSpec, generate_tree
+from benchmarks.memory import measure_memory
+from benchmarks.runner import BASELINE_PATH, compare, load_results, run_benchmarks
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.startup import measure_startup
+
+SMALL = TreeSpec(core_modules=3, local_modules=2, submodules=1, modules_per_submodule=4, models_per_module=2)
+
+
+def _digest(root: Path) -> str:
+    h = hashlib.sha256()
+    for dirpath, dirnames, filenames in sorted(os.walk(root)):
+        dirnames.sort()
+        for name in sorted(filenames):
+            path = Path(dirpath) / name
+            h.update(str(path.relative_to(root)).encode())
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+class TestGenerator:
+    def test_same_spec_yields_identical_trees(self, tmp_path):
+        a = generate_tree(tmp_path / "a", SMALL)
+        b = generate_tree(tmp_path / "b", SMALL)
+        assert _digest(a.root) == _digest(b.root)
+
+    def test_seed_changes_content(self, tmp_path):
+        a = generate_tree(tmp_path / "a", SMALL)
+        b = generate_tree(tmp_path / "b", TreeSpec(**{**SMALL.__dict__, "seed": 99}))
+        assert _digest(a.root) != _digest(b.root)
+
+    def test_layout(self, tmp_path):
+        tree = generate_tree(tmp_path / "t", SMALL)
+
+        assert len(tree.modules) == 3 + 4 + 2
+        assert [p.name for p in tree.symlinks] == ["sub_0_mod_0", "sub_0_mod_1"]
+        assert all(p.is_symlink() and (p / "__manifest__.py").is_file() for p in tree.symlinks)
+        assert '[submodule "sub_0"]' in (tree.root / ".gitmodules").read_text()
+        assert tree.installed == sorted(["local_0", "local_1", "sub_0_mod_0", "sub_0_mod_1"])
+
+    def test_modules_extend_their_dependencies(self, tmp_path):
+        tree = generate_tree(tmp_path / "t", SMALL)
+        sources = "".join(p.read_text() for m in tree.modules[1:] for p in (m / "models").glob("model_*.py"))
+        assert "_inherit = " in sources
+        assert "super().write(vals)" in sources
+
+
+class TestScenarios:
+    def test_every_scenario_runs(self, tmp_path):
+        results = run_benchmarks(spec=SMALL, repeat=1, workdir=tmp_path)
+
+        assert set(results["scenarios"]) == set(SCENARIOS)
+        for entry in results["scenarios"].values():
+            assert entry["runs"] == 1
+            assert entry["normalized"] >= 0
+
+
+class TestMemory:
+    @pytest.mark.skipif(sys.platform == "win32", reason="resource is Unix only")
+    def test_measures_a_global_build(self, tmp_path):
+        usage = measure_memory(SMALL, workdir=tmp_path)
+
+        assert usage["modules"] == SMALL.core_modules
+        assert usage["symbols"] > 0
+        assert usage["peak_rss_mb"] >= usage["import_rss_mb"] > 0
+
+
+class TestStartup:
+    def test_hooks_skip_gitpython(self, tmp_path):
+        timings = measure_startup(["oops-check-manifest", "oops-check-submodules"], repeat=1, workdir=tmp_path)
+
+        manifest, submodules = timings["hooks"]["oops-check-manifest"], timings["hooks"]["oops-check-submodules"]
+        assert manifest["wall_ms"] >= manifest["import_ms"] > 0
+        assert manifest["gitpython"] is False
+        assert submodules["gitpython"] is True  # needs the submodule list
+
+
+class TestCompare:
+    def _results(self, **normalized):
+        return {"scenarios": {k: {"normalized": v} for k, v in normalized.items()}}
+
+    def test_flags_only_slowdowns_beyond_tolerance(self):
+        baseline = self._results(fast=1.0, slow=1.0)
+        current = self._results(fast=1.4, slow=1.6)
+
+        regressions = compare(current, baseline, tolerance=0.5)
+
+        assert [r.name for r in regressions] == ["slow"]
+        assert regressions[0].ratio == pytest.approx(1.6)
+
+    def test_per_scenario_tolerance_and_missing_entries(self):
+        baseline = {"scenarios": {"noisy": {"normalized": 1.0, "tolerance": 2.0}}}
+        current = self._results(noisy=2.5, new=10.0)
+
+        assert compare(current, baseline, tolerance=0.5) == []
+
+
+@pytest.mark.bench
+def test_no_regression_against_baseline(tmp_path):
+    baseline = load_results(BASELINE_PATH)
+    spec = TreeSpec(**baseline["spec"])
+
+    results = run_benchmarks(spec=spec, workdir=tmp_path)
+
+    regressions = compare(results, baseline)
+    assert not regressions, "\n".join(str(r) for r in regressions)
@@ -0,0 +1,254 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: test_cache.py — tests/test_cache.py
+
+"""Tests for oops.core.cache and the oops cache commands."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+
+import pytest
+from click.testing import CliRunner
+from oops.commands.cache.clear import main as clear_main
+from oops.commands.cache.prune import main as prune_main
+from oops.commands.cache.show import main as show_main
+from oops.core.cache import CacheIndex, maybe_housekeep, parse_size, record_access
+from oops.core.config import config
+from oops.core.paths import cache_housekeeping_marker, global_kb_dir, http_cache_dir, kb_artifacts_dir
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Isolate every cache root (``~/.cache/oops/kb`` follows ``$HOME``)."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    return tmp_path
+
+
+def _file(path, size, age=0.0):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+def _aged(index, path, age):
+    """Backdate the recorded last access of an entry."""
+    index._con.execute("UPDATE entries SET last_access = ? WHERE path = ?", (time.time() - age, str(path)))
+
+
+class TestParseSize:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (1024, 1024),
+            ("512", 512),
+            ("1K", 1024),
+            ("1.5M", 1536 * 1024),
+            ("10G", 10 << 30),
+            ("2GiB", 2 << 30),
+            ("1 mb", 1 << 20),
+        ],
+    )
+    def test_units(self, value, expected):
+        assert parse_size(value) == expected
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Invalid size"):
+            parse_size("lots")
+
+
+class TestCacheIndex:
+    def test_record_tracks_size_access_and_counters(self, home):
+        kb = _file(global_kb_dir() / "17.0.db", 100)
+
+        record_access(kb, "kb-global", hit=True)
+        record_access(kb, "kb-global", hit=True)
+        record_access(global_kb_dir() / "18.0.db", "kb-global", hit=False)
+
+        with CacheIndex() as index:
+            [entry] = index.entries()
+            assert (entry.path, entry.owner, entry.size, entry.pinned) == (str(kb), "kb-global", 100, False)
+            assert time.time() - entry.last_access < 5
+            assert index.counters() == {"kb-global": (2, 1)}
+
+    def test_paths_outside_the_owner_root_only_count(self, home):
+        shared = _file(home / "shared" / "abc.tar.gz", 10)
+
+        record_access(shared, "kb-artifacts", hit=True)
+
+        with CacheIndex() as index:
+            assert index.entries() == []
+            assert index.counters() == {"kb-artifacts": (1, 0)}
+
+    def test_scan_discovers_measures_and_forgets(self, home):
+        body = _file(http_cache_dir() / "k1.body", 50, age=3600)
+        _file(http_cache_dir() / "k1.meta.json", 5)
+        artifact = _file(kb_artifacts_dir() / "key.tar.gz", 30)
+        project = _file(home / "repo" / ".oops-cache" / "kb.db", 20)
+        record_access(project, "kb-project")
+
+        with CacheIndex() as index:
+            index.scan()
+            by_path = {e.path: e for e in index.entries()}
+            assert by_path[str(body)].size == 55  # companion metadata included
+            assert by_path[str(body)].last_access == pytest.approx(time.time() - 3600, abs=5)
+            assert set(by_path) == {str(body), str(artifact), str(project)}
+
+            artifact.unlink()
+            project.unlink()
+            index.scan()
+            assert [e.path for e in index.entries()] == [str(body)]
+
+    def test_evicts_least_recently_used_first(self, home):
+        old = _file(global_kb_dir() / "16.0.db", 100)
+        mid = _file(kb_artifacts_dir() / "a.tar.gz", 100)
+        new = _file(http_cache_dir() / "k.body", 100)
+        with CacheIndex() as index:
+            index.scan()
+            for path, age in ((old, 3000), (mid, 2000), (new, 1000)):
+                _aged(index, path, age)
+
+            evicted = index.evict(150)
+
+            assert [e.path for e in evicted] == [str(old), str(mid)]
+            assert not old.exists() and not mid.exists() and new.exists()
+            assert index.total_size() == 100
+
+    def test_recent_entries_and_pinned_owners_are_kept(self, home, monkeypatch):
+        sources = home / "sources"
+        monkeypatch.setattr(config.odoo, "sources_dir", sources)
+        checkout = _file(sources / "17.0" / "community" / "setup.py", 500, age=10000).parent.parent
+        recent = _file(global_kb_dir() / "17.0.db", 100)
+        with CacheIndex() as index:
+            index.scan(deep=True)
+
+            assert index.evict(0) == []
+            assert recent.exists() and checkout.exists()
+            assert index.total_size(pinned=True) == 500
+
+    def test_dry_run_removes_nothing(self, home):
+        kb = _file(global_kb_dir() / "17.0.db", 100)
+        with CacheIndex() as index:
+            index.scan()
+            _aged(index, kb, 3600)
+
+            assert len(index.evict(0, dry_run=True)) == 1
+            assert kb.exists() and len(index.entries()) == 1
+
+    def test_concurrent_recorders(self, home):
+        kb = _file(global_kb_dir() / "17.0.db", 10)
+        threads = [
+            threading.Thread(target=lambda: [record_access(kb, "kb-global", hit=True) for _ in range(20)])
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with CacheIndex() as index:
+            assert index.counters() == {"kb-global": (80, 0)}
+            assert len(index.entries()) == 1
+
+
+class TestHousekeeping:
+    def _config(self, monkeypatch, max_size):
+        monkeypatch.setattr(config.cache, "max_size", max_size)
+
+    def test_evicts_over_budget_once_per_interval(self, home, monkeypatch):
+        self._config(monkeypatch, "150")
+        first = _file(global_kb_dir() / "16.0.db", 100, age=3600)
+        _file(global_kb_dir() / "17.0.db", 100, age=1800)
+
+        maybe_housekeep()
+        assert not first.exists()
+
+        second = _file(global_kb_dir() / "15.0.db", 100, age=7200)
+        maybe_housekeep()  # not due again yet
+        assert second.exists()
+
+    def test_no_budget_no_housekeeping(self, home, monkeypatch):
+        self._config(monkeypatch, None)
+        kb = _file(global_kb_dir() / "16.0.db", 100, age=3600)
+
+        maybe_housekeep()
+
+        assert kb.exists()
+        assert not cache_housekeeping_marker().exists()
+
+
+class TestCacheCommands:
+    def _payload(self, result):
+        assert result.exit_code == 0, result.output
+        return json.loads(result.output[result.output.index("{") :])
+
+    def test_show_summarises_every_owner(self, home):
+        kb = _file(global_kb_dir() / "17.0.db", 100)
+        record_access(kb, "kb-global", hit=True)
+        record_access(kb, "kb-global", hit=False)
+
+        payload = self._payload(CliRunner().invoke(show_main, ["--format", "json"]))
+
+        owners = {row["owner"]: row for row in payload["owners"]}
+        assert {"kb-global", "kb-project", "kb-artifacts", "http", "images", "sources", "stats"} <= set(owners)
+        assert owners["kb-global"]["entries"] == 1 and owners["kb-global"]["hit_rate"] == 0.5
+        assert owners["sources"]["pinned"]
+        assert payload["size"] == 100 and payload["entries"] is None
+
+    def test_show_lists_entries_of_an_owner(self, home):
+        _file(global_kb_dir() / "17.0.db", 100)
+        _file(http_cache_dir() / "k.body", 10)
+
+        payload = self._payload(CliRunner().invoke(show_main, ["--owner", "http", "--format", "json"]))
+
+        assert [row["owner"] for row in payload["entries"]] == ["http"]
+
+    def test_show_text(self, home):
+        result = CliRunner().invoke(show_main, [])
+
+        assert result.exit_code == 0, result.output
+        assert "kb-global" in result.output and "(pinned)" in result.output
+
+    def test_prune(self, home):
+        kb = _file(global_kb_dir() / "16.0.db", 100, age=3600)
+
+        dry = self._payload(CliRunner().invoke(prune_main, ["--max-size", "0", "--dry-run", "--format", "json"]))
+        assert dry["freed"] == 100 and kb.exists()
+
+        done = self._payload(CliRunner().invoke(prune_main, ["--max-size", "0", "--format", "json"]))
+        assert done["freed"] == 100 and not kb.exists()
+
+    def test_prune_needs_a_budget(self, home):
+        result = CliRunner().invoke(prune_main, [])
+
+        assert result.exit_code == 2
+        assert "No size budget" in result.output
+
+    def test_clear_ignores_the_grace_period(self, home):
+        kb = _file(global_kb_dir() / "17.0.db", 100)
+        body = _file(http_cache_dir() / "k.body", 10)
+        record_access(kb, "kb-global", hit=True)
+
+        payload = self._payload(
+            CliRunner().invoke(clear_main, ["--owner", "kb-global", "--counters", "--yes", "--format", "json"])
+        )
+
+        assert [row["path"] for row in payload["evicted"]] == [str(kb)]
+        assert not kb.exists() and body.exists()
+        with CacheIndex() as index:
+            assert index.counters() == {}
+
+    def test_clear_asks_first(self, home):
+        kb = _file(global_kb_dir() / "17.0.db", 100)
+
+        result = CliRunner().invoke(clear_main, [], input="n\n")
+
+        assert result.exit_code == 1
+        assert kb.exists()
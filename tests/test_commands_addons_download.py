@@ -0,0 +1,161 @@
+"""Tests for `oops addons download` (blobless sparse clone, hardlinked
+materialization), utils.net.sparse_clone and io.file.clone_file, using
+file:// bare repositories as the upstream."""
+
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+from oops.commands.addons.download import main
+from oops.utils.net import sparse_clone
+
+
+def _git(*args, cwd=None):
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def upstream(tmp_path):
+    """file:// URL of a bare repo (branch 17.0) with addons a, b and c; c ships a binary."""
+    work = tmp_path / "upstream-work"
+    for name in ("a", "b", "c"):
+        (work / name).mkdir(parents=True)
+        (work / name / "__manifest__.py").write_text(f"{{'name': '{name}', 'version': '17.0.1.0.0'}}\n")
+        (work / name / "__init__.py").write_text("")
+    (work / "c" / "static").mkdir()
+    (work / "c" / "static" / "blob.bin").write_bytes(os.urandom(200_000))
+    (work / "c" / "static" / "a").mkdir()  # same name as addon a, nested
+    (work / "c" / "static" / "a" / "icon.png").write_bytes(b"png")
+    (work / "a" / "run.sh").write_text("#!/bin/sh\n")
+    (work / "a" / "run.sh").chmod(0o755)
+    _git("init", "-q", "-b", "17.0", cwd=work)
+    _git("add", ".", cwd=work)
+    _git("commit", "-qm", "init", cwd=work)
+
+    bare = tmp_path / "upstream.git"
+    _git("clone", "-q", "--bare", str(work), str(bare))
+    _git("config", "uploadpack.allowFilter", "true", cwd=bare)
+    return bare.as_uri()
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    root = tmp_path / "project"
+    root.mkdir()
+    _git("init", "-q", "-b", "main", cwd=root)
+    (root / "README.md").write_text("project\n")
+    _git("add", ".", cwd=root)
+    _git("commit", "-qm", "init", cwd=root)
+    monkeypatch.chdir(root)
+    return root
+
+
+def _missing_blobs(repo: Path) -> set:
+    out = _git("rev-list", "--objects", "--all", "--missing=print", cwd=repo)
+    return {line[1:] for line in out.splitlines() if line.startswith("?")}
+
+
+class TestSparseCloneBlobless:
+    def test_only_selected_paths_are_fetched(self, upstream, tmp_path):
+        dest = tmp_path / "clone"
+        sparse_clone(upstream, dest, ["/a/"], "17.0")
+
+        assert (dest / "a" / "__manifest__.py").is_file()
+        assert not (dest / "c").exists()  # c/static/a/ is not matched by /a/
+        skipped = {_git("rev-parse", f"HEAD:{path}", cwd=dest) for path in ("b/__manifest__.py", "c/static/blob.bin")}
+        assert skipped <= _missing_blobs(dest)
+
+    def test_full_blobs_without_filter(self, upstream, tmp_path):
+        dest = tmp_path / "clone"
+        sparse_clone(upstream, dest, ["/a/"], "17.0", blobless=False)
+
+        assert _missing_blobs(dest) == set()
+
+
+class TestCloneFile:
+    def test_hardlink_shares_inode(self, tmp_path):
+        from oops.io.file import clone_file
+
+        src = tmp_path / "src.txt"
+        src.write_text("data")
+
+        assert clone_file(src, tmp_path / "dst.txt", hardlink=True) == "hardlink"
+        assert (tmp_path / "dst.txt").stat().st_ino == src.stat().st_ino
+
+    def test_falls_back_to_copy_preserving_mode_and_mtime(self, tmp_path):
+        from oops.io.file import clone_file
+
+        src = tmp_path / "run.sh"
+        src.write_text("#!/bin/sh\n")
+        src.chmod(0o750)
+        os.utime(src, (1_600_000_000, 1_600_000_000))
+        dst = tmp_path / "copy.sh"
+
+        with patch("oops.io.file.os.link", side_effect=OSError("cross-device")):
+            method = clone_file(src, dst, hardlink=True)
+
+        assert method in {"reflink", "copy_file_range", "copy"}
+        assert dst.read_text() == "#!/bin/sh\n"
+        assert dst.stat().st_ino != src.stat().st_ino
+        assert dst.stat().st_mode & 0o777 == 0o750
+        assert dst.stat().st_mtime == 1_600_000_000
+
+    def test_plain_buffered_copy_when_kernel_paths_fail(self, tmp_path):
+        from oops.io.file import clone_file
+
+        src = tmp_path / "a.bin"
+        src.write_bytes(os.urandom(10_000))
+        with patch("oops.io.file._reflink", return_value=False), patch(
+            "oops.io.file._copy_file_range", return_value=False
+        ):
+            assert clone_file(src, tmp_path / "b.bin") == "copy"
+        assert (tmp_path / "b.bin").read_bytes() == src.read_bytes()
+
+
+class TestDownloadCommand:
+    def _invoke(self, upstream, *args):
+        with patch("oops.commands.addons.download.encode_url", return_value=upstream):
+            return CliRunner().invoke(main, [upstream, "17.0", "--no-exclude", *args])
+
+    def test_sparse_download_of_selected_addons(self, upstream, project):
+        with patch("oops.commands.addons.download.sparse_clone", wraps=sparse_clone) as spy:
+            result = self._invoke(upstream, "--addons", "a")
+
+        assert result.exit_code == 0, result.output
+        assert spy.call_args[0][2] == ["/a/"]
+        assert spy.call_args[0][1].parent == project / ".git"  # outside the worktree
+        assert (project / "a" / "__manifest__.py").is_file()
+        assert os.access(project / "a" / "run.sh", os.X_OK)
+        assert not (project / "b").exists() and not (project / "c").exists()
+        assert not list((project / ".git").glob("oops-download-*"))
+        assert _git("status", "--porcelain", cwd=project) == "?? a/"
+
+    def test_missing_addon_is_reported(self, upstream, project):
+        result = self._invoke(upstream, "--addons", "a,zzz")
+
+        assert result.exit_code == 0, result.output
+        assert "zzz" in result.output
+        assert (project / "a").is_dir()
+
+    def test_no_sparse_clones_everything(self, upstream, project):
+        with patch("oops.commands.addons.download.sparse_clone") as spy:
+            result = self._invoke(upstream, "--addons", "c", "--no-sparse")
+
+        assert result.exit_code == 0, result.output
+        spy.assert_not_called()
+        assert (project / "c" / "static" / "blob.bin").stat().st_size == 200_000
+
+    def test_all_addons_without_selection(self, upstream, project):
+        result = self._invoke(upstream)
+
+        assert result.exit_code == 0, result.output
+        assert all((project / name / "__manifest__.py").is_file() for name in ("a", "b", "c"))
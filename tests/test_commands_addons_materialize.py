@@ -0,0 +1,128 @@
+"""Tests for `oops addons materialize` and the pooled copy engine behind it
+(oops.io.file.copytree / CopyStats)."""
+
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+from oops.commands.addons.materialize import main
+from oops.io.file import CopyStats, copytree
+
+
+def _addon(root, name, payload=b""):
+    (root / name / "static").mkdir(parents=True)
+    (root / name / "__manifest__.py").write_text(f"{{'name': '{name}'}}\n")
+    (root / name / "static" / "blob.bin").write_bytes(payload or os.urandom(50_000))
+    return root / name
+
+
+class TestCopytree:
+    def test_preserves_modes_mtimes_and_links(self, tmp_path):
+        src = _addon(tmp_path, "a")
+        (src / "run.sh").write_text("#!/bin/sh\n")
+        (src / "run.sh").chmod(0o750)
+        os.utime(src / "run.sh", (1_600_000_000, 1_600_000_000))
+        os.utime(src / "static", (1_500_000_000, 1_500_000_000))
+        (src / "link.py").symlink_to("__manifest__.py")
+        (src / ".git").mkdir()
+        (src / ".git" / "HEAD").write_text("ref\n")
+
+        stats = copytree(src, tmp_path / "b")
+
+        dst = tmp_path / "b"
+        assert stats.files == 3
+        assert stats.bytes == sum((src / p).stat().st_size for p in ("__manifest__.py", "run.sh", "static/blob.bin"))
+        assert sum(stats.methods.values()) == 3
+        assert (dst / "run.sh").stat().st_mode & 0o777 == 0o750
+        assert (dst / "run.sh").stat().st_mtime == 1_600_000_000
+        assert (dst / "static").stat().st_mtime == 1_500_000_000
+        assert os.readlink(dst / "link.py") == "__manifest__.py"
+        assert not (dst / ".git").exists()
+
+    def test_cloned_and_copied_bytes(self, tmp_path):
+        src = _addon(tmp_path, "a", payload=b"x" * 1000)
+
+        linked = copytree(src, tmp_path / "linked", hardlink=True)
+        with patch("oops.io.file._reflink", return_value=False), patch(
+            "oops.io.file._copy_file_range", return_value=False
+        ):
+            copied = copytree(src, tmp_path / "copied")
+
+        assert linked.methods == {"hardlink": 2}
+        assert linked.cloned_bytes == linked.bytes
+        assert copied.methods == {"copy": 2}
+        assert copied.cloned_bytes == 0
+
+    def test_existing_destination_is_refused(self, tmp_path):
+        src = _addon(tmp_path, "a")
+        (tmp_path / "b").mkdir()
+
+        with pytest.raises(FileExistsError):
+            copytree(src, tmp_path / "b")
+
+    def test_merge(self):
+        total = CopyStats()
+        a, b = CopyStats(), CopyStats()
+        a.add("reflink", 10)
+        b.add("copy", 5)
+        b.add("reflink", 1)
+
+        total.merge(a)
+        total.merge(b)
+
+        assert (total.files, total.bytes, total.cloned_bytes) == (3, 16, 11)
+        assert total.methods == {"reflink": 2, "copy": 1}
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A git repository whose root holds symlinks to three vendored addons."""
+    vendor = tmp_path / "vendor"
+    for name in ("a", "b", "c"):
+        _addon(vendor, name)
+    root = tmp_path / "project"
+    root.mkdir()
+    for name in ("a", "b", "c"):
+        (root / name).symlink_to(vendor / name)
+    (root / "README.md").write_text("project\n")
+    for args in (["init", "-q", "-b", "main"], ["add", "README.md"], ["commit", "-qm", "init"]):
+        subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], cwd=root, check=True)
+    monkeypatch.chdir(root)
+    return root
+
+
+class TestMaterializeCommand:
+    def test_parallel_materialize(self, project):
+        with patch("oops.commands.addons.materialize.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            result = CliRunner().invoke(main, ["--jobs", "2", "--no-commit"])
+
+        assert result.exit_code == 0, result.output
+        assert pool.call_args.kwargs["max_workers"] == 2
+        for name in ("a", "b", "c"):
+            assert not (project / name).is_symlink()
+            assert (project / name / "static" / "blob.bin").stat().st_size == 50_000
+        assert "Cloned" in result.output and "Copied" in result.output
+
+    def test_failures_are_reported_per_addon(self, project):
+        (project / "b").unlink()
+        (project / "b").symlink_to(project.parent / "missing")
+
+        result = CliRunner().invoke(main, ["--no-commit"])
+
+        assert result.exit_code != 0
+        assert "Failed to materialize b" in result.output
+        assert not (project / "a").is_symlink() and not (project / "c").is_symlink()
+
+    def test_dry_run_copies_nothing(self, project):
+        result = CliRunner().invoke(main, ["--dry-run"])
+
+        assert result.exit_code == 0, result.output
+        assert all((project / name).is_symlink() for name in ("a", "b", "c"))
+
+    def test_jobs_must_be_positive(self, project):
+        result = CliRunner().invoke(main, ["--jobs", "0"])
+
+        assert result.exit_code == 2
@@ -0,0 +1,126 @@
+"""Tests for `oops misc batch` and oops.services.batch (per-project runs in
+a worker pool, aggregated JSON report)."""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from oops.commands.misc.batch import main
+from oops.services.batch import resolve_command, run_batch, supports_json
+
+
+def _project(root, name, version="apik/odoo:18.0-20250101-enterprise"):
+    path = root / name
+    path.mkdir()
+    (path / "requirements.txt").write_text("")
+    (path / "packages.txt").write_text("")
+    (path / "odoo_version.txt").write_text(version + "\n")
+    for args in (["init", "-q", "-b", "main"], ["add", "."], ["commit", "-qm", "init"]):
+        subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], cwd=path, check=True)
+    return path
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    root = tmp_path / "ws"
+    root.mkdir()
+    for name in ("alpha", "beta", "gamma"):
+        _project(root, name)
+    (root / "not-a-project").mkdir()
+    return root
+
+
+def _report(output: str) -> dict:
+    return json.loads(output[output.index("{") :])
+
+
+class TestResolveCommand:
+    def test_group_and_command(self):
+        cmd, path = resolve_command(["project", "check", "--strict"])
+
+        assert path == ["project", "check"]
+        assert supports_json(cmd)
+
+    def test_command_without_json(self):
+        cmd, _ = resolve_command(["manifest", "check"])
+
+        assert cmd is not None and not supports_json(cmd)
+
+    @pytest.mark.parametrize("args", [["project"], ["nope", "check"]])
+    def test_unknown_or_incomplete(self, args):
+        assert resolve_command(args)[0] is None
+
+
+class TestRunBatch:
+    def test_sequential_runs_keep_cwd(self, workspace):
+        cwd = os.getcwd()
+        projects = sorted(p for p in workspace.iterdir() if (p / ".git").exists())
+
+        rows = run_batch(projects, ["project", "check", "--format", "json"], jobs=1)
+
+        assert os.getcwd() == cwd
+        assert [r["project"] for r in rows] == ["alpha", "beta", "gamma"]
+        assert all(r["exit_code"] == 0 and r["payload"]["errors"] == [] for r in rows)
+        assert all(r["duration_ms"] >= 0 for r in rows)
+
+    def test_worker_pool(self, workspace):
+        projects = sorted(p for p in workspace.iterdir() if (p / ".git").exists())
+
+        rows = run_batch(projects, ["project", "check", "--format", "json"], jobs=2)
+
+        assert [r["project"] for r in rows] == ["alpha", "beta", "gamma"]
+        assert all(r["payload"]["metadata"]["project_name"] == r["project"] for r in rows)
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_each_project_uses_its_own_config(self, workspace, tmp_path, monkeypatch, jobs):
+        # Only the project-local .oops.yaml, resolved against the working directory.
+        monkeypatch.setattr("oops.core.config._CONFIG_PATHS", [Path(".oops.yaml")])
+        base = (tmp_path / ".oops.yaml").read_text()
+        (workspace / "alpha" / ".oops.yaml").write_text(base)
+        strict = "project:\n  mandatory_files: [requirements.txt, odoo_version.txt, packages.txt, CHANGELOG.md]\n"
+        (workspace / "beta" / ".oops.yaml").write_text(base + strict)
+
+        rows = run_batch([workspace / "alpha", workspace / "beta"], ["project", "check", "--format", "json"], jobs=jobs)
+
+        codes = {r["project"]: r["exit_code"] for r in rows}
+        assert codes["alpha"] == 0, rows
+        assert codes["beta"] == 1
+        assert rows[1]["payload"]["errors"] == ["Mandatory file is missing: CHANGELOG.md"]
+
+
+class TestBatchCommand:
+    def test_aggregated_json_report(self, workspace):
+        result = CliRunner().invoke(
+            main, ["--working-dir", str(workspace), "-j", "1", "--format", "json", "project", "check"]
+        )
+
+        assert result.exit_code == 0, result.output
+        report = _report(result.output)
+        assert report["args"] == ["project", "check", "--format", "json"]
+        assert [p["project"] for p in report["projects"]] == ["alpha", "beta", "gamma"]
+
+    def test_failure_in_one_project_fails_the_batch(self, workspace):
+        (workspace / "beta" / "odoo_version.txt").write_text("garbage\n")
+
+        result = CliRunner().invoke(
+            main, ["--working-dir", str(workspace), "-j", "1", "--format", "json", "project", "check"]
+        )
+
+        assert result.exit_code == 1
+        codes = {p["project"]: p["exit_code"] for p in _report(result.output)["projects"]}
+        assert codes["alpha"] == 0 and codes["beta"] != 0
+
+    def test_text_output_for_commands_without_json(self, workspace):
+        result = CliRunner().invoke(main, ["--working-dir", str(workspace), "-j", "1", "manifest", "check"])
+
+        assert result.exit_code == 0, result.output
+        assert "alpha" in result.output and "passed in 3 project(s)" in result.output
+
+    @pytest.mark.parametrize("args", [["nope"], ["misc", "batch", "project", "check"]])
+    def test_rejected_commands(self, workspace, args):
+        result = CliRunner().invoke(main, ["--working-dir", str(workspace), *args])
+
+        assert result.exit_code == 2
@@ -1,9 +1,23 @@
+import marshal
+import os
+import time
 from dataclasses import dataclass, field
+from datetime import date
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+import yaml
 from oops.core.compat import List
-from oops.core.config import _MISSING, Config, ConfigurationError, _apply, _is_list_of_path, load_config
+from oops.core.config import (
+    _MISSING,
+    Config,
+    ConfigurationError,
+    _apply,
+    _compiled_path,
+    _is_list_of_path,
+    load_config,
+)
 
 # ---------------------------------------------------------------------------
 # _is_list_of_path
@@ -160,3 +174,83 @@ class TestLoadConfig:
         monkeypatch.setattr("oops.core.config._CONFIG_PATHS", [missing])
         with pytest.raises(ConfigurationError, match="No config file found"):
             load_config()
+
+
+# ---------------------------------------------------------------------------
+# Compiled config cache
+# ---------------------------------------------------------------------------
+
+
+def _settled(path, text, age=60):
+    """Write *text* with an mtime old enough to be cached."""
+    path.write_text(text)
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+class TestCompiledConfig:
+    def test_warm_load_skips_yaml(self, tmp_path, monkeypatch):
+        local = _settled(tmp_path / ".oops.yaml", REQUIRED_YAML + "submodules:\n  force_scheme: https\n")
+        monkeypatch.setattr("oops.core.config._CONFIG_PATHS", [local])
+        load_config()
+
+        with patch("yaml.safe_load", side_effect=AssertionError("YAML parsed")):
+            cfg = load_config()
+
+        assert cfg.submodules.force_scheme == "https"
+        assert cfg.submodules.current_path == Path(".third-party")
+
+    def test_edit_invalidates(self, tmp_path, monkeypatch):
+        local = _settled(tmp_path / ".oops.yaml", REQUIRED_YAML + "submodules:\n  force_scheme: https\n")
+        monkeypatch.setattr("oops.core.config._CONFIG_PATHS", [local])
+        load_config()
+
+        _settled(local, REQUIRED_YAML + "submodules:\n  force_scheme: ssh\n", age=30)
+
+        assert load_config().submodules.force_scheme == "ssh"
+
+    def test_new_local_file_invalidates(self, tmp_path, monkeypatch):
+        global_file = _settled(tmp_path / "global.yaml", REQUIRED_YAML)
+        local_file = tmp_path / "local.yaml"
+        monkeypatch.setattr("oops.core.config._CONFIG_PATHS", [global_file, local_file])
+        load_config()
+
+        _settled(local_file, "submodules:\n  force_scheme: https\n")
+
+        assert load_config().submodules.force_scheme == "https"
+
+    def test_recently_modified_files_are_not_cached(self, tmp_path, monkeypatch):
+        local = tmp_path / ".oops.yaml"
+        local.write_text(REQUIRED_YAML)
+        monkeypatch.setattr("oops.core.config._CONFIG_PATHS", [local])
+        load_config()
+
+        assert not _compiled_path().exists()
+
+    def test_non_core_values_are_not_cached(self, tmp_path, monkeypatch):
+        local = _settled(tmp_path / ".oops.yaml", REQUIRED_YAML + "sync:\n  branch: 2026-01-01\n")
+        monkeypatch.setattr("oops.core.config._CONFIG_PATHS", [local])
+
+        assert load_config().sync.branch == date(2026, 1, 1)
+        assert not _compiled_path().exists()
+
+    def test_corrupt_cache_is_rebuilt(self, tmp_path, monkeypatch):
+        local = _settled(tmp_path / ".oops.yaml", REQUIRED_YAML)
+        monkeypatch.setattr("oops.core.config._CONFIG_PATHS", [local])
+        load_config()
+        _compiled_path().write_bytes(b"\x00garbage")
+
+        assert load_config().manifest.author == "Apik"
+        assert marshal.loads(_compiled_path().read_bytes())[1] == [yaml.safe_load(REQUIRED_YAML)]
+
+    def test_warnings_survive_a_warm_load(self, tmp_path, monkeypatch):
+        local = _settled(tmp_path / ".oops.yaml", REQUIRED_YAML + "bogus: 1\n")
+        monkeypatch.setattr("oops.core.config._CONFIG_PATHS", [local])
+        with pytest.warns(UserWarning):
+            load_config()
+
+        with pytest.warns(UserWarning) as record:
+            load_config()
+
+        assert any("'bogus'" in str(w.message) for w in record)
@@ -113,6 +113,72 @@ class TestGetConsole:
         assert get_error_console().stderr is True
 
 
+COLUMNS = [("Name", "dim", "left"), ("Version", "green", "right")]
+
+
+class TestStreamTable:
+    def test_piped_output_is_tsv(self):
+        import io
+
+        from oops.utils.render import stream_table
+        from rich.console import Console
+
+        console = Console(file=io.StringIO())
+        stream_table(COLUMNS, iter([["[b]sale[/b]", "17.0.1"], ["a\tb", None]]), console)
+        assert console.file.getvalue() == 'Name\tVersion\nsale\t17.0.1\n"a\tb"\t\n'
+
+    def test_terminal_rows_are_aligned_and_chunked(self):
+        from oops.utils.render import stream_table
+        from rich.console import Console
+
+        console = Console(force_terminal=True, color_system=None, width=40, record=True)
+        rows = ([f"addon_{i}", f"17.0.{i}"] for i in range(250))
+        with console.capture() as capture:
+            stream_table(COLUMNS, rows, console)
+        lines = capture.get().splitlines()
+        assert lines[0].split() == ["Name", "Version"]
+        assert len(lines) == 252  # header, rule, one line per row
+        assert len({len(line.rstrip()) for line in lines[2:12]}) == 1  # right-aligned versions line up
+        assert "addon_249" in lines[-1]
+
+    def test_wide_cells_are_ellipsised(self):
+        from oops.utils.render import stream_table
+        from rich.console import Console
+
+        console = Console(force_terminal=True, color_system=None, width=30)
+        with console.capture() as capture:
+            stream_table(COLUMNS, [["x" * 100, "1.0"]], console)
+        assert all(len(line) <= 30 for line in capture.get().splitlines())
+        assert "…" in capture.get()
+
+    def test_print_table_streams_long_tables_only(self):
+        from oops.utils import render
+
+        with patch.object(render, "stream_table") as stream:
+            render.print_table(COLUMNS, [["a", "1"]] * render.STREAM_THRESHOLD)
+            stream.assert_not_called()
+            render.print_table(COLUMNS, [["a", "1"]] * (render.STREAM_THRESHOLD + 1))
+            stream.assert_called_once()
+
+    def test_simple_summary_pipes_long_tables_as_tsv(self, capsys):
+        from oops.output.formatters import SimpleSummaryConsoleFormatter
+        from oops.output.layout import ConclusionBlock, MetricsPanelBlock, Output, SimpleSummaryLayout, TableBlock
+        from oops.utils.render import STREAM_THRESHOLD
+
+        rows = [[f"addon_{i}", "1.0"] for i in range(STREAM_THRESHOLD + 1)]
+        layout = SimpleSummaryLayout(
+            title="Addons",
+            table=TableBlock(title="", columns=COLUMNS, rows=rows),
+            panel=MetricsPanelBlock("Summary", [["Total", str(len(rows))]]),
+            conclusion=ConclusionBlock(True, "All done"),
+        )
+        SimpleSummaryConsoleFormatter().render(Output(layout))
+        out = capsys.readouterr().out
+        assert "Name\tVersion\naddon_0\t1.0\n" in out
+        assert f"addon_{STREAM_THRESHOLD}\t1.0" in out
+        assert "Summary" in out and "All done" in out
+
+
 class TestOopsError:
     def test_inherits_click_exception(self):
         import click
@@ -576,7 +642,7 @@ class TestMakeJsonGet:
         mock_response.json.return_value = {"ok": True}
         mock_response.raise_for_status = MagicMock()
 
-        with patch("oops.utils.net.requests.get", return_value=mock_response) as mock_get:
+        with patch("oops.utils.net.HttpClient.get", return_value=mock_response) as mock_get:
             result = make_json_get(
                 "https://example.com/api",
                 headers={"Authorization": "Bearer token"},
@@ -600,7 +666,7 @@ class TestRequireRepositoryErrors:
         from oops.services.git import require_repository
 
         monkeypatch.chdir(tmp_path)
-        with patch("oops.services.git.Repo", side_effect=InvalidGitRepositoryError("not a repo")):
+        with patch("git.Repo", side_effect=InvalidGitRepositoryError("not a repo")):
             with pytest.raises(click.ClickException, match="Not inside a git repository"):
                 require_repository()
 
@@ -608,7 +674,7 @@ class TestRequireRepositoryErrors:
         import click
         from oops.services.git import require_repository
 
-        with patch("oops.services.git.Repo", side_effect=RuntimeError("unexpected")):
+        with patch("git.Repo", side_effect=RuntimeError("unexpected")):
             with pytest.raises(click.ClickException, match="Error accessing git repository"):
                 require_repository()
 
@@ -618,7 +684,7 @@ class TestRequireRepositoryErrors:
 
         mock_repo = MagicMock()
         mock_repo.working_tree_dir = None
-        with patch("oops.services.git.Repo", return_value=mock_repo):
+        with patch("git.Repo", return_value=mock_repo):
             with pytest.raises(click.ClickException, match="Not inside a git repository"):
                 require_repository()
 
@@ -0,0 +1,146 @@
+"""Tests for oops.core.profiling and the --profile option of OopsCommand."""
+
+import json
+import sqlite3
+
+import click
+import pytest
+from click.testing import CliRunner
+from oops.commands.base import command
+from oops.core import profiling
+from oops.core.profiling import Tracer, count, get_tracer, span, start_profiling, stop_profiling
+
+
+@pytest.fixture(autouse=True)
+def _no_tracer():
+    stop_profiling()
+    yield
+    stop_profiling()
+
+
+class TestTracer:
+    def test_summary_nests_and_aggregates_by_path(self):
+        tracer = Tracer()
+        with tracer.span("outer"):
+            for _ in range(3):
+                with tracer.span("inner"):
+                    pass
+        with tracer.span("after"):
+            pass
+
+        phases = tracer.summary()
+
+        assert [(p.name, p.depth, p.calls) for p in phases] == [("outer", 0, 1), ("inner", 1, 3), ("after", 0, 1)]
+        outer, inner, _ = phases
+        assert outer.child == pytest.approx(inner.total)
+        assert outer.self_time <= outer.total
+
+    def test_chrome_trace_events(self):
+        tracer = Tracer()
+        with tracer.span("phase", module="sale"):
+            tracer.count("kb.queries", 2)
+
+        trace = tracer.chrome_trace()
+
+        span_event, counter_event = trace["traceEvents"]
+        assert span_event["ph"] == "X"
+        assert span_event["name"] == "phase"
+        assert span_event["args"] == {"module": "sale"}
+        assert span_event["dur"] >= 0
+        assert counter_event["ph"] == "C"
+        assert counter_event["args"] == {"kb.queries": 2}
+
+
+class TestModuleHelpers:
+    def test_noop_without_tracer(self):
+        with span("ignored"):
+            count("ignored")
+        assert get_tracer() is None
+
+    def test_helpers_record_on_active_tracer(self):
+        tracer = start_profiling()
+        with span("phase"):
+            count("subprocess.git")
+            count("subprocess.git")
+
+        assert stop_profiling() is tracer
+        assert tracer.counters == {"subprocess.git": 2}
+        assert [s.name for s in tracer.spans] == ["phase"]
+
+    def test_kb_reader_counts_queries(self, tmp_path):
+        from oops.kb.store import KBReader
+
+        db = tmp_path / "kb.db"
+        con = sqlite3.connect(str(db))
+        con.execute("CREATE TABLE meta (key TEXT, value TEXT)")
+        con.commit()
+        con.close()
+
+        tracer = start_profiling()
+        with KBReader(db) as kb:
+            kb.get_meta()
+            kb.get_meta()
+
+        assert tracer.counters["kb.queries"] == 2
+
+
+@command(name="probe")
+@click.option("--fail", is_flag=True)
+def _probe(fail):
+    with span("work"):
+        count("io.bytes_written", 42)
+    if fail:
+        raise click.ClickException("boom")
+    click.echo("done")
+
+
+@command(name="outer")
+@click.pass_context
+def _outer(ctx):
+    # Same shape as `project init` -> `create-workspace` -> `download`.
+    ctx.invoke(_probe, fail=False)
+
+
+class TestProfileOption:
+    def test_options_are_not_forwarded_to_callback(self):
+        result = CliRunner().invoke(_probe, [])
+        assert result.exit_code == 0
+        assert "Profile" not in result.output
+
+    def test_profile_prints_summary(self):
+        result = CliRunner().invoke(_probe, ["--profile"])
+
+        assert result.exit_code == 0
+        assert "Profile" in result.output
+        assert "work" in result.output
+        assert "io.bytes_written" in result.output
+        assert get_tracer() is None
+
+    def test_profile_trace_writes_chrome_json(self, tmp_path):
+        trace_file = tmp_path / "trace.json"
+
+        result = CliRunner().invoke(_probe, ["--profile-trace", str(trace_file), "--fail"])
+
+        assert result.exit_code == 1
+        trace = json.loads(trace_file.read_text(encoding="utf-8"))
+        names = [e["name"] for e in trace["traceEvents"] if e["ph"] == "X"]
+        assert "work" in names
+        assert get_tracer() is None
+
+    def test_nested_command_joins_outer_profile(self):
+        outer = start_profiling()
+
+        result = CliRunner().invoke(_probe, ["--profile"], standalone_mode=False)
+
+        assert result.exit_code == 0
+        assert profiling.get_tracer() is outer
+        assert "Profile" not in result.output
+        assert [p.name for p in outer.summary()][-1] == "work"
+
+    def test_command_invoking_another_command(self):
+        for args in ([], ["--profile"]):
+            result = CliRunner().invoke(_outer, args)
+
+            assert result.exit_code == 0, result.output
+            assert "done" in result.output
+            assert ("Profile" in result.output) == bool(args)
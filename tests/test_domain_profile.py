@@ -10,7 +10,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from oops.commands.addons.domain_profile import (
@@ -21,8 +21,8 @@ from oops.commands.addons.domain_profile import (
 from oops.core.config import AnalyzeConfig
 from oops.core.models import ClassSummary, ModuleSummary, ViewsSummary
 from oops.kb.build import _resolve_module_apps
-from oops.kb.domains import DOMAIN_LABELS, domain_label
-from oops.kb.store import KBReader, write_project_kb
+from oops.kb.domains import DOMAIN_LABELS, classify_creator, domain_label
+from oops.kb.store import KBReader, replace_kb_modules, write_project_kb
 
 
 # ---------------------------------------------------------------------------
@@ -190,6 +190,91 @@ class TestKBReaderHelpers:
         assert mods["sale"]["app"] == "sale"
 
 
+# ---------------------------------------------------------------------------
+# TestModelDomains
+# ---------------------------------------------------------------------------
+
+
+class TestModelDomains:
+    @pytest.mark.parametrize(
+        ("module", "app", "expected"),
+        [
+            (None, None, ("noise", None)),
+            ("base", None, ("noise", None)),
+            ("product", None, ("pillar", "product")),
+            ("my_helper", None, ("noise", None)),
+            ("mail_bot", "mail", ("domain", "mail_bot")),
+            ("product_expiry", "product", ("pillar", "product")),
+            ("sale_management", "sale", ("domain", "sale")),
+        ],
+    )
+    def test_classify_creator(self, module, app, expected):
+        assert classify_creator(module, app) == expected
+
+    def _kb(self, tmp_path: Path) -> Path:
+        db_path = tmp_path / "kb.db"
+        _write_kb(
+            db_path,
+            modules={
+                "sale": _mod("sale", [], application=1, app="sale"),
+                "sale_stock": _mod("sale_stock", ["sale"], app="sale"),
+                "sale_margin": _mod("sale_margin", ["sale"], app="sale"),
+                "my_ext": _mod("my_ext", ["base"]),
+                "base": _mod("base", []),
+            },
+            model_origins=[
+                _origin("sale.order", "sale"),
+                _origin("sale.order", "sale_stock", role="extend"),
+                _origin("sale.order", "sale_margin", role="extend"),
+                _origin("sale.order", "my_ext", role="extend"),
+                _origin("res.partner", "base"),
+                _origin("orphan.model", "my_ext", role="extend"),
+            ],
+        )
+        return db_path
+
+    def test_table_is_built_with_the_kb(self, tmp_path):
+        with KBReader(self._kb(tmp_path)) as kb:
+            domains = kb.get_model_domains(["sale.order", "res.partner", "orphan.model", "no.such.model"])
+
+        assert domains["sale.order"] == {
+            "creator": "sale",
+            "app": "sale",
+            "kind": "domain",
+            "anchor": "sale",
+            "extensions": {"my_ext": 1, "sale": 2},
+        }
+        assert (domains["res.partner"]["kind"], domains["res.partner"]["anchor"]) == ("noise", None)
+        assert domains["orphan.model"]["creator"] is None and domains["orphan.model"]["kind"] == "noise"
+        assert "no.such.model" not in domains
+
+    def test_partial_rewrite_reclassifies(self, tmp_path):
+        db_path = self._kb(tmp_path)
+        scan = {
+            "modules": {"my_ext": _mod("my_ext", ["base"])},
+            "model_origins": [_origin("orphan.model", "my_ext")],
+        }
+
+        replace_kb_modules(db_path, ["my_ext"], scan)
+
+        with KBReader(db_path) as kb:
+            domains = kb.get_model_domains(["sale.order", "orphan.model"])
+        assert domains["sale.order"]["extensions"] == {"sale": 2}
+        assert domains["orphan.model"]["creator"] == "my_ext"
+
+    def test_profile_does_not_query_per_model(self, tmp_path):
+        db_path = self._kb(tmp_path)
+        cis = [_make_ci(None, [model], is_new=False) for model in ("sale.order", "res.partner")]
+        summary = _make_summary([_make_cs(), _make_cs()], cis)
+
+        with KBReader(db_path) as kb, patch.object(
+            KBReader, "get_model_creators", side_effect=AssertionError
+        ), patch.object(KBReader, "get_module_app", side_effect=AssertionError):
+            profile = compute_domain_profile(summary, kb, AnalyzeConfig().domain_weights)
+
+        assert [d["domain"] for d in profile["domains"]] == ["sale"]
+
+
 # ---------------------------------------------------------------------------
 # TestDomainLabel
 # ---------------------------------------------------------------------------
@@ -0,0 +1,112 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: test_io_watch.py — tests/test_io_watch.py
+
+"""Tests for oops/io/watch.py and the module mapping of oops/services/watch.py."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from oops.io.watch import FileWatcher, is_ignored
+from oops.services.watch import touched_modules
+
+BACKENDS = [pytest.param(False, id="native"), pytest.param(True, id="polling")]
+
+
+def _later(delay: float, action) -> threading.Thread:
+    thread = threading.Timer(delay, action)
+    thread.start()
+    return thread
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "sale_ext"
+    (root / "models").mkdir(parents=True)
+    (root / "models" / "sale.py").write_text("x = 1\n")
+    return root
+
+
+class TestFileWatcher:
+    @pytest.mark.parametrize("polling", BACKENDS)
+    def test_reports_modified_file(self, tree, polling):
+        target = tree / "models" / "sale.py"
+        with FileWatcher([tree], debounce=0.05, polling=polling) as watcher:
+            _later(0.1, lambda: target.write_text("x = 2\n"))
+            batch = watcher.next_batch(timeout=3)
+
+        assert target in batch
+
+    @pytest.mark.parametrize("polling", BACKENDS)
+    def test_burst_is_debounced_into_one_batch(self, tree, polling):
+        files = [tree / "models" / f"m{i}.py" for i in range(3)]
+
+        def burst():
+            for path in files:
+                path.write_text("pass\n")
+                time.sleep(0.02)
+
+        with FileWatcher([tree], debounce=0.3, polling=polling) as watcher:
+            _later(0.1, burst)
+            batch = watcher.next_batch(timeout=3)
+
+        assert set(files) <= batch
+
+    @pytest.mark.parametrize("polling", BACKENDS)
+    def test_timeout_without_changes(self, tree, polling):
+        with FileWatcher([tree], debounce=0.05, polling=polling) as watcher:
+            assert watcher.next_batch(timeout=0.2) == set()
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify only")
+    def test_new_directories_are_watched(self, tree):
+        with FileWatcher([tree], debounce=0.05) as watcher:
+            assert watcher.backend == "inotify"
+            (tree / "wizard").mkdir()
+            watcher.next_batch(timeout=1)
+            _later(0.1, lambda: (tree / "wizard" / "w.py").write_text("pass\n"))
+            batch = watcher.next_batch(timeout=3)
+
+        assert tree / "wizard" / "w.py" in batch
+
+    def test_noise_is_ignored(self, tree):
+        with FileWatcher([tree], debounce=0.05) as watcher:
+            (tree / "models" / ".sale.py.swp").write_text("")
+            (tree / "models" / "sale.py~").write_text("")
+            (tree / "__pycache__").mkdir()
+            (tree / "__pycache__" / "sale.cpython-311.pyc").write_bytes(b"")
+            batch = watcher.next_batch(timeout=0.5)
+
+        assert batch == set()
+
+    @pytest.mark.parametrize("name", [".sale.py.swp", "sale.py~", "4913", "sale.cpython-311.pyc"])
+    def test_is_ignored(self, name):
+        assert is_ignored(name)
+
+
+class TestTouchedModules:
+    def test_maps_paths_to_modules_in_order(self, tmp_path):
+        a, b, c = (tmp_path / name for name in ("a", "b", "c"))
+        for module in (a, b, c):
+            module.mkdir()
+
+        touched = touched_modules({c / "models" / "x.py", a / "__manifest__.py", tmp_path / "other.txt"}, [a, b, c])
+
+        assert touched == [a, c]
+
+    def test_symlinked_module_matches_real_path(self, tmp_path):
+        real = tmp_path / "vendor" / "sale_ext"
+        real.mkdir(parents=True)
+        link = tmp_path / "repo" / "sale_ext"
+        link.parent.mkdir()
+        link.symlink_to(real)
+
+        assert touched_modules({real / "models" / "sale.py"}, [link]) == [link]
+
+    def test_nothing_touched(self, tmp_path):
+        assert touched_modules({Path("/elsewhere/x.py")}, [tmp_path]) == []
@@ -0,0 +1,328 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: test_kb_artifact.py — tests/test_kb_artifact.py
+
+"""Tests for oops.kb.artifact and the oops kb pack / unpack commands."""
+
+from __future__ import annotations
+
+import io
+import json
+import subprocess
+import tarfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+from oops.commands.kb.pack import main as pack_main
+from oops.commands.kb.unpack import main as unpack_main
+from oops.commands.misc.build_global import main as build_kb_main
+from oops.io.file import OdooSourcesDirs
+from oops.kb.artifact import (
+    ArtifactError,
+    ArtifactStore,
+    artifact_key,
+    pack_kb,
+    read_artifact_info,
+    source_revisions,
+    unpack_kb,
+)
+from oops.kb.build import build_global_kb, restore_global_kb
+from oops.kb.store import KBReader, write_global_kb
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], cwd=repo, check=True)
+
+
+def _checkout(path: Path, addon: str) -> Path:
+    (path / addon / "models").mkdir(parents=True)
+    (path / addon / "__manifest__.py").write_text(f"{{'name': '{addon}', 'depends': []}}\n")
+    (path / addon / "models" / "m.py").write_text(
+        "from odoo import fields, models\n\n\n"
+        f"class M(models.Model):\n    _name = '{addon}.m'\n\n    x = fields.Char()\n"
+    )
+    _git(path, "init", "-q")
+    _git(path, "add", ".")
+    _git(path, "commit", "-qm", "init")
+    return path
+
+
+@pytest.fixture
+def sources(tmp_path):
+    return [
+        ("odoo", _checkout(tmp_path / "sources" / "community", "base_mod")),
+        ("enterprise", _checkout(tmp_path / "sources" / "enterprise", "ent_mod")),
+    ]
+
+
+@pytest.fixture
+def global_kb(tmp_path, sources):
+    db_path = tmp_path / "kb" / "17.0.db"
+    with patch("oops.kb.build.odoo_addons_roots", side_effect=lambda path: [path]):
+        result = build_global_kb(db_path, "17.0", sources, source_revisions(sources))
+    assert not result.errors
+    return db_path
+
+
+def _modules(db_path: Path) -> "dict[str, str]":
+    with KBReader(db_path) as kb:
+        return {name: data["origin"] for name, data in kb.get_modules().items()}
+
+
+def _retar(src: Path, dest: Path, manifest=None, database=None) -> None:
+    """Rewrite an artifact, replacing its manifest and/or database bytes."""
+    with tarfile.open(src, "r:gz") as tar:
+        members = {m.name: tar.extractfile(m).read() for m in tar.getmembers()}
+    if manifest is not None:
+        members["manifest.json"] = json.dumps(manifest).encode()
+    if database is not None:
+        members["kb.db"] = database
+    with tarfile.open(dest, "w:gz") as tar:
+        for name in ("manifest.json", "kb.db"):
+            entry = tarfile.TarInfo(name)
+            entry.size = len(members[name])
+            tar.addfile(entry, io.BytesIO(members[name]))
+
+
+# ---------------------------------------------------------------------------
+# Keys and revisions
+# ---------------------------------------------------------------------------
+
+
+class TestArtifactKey:
+    def test_stable_and_order_independent(self):
+        a = artifact_key("17.0", {"odoo": "a1", "enterprise": "b2"})
+        assert a == artifact_key("17.0", {"enterprise": "b2", "odoo": "a1"})
+        assert len(a) == 64
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            ("18.0", {"odoo": "a1"}, 10, 1),
+            ("17.0", {"odoo": "a2"}, 10, 1),
+            ("17.0", {"odoo": "a1", "enterprise": "b2"}, 10, 1),
+            ("17.0", {"odoo": "a1"}, 11, 1),
+            ("17.0", {"odoo": "a1"}, 10, 2),
+        ],
+    )
+    def test_every_input_changes_the_key(self, other):
+        assert artifact_key("17.0", {"odoo": "a1"}, 10, 1) != artifact_key(*other)
+
+
+class TestSourceRevisions:
+    def test_reads_head_commits(self, sources):
+        revisions = source_revisions(sources)
+
+        assert set(revisions) == {"odoo", "enterprise"}
+        assert all(len(commit) == 40 for commit in revisions.values())
+
+    def test_none_when_a_tree_is_not_a_checkout(self, sources, tmp_path):
+        (tmp_path / "plain").mkdir()
+
+        assert source_revisions([*sources, ("themes", tmp_path / "plain")]) is None
+
+
+# ---------------------------------------------------------------------------
+# Pack / unpack
+# ---------------------------------------------------------------------------
+
+
+class TestPackUnpack:
+    def test_round_trip(self, global_kb, sources, tmp_path):
+        artifact = tmp_path / "kb.tar.gz"
+        packed = pack_kb(global_kb, artifact)
+
+        dest = tmp_path / "installed" / "17.0.db"
+        info = unpack_kb(artifact, dest, expected_key=artifact_key("17.0", source_revisions(sources)))
+
+        assert info.key == packed.key
+        assert info.sources == source_revisions(sources)
+        assert dest.read_bytes() == global_kb.read_bytes()
+        assert _modules(dest) == {"base_mod": "odoo", "ent_mod": "enterprise"}
+
+    def test_manifest_is_read_without_the_database(self, global_kb, tmp_path):
+        packed = pack_kb(global_kb, tmp_path / "kb.tar.gz")
+
+        assert read_artifact_info(tmp_path / "kb.tar.gz") == packed
+
+    def test_kb_without_revisions_cannot_be_packed(self, tmp_path):
+        db_path = tmp_path / "global.db"
+        write_global_kb(db_path, "17.0", {"odoo": "/src"}, [{"modules": {"base": {"origin": "odoo", "depends": []}}}])
+
+        with pytest.raises(ArtifactError, match="no source revisions"):
+            pack_kb(db_path, tmp_path / "kb.tar.gz")
+
+    def _installed(self, tmp_path: Path) -> Path:
+        dest = tmp_path / "installed" / "17.0.db"
+        dest.parent.mkdir()
+        dest.write_bytes(b"previous KB")
+        return dest
+
+    def _assert_rejected(self, artifact: Path, dest: Path, match: str, **kwargs) -> None:
+        with pytest.raises(ArtifactError, match=match):
+            unpack_kb(artifact, dest, **kwargs)
+        assert dest.read_bytes() == b"previous KB"
+        assert [p.name for p in dest.parent.iterdir()] == [dest.name]
+
+    def test_truncated_artifact(self, global_kb, tmp_path):
+        artifact = tmp_path / "kb.tar.gz"
+        pack_kb(global_kb, artifact)
+        artifact.write_bytes(artifact.read_bytes()[: artifact.stat().st_size // 2])
+
+        self._assert_rejected(artifact, self._installed(tmp_path), "Corrupt|Unreadable")
+
+    def test_tampered_database(self, global_kb, tmp_path):
+        pack_kb(global_kb, tmp_path / "kb.tar.gz")
+        _retar(tmp_path / "kb.tar.gz", tmp_path / "bad.tar.gz", database=global_kb.read_bytes()[:-1] + b"x")
+
+        self._assert_rejected(tmp_path / "bad.tar.gz", self._installed(tmp_path), "checksum")
+
+    def test_key_must_match_its_inputs(self, global_kb, tmp_path):
+        info = pack_kb(global_kb, tmp_path / "kb.tar.gz")
+        manifest = {**info.to_dict(), "sources": {"odoo": "0" * 40}}
+        _retar(tmp_path / "kb.tar.gz", tmp_path / "bad.tar.gz", manifest=manifest)
+
+        self._assert_rejected(tmp_path / "bad.tar.gz", self._installed(tmp_path), "carries key")
+
+    def test_other_scanner_version(self, global_kb, tmp_path):
+        pack_kb(global_kb, tmp_path / "kb.tar.gz")
+
+        with patch("oops.kb.artifact.SCANNER_VERSION", 99):
+            self._assert_rejected(tmp_path / "kb.tar.gz", self._installed(tmp_path), "scanner")
+
+    def test_other_source_commits(self, global_kb, tmp_path):
+        pack_kb(global_kb, tmp_path / "kb.tar.gz")
+
+        self._assert_rejected(tmp_path / "kb.tar.gz", self._installed(tmp_path), "expected key", expected_key="f" * 64)
+
+
+class TestArtifactStore:
+    def test_put_get_and_list(self, global_kb, tmp_path):
+        store = ArtifactStore(tmp_path / "store")
+
+        info = store.put(global_kb)
+
+        assert info.path == store.path_for(info.key)
+        assert info.key in store
+        assert [i.key for i in store.list("17.0")] == [info.key]
+        assert store.list("18.0") == []
+        store.get(info.key, tmp_path / "out.db")
+        assert _modules(tmp_path / "out.db") == _modules(global_kb)
+
+    def test_list_skips_foreign_files(self, global_kb, tmp_path):
+        store = ArtifactStore(tmp_path / "store")
+        store.put(global_kb)
+        (store.root / "junk.tar.gz").write_bytes(b"junk")
+
+        assert len(store.list()) == 1
+
+    def test_missing_key(self, tmp_path):
+        with pytest.raises(ArtifactError, match="No KB artifact"):
+            ArtifactStore(tmp_path / "store").get("f" * 64, tmp_path / "out.db")
+
+
+class TestRestoreGlobalKb:
+    def test_no_matching_artifact(self, sources, tmp_path):
+        store = ArtifactStore(tmp_path / "store")
+
+        assert restore_global_kb(tmp_path / "out.db", "17.0", sources, source_revisions(sources), store) is None
+        assert not (tmp_path / "out.db").exists()
+
+    def test_restores_and_relocates_sources(self, global_kb, sources, tmp_path):
+        store = ArtifactStore(tmp_path / "store")
+        store.put(global_kb)
+        moved = [(origin, tmp_path / "elsewhere" / origin) for origin, _ in sources]
+
+        result = restore_global_kb(tmp_path / "out.db", "17.0", moved, source_revisions(sources), store)
+
+        assert not result.errors
+        assert result.data["kb"]["modules"] == 2
+        assert [(s["name"], s["modules"]) for s in result.data["stats"]] == [("odoo", 1), ("enterprise", 1)]
+        with KBReader(tmp_path / "out.db") as kb:
+            assert kb.get_sources() == {origin: str(path) for origin, path in moved}
+
+
+# ---------------------------------------------------------------------------
+# Commands
+# ---------------------------------------------------------------------------
+
+
+class TestKbCommands:
+    @pytest.fixture
+    def env(self, global_kb, sources, tmp_path):
+        dirs = OdooSourcesDirs(community=sources[0][1], enterprise=sources[1][1], themes=tmp_path / "none")
+        installed = tmp_path / "cache" / "17.0.db"
+        with patch("oops.services.kb.global_kb_path", return_value=global_kb), patch(
+            "oops.commands.kb.unpack.global_kb_path", return_value=installed
+        ), patch("oops.commands.kb.unpack.get_odoo_sources_dirs", return_value=dirs), patch(
+            "oops.commands.misc.build_global.global_kb_dir", return_value=installed.parent
+        ), patch("oops.commands.misc.build_global.get_odoo_sources_dirs", return_value=dirs), patch(
+            "oops.kb.build.odoo_addons_roots", side_effect=lambda path: [path]
+        ):
+            yield installed
+
+    def _invoke(self, cmd, *args):
+        return CliRunner().invoke(cmd, [*args, "--version", "17.0", "--format", "json"])
+
+    def _payload(self, result):
+        return json.loads(result.output[result.output.index("{") :])
+
+    def test_pack_then_unpack(self, env, tmp_path):
+        store = str(tmp_path / "store")
+
+        packed = self._invoke(pack_main, "--store", store, "--export", str(tmp_path / "copy.tar.gz"))
+        assert packed.exit_code == 0, packed.output
+        key = self._payload(packed)["artifact"]["key"]
+        assert (tmp_path / "store" / f"{key}.tar.gz").is_file()
+        assert (tmp_path / "copy.tar.gz").is_file()
+
+        unpacked = self._invoke(unpack_main, "--store", store)
+        assert unpacked.exit_code == 0, unpacked.output
+        assert self._payload(unpacked)["artifact"]["key"] == key
+        assert _modules(env) == {"base_mod": "odoo", "ent_mod": "enterprise"}
+
+    def test_unpack_without_matching_artifact(self, env, tmp_path):
+        result = self._invoke(unpack_main, "--store", str(tmp_path / "store"))
+
+        assert result.exit_code == 1
+        assert "No KB artifact matches" in result.output
+        assert not env.exists()
+
+    def test_unpack_rejects_other_source_commits(self, env, sources, tmp_path):
+        self._invoke(pack_main, "--export", str(tmp_path / "copy.tar.gz"), "--store", str(tmp_path / "store"))
+        (sources[0][1] / "base_mod" / "README").write_text("x")
+        _git(sources[0][1], "add", ".")
+        _git(sources[0][1], "commit", "-qm", "bump")
+
+        rejected = self._invoke(unpack_main, str(tmp_path / "copy.tar.gz"))
+        forced = self._invoke(unpack_main, str(tmp_path / "copy.tar.gz"), "--force")
+
+        assert rejected.exit_code == 1 and "expected key" in rejected.output
+        assert forced.exit_code == 0, forced.output
+
+    def test_build_kb_reuses_a_matching_artifact(self, env, tmp_path):
+        self._invoke(pack_main, "--store", str(tmp_path / "store"))
+
+        with patch("oops.commands.misc.build_global.build_global_kb") as build:
+            result = self._invoke(build_kb_main, "--store", str(tmp_path / "store"))
+
+        assert result.exit_code == 0, result.output
+        build.assert_not_called()
+        assert self._payload(result)["addons"]["cmd"].startswith("Restore global KB")
+        assert _modules(env) == {"base_mod": "odoo", "ent_mod": "enterprise"}
+
+    def test_build_kb_rebuilds_on_a_corrupt_artifact(self, env, tmp_path):
+        packed = self._invoke(pack_main, "--store", str(tmp_path / "store"))
+        artifact = Path(self._payload(packed)["artifact"]["path"])
+        _retar(artifact, artifact, database=b"not a database")
+
+        result = self._invoke(build_kb_main, "--store", str(tmp_path / "store"))
+
+        assert result.exit_code == 0, result.output
+        payload = self._payload(result)
+        assert any("rebuilding from sources" in w for w in payload["warnings"])
+        assert payload["addons"]["cmd"].startswith("Build global KB")
+        assert _modules(env) == {"base_mod": "odoo", "ent_mod": "enterprise"}
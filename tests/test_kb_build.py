@@ -11,7 +11,14 @@ from pathlib import Path
 
 import pytest
 from oops.core.models import Result
-from oops.kb.build import build_project_kb, compute_root_drift, is_project_kb_stale
+from oops.kb.build import (
+    build_global_kb,
+    build_project_kb,
+    changed_project_modules,
+    compute_root_drift,
+    is_project_kb_stale,
+    refresh_project_kb,
+)
 from oops.kb.store import KBReader, write_global_kb
 
 # ---------------------------------------------------------------------------
@@ -224,6 +231,68 @@ class TestBuildProjectKb:
 # ---------------------------------------------------------------------------
 
 
+# ---------------------------------------------------------------------------
+# build_global_kb
+# ---------------------------------------------------------------------------
+
+
+def _write_addon(root: Path, name: str, model_src: str, views: str = "") -> None:
+    (root / name / "models").mkdir(parents=True, exist_ok=True)
+    data = "'data': ['views/views.xml']," if views else ""
+    (root / name / "__manifest__.py").write_text(f"{{'name': '{name}', 'depends': [], {data}}}")
+    (root / name / "models" / "m.py").write_text("from odoo import fields, models\n\n\n" + model_src)
+    if views:
+        (root / name / "views").mkdir()
+        (root / name / "views" / "views.xml").write_text(f"<odoo>{views}</odoo>")
+
+
+class TestBuildGlobalKb:
+    def _tiers(self, tmp_path: Path) -> "list[tuple[str, Path]]":
+        community = tmp_path / "community"
+        enterprise = tmp_path / "enterprise"
+        (community / "addons").mkdir(parents=True)
+        (enterprise).mkdir()
+        _write_addon(
+            community / "addons",
+            "sale",
+            "class SaleOrder(models.Model):\n    _name = 'sale.order'\n\n    name = fields.Char()\n",
+            '<record id="view_form" model="ir.ui.view"><field name="model">sale.order</field>'
+            '<field name="arch" type="xml"><form/></field></record>',
+        )
+        _write_addon(
+            enterprise,
+            "sale_ent",
+            "class SaleQuote(models.Model):\n    _name = 'sale.quote'\n    _inherit = ['sale.order']\n",
+            '<record id="view_form_ext" model="ir.ui.view"><field name="inherit_id" ref="sale.view_form"/>'
+            '<field name="arch" type="xml"><form/></field></record>',
+        )
+        return [("odoo", community), ("enterprise", enterprise)]
+
+    def test_streams_every_tier_and_resolves_across_them(self, tmp_path):
+        db_path = tmp_path / "global.db"
+
+        result = build_global_kb(db_path, "17.0", self._tiers(tmp_path))
+
+        assert not result.errors
+        assert [(s["name"], s["modules"]) for s in result.data["stats"]] == [("odoo", 1), ("enterprise", 1)]
+        assert result.data["kb"]["modules"] == 2
+        with KBReader(db_path) as kb:
+            assert set(kb.get_sources()) == {"odoo", "enterprise"}
+            assert kb.symbol_exists("sale.order", "name", "field")
+            # Roles and view types are resolved against the odoo tier.
+            assert (
+                kb._con.execute("SELECT role FROM model_origins WHERE model = 'sale.quote'").fetchone()[0]
+                == "prototype"
+            )
+            assert kb.get_view("sale_ent.view_form_ext")["view_type"] == "form"
+
+    def test_missing_addons_root_is_a_warning(self, tmp_path):
+        result = build_global_kb(tmp_path / "global.db", "17.0", [("odoo", tmp_path / "missing")])
+
+        assert not result.errors
+        assert any("Tier root not found" in w for w in result.warnings)
+
+
 def _set_kb_generated_at(db_path: Path, ts: datetime) -> None:
     """Overwrite the meta.generated_at row in a KB with a specific timestamp."""
     con = sqlite3.connect(str(db_path))
@@ -664,3 +733,131 @@ class TestXmlEndToEnd:
         origins = {v["xml_id"]: v["origin"] for v in views}
         assert origins.get("base.view_form_primary") == "odoo"
         assert origins.get("mod_a.view_form_ext") == "apik"
+
+
+# ---------------------------------------------------------------------------
+# refresh_project_kb — in-place re-scan of a few modules (watch mode)
+# ---------------------------------------------------------------------------
+
+
+_PARTNER_EXT = """from odoo import fields, models
+
+
+class ResPartner(models.Model):
+    _inherit = "res.partner"
+
+{fields}
+"""
+
+
+@pytest.fixture
+def built_repo(tmp_path):
+    """A repo with two third-party modules extending res.partner, its project KB built."""
+    global_kb = _make_global_kb_with_views(tmp_path / "global.db")
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _make_tp_symlinks(repo, "module_a", "module_b")
+    for name in ("module_a", "module_b"):
+        models = repo / ".third-party" / name / "models"
+        models.mkdir()
+        (models / "__init__.py").write_text("from . import partner\n")
+        (models / "partner.py").write_text(_PARTNER_EXT.format(fields=f"    {name}_x = fields.Char()"))
+        (repo / ".third-party" / name / "__init__.py").write_text("from . import models\n")
+    build_project_kb(repo, "17.0", ["module_a", "module_b"], global_kb=global_kb)
+    return repo
+
+
+class TestRefreshProjectKb:
+    @pytest.fixture
+    def repo(self, built_repo):
+        return built_repo
+
+    def _fields(self, repo: Path, module: str) -> set:
+        with KBReader(repo / ".oops-cache" / "kb.db") as kb:
+            return {s["name"] for s in kb.get_model_symbols("res.partner", "field") if s["module"] == module}
+
+    def test_only_touched_module_is_rescanned(self, repo):
+        (repo / ".third-party" / "module_a" / "models" / "partner.py").write_text(
+            _PARTNER_EXT.format(fields="    module_a_y = fields.Char()")
+        )
+        (repo / ".third-party" / "module_b" / "models" / "partner.py").write_text(
+            _PARTNER_EXT.format(fields="    module_b_y = fields.Char()")
+        )
+
+        result = refresh_project_kb(repo, ["module_a"])
+
+        assert result.data == ["module_a"] and result.ok
+        assert self._fields(repo, "module_a") == {"module_a_y"}
+        assert self._fields(repo, "module_b") == {"module_b_x"}  # not refreshed
+        with KBReader(repo / ".oops-cache" / "kb.db") as kb:
+            meta = kb.get_meta()
+            assert "updated_at" in meta
+            assert kb.get_view("base.view_form_primary") is not None  # global rows kept
+
+    def test_extension_view_resolved_against_the_kb(self, repo):
+        module = repo / ".third-party" / "module_a"
+        (module / "__manifest__.py").write_text("{'name': 'A', 'depends': ['base'], 'data': ['views/ext.xml']}")
+        (module / "views").mkdir()
+        (module / "views" / "ext.xml").write_text(
+            _odoo_xml(
+                """<record id="view_form_ext" model="ir.ui.view">
+                    <field name="inherit_id" ref="base.view_form_primary"/>
+                    <field name="arch" type="xml"><field name="name" position="after"/></field>
+                </record>"""
+            )
+        )
+
+        refresh_project_kb(repo, ["module_a"])
+
+        with KBReader(repo / ".oops-cache" / "kb.db") as kb:
+            assert kb.get_view("module_a.view_form_ext")["view_type"] == "form"
+
+    def test_keeps_generated_at(self, repo):
+        with KBReader(repo / ".oops-cache" / "kb.db") as kb:
+            before = kb.get_meta()["generated_at"]
+
+        refresh_project_kb(repo, ["module_a"])
+
+        with KBReader(repo / ".oops-cache" / "kb.db") as kb:
+            assert kb.get_meta()["generated_at"] == before
+
+    def test_module_without_manifest_is_removed(self, repo):
+        (repo / ".third-party" / "module_b" / "__manifest__.py").unlink()
+
+        refresh_project_kb(repo, ["module_b"])
+
+        with KBReader(repo / ".oops-cache" / "kb.db") as kb:
+            assert "module_b" not in kb.get_modules()
+        assert self._fields(repo, "module_b") == set()
+
+    def test_modules_outside_scope_are_ignored(self, repo):
+        assert refresh_project_kb(repo, ["base", "unknown"]).data == []
+
+    def test_missing_project_kb_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            refresh_project_kb(tmp_path, ["module_a"])
+
+
+class TestChangedProjectModules:
+    @pytest.fixture
+    def repo(self, built_repo):
+        return built_repo
+
+    def _age_kb(self, repo: Path) -> None:
+        # Backdate the module files so only explicit edits look newer than the KB.
+        for path in (repo / ".third-party").rglob("*"):
+            os.utime(path, (0, 0))
+
+    def test_only_edited_in_scope_modules(self, repo):
+        self._age_kb(repo)
+        (repo / ".third-party" / "module_b" / "models" / "partner.py").write_text("# edited\n")
+
+        assert changed_project_modules(repo, ["module_a", "module_b", "base"]) == ["module_b"]
+
+    def test_bytecode_is_ignored(self, repo):
+        self._age_kb(repo)
+        cache = repo / ".third-party" / "module_a" / "__pycache__"
+        cache.mkdir()
+        (cache / "x.cpython-311.pyc").write_bytes(b"")
+
+        assert changed_project_modules(repo, ["module_a"]) == []
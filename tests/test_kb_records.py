@@ -0,0 +1,68 @@
+# Copyright 2026 apik (https://apik.cloud).
+# License AGPL-3.0-only (https://www.gnu.org/licenses/agpl-3.0.html)
+#
+# File: test_kb_records.py — tests/test_kb_records.py
+
+"""Tests for oops/kb/records.py."""
+
+from __future__ import annotations
+
+import pytest
+from oops.kb.records import ModelOriginRow, SymbolRow, ViewRow
+
+
+def _symbol(**kw: object) -> SymbolRow:
+    values = {"model": "sale.order", "name": "name", "kind": "field", "origin": "odoo", "module": "sale"}
+    values.update(kw)
+    return SymbolRow(**values)
+
+
+class TestScanRow:
+    def test_reads_like_a_dict(self):
+        row = _symbol(section="FIELDS")
+
+        assert row["model"] == "sale.order"
+        assert row.get("section") == "FIELDS"
+        assert row.get("missing", "x") == "x"
+        assert "kind" in row and "missing" not in row
+        assert dict(row.items())["module"] == "sale"
+        assert row.to_dict() == dict(row)
+
+    def test_missing_columns_default_to_none(self):
+        assert _symbol()["source_line"] is None
+
+    def test_defaults(self):
+        row = ModelOriginRow(model="sale.order", module="sale", origin="odoo", role="create")
+
+        assert (row["model_type"], row["inherit_json"], row["inherits_json"]) == ("model", "[]", "{}")
+        assert ViewRow(xml_id="sale.v")["fields_json"] == "[]"
+
+    def test_write_known_column(self):
+        row = ModelOriginRow(model="sale.order", role="create")
+        row["role"] = "prototype"
+
+        assert row["role"] == "prototype"
+        with pytest.raises(KeyError):
+            row["unknown"] = 1
+
+    def test_unknown_column_raises(self):
+        with pytest.raises(TypeError, match="unexpected column"):
+            _symbol(colour="red")
+        with pytest.raises(KeyError):
+            _symbol()["colour"]
+
+    def test_repeated_strings_are_interned(self):
+        a = _symbol(model="".join(["sale.", "order"]))
+        b = _symbol(model="".join(["sale.", "order"]))
+
+        assert a["model"] is b["model"]
+
+    def test_equality_with_dicts(self):
+        row = _symbol()
+
+        assert row == row.to_dict()
+        assert row == _symbol()
+        assert row != _symbol(name="other")
+
+    def test_no_instance_dict(self):
+        assert not hasattr(_symbol(), "__dict__")
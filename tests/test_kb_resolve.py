@@ -344,6 +344,33 @@ class TestResolveSymbolRoot:
         assert r1["module"] == r2["module"] == "sale"
 
 
+# ---------------------------------------------------------------------------
+# TestResolveWithKB — chains read from module_closure
+# ---------------------------------------------------------------------------
+
+
+class TestResolveWithKB:
+    def test_same_winners_as_the_python_walk(self, tmp_path):
+        from oops.kb.store import KBReader, write_project_kb
+
+        index = _index(
+            ("base", "odoo", []),
+            ("sale", "odoo", ["base"]),
+            ("sale_ext", "third-party", ["sale"]),
+            ("other", "apik", ["base"]),
+            ("my_module", "apik", ["sale_ext", "other"]),
+        )
+        db_path = tmp_path / "kb.db"
+        modules = {name: {**data, "application": 0, "app": None} for name, data in index.items()}
+        write_project_kb(db_path, "17.0", "test", [], {}, [{"modules": modules}])
+        entries = [_entry("base"), _entry("sale"), _entry("sale_ext", "third-party"), _entry("other", "apik")]
+
+        with KBReader(db_path) as kb:
+            assert resolve_symbol(entries, "my_module", {}, kb) == resolve_symbol(entries, "my_module", index)
+            assert resolve_symbol_root(entries, "my_module", {}, kb) == resolve_symbol_root(entries, "my_module", index)
+            assert resolve_symbol(entries, "my_module", {}, kb)["module"] == "sale_ext"
+
+
 # ---------------------------------------------------------------------------
 # TestResolveViewTypes
 # ---------------------------------------------------------------------------
@@ -9,8 +9,12 @@ from __future__ import annotations
 
 import sqlite3
 from pathlib import Path
+from unittest.mock import patch
 
-from oops.kb.store import KBReader, write_project_kb
+import pytest
+from oops.kb.records import SymbolRow
+from oops.kb.resolve import build_depends_chain
+from oops.kb.store import KBReader, KBWriter, MigrationImpossible, migrate_kb, replace_kb_modules, write_project_kb
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -93,7 +97,7 @@ class TestDDL:
         con = sqlite3.connect(str(db_path))
         tables = {
             row[0]
-            for row in con.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+            for row in con.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'view')").fetchall()
         }
         assert "field_refs" in tables
         con.close()
@@ -103,7 +107,7 @@ class TestDDL:
         _write(db_path)
         with KBReader(db_path) as kb:
             meta = kb.get_meta()
-        assert meta.get("schema_version") == "7"
+        assert meta.get("schema_version") == "10"
 
     def test_write_twice_applies_schema_cleanly(self, tmp_path):
         db_path = tmp_path / "kb.db"
@@ -426,7 +430,9 @@ class TestXmlTables:
         _write(db_path)
         import sqlite3
         con = sqlite3.connect(str(db_path))
-        tables = {r[0] for r in con.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()}
+        tables = {
+            r[0] for r in con.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'view')").fetchall()
+        }
         con.close()
         assert "views" in tables
         assert "actions" in tables
@@ -591,3 +597,449 @@ class TestModuleHelpers:
         with KBReader(db_path) as kb:
             rows = kb.get_module_views("nonexistent_module")
         assert rows == []
+
+
+# ---------------------------------------------------------------------------
+# TestModuleGraph — module_depends / module_closure
+# ---------------------------------------------------------------------------
+
+
+def _module(depends: list[str], origin: str = "odoo") -> dict:
+    return {"origin": origin, "depends": depends, "application": 0, "app": None}
+
+
+class TestModuleGraph:
+    @pytest.fixture
+    def kb(self, tmp_path):
+        db_path = tmp_path / "kb.db"
+        _write(
+            db_path,
+            modules={
+                "base": _module([]),
+                "mail": _module(["base"]),
+                "product": _module(["mail"]),
+                "stock": _module(["product", "mail"]),
+                "sale": _module(["product", "mail"]),
+                "sale_stock": _module(["sale", "stock"]),
+                "my_stock": _module(["stock", "missing_dep"], origin="apik"),
+                "my_sale": _module(["sale_stock", "sale"], origin="apik"),
+            },
+        )
+        return db_path
+
+    def test_chains_match_the_python_walk(self, kb):
+        with KBReader(kb) as reader:
+            index = reader.get_modules()
+            for name in index:
+                assert reader.get_depends_chain(name) == build_depends_chain(name, index)
+
+    def test_edges_keep_manifest_order_and_tier(self, kb):
+        con = sqlite3.connect(str(kb))
+        rows = con.execute("SELECT depends_on, tier, seq FROM module_depends WHERE module = 'my_stock'").fetchall()
+        con.close()
+        assert sorted(rows, key=lambda r: r[2]) == [("stock", "apik", 0), ("missing_dep", "apik", 1)]
+
+    def test_closure_distances(self, kb):
+        con = sqlite3.connect(str(kb))
+        rows = dict(con.execute("SELECT ancestor, distance FROM module_closure WHERE module = 'my_sale'"))
+        con.close()
+        assert rows == {"sale_stock": 1, "sale": 1, "stock": 2, "product": 2, "mail": 2, "base": 3}
+
+    def test_reverse_lookups(self, kb):
+        with KBReader(kb) as reader:
+            assert reader.get_dependents("stock", tiers=["apik"]) == ["my_sale", "my_stock"]
+            assert reader.get_dependents("stock", direct=True) == ["my_stock", "sale_stock"]
+            assert reader.get_dependents("missing_dep") == ["my_stock"]
+            assert reader.get_dependents("my_sale") == []
+
+    def test_modules_closure_subset(self, kb):
+        with KBReader(kb) as reader:
+            subset = reader.get_modules_closure(["sale", "missing_dep"])
+            assert set(subset) == {"sale", "product", "mail", "base"}
+            assert subset["sale"] == reader.get_modules()["sale"]
+
+    def test_partial_rewrite_updates_graph(self, kb):
+        replace_kb_modules(kb, ["my_stock"], {"modules": {"my_stock": _module(["sale"], origin="apik")}})
+
+        with KBReader(kb) as reader:
+            assert reader.get_depends_chain("my_stock") == ["sale", "product", "mail", "base"]
+            assert reader.get_dependents("stock", tiers=["apik"]) == ["my_sale"]
+
+
+# ---------------------------------------------------------------------------
+# TestDictionaryEncoding — interned strings behind the v7-compatible views
+# ---------------------------------------------------------------------------
+
+
+class TestDictionaryEncoding:
+    def _facts(self, db_path: Path, sql: str) -> list:
+        con = sqlite3.connect(str(db_path))
+        try:
+            return con.execute(sql).fetchall()
+        finally:
+            con.close()
+
+    def test_repeated_strings_are_stored_once(self, tmp_path):
+        db_path = tmp_path / "kb.db"
+        _write(
+            db_path,
+            symbols=[_sym("sale.order", f"f{i}", "field", field_type="Char") for i in range(5)],
+            views=[_view("sale.view_a"), _view("sale.view_b")],
+        )
+
+        assert self._facts(db_path, "SELECT name FROM models") == [("sale.order",)]
+        assert len(self._facts(db_path, "SELECT path FROM files")) == 2  # model file + view file
+        assert self._facts(db_path, "SELECT DISTINCT typeof(model_id), typeof(module_id) FROM symbol_facts") == [
+            ("integer", "integer")
+        ]
+
+    def test_views_decode_every_column(self, tmp_path):
+        db_path = tmp_path / "kb.db"
+        sym = _sym("sale.order", "action_confirm", "method", section="ACTION METHODS")
+        _write(
+            db_path,
+            symbols=[sym],
+            field_refs=[
+                {
+                    "model": "sale.order",
+                    "field_name": "amount",
+                    "module": "sale",
+                    "kwarg": "compute",
+                    "target_method": "_c",
+                }
+            ],
+            model_origins=[
+                {
+                    "model": "sale.order",
+                    "module": "sale",
+                    "origin": "odoo",
+                    "role": "create",
+                    "source_file": "addons/sale/models/sale.py",
+                    "source_line": 3,
+                    "description": "Sales Order",
+                }
+            ],
+        )
+
+        with KBReader(db_path) as kb:
+            [entry] = kb.get_symbol("sale.order", "action_confirm", "method")
+            assert entry == {k: sym[k] for k in entry}
+            assert kb.get_field_refs_for_method("sale.order", "_c") == [
+                {"module": "sale", "field_name": "amount", "kwarg": "compute"}
+            ]
+            assert kb.get_model_creators("sale.order")[0]["source_file"] == "addons/sale/models/sale.py"
+
+    def test_view_without_model(self, tmp_path):
+        db_path = tmp_path / "kb.db"
+        _write(db_path, views=[_view("web.layout", module="web", model=None, view_type="qweb")])
+
+        with KBReader(db_path) as kb:
+            view = kb.get_view("web.layout")
+        assert view["model"] is None and view["module"] == "web"
+
+    def test_point_lookups_use_indexes(self, tmp_path):
+        db_path = tmp_path / "kb.db"
+        _write(db_path, symbols=[_sym("sale.order", "name", "field")])
+        plans = {
+            "symbol": "SELECT * FROM symbols WHERE model = 'a' AND name = 'b' AND kind = 'field'",
+            "module": "SELECT * FROM views WHERE module = 'a'",
+            "model": "SELECT * FROM model_origins WHERE model = 'a' AND role = 'create'",
+        }
+        for label, sql in plans.items():
+            detail = " | ".join(row[3] for row in self._facts(db_path, f"EXPLAIN QUERY PLAN {sql}"))
+            assert "SCAN" not in detail, (label, detail)
+
+    def test_rewrites_a_v7_database(self, tmp_path):
+        db_path = tmp_path / "kb.db"
+        con = sqlite3.connect(str(db_path))
+        con.executescript(
+            """
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE symbols (model TEXT, name TEXT, kind TEXT, origin TEXT, module TEXT,
+                                  source_file TEXT, source_line INTEGER);
+            CREATE TABLE views (xml_id TEXT PRIMARY KEY);
+            """
+        )
+        con.close()
+
+        _write(db_path, symbols=[_sym("sale.order", "name", "field")])
+
+        kinds = dict(self._facts(db_path, "SELECT name, type FROM sqlite_master WHERE name IN ('symbols', 'views')"))
+        assert kinds == {"symbols": "view", "views": "view"}
+        with KBReader(db_path) as kb:
+            assert kb.symbol_exists("sale.order", "name", "field")
+
+
+class TestKBWriter:
+    def test_streamed_inserts_match_a_single_write(self, tmp_path):
+        symbols = [_sym("sale.order", f"f{i}", "field", field_type="Char") for i in range(6)]
+        _write(tmp_path / "once.db", symbols=symbols, modules={"sale": {"origin": "odoo", "depends": []}})
+
+        with patch("oops.kb.store._INSERT_BATCH", 4):
+            writer = KBWriter(tmp_path / "streamed.db", "project", "17.0", project="test", scope=[])
+            writer.add_sources({"odoo": "/odoo"})
+            writer.insert({"symbols": (SymbolRow(**s) for s in symbols[:3])})
+            writer.insert({"symbols": iter(symbols[3:])})
+            writer.insert({"modules": {"sale": {"origin": "odoo", "depends": []}}})
+            result = writer.close()
+
+        assert result.data["symbols"] == 6
+        with KBReader(tmp_path / "once.db") as once, KBReader(tmp_path / "streamed.db") as streamed:
+            assert streamed.get_sources() == once.get_sources()
+            assert streamed.get_modules() == once.get_modules()
+            assert [dict(r) for r in streamed._con.execute("SELECT * FROM symbols ORDER BY name")] == [
+                dict(r) for r in once._con.execute("SELECT * FROM symbols ORDER BY name")
+            ]
+
+    def test_later_row_wins(self, tmp_path):
+        with KBWriter(tmp_path / "kb.db", "global", "17.0") as writer:
+            writer.insert({"views": [_view("sale.view_a", name="old")]})
+            writer.insert({"views": [_view("sale.view_a", name="new")]})
+        writer.close()
+
+        with KBReader(tmp_path / "kb.db") as kb:
+            assert kb.get_view("sale.view_a")["name"] == "new"
+
+    def test_failed_rebuild_keeps_the_previous_kb(self, tmp_path):
+        db_path = tmp_path / "kb.db"
+        _write(db_path, symbols=[_sym("sale.order", "name", "field")])
+        with KBReader(db_path) as kb:
+            meta = kb.get_meta()
+
+        with pytest.raises(RuntimeError):
+            with KBWriter(db_path, "project", "17.0", project="test", scope=[]) as writer:
+                writer.insert({"symbols": [_sym("sale.order", "other", "field")]})
+                raise RuntimeError
+
+        with KBReader(db_path) as kb:
+            assert kb.get_meta() == meta
+            assert kb.symbol_exists("sale.order", "name", "field")
+            assert not kb.symbol_exists("sale.order", "other", "field")
+        assert not list(tmp_path.glob("kb.db.*"))
+
+    def test_previous_kb_stays_available_during_a_build(self, tmp_path):
+        db_path = tmp_path / "kb.db"
+        _write(db_path, symbols=[_sym("sale.order", "name", "field")])
+
+        writer = KBWriter(db_path, "project", "17.0", project="test", scope=[])
+        writer.insert({"symbols": [_sym("sale.order", "other", "field")]})
+        with KBReader(db_path) as kb:
+            assert kb.get_meta()["schema_version"]
+            assert kb.symbol_exists("sale.order", "name", "field")
+        assert replace_kb_modules(db_path, ["purchase"], {"modules": {}}).ok  # not locked out by the build
+
+        assert writer.close().ok
+        with KBReader(db_path) as kb:
+            assert kb.symbol_exists("sale.order", "other", "field")
+            assert not kb.symbol_exists("sale.order", "name", "field")
+
+
+# ---------------------------------------------------------------------------
+# TestMigrations — in-place upgrades of older KBs
+# ---------------------------------------------------------------------------
+
+
+def _downgrade_to_v9(db_path: Path) -> None:
+    """Turn a v10 KB into its v9 layout: depends only as JSON, no closure."""
+    con = sqlite3.connect(str(db_path))
+    con.execute("DROP TABLE module_depends")
+    con.execute("DROP TABLE module_closure")
+    con.execute("UPDATE meta SET value = '9' WHERE key = 'schema_version'")
+    con.commit()
+    con.close()
+
+
+def _downgrade_to_v8(db_path: Path) -> None:
+    """Turn a v10 KB into its v8 layout: no precomputed model_domains."""
+    _downgrade_to_v9(db_path)
+    con = sqlite3.connect(str(db_path))
+    con.execute("DROP TABLE model_domains")
+    con.execute("UPDATE meta SET value = '8' WHERE key = 'schema_version'")
+    con.commit()
+    con.close()
+
+
+def _downgrade_to_v7(db_path: Path) -> None:
+    """Turn a v10 KB into its v7 layout: plain text fact tables, no dictionaries."""
+    _downgrade_to_v8(db_path)
+    con = sqlite3.connect(str(db_path))
+    for name in ("symbols", "field_refs", "model_origins", "views"):
+        con.execute(f"CREATE TABLE v7_{name} AS SELECT * FROM {name}")
+        con.execute(f"DROP VIEW {name}")
+    for table in ("symbol_facts", "field_ref_facts", "model_origin_facts", "view_facts"):
+        con.execute(f"DROP TABLE {table}")
+    for table in ("models", "module_names", "files", "origins"):
+        con.execute(f"DROP TABLE {table}")
+    for name in ("symbols", "field_refs", "model_origins", "views"):
+        con.execute(f"ALTER TABLE v7_{name} RENAME TO {name}")
+    con.execute("UPDATE meta SET value = '7' WHERE key = 'schema_version'")
+    con.commit()
+    con.close()
+
+
+def _set_version(db_path: Path, value: str) -> None:
+    con = sqlite3.connect(str(db_path))
+    con.execute("UPDATE meta SET value = ? WHERE key = 'schema_version'", (value,))
+    con.commit()
+    con.close()
+
+
+def _snapshot(db_path: Path) -> dict:
+    with KBReader(db_path) as kb:
+        return {
+            "symbols": kb.get_symbol("sale.order", "action_confirm", "method"),
+            "all": kb.get_model_symbols("sale.order"),
+            "views_all": kb.get_views(),
+            "refs": kb.get_field_refs_for_method("sale.order", "_compute_amount"),
+            "creators": kb.get_model_creators("sale.order"),
+            "views": [kb.get_view("sale.view_form"), kb.get_view("web.layout")],
+            "domains": kb.get_model_domains(["sale.order"]),
+            "chain": kb.get_depends_chain("sale_stock"),
+        }
+
+
+class TestMigrations:
+    @pytest.fixture
+    def kb(self, tmp_path):
+        db_path = tmp_path / "kb.db"
+        _write(
+            db_path,
+            symbols=[
+                _sym("sale.order", "action_confirm", "method", section="ACTION METHODS"),
+                _sym("sale.order", "amount", "field", field_type="Monetary"),
+                _sym("sale.order", "amount", "field", field_type="Monetary", module="sale_stock"),
+            ],
+            field_refs=[
+                {
+                    "model": "sale.order",
+                    "field_name": "amount",
+                    "module": "sale",
+                    "kwarg": "compute",
+                    "target_method": "_compute_amount",
+                }
+            ],
+            model_origins=[
+                {
+                    "model": "sale.order",
+                    "module": "sale",
+                    "origin": "odoo",
+                    "role": "create",
+                    "source_file": "addons/sale/models/sale.py",
+                    "source_line": 3,
+                    "description": "Sales Order",
+                }
+            ],
+            views=[_view("sale.view_form"), _view("web.layout", module="web", model=None, view_type="qweb")],
+            modules={
+                "base": _module([]),
+                "sale": _module(["base"]),
+                "stock": _module(["base"]),
+                "sale_stock": _module(["sale", "stock"]),
+            },
+        )
+        return db_path
+
+    def test_v7_is_upgraded_in_place(self, kb):
+        expected = _snapshot(kb)
+        _downgrade_to_v7(kb)
+
+        assert migrate_kb(kb) == [7, 8, 9]
+
+        assert _snapshot(kb) == expected
+        with KBReader(kb) as reader:
+            meta = reader.get_meta()
+        assert meta["schema_version"] == "10" and "migrated_at" in meta
+        con = sqlite3.connect(str(kb))
+        kinds = dict(con.execute("SELECT name, type FROM sqlite_master WHERE name IN ('symbols', 'views')"))
+        leftovers = con.execute("SELECT name FROM sqlite_master WHERE name LIKE 'v7_%'").fetchall()
+        con.close()
+        assert kinds == {"symbols": "view", "views": "view"} and leftovers == []
+
+    def test_v8_gains_model_domains(self, kb):
+        expected = _snapshot(kb)
+        _downgrade_to_v8(kb)
+
+        assert migrate_kb(kb) == [8, 9]
+
+        assert _snapshot(kb) == expected
+        assert expected["domains"]["sale.order"]["creator"] == "sale"
+
+    def test_v9_gains_module_graph(self, kb):
+        expected = _snapshot(kb)
+        _downgrade_to_v9(kb)
+
+        assert migrate_kb(kb) == [9]
+
+        assert _snapshot(kb) == expected
+        assert expected["chain"] == ["sale", "stock", "base"]
+
+    def test_steps_do_not_depend_on_the_live_schema(self, kb):
+        def schema():
+            con = sqlite3.connect(str(kb))
+            rows = con.execute("SELECT type, name, sql FROM sqlite_master WHERE sql IS NOT NULL").fetchall()
+            con.close()
+            return {(kind, name): " ".join(sql.replace("IF NOT EXISTS ", "").split()) for kind, name, sql in rows}
+
+        def unused(*args):
+            raise AssertionError("migration step called a live builder")
+
+        expected, expected_rows = schema(), _snapshot(kb)
+        _downgrade_to_v7(kb)
+
+        broken = "CREATE TABLE broken (x);\n"
+        with patch.multiple(
+            "oops.kb.store",
+            _ENCODED_DDL=broken,
+            _DOMAINS_DDL=broken,
+            _GRAPH_DDL=broken,
+            _build_model_domains=unused,
+            _build_module_graph=unused,
+            classify_creator=unused,
+            walk_depends=unused,
+        ):
+            assert migrate_kb(kb) == [7, 8, 9]
+
+        assert schema() == expected
+        assert _snapshot(kb) == expected_rows
+
+    def test_current_kb_is_left_alone(self, kb):
+        assert migrate_kb(kb) == []
+
+    @pytest.mark.parametrize("version", ["6", "99", "garbage"])
+    def test_unsupported_versions_are_refused(self, kb, version):
+        _set_version(kb, version)
+
+        with pytest.raises(MigrationImpossible):
+            migrate_kb(kb)
+
+        with KBReader(kb) as reader:
+            assert reader.get_meta()["schema_version"] == version
+
+    def test_failed_step_rolls_back(self, kb):
+        _downgrade_to_v7(kb)
+
+        def broken(con):
+            con.execute("DROP TABLE symbols")
+            raise RuntimeError("boom")
+
+        with patch.dict("oops.kb.store._MIGRATIONS", {7: broken}), pytest.raises(RuntimeError):
+            migrate_kb(kb)
+
+        con = sqlite3.connect(str(kb))
+        assert con.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone() == ("7",)
+        assert con.execute("SELECT count(*) FROM symbols").fetchone() == (3,)
+        con.close()
+
+    def test_stale_check_migrates_instead_of_rebuilding(self, tmp_path, kb):
+        from oops.kb.build import is_project_kb_stale
+
+        cache = tmp_path / ".oops-cache"
+        cache.mkdir()
+        kb.rename(cache / "kb.db")
+        _downgrade_to_v7(cache / "kb.db")
+
+        stale, reason = is_project_kb_stale(tmp_path, "17.0")
+
+        assert "schema" not in reason
+        with KBReader(cache / "kb.db") as reader:
+            assert reader.get_meta()["schema_version"] == "10"
@@ -12,8 +12,8 @@ from unittest.mock import MagicMock, patch
 import click
 from click.testing import CliRunner
 from oops.commands.misc.create_workspace import main as workspace_main
-from oops.core.models import Result
 from oops.io.file import OdooSourcesDirs
+from oops.kb.store import KBReader
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -348,22 +348,29 @@ class TestBuildKb:
     def _runner(self):
         return CliRunner()
 
+    def _addon(self, root, name):
+        (root / name / "models").mkdir(parents=True, exist_ok=True)
+        (root / name / "__manifest__.py").write_text(f"{{'name': '{name}', 'depends': []}}\n")
+        (root / name / "models" / "m.py").write_text(
+            "from odoo import fields, models\n\n\n"
+            f"class M(models.Model):\n    _name = '{name}.m'\n\n    x = fields.Char()\n"
+        )
+
     def _invoke(self, tmp_path, version="17.0", with_enterprise=True, with_themes=True):
         sources = tmp_path / "sources"
         community = sources / version / "community"
         enterprise = sources / version / "enterprise"
         themes = sources / version / "themes"
-        community.mkdir(parents=True, exist_ok=True)
+        self._addon(community, "base_mod")
         if with_enterprise:
-            enterprise.mkdir(parents=True, exist_ok=True)
+            self._addon(enterprise, "ent_mod")
         if with_themes:
-            themes.mkdir(parents=True, exist_ok=True)
+            self._addon(themes, "theme_mod")
         dirs = OdooSourcesDirs(community=community, enterprise=enterprise, themes=themes)
         cache_dir = tmp_path / "cache"
 
         from oops.commands.misc.build_global import main as build_kb_main
 
-        _xml_scan_data = {"views": [], "actions": [], "menus": []}
         with patch(
             "oops.commands.misc.build_global.global_kb_dir",
             return_value=cache_dir,
@@ -371,78 +378,50 @@ class TestBuildKb:
             "oops.commands.misc.build_global.get_odoo_sources_dirs",
             return_value=dirs,
         ), patch(
-            "oops.commands.misc.build_global.odoo_addons_roots",
-            return_value=[community],
-        ), patch(
-            "oops.commands.misc.build_global.scan_tier",
-            return_value=Result(
-                data={"modules": {}, "symbols": [], "field_refs": [], "model_origins": []}
-            ),
-        ) as mock_scan, patch(
-            "oops.commands.misc.build_global.scan_tier_xml",
-            return_value=Result(data=_xml_scan_data),
-        ), patch(
-            "oops.commands.misc.build_global._resolve_prototype_roles"
-        ), patch(
-            "oops.commands.misc.build_global._resolve_view_types"
-        ), patch(
-            "oops.commands.misc.build_global.write_global_kb",
-            return_value=Result(
-                data={
-                    "file": tmp_path / "kb.db",
-                    "modules": 0,
-                    "symbols": 0,
-                    "fields": 0,
-                    "methods": 0,
-                    "field_refs": 0,
-                    "model_origins": 0,
-                    "views": 0,
-                    "actions": 0,
-                    "menus": 0,
-                }
-            ),
-        ) as mock_write:
+            "oops.kb.build.odoo_addons_roots",
+            side_effect=lambda path: [path],
+        ):
             result = self._runner().invoke(
                 build_kb_main,
                 ["--version", version],
             )
-        return result, mock_scan, mock_write
+        return result, cache_dir / f"{version}.db"
+
+    def _origins(self, db_path):
+        with KBReader(db_path) as kb:
+            return {name: data["origin"] for name, data in kb.get_modules().items()}
 
     def test_happy_path_runs_to_completion(self, tmp_path):
-        result, _, mock_write = self._invoke(tmp_path)
+        result, db_path = self._invoke(tmp_path)
         assert result.exit_code == 0, result.output
-        mock_write.assert_called_once()
+        assert db_path.exists()
 
     def test_scans_community_enterprise_themes_when_all_present(self, tmp_path):
-        result, mock_scan, _ = self._invoke(tmp_path)
+        result, db_path = self._invoke(tmp_path)
         assert result.exit_code == 0, result.output
-        tiers = [call.args[1] for call in mock_scan.call_args_list]
-        assert "odoo" in tiers
-        assert "enterprise" in tiers
-        assert "themes" in tiers
+        assert self._origins(db_path) == {"base_mod": "odoo", "ent_mod": "enterprise", "theme_mod": "themes"}
 
     def test_skips_enterprise_when_missing(self, tmp_path):
-        result, mock_scan, _ = self._invoke(tmp_path, with_enterprise=False)
+        result, db_path = self._invoke(tmp_path, with_enterprise=False)
         assert result.exit_code == 0, result.output
-        tiers = [call.args[1] for call in mock_scan.call_args_list]
-        assert "enterprise" not in tiers
+        assert "enterprise" not in self._origins(db_path).values()
 
     def test_skips_themes_when_missing(self, tmp_path):
-        result, mock_scan, _ = self._invoke(tmp_path, with_themes=False)
+        result, db_path = self._invoke(tmp_path, with_themes=False)
         assert result.exit_code == 0, result.output
-        tiers = [call.args[1] for call in mock_scan.call_args_list]
-        assert "themes" not in tiers
+        assert "themes" not in self._origins(db_path).values()
 
     def test_summary_panel_includes_xml_rows(self, tmp_path):
-        result, _, _ = self._invoke(tmp_path)
+        result, _ = self._invoke(tmp_path)
         assert result.exit_code == 0, result.output
         assert "Views" in result.output
         assert "Actions" in result.output
         assert "Menus" in result.output
 
     def test_writes_sources_map_with_themes_when_present(self, tmp_path):
-        _, _, mock_write = self._invoke(tmp_path)
-        sources = mock_write.call_args.kwargs["sources"]
+        _, db_path = self._invoke(tmp_path)
+        with KBReader(db_path) as kb:
+            sources = kb.get_sources()
         assert "odoo" in sources
         assert "enterprise" in sources
         assert "themes" in sources
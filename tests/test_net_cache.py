@@ -0,0 +1,173 @@
+"""Tests for the on-disk HTTP cache (oops.utils.net.cached_json_get) and the
+per-version image index built on top of it (oops.services.docker)."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+import requests
+
+
+def _image(tag: str, version, edition: str = "enterprise") -> dict:
+    return {
+        "image": f"apik/odoo:{tag}",
+        "org": "apik",
+        "repo": "odoo",
+        "collection": "production",
+        "version": version,
+        "edition": edition,
+        "release": tag.split("-")[1],
+    }
+
+
+IMAGES = [
+    _image("19.0-20250921-enterprise", 19),
+    _image("18.0-20250915-enterprise", 18),
+    _image("19.0-20250901-community", 19.0, edition="community"),
+]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves ``server.payload`` with a strong ETag and honours If-None-Match."""
+
+    def do_GET(self):  # noqa: N802 - http.server API
+        server = self.server
+        server.requests.append(dict(self.headers))
+        body = json.dumps(server.payload).encode()
+        etag = f'"{len(body)}-{hash(body) & 0xFFFF}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.payload = IMAGES
+    httpd.requests = []
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/tags.json"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestCachedJsonGet:
+    def test_first_fetch_stores_body(self, server, tmp_path):
+        from oops.utils.net import cached_json_get
+
+        response = cached_json_get(server.url, ttl=60, cache_dir=tmp_path)
+
+        assert response.data == IMAGES
+        assert not response.from_cache
+        assert response.path.is_file()
+        assert len(server.requests) == 1
+
+    def test_fresh_entry_sends_no_request(self, server, tmp_path):
+        from oops.utils.net import cached_json_get
+
+        first = cached_json_get(server.url, ttl=60, cache_dir=tmp_path)
+        second = cached_json_get(server.url, ttl=60, cache_dir=tmp_path)
+
+        assert second.from_cache
+        assert second.digest == first.digest
+        assert len(server.requests) == 1
+
+    def test_expired_entry_revalidates_with_etag(self, server, tmp_path):
+        from oops.utils.net import cached_json_get
+
+        cached_json_get(server.url, ttl=0, cache_dir=tmp_path)
+        response = cached_json_get(server.url, ttl=0, cache_dir=tmp_path)
+
+        assert response.from_cache
+        assert response.data == IMAGES
+        assert len(server.requests) == 2
+        assert "If-None-Match" in server.requests[1]
+
+    def test_changed_body_replaces_entry(self, server, tmp_path):
+        from oops.utils.net import cached_json_get
+
+        first = cached_json_get(server.url, ttl=0, cache_dir=tmp_path)
+        server.payload = IMAGES[:1]
+        second = cached_json_get(server.url, ttl=0, cache_dir=tmp_path)
+
+        assert not second.from_cache
+        assert second.digest != first.digest
+        assert second.data == IMAGES[:1]
+
+    def test_offline_serves_stale_copy(self, server, tmp_path, caplog):
+        from oops.utils.net import cached_json_get
+
+        cached_json_get(server.url, ttl=0, cache_dir=tmp_path)
+        with patch("oops.utils.net.HttpClient.get", side_effect=requests.ConnectionError("offline")):
+            response = cached_json_get(server.url, ttl=0, cache_dir=tmp_path)
+
+        assert response.stale
+        assert response.data == IMAGES
+        assert "cached copy" in caplog.text
+
+    def test_offline_without_cache_raises(self, tmp_path):
+        from oops.utils.net import cached_json_get
+
+        with patch("oops.utils.net.HttpClient.get", side_effect=requests.ConnectionError("offline")):
+            with pytest.raises(requests.ConnectionError):
+                cached_json_get("http://127.0.0.1:9/none.json", ttl=60, cache_dir=tmp_path)
+
+    def test_params_are_part_of_the_key(self, server, tmp_path):
+        from oops.utils.net import cached_json_get
+
+        cached_json_get(server.url, ttl=60, params={"page": 1}, cache_dir=tmp_path)
+        cached_json_get(server.url, ttl=60, params={"page": 2}, cache_dir=tmp_path)
+
+        assert len(server.requests) == 2
+
+
+class TestImageIndex:
+    @pytest.fixture(autouse=True)
+    def _source(self, server, monkeypatch):
+        from oops.core.config import ImageSourceConfig
+
+        monkeypatch.setattr(ImageSourceConfig, "url", property(lambda self: server.url))
+
+    def test_version_lookup_reads_index(self, server):
+        from oops.core.paths import images_index_dir
+        from oops.services.docker import load_image_dicts
+
+        assert [d["image"] for d in load_image_dicts(19.0)] == [IMAGES[0]["image"], IMAGES[2]["image"]]
+        assert load_image_dicts(17) == []
+
+        index = json.loads((images_index_dir() / "index.json").read_text())
+        assert index["versions"] == {"18.0": 1, "19.0": 2}
+        assert (images_index_dir() / "18.0.json").is_file()
+        assert len(server.requests) == 1
+
+    def test_index_rebuilt_when_source_changes(self, server, monkeypatch):
+        from oops.core.config import config
+        from oops.services.docker import load_image_dicts
+
+        monkeypatch.setattr(config.images, "cache_ttl", 0)
+        assert len(load_image_dicts(19.0)) == 2
+
+        server.payload = IMAGES[:1]
+        assert len(load_image_dicts(19.0)) == 1
+
+    def test_fetch_odoo_images_by_version(self):
+        from oops.services.docker import fetch_odoo_images
+
+        images = fetch_odoo_images(version=18.0)
+
+        assert [i.image for i in images] == [IMAGES[1]["image"]]
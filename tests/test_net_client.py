@@ -0,0 +1,167 @@
+"""Tests for the pooled HTTP client (oops.utils.net.HttpClient) against a local
+threaded http.server."""
+
+import gzip
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes by path:
+
+    - ``/json``: small JSON body (gzip-encoded when accepted);
+    - ``/flaky``: answers ``server.failures`` times with ``server.fail_status``, then 200;
+    - ``/slow``: sleeps briefly while tracking how many requests are in flight.
+    """
+
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):  # noqa: N802 - http.server API
+        server = self.server
+        with server.lock:
+            server.ports.add(self.client_address[1])
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+
+        if self.path == "/flaky":
+            with server.lock:
+                fail = server.failures > 0
+                server.failures -= 1
+            if fail:
+                self._send(server.fail_status, b"busy", {"Retry-After": "0"})
+                return
+
+        if self.path == "/slow":
+            with server.lock:
+                server.in_flight += 1
+                server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            time.sleep(0.05)
+            with server.lock:
+                server.in_flight -= 1
+
+        body = json.dumps({"path": self.path, "payload": "x" * 2000}).encode()
+        headers = {"Content-Type": "application/json"}
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+            with server.lock:
+                server.gzipped += 1
+        self._send(200, body, headers)
+
+    def _send(self, status, body, headers):
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.ports = set()
+    httpd.hits = {}
+    httpd.failures = 0
+    httpd.fail_status = 503
+    httpd.gzipped = 0
+    httpd.in_flight = httpd.max_in_flight = 0
+    httpd.base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def client():
+    from oops.utils.net import HttpClient
+
+    c = HttpClient(max_connections=2, retries=3, backoff=0, timeout=5)
+    yield c
+    c.close()
+
+
+class TestHttpClient:
+    def test_connections_are_reused(self, server, client):
+        for _ in range(5):
+            assert client.get(f"{server.base}/json").json()["path"] == "/json"
+
+        assert server.hits["/json"] == 5
+        assert len(server.ports) == 1
+
+    def test_gzip_is_negotiated_and_decoded(self, server, client):
+        r = client.get(f"{server.base}/json")
+
+        assert r.json()["payload"] == "x" * 2000
+        assert server.gzipped == 1
+        assert client.stats["bytes"] == len(r.content)
+
+    @pytest.mark.parametrize("status", [429, 503])
+    def test_retries_transient_statuses(self, server, client, status):
+        server.failures = 2
+        server.fail_status = status
+
+        r = client.get(f"{server.base}/flaky")
+
+        assert r.status_code == 200
+        assert server.hits["/flaky"] == 3
+        assert client.stats == {"requests": 1, "retries": 2, "bytes": len(r.content)}
+
+    def test_exhausted_retries_return_last_response(self, server, client):
+        server.failures = 10
+
+        r = client.get(f"{server.base}/flaky")
+
+        assert r.status_code == 503
+        assert server.hits["/flaky"] == 4  # first try + 3 retries
+
+    def test_concurrency_is_bounded(self, server, client):
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            codes = list(pool.map(lambda _: client.get(f"{server.base}/slow").status_code, range(6)))
+
+        assert codes == [200] * 6
+        assert server.max_in_flight <= 2
+
+    def test_streamed_bytes_are_counted(self, server, client):
+        with client.get(f"{server.base}/json", stream=True) as r:
+            body = b"".join(client.iter_content(r, chunk_size=256))
+
+        assert json.loads(body)["path"] == "/json"
+        assert client.stats["bytes"] == len(body)
+
+    def test_counters_reach_the_profiler(self, server, client):
+        from oops.core.profiling import start_profiling, stop_profiling
+
+        tracer = start_profiling()
+        try:
+            client.get(f"{server.base}/json")
+        finally:
+            stop_profiling()
+
+        assert tracer.counters["http.requests"] == 1
+        assert tracer.counters["http.bytes"] > 0
+
+
+class TestSharedClient:
+    def test_single_instance(self):
+        from oops.utils.net import get_http_client
+
+        assert get_http_client() is get_http_client()
+
+    def test_make_json_get_uses_the_pool(self, server):
+        from oops.utils.net import get_http_client, make_json_get
+
+        before = get_http_client().stats["requests"]
+        assert make_json_get(f"{server.base}/json", params={"a": "1"})["path"] == "/json?a=1"
+        assert get_http_client().stats["requests"] == before + 1
@@ -1,3 +1,4 @@
+import json
 from datetime import date
 from unittest.mock import patch
 
@@ -78,7 +79,10 @@ tags = [
 
 @pytest.fixture
 def mock_response():
-    with patch("requests.get") as mock_get:
+    with patch("oops.utils.net.HttpClient.get") as mock_get:
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
+        mock_get.return_value.content = json.dumps(tags).encode()
         yield mock_get
 
 
@@ -241,8 +245,6 @@ def test_check_unusual_image():
 
 
 def test_fetch_odoo_images_filter_on_collections(mock_response):
-    # Successful response
-    mock_response.return_value.json.return_value = tags
     assert fetch_odoo_images() == [
         ImageInfo.from_raw_dict(
             {
@@ -302,7 +304,6 @@ def test_fetch_odoo_images_filter_on_collections(mock_response):
 
 def test_find_available_images(mock_response):
     release = date(2025, 9, 1)
-    mock_response.return_value.json.return_value = tags
     assert find_available_images(release=release, enterprise=True, version=19.0) == [
         ImageInfo(
             **{
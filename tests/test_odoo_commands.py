@@ -6,7 +6,9 @@
 """Tests for oops/utils/git.py and the three odoo CLI commands."""
 
 import json
+import os
 import subprocess
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -864,3 +866,169 @@ class TestOdooConfig:
         assert cfg.community_url == "git@github.com:odoo/odoo.git"
         assert cfg.enterprise_url == "git@github.com:odoo/enterprise.git"
         assert cfg.themes_url == "git@github.com:odoo/design-themes.git"
+
+
+# ---------------------------------------------------------------------------
+# Shared reference repositories — end to end over file:// bare upstreams
+# ---------------------------------------------------------------------------
+
+
+def _run(*args, cwd=None):
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", "-c", "init.defaultBranch=16.0", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def _make_upstream(root: Path, name: str) -> str:
+    """Bare upstream with branches 16.0 and 17.0 sharing most of their history."""
+    work = root / f"{name}-work"
+    work.mkdir(parents=True)
+    _run("init", "-q", cwd=work)
+    for i in range(3):
+        (work / f"file{i}.py").write_text(f"# {name} {i}\n" * 200)
+        _run("add", ".", cwd=work)
+        _run("commit", "-qm", f"commit {i}", cwd=work)
+    _run("checkout", "-qb", "17.0", cwd=work)
+    (work / "v17.py").write_text("# 17\n")
+    _run("add", ".", cwd=work)
+    _run("commit", "-qm", "17.0 only", cwd=work)
+    bare = root / f"{name}.git"
+    _run("clone", "-q", "--bare", str(work), str(bare))
+    return bare.as_uri()
+
+
+def _object_count(repo: Path) -> int:
+    """Number of objects stored in the repository itself (alternates excluded)."""
+    out = _run("count-objects", "-v", cwd=repo)
+    stats = dict(line.split(": ") for line in out.splitlines())
+    return int(stats["count"]) + int(stats["in-pack"])
+
+
+class TestReferenceRepositories:
+    def test_ensure_reference_fetches_each_branch_once(self, tmp_path):
+        from oops.utils.git import ensure_reference
+
+        url = _make_upstream(tmp_path, "odoo")
+        ref = tmp_path / "sources" / ".reference" / "community.git"
+
+        ensure_reference(url, ref, "16.0", quiet=True)
+        ensure_reference(url, ref, "17.0", quiet=True)
+
+        assert _run("for-each-ref", "--format=%(refname)", cwd=ref).splitlines() == [
+            "refs/heads/16.0",
+            "refs/heads/17.0",
+        ]
+        assert _run("rev-parse", "--is-shallow-repository", cwd=ref) == "true"
+
+    def test_clone_with_reference_borrows_objects(self, tmp_path):
+        from oops.utils.git import ensure_reference
+
+        url = _make_upstream(tmp_path, "odoo")
+        ref = ensure_reference(url, tmp_path / "ref.git", "16.0", quiet=True)
+        ensure_reference(url, ref, "17.0", quiet=True)
+
+        clone(url, tmp_path / "16.0", "16.0", quiet=True, reference=ref)
+        clone(url, tmp_path / "17.0", "17.0", quiet=True, reference=ref)
+
+        for version in ("16.0", "17.0"):
+            checkout = tmp_path / version
+            assert (checkout / ".git" / "objects" / "info" / "alternates").exists()
+            assert _object_count(checkout) == 0
+            assert _run("rev-parse", "--is-shallow-repository", cwd=checkout) == "true"
+            assert _run("rev-parse", "--abbrev-ref", "@{upstream}", cwd=checkout) == f"origin/{version}"
+            assert _run("fsck", "--no-dangling", cwd=checkout) == ""
+        assert (tmp_path / "17.0" / "v17.py").exists()
+        assert not (tmp_path / "16.0" / "v17.py").exists()
+
+    def test_borrow_objects_reclaims_existing_checkout(self, tmp_path):
+        from oops.utils.git import borrow_objects, ensure_reference
+
+        url = _make_upstream(tmp_path, "odoo")
+        _run("clone", "-q", "--single-branch", "--branch", "16.0", url, str(tmp_path / "co"))
+        before = _object_count(tmp_path / "co")
+
+        ref = ensure_reference(url, tmp_path / "ref.git", "16.0", quiet=True)
+        assert borrow_objects(tmp_path / "co", ref, quiet=True) is True
+        assert borrow_objects(tmp_path / "co", ref, quiet=True) is False
+
+        # The reference holds the tip only: older history stays in the checkout.
+        assert 0 < _object_count(tmp_path / "co") < before
+        assert _run("status", "--porcelain", cwd=tmp_path / "co") == ""
+        assert _run("rev-list", "--count", "HEAD", cwd=tmp_path / "co") == "3"  # full history still reachable
+
+    def test_gc_keeps_objects_of_a_moved_tip(self, tmp_path):
+        from oops.utils.git import ensure_reference
+
+        url = _make_upstream(tmp_path, "odoo")
+        ref = ensure_reference(url, tmp_path / "ref.git", "16.0", quiet=True)
+        clone(url, tmp_path / "16.0", "16.0", quiet=True, reference=ref)
+
+        work = tmp_path / "odoo-work"
+        _run("checkout", "-q", "16.0", cwd=work)
+        (work / "file0.py").write_text("# moved\n")
+        _run("commit", "-qam", "moved", cwd=work)
+        _run("push", "-q", url, "16.0", cwd=work)
+        ensure_reference(url, ref, "16.0", quiet=True)
+
+        # The old tip is now unreachable in the reference; make it look stale.
+        old = time.time() - 90 * 86400
+        for path in (ref / "objects").rglob("*"):
+            os.utime(path, (old, old))
+        _run("gc", "-q", cwd=ref)
+
+        assert _run("fsck", "--no-dangling", cwd=tmp_path / "16.0") == ""
+        assert _run("config", "gc.auto", cwd=ref) == "0"
+
+    def test_reference_dir_hidden_from_version_listing(self, tmp_path):
+        from oops.io.file import get_odoo_reference_dir, list_odoo_sources_versions
+
+        (tmp_path / "17.0" / "community").mkdir(parents=True)
+        get_odoo_reference_dir("community", base_dir=tmp_path).mkdir(parents=True)
+
+        assert [s.version for s in list_odoo_sources_versions(base_dir=tmp_path)] == ["17.0"]
+
+
+class TestParallelDownload:
+    @pytest.fixture
+    def upstreams(self, tmp_path, monkeypatch):
+        from oops.core.config import config
+
+        monkeypatch.setattr(config.odoo, "sources_dir", tmp_path / "sources")
+        monkeypatch.setattr(config.odoo, "community_url", _make_upstream(tmp_path / "up", "odoo"))
+        monkeypatch.setattr(config.odoo, "enterprise_url", _make_upstream(tmp_path / "up", "enterprise"))
+        monkeypatch.setattr(config.odoo, "themes_url", _make_upstream(tmp_path / "up", "design-themes"))
+        return tmp_path / "sources"
+
+    def test_download_with_reference_for_two_versions(self, upstreams):
+        runner = CliRunner()
+        for version in ("16.0", "17.0"):
+            result = runner.invoke(download_main, ["--version", version, "--reference", "--format", "json"])
+            assert result.exit_code == 0, result.output
+            rows = json.loads(result.output[result.output.index("{") :])["repos"]
+            assert [(r["repo"], r["action"]) for r in rows] == [
+                ("Community", "cloned"),
+                ("Enterprise", "cloned"),
+                ("Themes", "cloned"),
+            ]
+
+        for name in ("community", "enterprise", "themes"):
+            ref = upstreams / ".reference" / f"{name}.git"
+            assert _run("for-each-ref", "--format=%(refname:short)", cwd=ref).splitlines() == ["16.0", "17.0"]
+            for version in ("16.0", "17.0"):
+                assert _object_count(upstreams / version / name) == 0
+
+    def test_update_with_reference_borrows_from_plain_clone(self, upstreams):
+        runner = CliRunner()
+        assert runner.invoke(download_main, ["--version", "17.0"]).exit_code == 0
+        before = _object_count(upstreams / "17.0" / "community")
+
+        with patch("oops.commands.odoo.update.require_odoo_sources", return_value=[]):
+            result = runner.invoke(update_main, ["--version", "17.0", "--reference"])
+
+        assert result.exit_code == 0, result.output
+        assert before > 0
+        assert _object_count(upstreams / "17.0" / "community") == 0
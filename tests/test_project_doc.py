@@ -11,7 +11,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from click.testing import CliRunner
-from oops.commands.project.doc import _build_inventory, main
+from oops.commands.project.doc import _build_inventory, _reanalyse, main
 from oops.commands.project.presenters.doc import ProjectDocPresenter
 from oops.core.models import Result
 from oops.output.base import RenderTarget
@@ -671,3 +671,58 @@ class TestCleanAndIntegration:
         assert result.exit_code == 0, result.output
         assert not (out / "stale.md").exists()  # wiped
         assert (out / "index.md").is_file()
+
+
+# ---------------------------------------------------------------------------
+# --watch — touched modules are re-analysed and spliced into the IR
+# ---------------------------------------------------------------------------
+
+
+def _ir_module(name: str, title: str, loc_total: int) -> dict:
+    return {
+        "module": name,
+        "manifest": {"name": title},
+        "depends": [],
+        "loc": {"total": loc_total, "pct": 0.0},
+        "metrics": {"missing_docs": 0},
+        "models": [],
+        "fields": [],
+        "methods": [],
+        "views": [],
+    }
+
+
+class TestWatch:
+    def test_reanalyse_splices_touched_modules(self, tmp_path: Path) -> None:
+        ir = {"warnings": [], "modules": [_ir_module("a", "A", 30), _ir_module("b", "B", 10)]}
+        inventory = {"b": {"path": str(tmp_path / "b"), "loc": {"total": 10}}}
+
+        with patch("oops.commands.project.doc.refresh_modules", return_value=Result()) as refresh, patch(
+            "oops.commands.project.doc._run_analyze", return_value={"modules": [_ir_module("b", "B2", 70)]}
+        ) as run, patch("oops.commands.project.doc.get_addon_loc", return_value=LocStats(python=70)):
+            _reanalyse(tmp_path, ir, inventory, [tmp_path / "b"])
+
+        assert refresh.call_args.args == (tmp_path, [tmp_path / "b"])
+        assert run.call_args.args == ([str(tmp_path / "b")],)
+        assert [m["manifest"]["name"] for m in ir["modules"]] == ["A", "B2"]
+        assert [m["loc"]["pct"] for m in ir["modules"]] == [30.0, 70.0]
+        assert inventory["b"]["loc"]["total"] == 70
+
+    def test_site_regenerated_on_change(self, tmp_path: Path) -> None:
+        out = tmp_path / "docs"
+
+        def one_change(paths):
+            yield [Path(paths[0])]
+
+        def reanalyse(repo_path, ir, inventory, touched):
+            ir["modules"][0]["models"][0]["model"] = "res.users"
+
+        with patch("oops.commands.project.doc.watch_modules", side_effect=one_change), patch(
+            "oops.commands.project.doc._reanalyse", side_effect=reanalyse
+        ):
+            result = _invoke_doc(tmp_path, out, extra_args=["--watch"])
+
+        assert result.exit_code == 0, result.output
+        assert result.output.count("Documentation written to") == 2
+        assert (out / "models" / "res.users.md").is_file()
+        assert "pm updated in" in result.output
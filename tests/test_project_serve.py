@@ -7,11 +7,19 @@
 
 from __future__ import annotations
 
+import functools
+import gzip
+import http.server
 import json
+import threading
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from oops.commands.project.serve import build_payload, prepare_site_dir
+from oops.commands.project.serve import LiveUpdates, ShardRequestHandler, build_payload, prepare_site_dir
+from oops.output.shards import join_serve_payload, split_serve_payload, write_shards
 from oops.services.loc import LocStats
 
 
@@ -120,18 +128,26 @@ class TestBuildPayload:
 
 
 class TestPrepareSiteDir:
-    def test_prepare_site_dir_writes_data_js(self, tmp_path: Path) -> None:
+    def test_prepare_site_dir_writes_sharded_bundle(self, tmp_path: Path) -> None:
         dest = tmp_path / "site"
         dest.mkdir()
-        payload = {"metadata": {"schema_version": 2}, "modules": []}
 
-        prepare_site_dir(payload, dest)
+        prepare_site_dir(_sharded_payload(), dest)
+
+        assert not (dest / "data.js").exists()
+        index = json.loads((dest / "data" / "index.json").read_text(encoding="utf-8"))
+        assert [m["module"] for m in index["modules"]] == ["my_module"]
+        assert (dest / "data" / "modules" / "my_module.json").is_file()
+        assert (dest / "data" / "modules" / "my_module.json.gz").is_file()
+
+    def test_live_reload_subscribes_index_to_events(self, tmp_path: Path) -> None:
+        plain, live = tmp_path / "plain", tmp_path / "live"
 
-        data_js = dest / "data.js"
-        assert data_js.exists()
-        content = data_js.read_text(encoding="utf-8")
-        assert content.startswith("window.OOPS = ")
-        assert content.endswith(";\n")
+        prepare_site_dir({"metadata": {}}, plain)
+        prepare_site_dir({"metadata": {}}, live, live_reload=True)
+
+        assert "/api/events" not in (plain / "index.html").read_text(encoding="utf-8")
+        assert 'EventSource("/api/events")' in (live / "index.html").read_text(encoding="utf-8")
 
     def test_prepare_site_dir_copies_index_and_app(self, tmp_path: Path) -> None:
         dest = tmp_path / "site"
@@ -158,6 +174,226 @@ class TestPrepareSiteDir:
         assert bundle.stat().st_size > 10_000, "dist/app.bundle.js suspiciously small"
 
 
+def _sharded_payload() -> dict:
+    field = {"id": "my_module:my.model#field:name", "name": "name", "model": "my_module:my.model"}
+    method = {"id": "my_module:my.model#method:run", "name": "run", "model": "my_module:my.model"}
+    model_node = {"id": "my_module:my.model", "model": "my.model", "status": "new"}
+    return {
+        "metadata": {"command": "project serve", "schema_version": 2},
+        "warnings": [],
+        "schema": {"definitions": {}},
+        "index": {"my_module:my.model": {"type": "model"}},
+        "modules": [
+            {
+                "module": "my_module",
+                "manifest": {"name": "My Module"},
+                "inventory": {"classification": "custom"},
+                "readme": {"present": True, "format": "md", "path": "README.md", "content": "# Hello"},
+                "models": [model_node],
+                "fields": [field],
+                "methods": [method],
+                "views": [],
+            }
+        ],
+        "models_by_bare": {
+            "my.model": {
+                "bare": "my.model",
+                "page": "models/my.model.md",
+                "description": None,
+                "description_inherited_from": None,
+                "contributions": [
+                    {"module": "my_module", "model_node": model_node, "fields": [field], "methods": [method]}
+                ],
+            }
+        },
+    }
+
+
+class TestShards:
+    def test_index_is_light_and_shards_carry_nodes(self) -> None:
+        index, shards = split_serve_payload(_sharded_payload())
+
+        mod = index["modules"][0]
+        assert "fields" not in mod and "methods" not in mod
+        assert mod["readme"] == {"present": True, "format": "md"}
+        assert mod["counts"] == {"models": 1, "fields": 1, "methods": 1, "views": 0}
+        assert mod["shard"] == "modules/my_module.json"
+        contribution = index["models_by_bare"]["my.model"]["contributions"][0]
+        assert contribution["fields_count"] == 1 and "fields" not in contribution
+        assert "index" not in index
+        assert shards["my_module"]["readme"]["content"] == "# Hello"
+
+    def test_index_carries_the_search_entries(self) -> None:
+        payload = _sharded_payload()
+        payload["modules"][0]["fields"][0].update(label_inferred=True, type="Char")
+        payload["modules"][0]["methods"][0]["docstring"] = "Run it.\n\nAt length."
+
+        index, _ = split_serve_payload(payload)
+
+        assert index["search"] == [
+            {
+                "kind": "field",
+                "id": "my_module:my.model#field:name",
+                "label": "Name",
+                "module": "my_module",
+                "model": "my.model",
+                "text": "name Name Char",
+            },
+            {
+                "kind": "method",
+                "id": "my_module:my.model#method:run",
+                "label": "run",
+                "module": "my_module",
+                "model": "my.model",
+                "text": "run Run it.",
+            },
+        ]
+
+    def test_write_shards_can_limit_to_some_modules(self, tmp_path: Path) -> None:
+        payload = _sharded_payload()
+        write_shards(payload, tmp_path)
+        shard = tmp_path / "data" / "modules" / "my_module.json"
+        shard.write_text("stale")
+
+        payload["modules"][0]["manifest"]["name"] = "Renamed"
+        write_shards(payload, tmp_path, modules=[])
+
+        assert shard.read_text() == "stale"
+        index = json.loads((tmp_path / "data" / "index.json").read_text(encoding="utf-8"))
+        assert index["modules"][0]["manifest"]["name"] == "Renamed"
+
+    def test_join_reverses_split(self) -> None:
+        payload = _sharded_payload()
+        index, shards = split_serve_payload(payload)
+
+        joined = join_serve_payload(index, shards)
+
+        expected = {k: v for k, v in payload.items() if k != "index"}
+        assert joined == expected
+
+
+class TestShardRequestHandler:
+    @contextmanager
+    def _serve(self, site: Path, handler_class=ShardRequestHandler):
+        handler = functools.partial(handler_class, directory=str(site))
+        handler.log_message = lambda *a, **k: None  # type: ignore[attr-defined]
+        with http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler) as httpd:
+            thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+            thread.start()
+            try:
+                yield f"http://127.0.0.1:{httpd.server_address[1]}"
+            finally:
+                httpd.shutdown()
+
+    def _get(self, url: str, headers: "dict | None" = None):
+        req = urllib.request.Request(url, headers=headers or {})
+        try:
+            with urllib.request.urlopen(req) as res:
+                return res.status, dict(res.headers), res.read()
+        except urllib.error.HTTPError as err:
+            return err.code, dict(err.headers), b""
+
+    def test_gzip_sibling_and_strong_etag_revalidation(self, tmp_path: Path) -> None:
+        site = tmp_path / "site"
+        site.mkdir()
+        write_shards(_sharded_payload(), site)
+
+        with self._serve(site) as base:
+            url = f"{base}/data/modules/my_module.json"
+            status, headers, body = self._get(url, {"Accept-Encoding": "gzip"})
+            assert status == 200
+            assert headers["Content-Encoding"] == "gzip"
+            assert json.loads(gzip.decompress(body))["module"] == "my_module"
+            etag = headers["ETag"]
+            assert etag.startswith('"') and not etag.startswith("W/")
+
+            status, _, body = self._get(url, {"Accept-Encoding": "gzip", "If-None-Match": etag})
+            assert status == 304
+            assert body == b""
+
+            status, plain_headers, body = self._get(url)
+            assert status == 200
+            assert "Content-Encoding" not in plain_headers
+            assert plain_headers["ETag"] != etag
+            assert json.loads(body)["module"] == "my_module"
+
+    def test_etag_cache_keeps_one_entry_per_file(self, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.setattr(ShardRequestHandler, "_etags", {})
+        site = tmp_path / "site"
+        site.mkdir()
+        write_shards(_sharded_payload(), site)
+
+        with self._serve(site) as base:
+            url = f"{base}/data/modules/my_module.json"
+            etags = []
+            for readme in ("# One", "# Two!", "# Three"):
+                payload = _sharded_payload()
+                payload["modules"][0]["readme"]["content"] = readme
+                write_shards(payload, site)
+                etags.append(self._get(url)[1]["ETag"])
+
+        assert len(set(etags)) == 3
+        assert list(ShardRequestHandler._etags) == [str(site / "data" / "modules" / "my_module.json")]
+
+    def test_api_scan_project_returns_joined_payload(self, tmp_path: Path) -> None:
+        site = tmp_path / "site"
+        site.mkdir()
+        write_shards(_sharded_payload(), site)
+
+        with self._serve(site) as base:
+            req = urllib.request.Request(f"{base}/api/scan_project", data=b"[]", method="POST")
+            with urllib.request.urlopen(req) as res:
+                payload = json.loads(res.read())
+
+        assert payload["models_by_bare"]["my.model"]["contributions"][0]["fields"][0]["name"] == "name"
+
+    def test_events_stream_pushes_updates(self, tmp_path: Path) -> None:
+        site = tmp_path / "site"
+        site.mkdir()
+        updates = LiveUpdates()
+        handler_class = type("Live", (ShardRequestHandler,), {"updates": updates, "keepalive": 0.05})
+
+        with self._serve(site, handler_class) as base:
+            with urllib.request.urlopen(f"{base}/api/events", timeout=5) as res:
+                assert res.headers["Content-Type"] == "text/event-stream"
+                assert res.readline() == b": keep-alive\n"
+                res.readline()
+                updates.publish({"modules": ["my_module"]})
+                while res.readline() != b"event: update\n":  # skip keep-alives
+                    pass
+                data = res.readline()
+            updates.close()
+
+        assert json.loads(data[len(b"data: ") :]) == {"modules": ["my_module"]}
+
+    def test_events_endpoint_only_in_watch_mode(self, tmp_path: Path) -> None:
+        site = tmp_path / "site"
+        site.mkdir()
+
+        with self._serve(site) as base:
+            status, _, _ = self._get(f"{base}/api/events")
+
+        assert status == 404
+
+
+class TestLiveUpdates:
+    def test_wait_returns_latest_payload(self) -> None:
+        updates = LiveUpdates()
+        threading.Timer(0.05, updates.publish, args=({"modules": ["a"]},)).start()
+
+        generation, data = updates.wait(0, timeout=2)
+
+        assert generation == 1 and json.loads(data) == {"modules": ["a"]}
+
+    def test_wait_times_out_and_close_releases(self) -> None:
+        updates = LiveUpdates()
+        assert updates.wait(0, timeout=0.01) == (0, None)
+
+        threading.Timer(0.05, updates.close).start()
+        assert updates.wait(0, timeout=2) == (0, None)
+        assert updates.closed
+
+
 class TestResolutionContract:
     """Verify the DocModel carries resolved *_ref keys on field and method nodes."""
 
@@ -863,6 +863,25 @@ class TestRefactorCLI:
         assert real_file.read_text() == NEW_MODEL_SOURCE
 
 
+    def test_parallel_run_matches_serial(self, tmp_path):
+        kb_path = tmp_path / "kb.db"
+        _make_kb(kb_path)
+        sources = {"a.py": NEW_MODEL_SOURCE, "b.py": INHERIT_MODEL_SOURCE}
+        serial = [_make_module(tmp_path / "serial", f"mod_{i}", sources) for i in range(3)]
+        parallel = [_make_module(tmp_path / "parallel", f"mod_{i}", sources) for i in range(3)]
+        common = ["--kb", str(kb_path), "--no-branch", "--no-commit"]
+
+        first = self._runner().invoke(main, [*map(str, serial), *common])
+        second = self._runner().invoke(main, [*map(str, parallel), *common, "--jobs", "3"])
+
+        assert first.exit_code == 0 and second.exit_code == 0, second.output
+        assert "6 file(s) rewritten across 3 module(s)" in second.output
+        for before, after in zip(serial, parallel):
+            for name in sources:
+                assert (after / "models" / name).read_text() == (before / "models" / name).read_text()
+        assert second.output.index("mod_0") < second.output.index("mod_1") < second.output.index("mod_2")
+
+
 # ---------------------------------------------------------------------------
 # TestRefactorRebuild — Phase 4: --refresh and auto-rebuild logic
 # ---------------------------------------------------------------------------
@@ -0,0 +1,129 @@
+"""Tests for oops.services.repository: locating a repository without GitPython."""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+from oops.core.exceptions import OopsError
+from oops.services.repository import find_repository, require_repo_context
+
+
+def _git(repo, *args):
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / "repo"
+    path.mkdir()
+    _git(path, "init", "-q", "-b", "main")
+    (path / "a.txt").write_text("a\n")
+    _git(path, "add", ".")
+    _git(path, "commit", "-qm", "init")
+    return path
+
+
+class TestFindRepository:
+    def test_reads_branch_and_commit(self, repo):
+        (repo / "sub" / "dir").mkdir(parents=True)
+
+        ctx = find_repository(repo / "sub" / "dir")
+
+        assert ctx.root == repo
+        assert ctx.git_dir == ctx.common_dir == repo / ".git"
+        assert ctx.head_ref == "refs/heads/main" and ctx.branch == "main"
+        assert ctx.head_commit == _git(repo, "rev-parse", "HEAD")
+
+    def test_packed_refs(self, repo):
+        _git(repo, "pack-refs", "--all")
+        assert not (repo / ".git" / "refs" / "heads" / "main").exists()
+
+        ctx = find_repository(repo)
+
+        assert ctx.head_commit == _git(repo, "rev-parse", "HEAD")
+        _git(repo, "tag", "-a", "v1", "-m", "v1")
+        _git(repo, "pack-refs", "--all")
+        assert ctx.read_ref("refs/tags/v1") == _git(repo, "rev-parse", "v1")  # the tag object, not its peeled line
+
+    def test_detached_head(self, repo):
+        _git(repo, "checkout", "-q", "--detach")
+
+        ctx = find_repository(repo)
+
+        assert ctx.head_ref is None and ctx.branch is None
+        assert ctx.head_commit == _git(repo, "rev-parse", "HEAD")
+
+    def test_unborn_branch(self, tmp_path):
+        _git(tmp_path, "init", "-q", "-b", "main")
+
+        ctx = find_repository(tmp_path)
+
+        assert ctx.branch == "main"
+        assert ctx.head_commit is None
+
+    def test_linked_worktree(self, repo, tmp_path):
+        _git(repo, "worktree", "add", "-q", "-b", "feature", str(tmp_path / "wt"))
+
+        ctx = find_repository(tmp_path / "wt")
+
+        assert ctx.root == tmp_path / "wt"
+        assert ctx.git_dir != ctx.common_dir == (repo / ".git").resolve()
+        assert ctx.branch == "feature"
+        assert ctx.head_commit == _git(repo, "rev-parse", "main")
+
+    def test_gitfile(self, repo, tmp_path):
+        # Submodule checkouts point at their git dir through a relative gitfile.
+        (repo / ".git").rename(tmp_path / "moved.git")
+        (repo / ".git").write_text("gitdir: ../moved.git\n")
+
+        ctx = find_repository(repo)
+
+        assert ctx.root == repo
+        assert ctx.branch == "main"
+        assert ctx.head_commit is not None
+
+    def test_outside_a_repository(self, tmp_path):
+        (tmp_path / "empty").mkdir()
+
+        assert find_repository(tmp_path / "empty") is None
+
+    def test_broken_dot_git_is_skipped(self, repo):
+        (repo / "nested").mkdir()
+        (repo / "nested" / ".git").write_text("not a gitfile\n")
+
+        assert find_repository(repo / "nested").root == repo
+
+
+class TestRequireRepoContext:
+    def test_raises_outside_a_repository(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        with pytest.raises(OopsError, match="Not inside a git repository"):
+            require_repo_context()
+
+    def test_repo_is_built_lazily(self, repo, monkeypatch):
+        monkeypatch.chdir(repo)
+
+        ctx = require_repo_context()
+
+        with patch("git.Repo") as repo_cls:
+            assert ctx.repo is ctx.repo
+        repo_cls.assert_called_once_with(repo)
+
+    def test_hook_entry_points_do_not_import_gitpython(self):
+        code = (
+            "import sys\n"
+            "import oops.commands.manifest.check, oops.commands.project.check, oops.commands.requirements.check\n"
+            "import oops.commands.readme.update, oops.commands.project.exclude, oops.commands.manifest.fix\n"
+            "print('git' in sys.modules)\n"
+        )
+        out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+
+        assert out.strip() == "False"
@@ -0,0 +1,260 @@
+"""Tests for oops.services.github.fetch_branch_zip (streaming, resumable
+download) and oops.io.archive.StreamingZipExtractor, against a local
+threaded http.server serving fixture zipballs."""
+
+import hashlib
+import io
+import random
+import re
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+FILES = {
+    "addons/base/__manifest__.py": b"{'name': 'Base'}\n",
+    "addons/base/models/res.py": b"# model\n" * 5000,
+    "addons/base/static/logo.bin": random.Random(0).randbytes(256 * 1024),
+    "README.md": b"readme\n",
+    "empty.txt": b"",
+}
+
+
+def _zipball(top: str, files=FILES, streamed: bool = False) -> bytes:
+    """Build a GitHub-like zipball; ``streamed`` forces trailing data descriptors."""
+
+    class _Unseekable(io.RawIOBase):
+        def __init__(self):
+            self.data = bytearray()
+
+        def writable(self):
+            return True
+
+        def write(self, b):
+            self.data += b
+            return len(b)
+
+    out = _Unseekable() if streamed else io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(f"{top}/", b"")
+        for name, data in files.items():
+            zf.writestr(f"{top}/{name}", data)
+    return bytes(out.data if streamed else out.getvalue())
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves ``server.archives[repo]`` with ETag and single byte-range support.
+
+    ``server.drop_after`` (bytes) cuts the next full response short once.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802 - http.server API
+        server = self.server
+        m = re.match(r"^/repos/[^/]+/([^/]+)/zipball/[^/]+$", self.path)
+        if not m or m.group(1) not in server.archives:
+            self.send_error(404)
+            return
+        body = server.archives[m.group(1)]
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        server.log.append(
+            {"path": self.path, "range": self.headers.get("Range"), "if_range": self.headers.get("If-Range")}
+        )
+
+        status, start = 200, 0
+        rng = re.match(r"bytes=(\d+)-$", self.headers.get("Range") or "")
+        if rng and server.ranges and self.headers.get("If-Range", etag) == etag:
+            start = int(rng.group(1))
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            status = 206
+
+        payload = body[start:]
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(payload)))
+        if status == 206:  # noqa: PLR2004
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        self.end_headers()
+
+        if server.drop_after is not None:
+            cut, server.drop_after = server.drop_after, None
+            self.wfile.write(payload[:cut])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    from oops.core.config import config
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.archives = {
+        "odoo": _zipball("odoo-abc123"),
+        "enterprise": _zipball("enterprise-def456", streamed=True),
+        "design-themes": _zipball("design-themes-789", {"theme/x.xml": b"<odoo/>"}),
+    }
+    httpd.log = []
+    httpd.ranges = True
+    httpd.drop_after = None
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(config, "github_api", f"http://127.0.0.1:{httpd.server_address[1]}")
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _assert_extracted(root):
+    for name, data in FILES.items():
+        assert (root / name).read_bytes() == data
+
+
+class TestStreamingZipExtractor:
+    @pytest.mark.parametrize("streamed", [False, True])
+    @pytest.mark.parametrize("chunk", [1, 7, 4096])
+    def test_extracts_any_chunking(self, tmp_path, streamed, chunk):
+        from oops.io.archive import StreamingZipExtractor
+
+        data = _zipball("top", streamed=streamed)
+        extractor = StreamingZipExtractor(tmp_path)
+        for i in range(0, len(data), chunk):
+            extractor.feed(data[i : i + chunk])
+        extractor.close()
+
+        assert extractor.root == "top"
+        _assert_extracted(tmp_path / "top")
+
+    def test_crc_mismatch_is_detected(self, tmp_path):
+        from oops.io.archive import CorruptArchiveError, StreamingZipExtractor
+
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zf:
+            zf.writestr("top/a.txt", b"hello")
+        data = bytearray(buf.getvalue())
+        data[data.index(b"hello")] = ord("j")  # stored payload, CRC now wrong
+
+        extractor = StreamingZipExtractor(tmp_path)
+        with pytest.raises(CorruptArchiveError, match="Checksum mismatch"):
+            extractor.feed(bytes(data))
+
+    def test_truncated_archive(self, tmp_path):
+        from oops.io.archive import CorruptArchiveError, StreamingZipExtractor
+
+        data = _zipball("top")
+        extractor = StreamingZipExtractor(tmp_path)
+        extractor.feed(data[: len(data) // 2])
+        with pytest.raises(CorruptArchiveError, match="truncated"):
+            extractor.close()
+
+    def test_rejects_path_traversal(self, tmp_path):
+        from oops.io.archive import CorruptArchiveError, StreamingZipExtractor
+
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("../evil.txt", b"x")
+        with pytest.raises(CorruptArchiveError, match="Unsafe path"):
+            StreamingZipExtractor(tmp_path / "out").feed(buf.getvalue())
+        assert not (tmp_path / "evil.txt").exists()
+
+
+class TestFetchBranchZip:
+    def test_downloads_and_extracts(self, server, tmp_path):
+        from oops.services.github import fetch_branch_zip
+
+        zip_path, root = fetch_branch_zip("odoo", "odoo", "17.0", str(tmp_path))
+
+        assert root == str(tmp_path / "odoo-abc123")
+        _assert_extracted(tmp_path / "odoo-abc123")
+        assert open(zip_path, "rb").read() == server.archives["odoo"]
+        assert not (tmp_path / "odoo-17.0.zip.part").exists()
+
+    def test_extract_false_only_downloads(self, server, tmp_path):
+        from oops.services.github import fetch_branch_zip
+
+        zip_path, root = fetch_branch_zip("odoo", "odoo", "17.0", str(tmp_path), extract=False)
+
+        assert root is None
+        assert zipfile.is_zipfile(zip_path)
+        assert not (tmp_path / "odoo-abc123").exists()
+
+    def test_resumes_from_partial_file(self, server, tmp_path):
+        from oops.services.github import fetch_branch_zip
+
+        body = server.archives["odoo"]
+        (tmp_path / "odoo-17.0.zip.part").write_bytes(body[:1000])
+
+        fetch_branch_zip("odoo", "odoo", "17.0", str(tmp_path))
+
+        assert server.log[-1]["range"] == "bytes=1000-"
+        _assert_extracted(tmp_path / "odoo-abc123")
+
+    def test_resumes_dropped_connection(self, server, tmp_path):
+        from oops.services.github import fetch_branch_zip
+
+        server.drop_after = 150_000
+
+        zip_path, _ = fetch_branch_zip("odoo", "odoo", "17.0", str(tmp_path))
+
+        first, second = server.log
+        assert first["range"] is None
+        resumed_at = int(second["range"][len("bytes=") : -1])
+        assert 0 < resumed_at <= 150_000
+        assert server.log[1]["if_range"]
+        assert open(zip_path, "rb").read() == server.archives["odoo"]
+        _assert_extracted(tmp_path / "odoo-abc123")
+
+    def test_restarts_when_range_ignored(self, server, tmp_path):
+        from oops.services.github import fetch_branch_zip
+
+        server.ranges = False
+        (tmp_path / "odoo-17.0.zip.part").write_bytes(b"stale partial bytes")
+
+        zip_path, _ = fetch_branch_zip("odoo", "odoo", "17.0", str(tmp_path))
+
+        assert open(zip_path, "rb").read() == server.archives["odoo"]
+        _assert_extracted(tmp_path / "odoo-abc123")
+
+    def test_checksum_verification(self, server, tmp_path):
+        from oops.core.exceptions import APIError
+        from oops.services.github import fetch_branch_zip
+
+        good = hashlib.sha256(server.archives["odoo"]).hexdigest()
+        fetch_branch_zip("odoo", "odoo", "17.0", str(tmp_path / "ok"), sha256=good)
+
+        with pytest.raises(APIError, match="Checksum mismatch"):
+            fetch_branch_zip("odoo", "odoo", "17.0", str(tmp_path / "bad"), sha256="0" * 64)
+        assert not (tmp_path / "bad" / "odoo-17.0.zip.part").exists()
+
+    def test_streamed_zipball(self, server, tmp_path):
+        from oops.services.github import fetch_branch_zip
+
+        _, root = fetch_branch_zip("odoo", "enterprise", "17.0", str(tmp_path))
+
+        assert root == str(tmp_path / "enterprise-def456")
+        _assert_extracted(tmp_path / "enterprise-def456")
+
+    def test_corrupt_archive_discards_partial(self, server, tmp_path):
+        from oops.io.archive import CorruptArchiveError
+        from oops.services.github import fetch_branch_zip
+
+        body = bytearray(server.archives["odoo"])
+        body[2000:2010] = b"\x00" * 10  # inside the first deflated entry
+        server.archives["odoo"] = bytes(body)
+
+        with pytest.raises(CorruptArchiveError):
+            fetch_branch_zip("odoo", "odoo", "17.0", str(tmp_path))
+
+        assert not (tmp_path / "odoo-17.0.zip.part").exists()
+        assert not (tmp_path / "odoo-17.0.zip.part.etag").exists()
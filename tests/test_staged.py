@@ -0,0 +1,155 @@
+"""Tests for oops.services.staged and the --staged fast path of the pre-commit hooks."""
+
+import json
+import subprocess
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+from oops.commands.manifest.check import main as manifest_check
+from oops.commands.project.exclude import main as exclude
+from oops.commands.readme.update import main as readme_update
+from oops.commands.requirements.check import main as requirements_check
+from oops.services.staged import resolve_staged, staged_paths
+
+OWN = '{"name": "%s", "version": "17.0.1.0.0", "author": "Acme", "summary": "x", "installable": True}\n'
+THIRD = '{"name": "%s", "version": "17.0.1.0.0", "author": "OCA", "summary": "x", "installable": True}\n'
+
+PRECOMMIT = "exclude: |\n  (?x)\n  # oops:exclude:start\n  # oops:exclude:end\n  ^setup/\n"
+
+
+def _git(repo, *args):
+    subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], cwd=repo, check=True)
+
+
+def _addon(repo, name, manifest=OWN):
+    (repo / name / "models").mkdir(parents=True, exist_ok=True)
+    (repo / name / "__manifest__.py").write_text(manifest % name)
+    (repo / name / "models" / "x.py").write_text("x = 1\n")
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    path = tmp_path / "repo"
+    path.mkdir()
+    _addon(path, "sale_ext")
+    _addon(path, "stock_ext")
+    _addon(path, "web_vendor", THIRD)
+    (path / "README.md").write_text("# Project\n")
+    (path / ".pre-commit-config.yaml").write_text(PRECOMMIT)
+    (path / "requirements.txt").write_text("")
+    _git(path, "init", "-q", "-b", "main")
+    _git(path, "add", ".")
+    _git(path, "commit", "-qm", "init")
+    monkeypatch.chdir(path)
+    staged_paths.cache_clear()
+    yield path
+    staged_paths.cache_clear()
+
+
+class TestResolveStaged:
+    def test_reads_the_index(self, repo):
+        (repo / "sale_ext" / "models" / "x.py").write_text("x = 2\n")
+        (repo / "stock_ext" / "models" / "x.py").write_text("x = 2\n")
+        _git(repo, "add", "sale_ext")
+
+        changes = resolve_staged(repo)
+
+        assert changes.paths == ["sale_ext/models/x.py"]
+        assert changes.addons == ["sale_ext"]
+        assert changes.manifests == []
+        assert not changes.full_scan
+
+    def test_manifest_and_removed_addon(self, repo):
+        changes = resolve_staged(repo, ["stock_ext/__manifest__.py", "gone/__manifest__.py", "gone/models/x.py"])
+
+        assert changes.addons == ["gone", "stock_ext"]
+        assert changes.manifests == ["gone", "stock_ext"]
+
+    def test_root_symlink(self, repo):
+        (repo / "linked").symlink_to(repo / "web_vendor")
+
+        assert resolve_staged(repo, ["linked"]).manifests == ["linked"]
+
+    @pytest.mark.parametrize("path", [".gitmodules", "requirements.txt", ".oops.yaml", ".pre-commit-config.yaml"])
+    def test_global_files_force_full_scan(self, repo, path):
+        assert resolve_staged(repo, ["sale_ext/models/x.py", path]).full_scan
+
+    def test_submodule_bump_forces_full_scan(self, repo):
+        (repo / ".third-party" / "OCA" / "web").mkdir(parents=True)
+
+        assert resolve_staged(repo, [".third-party/OCA/web"]).full_scan
+
+    def test_empty_index_forces_full_scan(self, repo):
+        assert resolve_staged(repo).full_scan
+
+    def test_unrelated_files(self, repo):
+        changes = resolve_staged(repo, ["docs/index.md", "README.md"])
+
+        assert not changes.full_scan and changes.addons == [] and changes.manifests == []
+        assert changes.touches("README.md")
+
+
+class TestStagedHooks:
+    def test_readme_skipped_without_manifest_change(self, repo):
+        (repo / "sale_ext" / "models" / "x.py").write_text("x = 2\n")
+        _git(repo, "add", "sale_ext")
+
+        result = CliRunner().invoke(readme_update, ["--staged", "--no-commit", "--hook"])
+
+        assert result.exit_code == 0, result.output
+        assert (repo / "README.md").read_text() == "# Project\n"
+
+    def test_readme_rebuilt_on_manifest_change(self, repo):
+        _addon(repo, "new_addon")
+        _git(repo, "add", "new_addon")
+
+        with patch("oops.commands.readme.update.get_github_user", side_effect=lambda user: user):
+            result = CliRunner().invoke(readme_update, ["--staged", "--no-commit", "--hook"])
+
+        assert result.exit_code == 0, result.output
+        assert "[new_addon](/new_addon)" in (repo / "README.md").read_text()
+
+    def test_exclude_updates_only_staged_addons(self, repo):
+        # Seed a stale entry for an unstaged addon: the staged run must leave it alone.
+        (repo / ".pre-commit-config.yaml").write_text(PRECOMMIT.replace("start\n", "start\n  stale/|\n"))
+        _git(repo, "commit", "-qam", "seed")
+        _addon(repo, "other_vendor", THIRD)
+        _git(repo, "add", "other_vendor")
+        staged_paths.cache_clear()
+
+        result = CliRunner().invoke(exclude, ["--staged", "--no-commit"])
+
+        assert result.exit_code == 0, result.output
+        content = (repo / ".pre-commit-config.yaml").read_text()
+        assert "  other_vendor/|" in content and "  stale/|" in content
+        assert "web_vendor" not in content
+
+    def test_exclude_full_scan_fallback(self, repo):
+        (repo / "requirements.txt").write_text("requests\n")
+        _git(repo, "add", "requirements.txt")
+
+        result = CliRunner().invoke(exclude, ["--staged", "--no-commit"])
+
+        assert result.exit_code == 0, result.output
+        assert "  web_vendor/|" in (repo / ".pre-commit-config.yaml").read_text()
+
+    def test_manifest_check_only_staged(self, repo):
+        (repo / "stock_ext" / "__manifest__.py").write_text(OWN % "stock_ext" + "\n")
+        _git(repo, "add", "stock_ext")
+
+        with patch("oops.commands.manifest.check.run_fixit", return_value=0) as run_fixit:
+            result = CliRunner().invoke(manifest_check, ["--staged"])
+
+        assert result.exit_code == 0, result.output
+        assert [p.parent.name for p in run_fixit.call_args.args[0]] == ["stock_ext"]
+
+    def test_requirements_check_skipped_without_manifest_change(self, repo):
+        (repo / "sale_ext" / "models" / "x.py").write_text("x = 2\n")
+        _git(repo, "add", "sale_ext")
+
+        result = CliRunner().invoke(requirements_check, ["--staged", "--format", "json"])
+
+        assert result.exit_code == 0, result.output
+        payload = json.loads(result.output[result.output.index("{") :])
+        assert "skipped" in json.dumps(payload) and "passed" not in json.dumps(payload)
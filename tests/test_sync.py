@@ -169,7 +169,7 @@ class TestSparseClone:
 
     def test_clone_without_branch(self, tmp_path):
         mock_repo = self._make_mock_repo(tmp_path)
-        with patch("oops.utils.net.Repo") as mock_repo_cls:
+        with patch("git.Repo") as mock_repo_cls:
             mock_repo_cls.clone_from.return_value = mock_repo
             sparse_clone("https://example.com/repo.git", tmp_path, ["Makefile"])
 
@@ -178,7 +178,7 @@ class TestSparseClone:
 
     def test_clone_with_branch(self, tmp_path):
         mock_repo = self._make_mock_repo(tmp_path)
-        with patch("oops.utils.net.Repo") as mock_repo_cls:
+        with patch("git.Repo") as mock_repo_cls:
             mock_repo_cls.clone_from.return_value = mock_repo
             sparse_clone("https://example.com/repo.git", tmp_path, ["Makefile"], "develop")
 
@@ -1,11 +1,39 @@
-import type { Payload } from "../types";
+import type { ModuleEntry, Payload, ShardLayout } from "../types";
 import type { Source } from "../source";
 
-// Stub for a future live `oops serve` exposing POST /api/<method>.
-// The current serve uses data.js (StaticSource), so this is not wired yet.
+// `oops project serve`: a small data/index.json plus one JSON shard per module,
+// fetched on demand. The server sends precompressed bodies with strong ETags,
+// so the browser revalidates cheaply and only refetches shards that changed.
+// POST /api/<method> runs a command live; scan_project returns the full,
+// unsharded payload.
 export class HttpSource implements Source {
   readonly kind = "http" as const;
-  async load(): Promise<Payload> { return this.run("scan_project"); }
+  private layout: ShardLayout = { base: "data/", modules: "modules/{module}.json" };
+  private shards = new Map<string, Promise<ModuleEntry>>();
+
+  async load(): Promise<Payload> {
+    const res = await fetch("./data/index.json");
+    if (!res.ok) return this.run("scan_project");
+    const index = (await res.json()) as Payload & { shards?: ShardLayout };
+    if (index.shards) this.layout = index.shards;
+    return index;
+  }
+
+  module(name: string): Promise<ModuleEntry> {
+    let pending = this.shards.get(name);
+    if (!pending) {
+      const url = "./" + this.layout.base + this.layout.modules.replace("{module}", encodeURIComponent(name));
+      pending = fetch(url).then(async (res) => {
+        if (!res.ok) throw new Error(`shard ${name}: ${res.status}`);
+        return (await res.json()) as ModuleEntry;
+      });
+      // Forget failures so a later navigation can retry.
+      pending.catch(() => this.shards.delete(name));
+      this.shards.set(name, pending);
+    }
+    return pending;
+  }
+
   async run(method: string, ...args: unknown[]): Promise<Payload> {
     const res = await fetch(`/api/${method}`, {
       method: "POST",
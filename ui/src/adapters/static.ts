@@ -1,8 +1,8 @@
 import type { Payload } from "../types";
 import type { Source } from "../source";
 
-// Data frozen into the page as window.OOPS — used by both the export file and
-// `oops serve` (which writes data.js). Read-only: no run().
+// Data frozen into the page as window.OOPS — used by the single-file export
+// (`--format html`). Read-only: no run().
 export class StaticSource implements Source {
   readonly kind = "static" as const;
   async load(): Promise<Payload> {
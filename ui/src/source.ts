@@ -1,4 +1,4 @@
-import type { Payload } from "./types";
+import type { ModuleEntry, Payload } from "./types";
 
 /** A hydration source. The renderer never knows which one is wired. */
 export interface Source {
@@ -7,4 +7,6 @@ export interface Source {
   load(): Promise<Payload>;
   /** Run a command live. Present only on interactive sources. */
   run?(method: string, ...args: unknown[]): Promise<Payload>;
+  /** Fetch one module shard on demand. Present only on sharded sources. */
+  module?(name: string): Promise<ModuleEntry>;
 }
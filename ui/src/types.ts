@@ -126,6 +126,9 @@ export interface ContributionEntry {
   fields?: FieldNode[];
   methods?: MethodNode[];
   views?: ViewNode[];
+  /** Sharded index only: list sizes, the lists themselves live in the module shard. */
+  fields_count?: number;
+  methods_count?: number;
 }
 
 export interface BareModelEntry {
@@ -148,7 +151,29 @@ export interface ModuleEntry {
   fields?: FieldNode[];
   methods?: MethodNode[];
   domain_profile?: Record<string, unknown>;
+  views?: ViewNode[];
+  /** Sharded index only: node list sizes and the shard path (relative to `shards.base`). */
+  counts?: Record<string, number>;
+  shard?: string;
   _locTotal?: number;
+  _hydrated?: boolean;
+}
+
+/** Where a sharded serve index finds its per-module shards. */
+export interface ShardLayout {
+  base: string;
+  modules: string;
+}
+
+/** Sharded index only: a field or method as the search view needs it. */
+export interface SearchDoc {
+  kind: "field" | "method";
+  id: string;
+  label: string;
+  module: string;
+  model: string;
+  section?: string;
+  text: string;
 }
 
 /** JSON schema shape used by descriptorTitle / descriptorKind. */
@@ -165,4 +190,8 @@ export interface ServePayload {
   schema?: Schema;
   metadata: Metadata;
   warnings?: string[];
+  /** Present when the payload is a sharded index (`oops project serve`). */
+  shards?: ShardLayout;
+  /** Sharded index only: the field and method entries of the search view. */
+  search?: SearchDoc[];
 }
@@ -1,6 +1,6 @@
 import * as d3 from "d3";
 import Fuse from "fuse.js";
-import type { Payload, ServePayload, ModuleEntry, BareModelEntry, Schema, InventoryNode, Loc } from "../types";
+import type { Payload, ServePayload, ModuleEntry, BareModelEntry, Schema, InventoryNode, Loc, SearchDoc } from "../types";
 import type { Source } from "../source";
 import {
   el, fmt, badge, numCell, tableWrap,
@@ -29,9 +29,16 @@ interface SearchEntry {
   hash: string;
 }
 
-function buildSearchIndex(modules: ModuleEntry[], modelsByBare: Record<string, BareModelEntry>): Fuse<SearchEntry> {
+function buildSearchIndex(
+  modules: ModuleEntry[], modelsByBare: Record<string, BareModelEntry>, docs?: SearchDoc[],
+): Fuse<SearchEntry> {
   const entries: SearchEntry[] = [];
 
+  // A sharded index carries its field and method entries: no shard is fetched.
+  for (const doc of docs ?? []) {
+    entries.push({ ...doc, hash: "#/model/" + encodeURIComponent(doc.model) });
+  }
+
   for (const mod of modules) {
     const name  = mod.module ?? "";
     const mfst  = mod.manifest ?? {};
@@ -41,6 +48,7 @@ function buildSearchIndex(modules: ModuleEntry[], modelsByBare: Record<string, B
       text: [name, mfst["name"], mfst["summary"], mfst["author"]].filter(Boolean).join(" "),
       hash: "#/module/" + encodeURIComponent(name),
     });
+    if (docs) continue;
     for (const f of mod.fields ?? []) {
       const bare  = ((f["model"] as string | undefined) ?? "").replace(/^[^:]+:/, "");
       const label = f.label ?? (f.label_inferred
@@ -84,7 +92,7 @@ function buildSearchIndex(modules: ModuleEntry[], modelsByBare: Record<string, B
 // viewServe: contained router + all sub-views
 // ---------------------------------------------------------------------------
 
-export function viewServe(root: HTMLElement, payload: Payload, _source: Source): void {
+export function viewServe(root: HTMLElement, payload: Payload, source: Source): void {
   const p = payload as unknown as ServePayload;
   const modules      = p.modules       ?? [];
   const modelsByBare = p.models_by_bare ?? {};
@@ -92,10 +100,44 @@ export function viewServe(root: HTMLElement, payload: Payload, _source: Source):
 
   let fuseIndex: Fuse<SearchEntry> | null = null;
   const getIndex = () => {
-    if (!fuseIndex) fuseIndex = buildSearchIndex(modules, modelsByBare);
+    if (!fuseIndex) fuseIndex = buildSearchIndex(modules, modelsByBare, p.search);
     return fuseIndex;
   };
 
+  // Sharded index (`oops project serve`): each module's node lists arrive on
+  // demand from its shard and are merged in place, so the sync views below
+  // work unchanged once a route's shards are loaded.
+  const sharded = !!p.shards && typeof source.module === "function";
+  const moduleByName = new Map(modules.map((m) => [m.module, m]));
+
+  async function hydrate(names: string[]): Promise<void> {
+    const shards = await Promise.all(names.map((n) => source.module!(n)));
+    for (const shard of shards) {
+      const mod = moduleByName.get(shard.module);
+      if (!mod || mod._hydrated) continue;
+      Object.assign(mod, shard, { _hydrated: true });
+      for (const entry of Object.values(modelsByBare)) {
+        for (const c of entry.contributions) {
+          if (c.module !== shard.module || !c.model_node) continue;
+          const id = c.model_node.id;
+          c.fields  = (shard.fields  ?? []).filter((f) => f["model"] === id);
+          c.methods = (shard.methods ?? []).filter((m) => m["model"] === id);
+        }
+      }
+    }
+    if (!p.search) fuseIndex = null;
+  }
+
+  function missingShards(hash: string): string[] {
+    if (!sharded) return [];
+    let names: string[] = [];
+    const mm = hash.match(/^#\/module\/(.+)$/);
+    const md = hash.match(/^#\/model\/(.+)$/);
+    if (mm) names = [decodeURIComponent(mm[1]!)];
+    else if (md) names = (modelsByBare[decodeURIComponent(md[1]!)]?.contributions ?? []).map((c) => c.module);
+    return names.filter((n) => moduleByName.has(n) && !moduleByName.get(n)!._hydrated);
+  }
+
   const modClassification = (name: string) =>
     modules.find((m) => m.module === name)?.inventory?.classification ?? "unknown";
 
@@ -120,6 +162,14 @@ export function viewServe(root: HTMLElement, payload: Payload, _source: Source):
     const hash = location.hash || "#/";
     root.innerHTML = "";
     closeDrawer();
+    const pending = missingShards(hash);
+    if (pending.length) {
+      root.appendChild(el("p", { class: "placeholder" }, "Loading…"));
+      hydrate(pending)
+        .then(() => { if ((location.hash || "#/") === hash) route(); })
+        .catch((e) => { root.innerHTML = ""; root.appendChild(el("p", { class: "placeholder" }, (e as Error).message)); });
+      return;
+    }
     for (const r of ROUTES) {
       const m = hash.match(r.re);
       if (m) { root.appendChild(r.view(m)); return; }